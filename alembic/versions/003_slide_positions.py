@@ -0,0 +1,47 @@
+"""Add sparse slide positions
+
+Revision ID: 003
+Revises: 002
+Create Date: 2024-01-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Order slides by a gap-spaced position key."""
+    op.add_column('slide', sa.Column('position', sa.BigInteger(), nullable=True))
+    op.execute('UPDATE slide SET position = slide_number * 1024')
+    op.alter_column('slide', 'position', nullable=False)
+    op.create_index('idx_slide_presentation_position', 'slide', ['presentation_id', 'position'], unique=False)
+    
+    # Slide numbers are rewritten by one set-based UPDATE, which an
+    # immediately checked unique constraint rejects part-way through, and
+    # soft-deleted slides keep their old numbers. An exclusion constraint
+    # can be both partial and deferred to commit.
+    op.drop_constraint('uq_presentation_slide_number', 'slide', type_='unique')
+    op.create_exclude_constraint(
+        'uq_presentation_slide_number', 'slide',
+        ('presentation_id', '='), ('slide_number', '='),
+        using='btree',
+        where=sa.text('deleted_at IS NULL'),
+        deferrable=True,
+        initially='DEFERRED'
+    )
+
+
+def downgrade() -> None:
+    """Restore slide number ordering."""
+    op.drop_constraint('uq_presentation_slide_number', 'slide')
+    op.create_unique_constraint('uq_presentation_slide_number', 'slide', ['presentation_id', 'slide_number'])
+    op.drop_index('idx_slide_presentation_position', table_name='slide')
+    op.drop_column('slide', 'position')
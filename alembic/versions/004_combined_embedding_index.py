@@ -0,0 +1,61 @@
+"""Index one combined embedding per presentation with HNSW
+
+Revision ID: 004
+Revises: 003
+Create Date: 2024-01-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Keep the latest embedding per presentation and type, and index combined ones."""
+    op.execute("""
+        DELETE FROM presentationembedding older
+        USING presentationembedding newer
+        WHERE older.presentation_id = newer.presentation_id
+        AND older.embedding_type IS NOT DISTINCT FROM newer.embedding_type
+        AND (older.generated_at, older.id) < (newer.generated_at, newer.id)
+    """)
+    op.add_column('presentationembedding', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.create_unique_constraint(
+        'uq_presentation_embedding_type',
+        'presentationembedding',
+        ['presentation_id', 'embedding_type']
+    )
+    
+    # The IVFFlat index was built on an empty table, so its lists never
+    # matched the data; HNSW needs no training and stays accurate as rows
+    # are added
+    op.drop_index('idx_embedding_vector', table_name='presentationembedding')
+    op.execute("""
+        CREATE INDEX idx_embedding_combined_hnsw
+        ON presentationembedding
+        USING hnsw (embedding vector_l2_ops)
+        WITH (m = 16, ef_construction = 64)
+        WHERE embedding_type = 'combined'
+    """)
+
+
+def downgrade() -> None:
+    """Restore the IVFFlat index over all embeddings."""
+    op.drop_index('idx_embedding_combined_hnsw', table_name='presentationembedding')
+    op.create_index(
+        'idx_embedding_vector',
+        'presentationembedding',
+        ['embedding'],
+        unique=False,
+        postgresql_using='ivfflat',
+        postgresql_with={'lists': '100'}
+    )
+    op.drop_constraint('uq_presentation_embedding_type', 'presentationembedding', type_='unique')
+    op.drop_column('presentationembedding', 'content_hash')
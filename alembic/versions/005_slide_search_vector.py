@@ -0,0 +1,104 @@
+"""Store and index slide search vectors
+
+Revision ID: 005
+Revises: 004
+Create Date: 2024-01-22 00:00:00.000000
+
+"""
+from typing import Any, Iterator, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+# Frozen copies of app.infrastructure.database.search_text as of this revision, so
+# the migration keeps producing the same schema and data as the app moves on
+SEARCH_VECTOR_EXPRESSION = "to_tsvector('english', coalesce(search_text, ''))"
+
+TEXT_KEYS = frozenset({
+    "title", "subtitle", "body", "content", "text", "items",
+    "caption", "headers", "rows", "notes",
+})
+
+
+def _text_values(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        if value.strip():
+            yield value.strip()
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            if key in TEXT_KEYS:
+                yield from _text_values(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _text_values(item)
+
+
+def slide_search_text(content: Any) -> str:
+    """Extract the searchable text of slide content."""
+    return "\n".join(_text_values(content or {}))
+
+
+def upgrade() -> None:
+    """Add the extracted search text, its generated vector and GIN indexes."""
+    op.add_column('slide', sa.Column('search_text', sa.Text(), nullable=True))
+
+    # Extract text as the model did on write at this revision
+    slide = sa.table(
+        'slide',
+        sa.column('id', postgresql.UUID(as_uuid=True)),
+        sa.column('content', postgresql.JSONB()),
+        sa.column('search_text', sa.Text()),
+    )
+    connection = op.get_bind()
+    last_id = None
+    while True:
+        stmt = sa.select(slide.c.id, slide.c.content).order_by(slide.c.id).limit(BACKFILL_BATCH_SIZE)
+        if last_id is not None:
+            stmt = stmt.where(slide.c.id > last_id)
+        rows = connection.execute(stmt).all()
+        if not rows:
+            break
+        connection.execute(
+            slide.update()
+            .where(slide.c.id == sa.bindparam('slide_id'))
+            .values(search_text=sa.bindparam('text')),
+            [{'slide_id': row.id, 'text': slide_search_text(row.content)} for row in rows]
+        )
+        last_id = rows[-1].id
+
+    op.add_column(
+        'slide',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+            nullable=True
+        )
+    )
+    op.create_index('idx_slide_search', 'slide', ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index(
+        'idx_slide_title_trgm', 'slide', ['title'], unique=False,
+        postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'idx_slide_speaker_notes_trgm', 'slide', ['speaker_notes'], unique=False,
+        postgresql_using='gin', postgresql_ops={'speaker_notes': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Drop slide search columns and indexes."""
+    op.drop_index('idx_slide_speaker_notes_trgm', table_name='slide')
+    op.drop_index('idx_slide_title_trgm', table_name='slide')
+    op.drop_index('idx_slide_search', table_name='slide')
+    op.drop_column('slide', 'search_vector')
+    op.drop_column('slide', 'search_text')
@@ -50,6 +50,7 @@ from app.services.export.export_coordinator import (
     ExportStatus,
     create_export_coordinator
 )
+from app.services.export.artifacts import iter_buffer, parse_range_header
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/export", tags=["export"])
@@ -366,13 +367,17 @@ async def get_job_result(
 @router.get("/jobs/{job_id}/download")
 async def download_export_file(
     job_id: str,
+    request: Request,
     current_user: UserRead = Depends(get_current_user),
     coordinator: ExportCoordinator = Depends(get_export_coordinator)
 ):
     """
     Download the exported file.
     
-    Returns the file as a streaming response with appropriate headers.
+    Supports single-range requests for resumable downloads. Local files are
+    sent by the server (zero-copy where it supports the pathsend extension);
+    artifacts in object storage are relayed chunk by chunk, so memory use
+    does not grow with artifact size.
     """
     try:
         result = await coordinator.get_job_result(job_id)
@@ -401,19 +406,35 @@ async def download_export_file(
         filename = f"presentation_{job_id}{format_info['extension']}"
         
         if result.file_path:
-            # Return file response
+            # FileResponse handles Range/If-Range itself
             return FileResponse(
                 path=result.file_path,
                 filename=filename,
                 media_type=format_info['mime_type']
             )
+        elif result.storage_key:
+            size = result.file_size or 0
+            byte_range = _requested_range(request, size)
+            start, end = byte_range or (0, size - 1)
+            return StreamingResponse(
+                coordinator.storage.stream_object(
+                    result.storage_key, result.storage_bucket,
+                    start=start if byte_range else None,
+                    end=end if byte_range else None
+                ),
+                status_code=status.HTTP_206_PARTIAL_CONTENT if byte_range else status.HTTP_200_OK,
+                media_type=format_info['mime_type'],
+                headers=_download_headers(filename, size, byte_range, result.content_sha256)
+            )
         elif result.buffer:
-            # Return streaming response from buffer
-            result.buffer.seek(0)
+            size = result.buffer.getbuffer().nbytes
+            byte_range = _requested_range(request, size)
+            start, end = byte_range or (0, size - 1)
             return StreamingResponse(
-                io.BytesIO(result.buffer.read()),
+                iter_buffer(result.buffer, start, end),
+                status_code=status.HTTP_206_PARTIAL_CONTENT if byte_range else status.HTTP_200_OK,
                 media_type=format_info['mime_type'],
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
+                headers=_download_headers(filename, size, byte_range, result.content_sha256)
             )
         else:
             raise HTTPException(
@@ -431,6 +452,41 @@ async def download_export_file(
         )
 
 
+def _requested_range(request: Request, size: int) -> Optional[tuple]:
+    """Parse the request's Range header, answering 416 if it cannot be satisfied."""
+    try:
+        return parse_range_header(request.headers.get("range"), size)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"}
+        )
+
+
+def _download_headers(
+    filename: str,
+    size: int,
+    byte_range: Optional[tuple],
+    sha256: Optional[str]
+) -> Dict[str, str]:
+    """Headers for a full or partial artifact download."""
+    headers = {
+        "Content-Disposition": f"attachment; filename={filename}",
+        "Accept-Ranges": "bytes",
+    }
+    if sha256:
+        headers["ETag"] = f'"{sha256}"'
+    
+    if byte_range:
+        start, end = byte_range
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+        headers["Content-Length"] = str(end - start + 1)
+    else:
+        headers["Content-Length"] = str(size)
+    return headers
+
+
 @router.delete("/jobs/{job_id}")
 async def cancel_export_job(
     job_id: str,
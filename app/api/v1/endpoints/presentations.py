@@ -56,10 +56,12 @@ from app.domain.schemas.document_processing import (
 )
 from app.infrastructure.database.base import get_db
 from app.infrastructure.database.models import User, Presentation, Slide
+from app.repositories.pagination import InvalidCursorError
 from app.repositories.presentation import PresentationRepository
 from app.repositories.slide import SlideRepository
 from app.repositories.generation_job import GenerationJobRepository
 from app.services.ai.generation_pipeline import GenerationPipeline
+from app.services.counters import get_view_count_buffer
 from app.services.document_processing.async_processor import AsyncDocumentProcessor
 from app.services.document_processing.storage.s3_manager import S3StorageManager
 from app.services.auth.authorization.decorators import require_permissions
@@ -87,9 +89,11 @@ class PresentationListResponse(BaseModel):
     """Response model for presentation list."""
     presentations: List[PresentationResponse]
     total: int
+    total_is_estimate: bool = False
     page: int
     page_size: int
     has_next: bool
+    next_cursor: Optional[str] = None
 
 
 class SlideAddRequest(SlideCreate):
@@ -136,7 +140,7 @@ async def generate_presentation_from_text(
         # Validate user quota
         presentation_repo = PresentationRepository(db)
         user_presentations = await presentation_repo.get_user_presentations(
-            current_user.id, limit=1
+            current_user.id, limit=1, include_total=False
         )
         
         # Check monthly presentation limit based on subscription
@@ -374,10 +378,11 @@ async def generate_presentation_from_file(
     description="Get a paginated list of user's presentations with filtering options"
 )
 async def list_presentations(
-    page: int = Query(1, ge=1, description="Page number"),
+    page: int = Query(1, ge=1, description="Page number, ignored when a cursor is given"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
     search: Optional[str] = Query(None, description="Search query"),
-    status: Optional[str] = Query(None, description="Filter by status"),
+    status_filter: Optional[str] = Query(None, alias="status", description="Filter by status"),
     presentation_type: Optional[str] = Query(None, description="Filter by presentation type"),
     field_of_study: Optional[str] = Query(None, description="Filter by field of study"),
     conference_name: Optional[str] = Query(None, description="Filter by conference name"),
@@ -398,15 +403,17 @@ async def list_presentations(
     - Conference name
     - Public/private visibility
     
-    Results are sorted by the specified field and order.
+    Results are sorted by relevance when searching, then by last update.
+    Pass next_cursor back as cursor to fetch the following page; totals of
+    large result sets are estimates.
     """
     try:
         presentation_repo = PresentationRepository(db)
         
         # Build filters
         filters = {}
-        if status:
-            filters['status'] = status
+        if status_filter:
+            filters['status'] = status_filter
         if presentation_type:
             filters['presentation_type'] = presentation_type
         if field_of_study:
@@ -421,35 +428,44 @@ async def list_presentations(
         
         # Get presentations
         if search:
-            presentations, total = await presentation_repo.search(
+            result_page = await presentation_repo.search(
                 query=search,
                 user_id=current_user.id,
                 filters=filters,
                 limit=page_size,
-                offset=offset
+                offset=offset,
+                cursor=cursor
             )
         else:
-            presentations, total = await presentation_repo.get_user_presentations(
+            result_page = await presentation_repo.get_user_presentations(
                 user_id=current_user.id,
                 include_collaborations=True,
-                status=status,
+                status=status_filter,
                 limit=page_size,
-                offset=offset
+                offset=offset,
+                cursor=cursor
             )
         
         # Convert to response models
         presentation_responses = [
-            PresentationResponse.from_orm(p) for p in presentations
+            PresentationResponse.from_orm(p) for p in result_page.items
         ]
         
         return PresentationListResponse(
             presentations=presentation_responses,
-            total=total,
+            total=result_page.total,
+            total_is_estimate=result_page.total_is_estimate,
             page=page,
             page_size=page_size,
-            has_next=offset + page_size < total
+            has_next=result_page.has_next,
+            next_cursor=result_page.next_cursor
         )
         
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
     except Exception as e:
         logger.error("list_presentations_error", error=str(e), user_id=current_user.id)
         raise HTTPException(
@@ -512,12 +528,14 @@ async def get_presentation(
                 detail="Access denied"
             )
         
-        # Increment view count if not owner
+        # Count the view if not owner; views are written in batches
+        view_counts = await get_view_count_buffer()
         if current_user and presentation.owner_id != current_user.id:
-            await presentation_repo.increment_view_count(presentation_id)
-            await db.commit()
+            await view_counts.record_view(presentation_id)
         
-        return PresentationResponse.from_orm(presentation)
+        response = PresentationResponse.from_orm(presentation)
+        response.view_count = await view_counts.view_count(presentation_id, presentation.view_count)
+        return response
         
     except HTTPException:
         raise
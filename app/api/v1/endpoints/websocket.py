@@ -29,8 +29,9 @@ from fastapi.security import HTTPBearer
 from pydantic import BaseModel, Field, ValidationError
 
 from app.core.config import get_settings
-from app.core.dependencies import get_current_user_websocket
+from app.core.dependencies import get_current_user, get_current_user_websocket
 from app.domain.schemas.user import User
+from app.infrastructure.cache.progress_bus import JobProgressBus, publish_job_progress
 from app.services.document_processing.async_processor import AsyncDocumentProcessor
 from app.services.document_processing.progress.tracker import ProgressTracker
 from app.services.document_processing.storage.s3_manager import S3StorageManager
@@ -125,6 +126,7 @@ class WebSocketManager:
         self.progress_tracker: Optional[ProgressTracker] = None
         self.async_processor: Optional[AsyncDocumentProcessor] = None
         self.storage_manager: Optional[S3StorageManager] = None
+        self.progress_bus: Optional[JobProgressBus] = None
         
         # Statistics
         self.total_connections = 0
@@ -150,6 +152,47 @@ class WebSocketManager:
         except Exception as e:
             logger.error(f"Failed to initialize WebSocket dependencies: {e}")
             raise
+        
+        await self.start_progress_bus()
+
+    async def start_progress_bus(self) -> None:
+        """Subscribe to cross-worker job progress frames."""
+        if self.progress_bus and self.progress_bus.is_running:
+            return
+        
+        self.progress_bus = JobProgressBus(
+            dispatcher=self._dispatch_bus_frame,
+            interested=self._has_local_job_subscribers,
+        )
+        try:
+            await self.progress_bus.start()
+        except Exception as e:
+            # Degrade to process-local delivery rather than refusing connections
+            logger.warning(f"Job progress bus unavailable, using local delivery only: {e}")
+            await self.progress_bus.stop()
+            self.progress_bus = None
+
+    async def shutdown(self) -> None:
+        """Release the progress bus subscription."""
+        if self.progress_bus:
+            await self.progress_bus.stop()
+            self.progress_bus = None
+
+    def _has_local_job_subscribers(self, job_id: str) -> bool:
+        """Check whether any socket on this worker follows the job."""
+        try:
+            return UUID(job_id) in self.job_subscriptions
+        except ValueError:
+            return False
+
+    async def _dispatch_bus_frame(
+        self,
+        job_id: str,
+        progress_data: Dict[str, Any],
+        published_at: float
+    ) -> None:
+        """Deliver a progress frame received from the bus to local sockets."""
+        await self.deliver_job_progress(UUID(job_id), progress_data)
 
     async def connect(
         self,
@@ -272,7 +315,27 @@ class WebSocketManager:
         job_id: UUID,
         progress_data: Dict[str, Any]
     ) -> None:
-        """Broadcast job progress to subscribed connections."""
+        """
+        Broadcast job progress to subscribed connections on every worker.
+        
+        The update is published to the job's Redis channel; when this process
+        is listening on the bus its own sockets are served by the listener,
+        otherwise (no listener, or Redis unreachable) they are served directly.
+        """
+        if self.progress_bus and self.progress_bus.is_running:
+            if await self.progress_bus.publish(job_id, progress_data):
+                return
+        else:
+            await publish_job_progress(job_id, progress_data)
+        
+        await self.deliver_job_progress(job_id, progress_data)
+
+    async def deliver_job_progress(
+        self,
+        job_id: UUID,
+        progress_data: Dict[str, Any]
+    ) -> None:
+        """Send job progress to connections held by this worker."""
         if job_id not in self.job_subscriptions:
             return
         
@@ -377,7 +440,8 @@ class WebSocketManager:
             "errors_count": self.errors_count,
             "job_subscriptions": len(self.job_subscriptions),
             "channel_subscriptions": len(self.channel_subscriptions),
-            "user_connections": len(self.user_connections)
+            "user_connections": len(self.user_connections),
+            "progress_bus": self.progress_bus.get_stats() if self.progress_bus else None
         }
 
 
@@ -391,6 +455,12 @@ async def startup_websocket_manager():
     await websocket_manager.initialize_dependencies()
 
 
+@router.on_event("shutdown")
+async def shutdown_websocket_manager():
+    """Release WebSocket manager resources on shutdown."""
+    await websocket_manager.shutdown()
+
+
 @router.websocket("/progress")
 async def websocket_progress_endpoint(
     websocket: WebSocket,
@@ -692,7 +762,12 @@ async def start_cleanup_task():
 # Utility functions for external services to broadcast messages
 
 async def broadcast_job_progress(job_id: UUID, progress_data: Dict[str, Any]) -> None:
-    """Utility function to broadcast job progress updates."""
+    """
+    Utility function to broadcast job progress updates.
+    
+    Usable from worker processes too: the update is published over Redis and
+    reaches clients connected to any API worker.
+    """
     await websocket_manager.broadcast_job_progress(job_id, progress_data)
 
 
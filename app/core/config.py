@@ -3,10 +3,10 @@ Application configuration management using Pydantic Settings.
 """
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Optional
 
 from pydantic import Field, PostgresDsn, RedisDsn, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -55,6 +55,10 @@ class Settings(BaseSettings):
     POSTGRES_PORT: int = 5432
     POSTGRES_DB: str = "slidegenie"
     DATABASE_URL: Optional[PostgresDsn] = None
+    DATABASE_REPLICA_URLS: Annotated[List[str], NoDecode] = []  # Read replicas, comma-separated in env
+    DATABASE_REPLICA_MAX_LAG_SECONDS: float = 5.0
+    DATABASE_REPLICA_LAG_CHECK_INTERVAL: float = 2.0
+    DATABASE_READ_YOUR_WRITES_SECONDS: float = 30.0
     
     # Redis
     REDIS_HOST: str = "localhost"
@@ -63,6 +67,10 @@ class Settings(BaseSettings):
     REDIS_PASSWORD: Optional[str] = None
     REDIS_URL: Optional[RedisDsn] = None
     
+    # View counters
+    VIEW_COUNT_BACKEND: str = "redis"  # Options: "redis", "memory"
+    VIEW_COUNT_FLUSH_INTERVAL: float = 10.0  # Seconds between batched writes
+    
     # MinIO (S3-compatible storage)
     MINIO_ENDPOINT: str = "localhost:9000"
     MINIO_ACCESS_KEY: str
@@ -189,6 +197,13 @@ class Settings(BaseSettings):
             return f"redis://:{password}@{host}:{port}/{db}"
         return f"redis://{host}:{port}/{db}"
     
+    @field_validator("DATABASE_REPLICA_URLS", mode="before")
+    @classmethod
+    def assemble_replica_urls(cls, v: str | List[str]) -> List[str]:
+        if isinstance(v, str):
+            return [i.strip() for i in v.split(",") if i.strip()]
+        return v
+    
     @field_validator("BACKEND_CORS_ORIGINS", mode="before")
     @classmethod
     def assemble_cors_origins(cls, v: str | List[str]) -> List[str]:
@@ -0,0 +1,262 @@
+"""
+Redis pub/sub fan-out for job progress updates.
+
+Producers (API handlers, ARQ/Celery workers) publish compact progress frames
+to a per-job channel. Every API process keeps a single pattern subscription
+and hands incoming frames to a local dispatcher, which delivers them to the
+WebSocket clients connected to that process.
+"""
+import asyncio
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+from uuid import UUID
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
+from app.core.logging import get_logger
+from app.infrastructure.cache.redis import get_redis
+
+logger = get_logger(__name__)
+
+PROGRESS_CHANNEL_PREFIX = "slidegenie:progress:"
+PROGRESS_CHANNEL_PATTERN = f"{PROGRESS_CHANNEL_PREFIX}*"
+
+FrameDispatcher = Callable[[str, Dict[str, Any], float], Awaitable[None]]
+
+
+def job_channel(job_id: Union[UUID, str]) -> str:
+    """
+    Get the pub/sub channel for a job.
+
+    Args:
+        job_id: Job identifier
+
+    Returns:
+        Channel name
+    """
+    return f"{PROGRESS_CHANNEL_PREFIX}{job_id}"
+
+
+def encode_frame(job_id: Union[UUID, str], data: Dict[str, Any]) -> str:
+    """
+    Encode a progress update as a compact frame.
+
+    Args:
+        job_id: Job identifier
+        data: Progress payload
+
+    Returns:
+        Serialized frame
+    """
+    return json.dumps(
+        {"j": str(job_id), "t": round(time.time(), 3), "d": data},
+        separators=(",", ":"),
+        default=str,
+    )
+
+
+def decode_frame(raw: Union[str, bytes]) -> Tuple[str, Dict[str, Any], float]:
+    """
+    Decode a progress frame.
+
+    Args:
+        raw: Serialized frame
+
+    Returns:
+        Tuple of (job_id, data, published_at)
+    """
+    frame = json.loads(raw)
+    return frame["j"], frame.get("d") or {}, float(frame.get("t", 0.0))
+
+
+async def publish_job_progress(
+    job_id: Union[UUID, str],
+    data: Dict[str, Any],
+    client: Optional[redis.Redis] = None,
+) -> bool:
+    """
+    Publish a progress update for a job.
+
+    Safe to call from any process, including workers that never accept
+    WebSocket connections.
+
+    Args:
+        job_id: Job identifier
+        data: Progress payload
+        client: Optional Redis client (defaults to the shared pool)
+
+    Returns:
+        True if the frame was handed to Redis
+    """
+    try:
+        client = client or await get_redis()
+        await client.publish(job_channel(job_id), encode_frame(job_id, data))
+        return True
+    except RedisError as e:
+        logger.error(f"Progress publish error for job {job_id}: {e}")
+        return False
+
+
+class JobProgressBus:
+    """
+    Process-wide listener for job progress frames.
+
+    Holds one pattern subscription per process regardless of how many jobs
+    or sockets are active, and skips decoding frames for jobs that have no
+    local subscribers.
+    """
+
+    def __init__(
+        self,
+        dispatcher: FrameDispatcher,
+        interested: Optional[Callable[[str], bool]] = None,
+        client: Optional[redis.Redis] = None,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+    ):
+        self.dispatcher = dispatcher
+        self.interested = interested
+        self.client = client
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+
+        self._pubsub: Optional[redis.client.PubSub] = None
+        self._listener_task: Optional[asyncio.Task] = None
+        self._subscribed = asyncio.Event()
+        self._stopping = False
+
+        # Statistics
+        self.frames_published = 0
+        self.frames_received = 0
+        self.frames_skipped = 0
+        self.frames_dropped = 0
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the listener is subscribed and consuming frames."""
+        return (
+            self._listener_task is not None
+            and not self._listener_task.done()
+            and self._subscribed.is_set()
+        )
+
+    async def start(self, timeout: float = 5.0) -> None:
+        """
+        Start the pattern subscription.
+
+        Args:
+            timeout: Seconds to wait for the first subscription
+        """
+        if self._listener_task and not self._listener_task.done():
+            return
+
+        self._stopping = False
+        self.client = self.client or await get_redis()
+        self._listener_task = asyncio.create_task(self._listen_loop())
+        await asyncio.wait_for(self._subscribed.wait(), timeout)
+        logger.info(f"Job progress bus subscribed to {PROGRESS_CHANNEL_PATTERN}")
+
+    async def stop(self) -> None:
+        """Stop the listener and release the subscription."""
+        self._stopping = True
+        self._subscribed.clear()
+
+        if self._listener_task:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+
+        await self._close_pubsub()
+
+    async def publish(self, job_id: Union[UUID, str], data: Dict[str, Any]) -> bool:
+        """
+        Publish a progress update through this bus's client.
+
+        Args:
+            job_id: Job identifier
+            data: Progress payload
+
+        Returns:
+            True if the frame was handed to Redis
+        """
+        published = await publish_job_progress(job_id, data, client=self.client)
+        if published:
+            self.frames_published += 1
+        return published
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get bus statistics."""
+        return {
+            "running": self.is_running,
+            "frames_published": self.frames_published,
+            "frames_received": self.frames_received,
+            "frames_skipped": self.frames_skipped,
+            "frames_dropped": self.frames_dropped,
+        }
+
+    async def _listen_loop(self) -> None:
+        """Consume frames, resubscribing with backoff on connection loss."""
+        delay = self.reconnect_delay
+
+        while not self._stopping:
+            try:
+                self._pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                await self._pubsub.psubscribe(PROGRESS_CHANNEL_PATTERN)
+                self._subscribed.set()
+                delay = self.reconnect_delay
+
+                async for message in self._pubsub.listen():
+                    if message.get("type") == "pmessage":
+                        await self._handle_message(message)
+
+            except asyncio.CancelledError:
+                raise
+            except (RedisError, OSError) as e:
+                self._subscribed.clear()
+                logger.warning(f"Job progress bus disconnected, retrying in {delay}s: {e}")
+                await self._close_pubsub()
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+            finally:
+                # Release this subscription's connection before the next
+                # one, also when listen() ends without an error
+                await self._close_pubsub()
+
+    async def _handle_message(self, message: Dict[str, Any]) -> None:
+        """Route a single pub/sub message to the dispatcher."""
+        channel = message["channel"]
+        if isinstance(channel, bytes):
+            channel = channel.decode()
+
+        job_id = channel[len(PROGRESS_CHANNEL_PREFIX):]
+        self.frames_received += 1
+
+        # Cheap channel-name check before paying for JSON decoding
+        if self.interested is not None and not self.interested(job_id):
+            self.frames_skipped += 1
+            return
+
+        try:
+            _, data, published_at = decode_frame(message["data"])
+            await self.dispatcher(job_id, data, published_at)
+        except (ValueError, KeyError, TypeError) as e:
+            self.frames_dropped += 1
+            logger.error(f"Malformed progress frame on {channel}: {e}")
+        except Exception as e:
+            self.frames_dropped += 1
+            logger.error(f"Progress dispatch error for job {job_id}: {e}")
+
+    async def _close_pubsub(self) -> None:
+        """Close the current pub/sub connection, ignoring errors."""
+        if self._pubsub is None:
+            return
+        try:
+            await self._pubsub.aclose()
+        except Exception:
+            pass
+        self._pubsub = None
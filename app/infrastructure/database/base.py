@@ -9,6 +9,7 @@ from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 from app.core.config import settings
+from app.infrastructure.database.routing import ReplicaRouter
 
 # Create async engine
 engine = create_async_engine(
@@ -27,6 +28,30 @@ AsyncSessionLocal = sessionmaker(
     expire_on_commit=False,
 )
 
+# Read replicas, used for read-only units of work and replica_read methods
+replica_engines = [
+    create_async_engine(
+        url,
+        echo=settings.DEBUG,
+        pool_pre_ping=True,
+        pool_size=20,
+        max_overflow=40,
+        pool_recycle=3600,
+    )
+    for url in settings.DATABASE_REPLICA_URLS
+]
+
+session_router = ReplicaRouter(
+    AsyncSessionLocal,
+    [
+        sessionmaker(replica_engine, class_=AsyncSession, expire_on_commit=False)
+        for replica_engine in replica_engines
+    ],
+    max_lag_seconds=settings.DATABASE_REPLICA_MAX_LAG_SECONDS,
+    lag_check_interval=settings.DATABASE_REPLICA_LAG_CHECK_INTERVAL,
+    read_your_writes_seconds=settings.DATABASE_READ_YOUR_WRITES_SECONDS,
+)
+
 # Custom naming convention for constraints
 convention = {
     "ix": "ix_%(column_0_label)s",
@@ -59,11 +84,31 @@ async def get_db() -> AsyncSession:
     """
     Dependency to get database session.
     
+    The session is on the primary; repository methods marked replica_read
+    may still be served by a replica.
+    
+    Yields:
+        AsyncSession: Database session
+    """
+    async with session_router.primary_session() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+async def get_read_db() -> AsyncSession:
+    """
+    Dependency to get a read-only database session.
+    
+    The session is on a replica unless replicas lag or this request has
+    committed to the primary.
+    
     Yields:
         AsyncSession: Database session
     """
-    async with AsyncSessionLocal() as session:
+    async with await session_router.read_session() as session:
         try:
             yield session
         finally:
-            await session.close()
\ No newline at end of file
+            await session.rollback()
\ No newline at end of file
@@ -0,0 +1,7 @@
+"""
+Constants shared by the database models and the repositories.
+"""
+
+# Spacing of the sparse slide position key; a slide created without a
+# position gets its slide number times the gap
+POSITION_GAP = 1024
@@ -9,6 +9,7 @@ from sqlalchemy import (
     BigInteger,
     Boolean,
     Column,
+    Computed,
     DateTime,
     Enum,
     Float,
@@ -21,13 +22,24 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID, ARRAY
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID, ARRAY, ExcludeConstraint
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship, validates
 from sqlalchemy_utils import TSVectorType
 
+# Import pgvector extension
+try:
+    import pgvector.sqlalchemy as pgvector
+except ImportError:
+    # Fallback for development without pgvector
+    class pgvector:
+        VECTOR = lambda x: ARRAY(Float)
+
 from app.infrastructure.database.base import Base
+from app.infrastructure.database.constants import POSITION_GAP
+from app.infrastructure.database.search_text import SEARCH_VECTOR_EXPRESSION, slide_search_text
 
 
 class TimestampMixin:
@@ -204,7 +216,7 @@ class Presentation(Base, TimestampMixin):
     owner = relationship("User", back_populates="presentations", foreign_keys=[owner_id])
     authors = relationship("User", secondary=presentation_authors, back_populates="authored_presentations")
     template = relationship("Template", back_populates="presentations")
-    slides = relationship("Slide", back_populates="presentation", cascade="all, delete-orphan", order_by="Slide.slide_number")
+    slides = relationship("Slide", back_populates="presentation", cascade="all, delete-orphan", order_by="Slide.position")
     references = relationship("Reference", back_populates="presentation", cascade="all, delete-orphan")
     generation_jobs = relationship("GenerationJob", back_populates="presentation")
     exports = relationship("Export", back_populates="presentation", cascade="all, delete-orphan")
@@ -221,11 +233,17 @@ class Presentation(Base, TimestampMixin):
     )
 
 
+def _default_slide_position(context):
+    """Space slides created without a position by their slide number."""
+    return context.get_current_parameters()['slide_number'] * POSITION_GAP
+
+
 class Slide(Base, TimestampMixin):
     """Slide model with flexible content structure."""
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     presentation_id = Column(UUID(as_uuid=True), ForeignKey('presentation.id'), nullable=False)
-    slide_number = Column(Integer, nullable=False)
+    slide_number = Column(Integer, nullable=False)  # Dense 1-based number shown to users
+    position = Column(BigInteger, nullable=False, default=_default_slide_position)  # Sparse ordering key
     
     # Content structure using JSONB for flexibility
     content = Column(JSONB, nullable=False, default=dict)
@@ -271,6 +289,11 @@ class Slide(Base, TimestampMixin):
     # Speaker notes
     speaker_notes = Column(Text)
     
+    # In-deck search: readable content text, extracted on write, and the
+    # full-text vector PostgreSQL generates from it
+    search_text = Column(Text)
+    search_vector = Column(TSVECTOR, Computed(SEARCH_VECTOR_EXPRESSION, persisted=True))
+    
     # Visibility
     is_hidden = Column(Boolean, default=False)  # Skip in presentation mode
     is_backup = Column(Boolean, default=False)  # Backup slide
@@ -280,14 +303,31 @@ class Slide(Base, TimestampMixin):
     
     # Unique constraint and indexes
     __table_args__ = (
-        UniqueConstraint('presentation_id', 'slide_number', name='uq_presentation_slide_number'),
+        # Live slide numbers are unique once a transaction commits, so the
+        # renumbering UPDATE may pass through duplicates
+        ExcludeConstraint(
+            ('presentation_id', '='), ('slide_number', '='),
+            name='uq_presentation_slide_number',
+            using='btree',
+            where=text('deleted_at IS NULL'),
+            deferrable=True,
+            initially='DEFERRED'
+        ),
         Index('idx_slide_presentation_number', 'presentation_id', 'slide_number'),
+        Index('idx_slide_presentation_position', 'presentation_id', 'position'),
         Index('idx_slide_content', 'content', postgresql_using='gin'),
+        Index('idx_slide_search', 'search_vector', postgresql_using='gin'),
+        Index('idx_slide_title_trgm', 'title', postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}),
+        Index(
+            'idx_slide_speaker_notes_trgm', 'speaker_notes',
+            postgresql_using='gin', postgresql_ops={'speaker_notes': 'gin_trgm_ops'}
+        ),
     )
     
     @validates('content')
     def validate_content(self, key, content):
         """Validate and extract metadata from content."""
+        self.search_text = slide_search_text(content)
         if content:
             # Extract metadata for easier querying
             self.contains_equations = any(
@@ -600,6 +640,7 @@ class PresentationEmbedding(Base):
     embedding_type = Column(String(50))  # title, abstract, content, combined
     embedding_model = Column(String(100))  # Model used to generate embedding
     embedding_vector = Column('embedding', pgvector.VECTOR(1536))  # OpenAI ada-002 dimension
+    content_hash = Column(String(64))  # Hash of the source text, to skip unchanged re-embeds
     
     # Metadata
     generated_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -609,7 +650,15 @@ class PresentationEmbedding(Base):
     
     # Indexes
     __table_args__ = (
-        Index('idx_embedding_vector', 'embedding_vector', postgresql_using='ivfflat'),
+        UniqueConstraint('presentation_id', 'embedding_type', name='uq_presentation_embedding_type'),
+        Index(
+            'idx_embedding_combined_hnsw',
+            'embedding',
+            postgresql_using='hnsw',
+            postgresql_with={'m': 16, 'ef_construction': 64},
+            postgresql_ops={'embedding': 'vector_l2_ops'},
+            postgresql_where=text("embedding_type = 'combined'"),
+        ),
     )
 
 
@@ -643,12 +692,3 @@ class APIKey(Base, TimestampMixin):
     __table_args__ = (
         Index('idx_api_key_prefix', 'key_prefix'),
     )
-
-
-# Import pgvector extension
-try:
-    import pgvector.sqlalchemy as pgvector
-except ImportError:
-    # Fallback for development without pgvector
-    class pgvector:
-        VECTOR = lambda x: ARRAY(Float)
\ No newline at end of file
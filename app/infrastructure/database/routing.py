@@ -0,0 +1,255 @@
+"""
+Read-replica session routing.
+
+Writes always go to the primary. Reads go to a replica when:
+
+- the unit of work is read-only, or a repository method is marked with
+  replica_read;
+- the session they would otherwise share has no uncommitted writes;
+- nothing was committed to the primary earlier in the same request
+  (read-your-writes), within read_your_writes_seconds;
+- a replica's last measured replication lag is within max_lag_seconds.
+
+Otherwise the read falls back to the primary. Replica lag is measured with
+a probe query at most every lag_check_interval seconds per replica; a
+failing probe takes the replica out of rotation until the next check.
+"""
+import copy
+import functools
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional, Sequence
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+logger = logging.getLogger(__name__)
+
+SessionFactory = Callable[[], AsyncSession]
+LagProbe = Callable[[AsyncSession], Awaitable[float]]
+
+# Keys of AsyncSession.info set on routed sessions
+ROUTER_KEY = "replica_router"
+ROLE_KEY = "database_role"
+WRITES_KEY = "has_uncommitted_writes"
+
+PRIMARY = "primary"
+REPLICA = "replica"
+
+# Monotonic time of the last primary commit in the current request context
+_last_commit_at: ContextVar[Optional[float]] = ContextVar("last_primary_commit_at", default=None)
+
+# Zero while the replica has replayed everything it received, so an idle
+# primary does not read as lag
+REPLICATION_LAG_QUERY = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+
+async def postgres_replication_lag(session: AsyncSession) -> float:
+    """Measure a PostgreSQL replica's replay lag in seconds."""
+    result = await session.execute(REPLICATION_LAG_QUERY)
+    return float(result.scalar() or 0)
+
+
+@dataclass
+class RoutingStats:
+    """Counters of routing decisions."""
+    replica_reads: int = 0
+    primary_reads: int = 0
+    sticky_reads: int = 0
+    lag_fallbacks: int = 0
+    probe_failures: int = 0
+
+
+@dataclass
+class ReplicaState:
+    """Last measured state of one replica."""
+    session_factory: SessionFactory
+    lag: Optional[float] = None
+    checked_at: Optional[float] = None
+    healthy: bool = True
+
+
+class ReplicaRouter:
+    """
+    Chooses the primary or a replica for each session.
+    """
+
+    def __init__(
+        self,
+        primary: SessionFactory,
+        replicas: Sequence[SessionFactory] = (),
+        max_lag_seconds: float = 5.0,
+        lag_check_interval: float = 2.0,
+        read_your_writes_seconds: float = 30.0,
+        lag_probe: LagProbe = postgres_replication_lag,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize router.
+
+        Args:
+            primary: Session factory of the primary
+            replicas: Session factories of the replicas
+            max_lag_seconds: Replication lag beyond which a replica is skipped
+            lag_check_interval: Seconds a lag measurement stays valid
+            read_your_writes_seconds: How long reads in a request stay on
+                the primary after it committed
+            lag_probe: Measures a replica's lag through one of its sessions
+            clock: Monotonic time source
+        """
+        self.primary = primary
+        self.replicas = [ReplicaState(factory) for factory in replicas]
+        self.max_lag_seconds = max_lag_seconds
+        self.lag_check_interval = lag_check_interval
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self.lag_probe = lag_probe
+        self.clock = clock
+
+        self.stats = RoutingStats()
+        self._next_replica = 0
+
+    def primary_session(self) -> AsyncSession:
+        """
+        Open a session on the primary.
+
+        Commits of the session make later reads in the same request
+        context read from the primary.
+        """
+        session = self.primary()
+        session.info[ROUTER_KEY] = self
+        session.info[ROLE_KEY] = PRIMARY
+        session.info[WRITES_KEY] = False
+        self._track_writes(session)
+        return session
+
+    async def read_session(self) -> AsyncSession:
+        """Open a session for reads, on a replica when one may serve them."""
+        factory = await self.replica_factory()
+        if factory is None:
+            return self.primary_session()
+
+        session = factory()
+        session.info[ROUTER_KEY] = self
+        session.info[ROLE_KEY] = REPLICA
+        return session
+
+    async def replica_factory(self) -> Optional[SessionFactory]:
+        """
+        Choose a replica for a read.
+
+        Returns:
+            Session factory of the replica, or None to read from the primary
+        """
+        if not self.replicas:
+            self.stats.primary_reads += 1
+            return None
+
+        last_commit = _last_commit_at.get()
+        if last_commit is not None and self.clock() - last_commit < self.read_your_writes_seconds:
+            self.stats.sticky_reads += 1
+            self.stats.primary_reads += 1
+            return None
+
+        for offset in range(len(self.replicas)):
+            index = (self._next_replica + offset) % len(self.replicas)
+            replica = self.replicas[index]
+            if await self._is_current(replica):
+                self._next_replica = index + 1
+                self.stats.replica_reads += 1
+                return replica.session_factory
+
+        self.stats.lag_fallbacks += 1
+        self.stats.primary_reads += 1
+        return None
+
+    def record_commit(self) -> None:
+        """Keep reads in this request context on the primary for a while."""
+        _last_commit_at.set(self.clock())
+
+    async def _is_current(self, replica: ReplicaState) -> bool:
+        """Check whether a replica is healthy and within max_lag_seconds."""
+        now = self.clock()
+        if replica.checked_at is None or now - replica.checked_at >= self.lag_check_interval:
+            # Stamp first, so concurrent reads use the last state instead
+            # of probing too
+            replica.checked_at = now
+            try:
+                async with replica.session_factory() as session:
+                    replica.lag = await self.lag_probe(session)
+                replica.healthy = True
+            except Exception as e:
+                replica.healthy = False
+                self.stats.probe_failures += 1
+                logger.warning(f"Replica lag probe failed: {e}")
+
+        return replica.healthy and replica.lag is not None and replica.lag <= self.max_lag_seconds
+
+    def _track_writes(self, session: AsyncSession) -> None:
+        sync_session = session.sync_session
+
+        @event.listens_for(sync_session, "after_flush")
+        def after_flush(sync_session, flush_context):
+            sync_session.info[WRITES_KEY] = True
+
+        # Set-based INSERT, UPDATE and DELETE statements bypass the flush
+        @event.listens_for(sync_session, "do_orm_execute")
+        def do_orm_execute(execute_state):
+            if execute_state.is_insert or execute_state.is_update or execute_state.is_delete:
+                execute_state.session.info[WRITES_KEY] = True
+
+        @event.listens_for(sync_session, "after_commit")
+        def after_commit(sync_session):
+            if sync_session.info.get(WRITES_KEY):
+                self.record_commit()
+            sync_session.info[WRITES_KEY] = False
+
+        @event.listens_for(sync_session, "after_rollback")
+        def after_rollback(sync_session):
+            sync_session.info[WRITES_KEY] = False
+
+
+def has_uncommitted_writes(session: AsyncSession) -> bool:
+    """Check whether a session holds changes a replica cannot see."""
+    return bool(session.info.get(WRITES_KEY) or session.new or session.dirty or session.deleted)
+
+
+def replica_read(method: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """
+    Mark a repository read method as safe to serve from a replica.
+
+    When the repository's session is a routed primary session without
+    uncommitted writes, the method runs on a copy of the repository bound to
+    a replica session. Results must not rely on lazy loading, since that
+    session is closed when the method returns.
+    """
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        router: Optional[ReplicaRouter] = self.db.info.get(ROUTER_KEY)
+        if (
+            router is None
+            or self.db.info.get(ROLE_KEY) != PRIMARY
+            or has_uncommitted_writes(self.db)
+        ):
+            return await method(self, *args, **kwargs)
+
+        factory = await router.replica_factory()
+        if factory is None:
+            return await method(self, *args, **kwargs)
+
+        async with factory() as session:
+            session.info[ROUTER_KEY] = router
+            session.info[ROLE_KEY] = REPLICA
+            replica_repository = copy.copy(self)
+            replica_repository.db = session
+            return await method(replica_repository, *args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,47 @@
+"""
+Slide search text shared by the database models and the repositories.
+
+Each slide stores the readable text of its JSONB content in search_text,
+and PostgreSQL keeps search_vector generated from it.
+"""
+from typing import Any, Iterator
+
+
+SEARCH_CONFIG = "english"
+
+# Expression of the generated search_vector column; to_tsvector with an
+# explicit configuration is immutable, as generated columns require
+SEARCH_VECTOR_EXPRESSION = f"to_tsvector('{SEARCH_CONFIG}', coalesce(search_text, ''))"
+
+# Content keys holding text a reader sees; layout, style, URLs and chart
+# data are left out of the search text
+TEXT_KEYS = frozenset({
+    "title", "subtitle", "body", "content", "text", "items",
+    "caption", "headers", "rows", "notes",
+})
+
+
+def _text_values(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        if value.strip():
+            yield value.strip()
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            if key in TEXT_KEYS:
+                yield from _text_values(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _text_values(item)
+
+
+def slide_search_text(content: Any) -> str:
+    """
+    Extract the searchable text of slide content.
+
+    Args:
+        content: Slide content structure
+
+    Returns:
+        Text values joined by newlines
+    """
+    return "\n".join(_text_values(content or {}))
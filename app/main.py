@@ -16,7 +16,8 @@ from structlog.contextvars import bind_contextvars, clear_contextvars
 from app.api.v1.router import api_router
 from app.core.config import settings
 from app.core.logging import get_logger, log_request_details, setup_logging
-from app.infrastructure.database.base import engine
+from app.infrastructure.database.base import engine, replica_engines
+from app.services.counters import get_view_count_buffer
 
 # Setup logging
 setup_logging()
@@ -54,11 +55,17 @@ async def lifespan(app: FastAPI):
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
     
+    view_counts = await get_view_count_buffer()
+    await view_counts.start()
+    
     yield
     
     # Shutdown
     logger.info("Shutting down SlideGenie API")
+    await view_counts.stop()
     await engine.dispose()
+    for replica_engine in replica_engines:
+        await replica_engine.dispose()
 
 
 # Create FastAPI application
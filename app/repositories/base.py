@@ -1,7 +1,11 @@
 """
 Base repository implementation.
+
+Statement builders used by the repositories take tables rather than ORM
+models, so they can run against any schema with the same column names.
 """
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Generic, List, Optional, Type, TypeVar
 from uuid import UUID
 
 from sqlalchemy import select
@@ -10,6 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.infrastructure.database.base import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
+RepositoryType = TypeVar("RepositoryType", bound="BaseRepository")
 
 
 class BaseRepository(Generic[ModelType]):
@@ -23,6 +28,47 @@ class BaseRepository(Generic[ModelType]):
         self.model = model
         self.db = db
     
+    @classmethod
+    @asynccontextmanager
+    async def session_scope(
+        cls: Type[RepositoryType],
+        session_factory: Callable[[], AsyncSession],
+    ) -> AsyncIterator[RepositoryType]:
+        """
+        Open a repository on its own session, committing on success.
+        
+        For background writers that outlive request sessions.
+        
+        Args:
+            session_factory: Session factory, e.g. AsyncSessionLocal
+        """
+        async with session_factory() as session:
+            yield cls(session)
+            await session.commit()
+    
+    @classmethod
+    def session_writer(
+        cls: Type[RepositoryType],
+        session_factory: Callable[[], AsyncSession],
+        write: Callable[..., Awaitable[Any]],
+    ) -> Callable[..., Awaitable[None]]:
+        """
+        Build a callable running one write in its own session scope.
+        
+        Args:
+            session_factory: Session factory, e.g. AsyncSessionLocal
+            write: Async callable taking the repository, then the
+                callable's own arguments
+            
+        Returns:
+            Async callable committing each write
+        """
+        async def write_in_scope(*args: Any) -> None:
+            async with cls.session_scope(session_factory) as repository:
+                await write(repository, *args)
+        
+        return write_in_scope
+    
     async def create(
         self,
         data: Dict[str, Any],
@@ -0,0 +1,215 @@
+"""
+Presentation embedding repository implementation.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.database.models import Presentation, PresentationEmbedding
+from app.repositories.base import BaseRepository
+
+
+COMBINED_EMBEDDING = "combined"
+
+# Candidates the index returns before deleted presentations are filtered
+# out, as a multiple of the requested results
+CANDIDATE_FACTOR = 2
+
+NEAREST_COMBINED_SQL = """
+    SELECT nearest.presentation_id, nearest.distance
+    FROM (
+        SELECT pe.presentation_id, pe.embedding <-> CAST(:embedding AS vector) AS distance
+        FROM presentationembedding pe
+        WHERE pe.embedding_type = 'combined'
+        {exclusion}
+        ORDER BY pe.embedding <-> CAST(:embedding AS vector)
+        LIMIT :candidates
+    ) nearest
+    INNER JOIN presentation p ON p.id = nearest.presentation_id
+    WHERE p.deleted_at IS NULL
+    ORDER BY nearest.distance
+    LIMIT :limit
+"""
+
+NEAREST_COMBINED_QUERY = text(NEAREST_COMBINED_SQL.format(exclusion=""))
+
+# A NULL :exclude_id would make "<>" unknown and drop every row, so the
+# predicate is only present when there is a presentation to leave out
+NEAREST_COMBINED_EXCLUDING_QUERY = text(
+    NEAREST_COMBINED_SQL.format(exclusion="AND pe.presentation_id <> :exclude_id")
+)
+
+
+class EmbeddingRepository(BaseRepository[PresentationEmbedding]):
+    """Repository for presentation embeddings and nearest-neighbour queries."""
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(PresentationEmbedding, db)
+
+    async def get_combined_embedding(self, presentation_id: UUID) -> Optional[str]:
+        """
+        Get a presentation's combined embedding in pgvector text form.
+
+        Args:
+            presentation_id: Presentation ID
+
+        Returns:
+            Embedding or None
+        """
+        result = await self.db.execute(
+            text("""
+                SELECT embedding::text
+                FROM presentationembedding
+                WHERE presentation_id = :presentation_id
+                AND embedding_type = 'combined'
+            """),
+            {"presentation_id": presentation_id}
+        )
+        return result.scalar()
+
+    async def nearest_combined(
+        self,
+        embedding: str,
+        limit: int = 10,
+        exclude_id: Optional[UUID] = None,
+        ef_search: Optional[int] = None,
+    ) -> List[Tuple[UUID, float]]:
+        """
+        Find presentations with the nearest combined embeddings.
+
+        The inner query orders embeddings by distance under a LIMIT with
+        no DISTINCT or joins, so PostgreSQL answers it from the HNSW index;
+        the outer query drops deleted presentations.
+
+        Args:
+            embedding: Query embedding in pgvector text form
+            limit: Maximum results
+            exclude_id: Presentation to leave out, e.g. the query's own
+            ef_search: HNSW candidate list size, trading latency for recall
+
+        Returns:
+            List of (presentation ID, L2 distance), nearest first
+        """
+        candidates = limit * CANDIDATE_FACTOR
+        if ef_search is not None:
+            # Transaction-local; the index never returns more than
+            # ef_search rows
+            await self.db.execute(
+                text("SELECT set_config('hnsw.ef_search', :ef_search, true)"),
+                {"ef_search": str(max(ef_search, candidates))}
+            )
+
+        params = {"embedding": embedding, "candidates": candidates, "limit": limit}
+        query = NEAREST_COMBINED_QUERY
+        if exclude_id is not None:
+            params["exclude_id"] = exclude_id
+            query = NEAREST_COMBINED_EXCLUDING_QUERY
+
+        result = await self.db.execute(query, params)
+        return [(row.presentation_id, row.distance) for row in result]
+
+    async def get_embedding_sources(
+        self,
+        presentation_ids: Sequence[UUID],
+    ) -> Dict[UUID, str]:
+        """
+        Get the text each presentation's combined embedding is built from.
+
+        Args:
+            presentation_ids: Presentation IDs
+
+        Returns:
+            Text by presentation ID, for presentations that exist
+        """
+        stmt = (
+            select(
+                Presentation.id,
+                Presentation.title,
+                Presentation.subtitle,
+                Presentation.abstract,
+                Presentation.description,
+                Presentation.keywords,
+                Presentation.field_of_study,
+            )
+            .where(
+                and_(
+                    Presentation.id.in_(presentation_ids),
+                    Presentation.deleted_at.is_(None)
+                )
+            )
+        )
+
+        result = await self.db.execute(stmt)
+        sources = {}
+        for row in result:
+            parts = [row.title, row.subtitle, row.abstract, row.description, row.field_of_study]
+            if row.keywords:
+                parts.append(", ".join(row.keywords))
+            sources[row.id] = "\n".join(part for part in parts if part)
+        return sources
+
+    async def get_content_hashes(
+        self,
+        presentation_ids: Sequence[UUID],
+    ) -> Dict[UUID, str]:
+        """
+        Get the source text hashes of stored combined embeddings.
+
+        Args:
+            presentation_ids: Presentation IDs
+
+        Returns:
+            Hash by presentation ID, for presentations with an embedding
+        """
+        stmt = (
+            select(PresentationEmbedding.presentation_id, PresentationEmbedding.content_hash)
+            .where(
+                and_(
+                    PresentationEmbedding.presentation_id.in_(presentation_ids),
+                    PresentationEmbedding.embedding_type == COMBINED_EMBEDDING
+                )
+            )
+        )
+
+        result = await self.db.execute(stmt)
+        return {row.presentation_id: row.content_hash for row in result}
+
+    async def upsert_combined_embeddings(
+        self,
+        rows: Sequence[Tuple[UUID, List[float], str]],
+        model: str,
+    ) -> None:
+        """
+        Insert or replace combined embeddings in one statement.
+
+        Args:
+            rows: (presentation ID, embedding, source text hash) tuples
+            model: Embedding model name
+        """
+        if not rows:
+            return
+
+        stmt = insert(PresentationEmbedding).values([
+            {
+                "presentation_id": presentation_id,
+                "embedding_type": COMBINED_EMBEDDING,
+                "embedding_model": model,
+                "embedding_vector": embedding,
+                "content_hash": text_hash,
+            }
+            for presentation_id, embedding, text_hash in rows
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[PresentationEmbedding.presentation_id, PresentationEmbedding.embedding_type],
+            set_={
+                "embedding_model": stmt.excluded.embedding_model,
+                "embedding": stmt.excluded.embedding,
+                "content_hash": stmt.excluded.content_hash,
+                "generated_at": func.now(),
+            }
+        )
+
+        await self.db.execute(stmt)
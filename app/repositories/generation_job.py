@@ -2,7 +2,7 @@
 Generation job repository implementation.
 """
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from uuid import UUID
 
 from sqlalchemy import select, and_, func
@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.infrastructure.database.models import GenerationJob
 from app.repositories.base import BaseRepository
+from app.repositories.job_progress import progress_update_statement
 
 
 class GenerationJobRepository(BaseRepository[GenerationJob]):
@@ -182,6 +183,59 @@ class GenerationJobRepository(BaseRepository[GenerationJob]):
             }
         )
     
+    @classmethod
+    def progress_writer(
+        cls,
+        session_factory: Callable[[], AsyncSession],
+    ) -> Callable[[UUID, List[Dict[str, Any]], Dict[str, Any]], Awaitable[None]]:
+        """
+        Build a writer applying progress on its own session.
+        
+        Used by JobProgressSink, which outlives request sessions.
+        
+        Args:
+            session_factory: Session factory, e.g. AsyncSessionLocal
+            
+        Returns:
+            Async callable (job ID, step patches, job values)
+        """
+        async def write(
+            jobs: "GenerationJobRepository",
+            job_id: UUID,
+            step_patches: List[Dict[str, Any]],
+            values: Dict[str, Any],
+        ) -> None:
+            await jobs.apply_progress(job_id, step_patches, **values)
+        
+        return cls.session_writer(session_factory, write)
+    
+    async def apply_progress(
+        self,
+        job_id: UUID,
+        step_patches: List[Dict[str, Any]],
+        **values: Any,
+    ) -> None:
+        """
+        Merge step patches and job fields into a job with one UPDATE.
+        
+        Args:
+            job_id: Job ID
+            step_patches: Step fields to set, each with a "step" name
+            **values: Other job columns, e.g. status
+        """
+        if not step_patches and not values:
+            return
+        
+        await self.db.execute(
+            progress_update_statement(
+                GenerationJob.__table__,
+                job_id,
+                step_patches,
+                self.db.get_bind().dialect.name,
+                **values
+            )
+        )
+    
     async def update_progress(
         self,
         job_id: UUID,
@@ -192,42 +246,26 @@ class GenerationJobRepository(BaseRepository[GenerationJob]):
         """
         Update job processing progress.
         
+        Writes only the given step, without loading the job. Callers with
+        frequent progress should go through JobProgressSink, which
+        coalesces ticks.
+        
         Args:
             job_id: Job ID
             step: Current step name
             progress: Progress (0.0 to 1.0)
             step_status: Step status
         """
-        job = await self.get(job_id)
-        if not job:
-            return
-        
-        # Update processing steps
-        steps = job.processing_steps or []
-        
-        # Find or create step
-        step_found = False
-        for s in steps:
-            if s['step'] == step:
-                s['status'] = step_status
-                s['progress'] = progress
-                if step_status == 'completed':
-                    s['duration_ms'] = s.get('duration_ms', 0)
-                step_found = True
-                break
-        
-        if not step_found:
-            steps.append({
+        await self.apply_progress(
+            job_id,
+            [{
                 'step': step,
                 'status': step_status,
                 'progress': progress,
                 'started_at': datetime.now(timezone.utc).isoformat()
-            })
-        
-        await self.update(
-            job_id,
-            {'processing_steps': steps}
+            }]
         )
+        await self.db.commit()
     
     async def get_job_statistics(
         self,
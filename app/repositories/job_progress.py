@@ -0,0 +1,100 @@
+"""
+Partial JSONB updates of generation job progress.
+
+A job's processing_steps array is merged in the database: each step patch
+is applied to the step of the same name, or appended when the job has no
+such step yet, so recording progress neither reads the job nor rewrites
+steps it does not touch.
+"""
+import json
+from typing import Any, Dict, Sequence
+
+from sqlalchemy import Table, text, update
+from sqlalchemy.sql import Executable
+
+
+# Merged steps keep their original order, followed by new steps in patch
+# order. started_at only applies to new steps.
+_MERGE_STEPS_SQL = {
+    'postgresql': """(
+        SELECT coalesce(jsonb_agg(merged.step ORDER BY merged.grp, merged.ord), '[]'::jsonb)
+        FROM (
+            SELECT
+                CASE WHEN p.patch IS NULL THEN s.step ELSE s.step || (p.patch - 'started_at') END AS step,
+                0 AS grp,
+                s.ord AS ord
+            FROM jsonb_array_elements({steps}) WITH ORDINALITY AS s(step, ord)
+            LEFT JOIN jsonb_array_elements(CAST(:step_patches AS jsonb)) AS p(patch)
+                ON p.patch->>'step' = s.step->>'step'
+            UNION ALL
+            SELECT p.patch, 1, p.ord
+            FROM jsonb_array_elements(CAST(:step_patches AS jsonb)) WITH ORDINALITY AS p(patch, ord)
+            WHERE NOT EXISTS (
+                SELECT 1 FROM jsonb_array_elements({steps}) AS e(step)
+                WHERE e.step->>'step' = p.patch->>'step'
+            )
+        ) merged
+    )""",
+    'sqlite': """(
+        SELECT json_group_array(json(merged.step))
+        FROM (
+            SELECT
+                CASE WHEN p.value IS NULL THEN s.value
+                ELSE json_patch(s.value, json_remove(p.value, '$.started_at')) END AS step,
+                0 AS grp,
+                s.key AS ord
+            FROM json_each({steps}) AS s
+            LEFT JOIN json_each(:step_patches) AS p
+                ON json_extract(p.value, '$.step') = json_extract(s.value, '$.step')
+            UNION ALL
+            SELECT p.value, 1, p.key
+            FROM json_each(:step_patches) AS p
+            WHERE NOT EXISTS (
+                SELECT 1 FROM json_each({steps}) AS e
+                WHERE json_extract(e.value, '$.step') = json_extract(p.value, '$.step')
+            )
+            ORDER BY grp, ord
+        ) merged
+    )""",
+}
+
+# The column default stores an empty list, but rows written as JSON null
+# must merge like an empty array
+_CURRENT_STEPS_SQL = {
+    'postgresql': "CASE WHEN jsonb_typeof({column}) = 'array' THEN {column} ELSE '[]'::jsonb END",
+    'sqlite': "CASE WHEN json_type({column}) = 'array' THEN {column} ELSE '[]' END",
+}
+
+
+def progress_update_statement(
+    jobs: Table,
+    job_id: Any,
+    step_patches: Sequence[Dict[str, Any]],
+    dialect_name: str,
+    **values: Any,
+) -> Executable:
+    """
+    Build one UPDATE merging step patches into a job's processing steps.
+
+    Args:
+        jobs: Generation job table
+        job_id: Job ID
+        step_patches: Step fields to set, one per step, each with a "step" name
+        dialect_name: Name of the database dialect, postgresql or sqlite
+        **values: Other job columns to set in the same statement
+
+    Returns:
+        UPDATE of the job row
+    """
+    if step_patches:
+        if dialect_name not in _MERGE_STEPS_SQL:
+            raise ValueError(f"Unsupported dialect for progress updates: {dialect_name}")
+
+        column = f"{jobs.name}.processing_steps"
+        steps = _CURRENT_STEPS_SQL[dialect_name].format(column=column)
+        values['processing_steps'] = (
+            text(_MERGE_STEPS_SQL[dialect_name].format(steps=steps))
+            .bindparams(step_patches=json.dumps(list(step_patches), default=str))
+        )
+
+    return update(jobs).where(jobs.c.id == job_id).values(**values)
@@ -0,0 +1,186 @@
+"""
+Set-based slide ordering statements.
+
+Slides are ordered by a sparse position key spaced POSITION_GAP apart, so a
+slide is inserted or moved by writing its own row only: it takes a position
+between its new neighbours. slide_number stays the dense 1-based number
+shown to users; it is rewritten by a single statement for just the rows
+whose number changed, together with the presentation's slide count.
+"""
+from typing import Any, List, Optional, Sequence
+
+from sqlalchemy import Table, and_, column, func, or_, select, update, values
+from sqlalchemy.sql import Executable
+
+from app.infrastructure.database.constants import POSITION_GAP
+
+
+def gap_position(index: int) -> int:
+    """Get the evenly spaced position of the slide at a 0-based index."""
+    return (index + 1) * POSITION_GAP
+
+
+def position_between(before: Optional[int], after: Optional[int]) -> Optional[int]:
+    """
+    Get a position strictly between two neighbouring positions.
+
+    Args:
+        before: Position of the previous slide, None at the start
+        after: Position of the next slide, None at the end
+
+    Returns:
+        New position, or None if the neighbours are adjacent and the
+        presentation needs rebalancing first
+    """
+    if before is None and after is None:
+        return gap_position(0)
+    if before is None:
+        return after - POSITION_GAP
+    if after is None:
+        return before + POSITION_GAP
+    if after - before < 2:
+        return None
+    return (before + after) // 2
+
+
+def reorder_statement(
+    slides: Table,
+    presentation_id: Any,
+    slide_ids: Sequence[Any],
+) -> Executable:
+    """
+    Build one UPDATE applying a new slide order.
+
+    Args:
+        slides: Slide table
+        presentation_id: Presentation ID
+        slide_ids: Slide IDs in their new order
+
+    Returns:
+        UPDATE ... FROM (VALUES ...) setting positions and numbers
+    """
+    new_order = values(
+        column('id', slides.c.id.type),
+        column('position', slides.c.position.type),
+        column('slide_number', slides.c.slide_number.type),
+        name='new_order'
+    ).data([
+        (slide_id, gap_position(i), i + 1)
+        for i, slide_id in enumerate(slide_ids)
+    ]).cte('new_order')
+
+    return (
+        update(slides)
+        .where(
+            and_(
+                slides.c.id == new_order.c.id,
+                slides.c.presentation_id == presentation_id
+            )
+        )
+        .values(position=new_order.c.position, slide_number=new_order.c.slide_number)
+    )
+
+
+def renumber_statement(
+    slides: Table,
+    presentation_id: Any,
+    rebalance: bool = False,
+) -> Executable:
+    """
+    Build one UPDATE making slide numbers dense in position order.
+
+    Only rows whose number (or, when rebalancing, position) changes are
+    written.
+
+    Args:
+        slides: Slide table
+        presentation_id: Presentation ID
+        rebalance: Also respace positions POSITION_GAP apart
+
+    Returns:
+        UPDATE ... FROM ranked slides
+    """
+    ranked = (
+        select(
+            slides.c.id,
+            func.row_number().over(order_by=(slides.c.position, slides.c.id)).label('rank')
+        )
+        .where(_live_slides(slides, presentation_id))
+        .cte('ranked')
+    )
+
+    changed = slides.c.slide_number != ranked.c.rank
+    new_values = {'slide_number': ranked.c.rank}
+    if rebalance:
+        changed = or_(changed, slides.c.position != ranked.c.rank * POSITION_GAP)
+        new_values['position'] = ranked.c.rank * POSITION_GAP
+
+    return (
+        update(slides)
+        .where(and_(slides.c.id == ranked.c.id, changed))
+        .values(**new_values)
+    )
+
+
+def slide_count_statement(
+    presentations: Table,
+    slides: Table,
+    presentation_id: Any,
+) -> Executable:
+    """Build one UPDATE setting a presentation's slide count to its visible slides."""
+    visible_count = (
+        select(func.count(slides.c.id))
+        .where(
+            and_(
+                _live_slides(slides, presentation_id),
+                slides.c.is_hidden.is_not(True)
+            )
+        )
+        .scalar_subquery()
+    )
+
+    return (
+        update(presentations)
+        .where(presentations.c.id == presentation_id)
+        .values(slide_count=visible_count)
+    )
+
+
+def renumber_statements(
+    presentations: Table,
+    slides: Table,
+    presentation_id: Any,
+    dialect_name: str,
+    rebalance: bool = False,
+) -> List[Executable]:
+    """
+    Build the statements renumbering slides and refreshing the slide count.
+
+    PostgreSQL runs both as one statement, with the renumbering in a
+    data-modifying CTE; other databases get two statements.
+
+    Args:
+        presentations: Presentation table
+        slides: Slide table
+        presentation_id: Presentation ID
+        dialect_name: Name of the database dialect
+        rebalance: Also respace positions POSITION_GAP apart
+
+    Returns:
+        Statements to execute in order
+    """
+    renumber = renumber_statement(slides, presentation_id, rebalance)
+    count = slide_count_statement(presentations, slides, presentation_id)
+
+    if dialect_name == 'postgresql':
+        renumbered = renumber.returning(slides.c.id).cte('renumbered')
+        return [count.add_cte(renumbered)]
+
+    return [renumber, count]
+
+
+def _live_slides(slides: Table, presentation_id: Any):
+    return and_(
+        slides.c.presentation_id == presentation_id,
+        slides.c.deleted_at.is_(None)
+    )
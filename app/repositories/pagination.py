@@ -0,0 +1,251 @@
+"""
+Keyset pagination with lazily computed, possibly estimated totals.
+
+Pages are fetched with WHERE (k1, k2, ...) < (last k1, last k2, ...)
+instead of OFFSET, so the cost of page N does not grow with N. The sort
+key values of a page's last row are returned as an opaque cursor.
+
+Totals are only computed when asked for. They are exact up to
+exact_total_limit rows, counted with a capped subquery; larger result
+sets get the PostgreSQL planner's row estimate, or the cap elsewhere.
+"""
+import base64
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Generic, List, Optional, Sequence, Tuple, TypeVar
+from uuid import UUID
+
+from sqlalchemy import Select, and_, func, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+EXACT_TOTAL_LIMIT = 1000
+
+
+class InvalidCursorError(ValueError):
+    """A pagination cursor that is malformed or for another ordering."""
+
+
+@dataclass
+class SortKey:
+    """One column of a keyset ordering."""
+    expression: ColumnElement
+    descending: bool = True
+
+
+@dataclass
+class KeysetPage(Generic[T]):
+    """A page of results with the cursor of the next page."""
+    items: List[T]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    total_is_estimate: bool = False
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode sort key values as an opaque cursor.
+
+    Args:
+        values: Sort key values of the last row of a page
+
+    Returns:
+        URL-safe cursor string
+    """
+    encoded = []
+    for value in values:
+        if isinstance(value, datetime):
+            encoded.append({"dt": value.isoformat()})
+        elif isinstance(value, UUID):
+            encoded.append({"uuid": str(value)})
+        else:
+            encoded.append(value)
+
+    payload = json.dumps(encoded, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, key_count: int) -> Tuple[Any, ...]:
+    """
+    Decode a cursor into sort key values.
+
+    Args:
+        cursor: Cursor from encode_cursor
+        key_count: Number of sort keys the cursor must hold
+
+    Returns:
+        Sort key values
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or for another ordering
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        encoded = json.loads(payload)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+
+    if not isinstance(encoded, list) or len(encoded) != key_count:
+        raise InvalidCursorError("Invalid pagination cursor")
+
+    values = []
+    for value in encoded:
+        if isinstance(value, dict) and "dt" in value:
+            decode, raw = datetime.fromisoformat, value["dt"]
+        elif isinstance(value, dict) and "uuid" in value:
+            decode, raw = UUID, value["uuid"]
+        elif isinstance(value, (dict, list)):
+            raise InvalidCursorError("Invalid pagination cursor")
+        else:
+            values.append(value)
+            continue
+
+        try:
+            values.append(decode(raw))
+        except (ValueError, TypeError, AttributeError) as e:
+            raise InvalidCursorError("Invalid pagination cursor") from e
+    return tuple(values)
+
+
+def keyset_condition(sort_keys: Sequence[SortKey], values: Sequence[Any]) -> ColumnElement:
+    """
+    Build the condition selecting rows after a cursor position.
+
+    A uniform sort direction uses a row-value comparison, which databases
+    can answer from a matching composite index; mixed directions expand to
+    the equivalent OR of prefixes.
+
+    Args:
+        sort_keys: Ordering of the query
+        values: Sort key values of the last row seen
+
+    Returns:
+        WHERE condition
+    """
+    directions = {key.descending for key in sort_keys}
+    if len(directions) == 1:
+        columns = tuple_(*(key.expression for key in sort_keys))
+        cursor = tuple_(*values)
+        return columns < cursor if sort_keys[0].descending else columns > cursor
+
+    alternatives = []
+    for i, key in enumerate(sort_keys):
+        equal_prefix = [sort_keys[j].expression == values[j] for j in range(i)]
+        after = key.expression < values[i] if key.descending else key.expression > values[i]
+        alternatives.append(and_(*equal_prefix, after))
+    return or_(*alternatives)
+
+
+async def paginate(
+    db: AsyncSession,
+    stmt: Select,
+    sort_keys: Sequence[SortKey],
+    limit: int,
+    cursor: Optional[str] = None,
+    offset: int = 0,
+    include_total: bool = False,
+    exact_total_limit: int = EXACT_TOTAL_LIMIT,
+) -> KeysetPage:
+    """
+    Fetch one page of a query by keyset.
+
+    Args:
+        db: Database session
+        stmt: Filtered query selecting one entity, without ordering
+        sort_keys: Ordering, ending in a unique column
+        limit: Page size
+        cursor: Cursor of the page to fetch, None for the first page
+        offset: Rows to skip when no cursor is given
+        include_total: Whether to compute the total
+        exact_total_limit: Largest total that is counted exactly
+
+    Returns:
+        Page of entities
+    """
+    page_stmt = stmt.add_columns(
+        *(key.expression.label(f"_sort_{i}") for i, key in enumerate(sort_keys))
+    ).order_by(
+        *(key.expression.desc() if key.descending else key.expression.asc() for key in sort_keys)
+    )
+
+    if cursor:
+        page_stmt = page_stmt.where(keyset_condition(sort_keys, decode_cursor(cursor, len(sort_keys))))
+    elif offset:
+        page_stmt = page_stmt.offset(offset)
+
+    rows = (await db.execute(page_stmt.limit(limit + 1))).all()
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+
+    page = KeysetPage(items=[row[0] for row in rows])
+    if has_next:
+        page.next_cursor = encode_cursor(rows[-1][1:])
+
+    if include_total:
+        if not cursor and not has_next:
+            # The whole result set fit on this page
+            page.total = offset + len(rows)
+        else:
+            page.total, page.total_is_estimate = await count_total(db, stmt, exact_total_limit)
+
+    return page
+
+
+async def count_total(
+    db: AsyncSession,
+    stmt: Select,
+    exact_total_limit: int = EXACT_TOTAL_LIMIT,
+) -> Tuple[int, bool]:
+    """
+    Count a query's rows, exactly only when there are few.
+
+    Args:
+        db: Database session
+        stmt: Filtered query
+        exact_total_limit: Largest total that is counted exactly
+
+    Returns:
+        Tuple of (total, whether it is an estimate)
+    """
+    capped = stmt.order_by(None).limit(exact_total_limit + 1).subquery()
+    count = (await db.execute(select(func.count()).select_from(capped))).scalar() or 0
+    if count <= exact_total_limit:
+        return count, False
+
+    estimate = await _planner_estimate(db, stmt)
+    return max(estimate or 0, count), True
+
+
+async def _planner_estimate(db: AsyncSession, stmt: Select) -> Optional[int]:
+    """Get PostgreSQL's row estimate for a query, None elsewhere or on error."""
+    bind = db.get_bind()
+    if bind.dialect.name != "postgresql":
+        return None
+
+    try:
+        compiled = stmt.order_by(None).compile(dialect=bind.dialect)
+        params = compiled.params
+        if compiled.positiontup is not None:
+            params = tuple(params[name] for name in compiled.positiontup)
+
+        connection = await db.connection()
+        result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled.string}", params)
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    except Exception as e:
+        logger.warning(f"Failed to estimate row count: {e}")
+        return None
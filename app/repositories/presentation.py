@@ -1,7 +1,7 @@
 """
 Presentation repository with advanced search capabilities.
 """
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from uuid import UUID
 
 from sqlalchemy import and_, or_, select, func
@@ -15,10 +15,17 @@ from app.infrastructure.database.models import (
     User,
     Template,
     Tag,
-    presentation_tags,
     presentation_authors
 )
+from app.infrastructure.database.routing import replica_read
 from app.repositories.base import BaseRepository
+from app.repositories.embedding import EmbeddingRepository
+from app.repositories.pagination import KeysetPage, SortKey, paginate
+from app.repositories.view_counts import ViewDelta, view_count_statement
+
+
+# Presentations per batched view count UPDATE
+VIEW_DELTA_BATCH_SIZE = 1000
 
 
 class PresentationRepository(BaseRepository[Presentation]):
@@ -72,6 +79,7 @@ class PresentationRepository(BaseRepository[Presentation]):
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
     
+    @replica_read
     async def search(
         self,
         query: str,
@@ -79,24 +87,35 @@ class PresentationRepository(BaseRepository[Presentation]):
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 20,
         offset: int = 0,
-    ) -> tuple[List[Presentation], int]:
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> KeysetPage[Presentation]:
         """
         Search presentations with full-text search.
         
+        Results are ordered by relevance, then most recently updated, and
+        paged by keyset so deep pages cost the same as the first.
+        
         Args:
             query: Search query
             user_id: Filter by user ID
             filters: Additional filters
             limit: Maximum results
-            offset: Results offset
+            offset: Results offset, used only without a cursor
+            cursor: Cursor of the page to fetch
+            include_total: Whether to compute the (possibly estimated) total
             
         Returns:
-            Tuple of (presentations, total_count)
+            Page of presentations
         """
         filters = filters or {}
         
         # Base query
         base_stmt = select(Presentation).where(Presentation.deleted_at.is_(None))
+        sort_keys = [
+            SortKey(Presentation.updated_at),
+            SortKey(Presentation.id),
+        ]
         
         # Add search condition
         if query:
@@ -104,6 +123,10 @@ class PresentationRepository(BaseRepository[Presentation]):
             base_stmt = base_stmt.where(
                 Presentation.search_vector.match(search_condition)
             )
+            sort_keys.insert(
+                0,
+                SortKey(func.ts_rank(Presentation.search_vector, search_condition))
+            )
         
         # Add user filter
         if user_id:
@@ -141,55 +164,33 @@ class PresentationRepository(BaseRepository[Presentation]):
             )
         
         if filters.get('tags'):
-            # Filter by tags
-            tag_names = filters['tags']
-            base_stmt = base_stmt.join(presentation_tags).join(Tag).where(
-                Tag.name.in_(tag_names)
-            )
-        
-        # Count total results
-        count_stmt = select(func.count()).select_from(base_stmt.subquery())
-        total_result = await self.db.execute(count_stmt)
-        total_count = total_result.scalar() or 0
-        
-        # Get paginated results with relevance ranking
-        if query:
-            ranked_stmt = (
-                base_stmt
-                .order_by(
-                    func.ts_rank(Presentation.search_vector, search_condition).desc(),
-                    Presentation.updated_at.desc()
-                )
-                .limit(limit)
-                .offset(offset)
-                .options(
-                    selectinload(Presentation.tags),
-                    joinedload(Presentation.owner),
-                    joinedload(Presentation.template)
-                )
-            )
-        else:
-            ranked_stmt = (
-                base_stmt
-                .order_by(Presentation.updated_at.desc())
-                .limit(limit)
-                .offset(offset)
-                .options(
-                    selectinload(Presentation.tags),
-                    joinedload(Presentation.owner),
-                    joinedload(Presentation.template)
-                )
+            # Filter by tags without a join, so each presentation appears once
+            base_stmt = base_stmt.where(
+                Presentation.tags.any(Tag.name.in_(filters['tags']))
             )
         
-        result = await self.db.execute(ranked_stmt)
-        presentations = list(result.scalars().unique())
+        base_stmt = base_stmt.options(
+            selectinload(Presentation.tags),
+            joinedload(Presentation.owner),
+            joinedload(Presentation.template)
+        )
         
-        return presentations, total_count
+        return await paginate(
+            self.db,
+            base_stmt,
+            sort_keys,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            include_total=include_total
+        )
     
+    @replica_read
     async def find_similar(
         self,
         presentation_id: UUID,
         limit: int = 10,
+        ef_search: Optional[int] = None,
     ) -> List[Presentation]:
         """
         Find similar presentations using vector similarity.
@@ -197,52 +198,38 @@ class PresentationRepository(BaseRepository[Presentation]):
         Args:
             presentation_id: Reference presentation ID
             limit: Maximum results
+            ef_search: HNSW candidate list size, trading latency for recall
             
         Returns:
-            List of similar presentations
+            List of similar presentations, most similar first
         """
-        # Get embedding for reference presentation
-        embedding_query = text("""
-            SELECT embedding
-            FROM presentationembedding
-            WHERE presentation_id = :presentation_id
-            AND embedding_type = 'combined'
-            ORDER BY generated_at DESC
-            LIMIT 1
-        """)
-        
-        result = await self.db.execute(
-            embedding_query,
-            {"presentation_id": presentation_id}
-        )
-        embedding = result.scalar()
+        embeddings = EmbeddingRepository(self.db)
         
+        # Get embedding for reference presentation
+        embedding = await embeddings.get_combined_embedding(presentation_id)
         if not embedding:
             return []
         
         # Find similar presentations
-        similarity_query = text("""
-            SELECT DISTINCT p.*
-            FROM presentation p
-            INNER JOIN presentationembedding pe ON p.id = pe.presentation_id
-            WHERE p.id != :presentation_id
-            AND p.deleted_at IS NULL
-            AND pe.embedding_type = 'combined'
-            ORDER BY pe.embedding <-> :embedding
-            LIMIT :limit
-        """)
+        neighbours = await embeddings.nearest_combined(
+            embedding,
+            limit=limit,
+            exclude_id=presentation_id,
+            ef_search=ef_search
+        )
+        if not neighbours:
+            return []
         
         result = await self.db.execute(
-            similarity_query,
-            {
-                "presentation_id": presentation_id,
-                "embedding": embedding,
-                "limit": limit
-            }
+            select(Presentation).where(
+                Presentation.id.in_([neighbour_id for neighbour_id, _ in neighbours])
+            )
         )
+        by_id = {presentation.id: presentation for presentation in result.scalars()}
         
-        return list(result.scalars())
+        return [by_id[neighbour_id] for neighbour_id, _ in neighbours if neighbour_id in by_id]
     
+    @replica_read
     async def get_user_presentations(
         self,
         user_id: UUID,
@@ -250,19 +237,23 @@ class PresentationRepository(BaseRepository[Presentation]):
         status: Optional[str] = None,
         limit: int = 50,
         offset: int = 0,
-    ) -> tuple[List[Presentation], int]:
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> KeysetPage[Presentation]:
         """
-        Get presentations for a specific user.
+        Get presentations for a specific user, most recently updated first.
         
         Args:
             user_id: User ID
             include_collaborations: Include presentations where user is author
             status: Filter by status
             limit: Maximum results
-            offset: Results offset
+            offset: Results offset, used only without a cursor
+            cursor: Cursor of the page to fetch
+            include_total: Whether to compute the (possibly estimated) total
             
         Returns:
-            Tuple of (presentations, total_count)
+            Page of presentations
         """
         # Base query
         conditions = [
@@ -279,34 +270,32 @@ class PresentationRepository(BaseRepository[Presentation]):
         if status:
             conditions.append(Presentation.status == status)
         
-        base_stmt = select(Presentation).where(and_(*conditions))
-        
-        # Count total
-        count_stmt = select(func.count()).select_from(base_stmt.subquery())
-        total_result = await self.db.execute(count_stmt)
-        total_count = total_result.scalar() or 0
-        
-        # Get results
-        stmt = (
-            base_stmt
-            .order_by(Presentation.updated_at.desc())
-            .limit(limit)
-            .offset(offset)
+        base_stmt = (
+            select(Presentation)
+            .where(and_(*conditions))
             .options(
                 selectinload(Presentation.tags),
                 joinedload(Presentation.template)
             )
         )
         
-        result = await self.db.execute(stmt)
-        presentations = list(result.scalars().unique())
-        
-        return presentations, total_count
+        return await paginate(
+            self.db,
+            base_stmt,
+            [SortKey(Presentation.updated_at), SortKey(Presentation.id)],
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            include_total=include_total
+        )
     
     async def increment_view_count(self, presentation_id: UUID) -> None:
         """
         Increment view count for a presentation.
         
+        Writes the row immediately; request paths count views through
+        ViewCountBuffer, which batches them.
+        
         Args:
             presentation_id: Presentation ID
         """
@@ -320,6 +309,40 @@ class PresentationRepository(BaseRepository[Presentation]):
         )
         await self.db.execute(stmt)
     
+    @classmethod
+    def view_count_writer(
+        cls,
+        session_factory: Callable[[], AsyncSession],
+    ) -> Callable[[Dict[UUID, ViewDelta]], Awaitable[None]]:
+        """
+        Build a writer applying buffered views on its own session.
+        
+        Args:
+            session_factory: Session factory, e.g. AsyncSessionLocal
+            
+        Returns:
+            Async callable taking pending views by presentation ID
+        """
+        return cls.session_writer(session_factory, cls.apply_view_deltas)
+    
+    async def apply_view_deltas(
+        self,
+        deltas: Dict[UUID, ViewDelta],
+        batch_size: int = VIEW_DELTA_BATCH_SIZE,
+    ) -> None:
+        """
+        Add buffered views to presentations in batched statements.
+        
+        Args:
+            deltas: Pending views by presentation ID
+            batch_size: Presentations per statement
+        """
+        items = list(deltas.items())
+        for start in range(0, len(items), batch_size):
+            await self.db.execute(
+                view_count_statement(Presentation.__table__, dict(items[start:start + batch_size]))
+            )
+    
     async def get_by_share_token(self, share_token: str) -> Optional[Presentation]:
         """
         Get presentation by share token.
@@ -4,11 +4,19 @@ Slide repository implementation.
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.infrastructure.database.models import Slide, Presentation
 from app.repositories.base import BaseRepository
+from app.repositories.ordering import (
+    gap_position,
+    position_between,
+    renumber_statements,
+    reorder_statement,
+    slide_count_statement,
+)
+from app.repositories.slide_search import search_condition
 
 
 class SlideRepository(BaseRepository[Slide]):
@@ -30,7 +38,7 @@ class SlideRepository(BaseRepository[Slide]):
             include_hidden: Include hidden slides
             
         Returns:
-            List of slides ordered by slide_number
+            List of slides in presentation order
         """
         conditions = [
             Slide.presentation_id == presentation_id,
@@ -43,7 +51,7 @@ class SlideRepository(BaseRepository[Slide]):
         stmt = (
             select(Slide)
             .where(and_(*conditions))
-            .order_by(Slide.slide_number)
+            .order_by(Slide.position)
         )
         
         result = await self.db.execute(stmt)
@@ -98,6 +106,8 @@ class SlideRepository(BaseRepository[Slide]):
             slide_data['presentation_id'] = presentation_id
             if 'slide_number' not in slide_data:
                 slide_data['slide_number'] = i + 1
+            if 'position' not in slide_data:
+                slide_data['position'] = gap_position(slide_data['slide_number'] - 1)
             
             slide = Slide(**slide_data)
             self.db.add(slide)
@@ -112,24 +122,45 @@ class SlideRepository(BaseRepository[Slide]):
         new_order: List[UUID],
     ) -> None:
         """
-        Reorder slides within a presentation.
+        Reorder slides within a presentation in one statement.
         
         Args:
             presentation_id: Presentation ID
             new_order: List of slide IDs in new order
         """
-        for i, slide_id in enumerate(new_order):
-            stmt = (
-                update(Slide)
-                .where(
-                    and_(
-                        Slide.id == slide_id,
-                        Slide.presentation_id == presentation_id
-                    )
-                )
-                .values(slide_number=i + 1)
+        if new_order:
+            await self.db.execute(
+                reorder_statement(Slide.__table__, presentation_id, new_order)
             )
-            await self.db.execute(stmt)
+    
+    async def move_slide(
+        self,
+        slide_id: UUID,
+        new_position: int,
+    ) -> bool:
+        """
+        Move a slide, writing only its own position and the changed numbers.
+        
+        Args:
+            slide_id: Slide to move
+            new_position: New 1-based slide number
+            
+        Returns:
+            Success status
+        """
+        slide = await self.get(slide_id)
+        if not slide:
+            return False
+        
+        slide.position = await self._position_at(
+            slide.presentation_id,
+            new_position,
+            exclude_id=slide.id
+        )
+        await self.db.flush()
+        await self._renumber(slide.presentation_id)
+        await self.db.commit()
+        return True
     
     async def duplicate_slide(
         self,
@@ -139,6 +170,9 @@ class SlideRepository(BaseRepository[Slide]):
         """
         Duplicate a slide.
         
+        The copy takes a position between its neighbours, so no other
+        slide's ordering key is written.
+        
         Args:
             slide_id: Slide to duplicate
             new_position: Position for new slide (defaults to after original)
@@ -155,28 +189,27 @@ class SlideRepository(BaseRepository[Slide]):
         if new_position is None:
             new_position = original.slide_number + 1
         
-        # Shift subsequent slides
-        await self._shift_slides(
-            original.presentation_id,
-            new_position,
-            1
-        )
-        
         # Create duplicate
-        new_slide_data = {
-            'presentation_id': original.presentation_id,
-            'slide_number': new_position,
-            'content': original.content.copy() if original.content else {},
-            'layout_type': original.layout_type,
-            'title': f"{original.title} (Copy)" if original.title else None,
-            'section': original.section,
-            'speaker_notes': original.speaker_notes,
-            'transitions': original.transitions.copy() if original.transitions else {},
-            'animations': original.animations.copy() if original.animations else {},
-            'duration_seconds': original.duration_seconds,
-        }
+        new_slide = Slide(
+            presentation_id=original.presentation_id,
+            slide_number=new_position,
+            position=await self._position_at(original.presentation_id, new_position),
+            content=original.content.copy() if original.content else {},
+            layout_type=original.layout_type,
+            title=f"{original.title} (Copy)" if original.title else None,
+            section=original.section,
+            speaker_notes=original.speaker_notes,
+            transitions=original.transitions.copy() if original.transitions else {},
+            animations=original.animations.copy() if original.animations else {},
+            duration_seconds=original.duration_seconds,
+        )
+        self.db.add(new_slide)
+        await self.db.flush()
         
-        return await self.create(new_slide_data)
+        await self._renumber(original.presentation_id)
+        await self.db.commit()
+        await self.db.refresh(new_slide)
+        return new_slide
     
     async def delete_slide(
         self,
@@ -193,22 +226,22 @@ class SlideRepository(BaseRepository[Slide]):
         Returns:
             Success status
         """
-        slide = await self.get(slide_id)
-        if not slide:
+        result = await self.db.execute(
+            delete(Slide)
+            .where(Slide.id == slide_id)
+            .returning(Slide.presentation_id)
+        )
+        presentation_id = result.scalar_one_or_none()
+        if presentation_id is None:
             return False
         
-        # Soft delete
-        success = await self.delete(slide_id)
+        if reorder:
+            await self._renumber(presentation_id)
+        else:
+            await self.update_slide_count(presentation_id)
         
-        if success and reorder:
-            # Shift subsequent slides
-            await self._shift_slides(
-                slide.presentation_id,
-                slide.slide_number + 1,
-                -1
-            )
-        
-        return success
+        await self.db.commit()
+        return True
     
     async def search_slides(
         self,
@@ -219,6 +252,9 @@ class SlideRepository(BaseRepository[Slide]):
         """
         Search slides within a presentation.
         
+        Served by the GIN indexes on the stored search vector and the
+        trigram indexes on title and speaker notes.
+        
         Args:
             presentation_id: Presentation ID
             query: Search query
@@ -232,36 +268,14 @@ class SlideRepository(BaseRepository[Slide]):
             Slide.deleted_at.is_(None)
         ]
         
-        search_conditions = []
-        query_lower = f"%{query.lower()}%"
-        
-        if 'title' in search_in:
-            search_conditions.append(
-                func.lower(Slide.title).like(query_lower)
-            )
-        
-        if 'speaker_notes' in search_in:
-            search_conditions.append(
-                func.lower(Slide.speaker_notes).like(query_lower)
-            )
-        
-        if 'content' in search_in:
-            # Search in JSONB content
-            search_conditions.append(
-                func.jsonb_to_tsvector(
-                    'english',
-                    Slide.content,
-                    '["string"]'
-                ).match(func.plainto_tsquery('english', query))
-            )
-        
-        if search_conditions:
-            conditions.append(or_(*search_conditions))
+        match = search_condition(Slide.__table__, query, search_in)
+        if match is not None:
+            conditions.append(match)
         
         stmt = (
             select(Slide)
             .where(and_(*conditions))
-            .order_by(Slide.slide_number)
+            .order_by(Slide.position)
         )
         
         result = await self.db.execute(stmt)
@@ -312,66 +326,87 @@ class SlideRepository(BaseRepository[Slide]):
             'slides_with_citations': row.slides_with_citations or 0,
         }
     
-    async def _shift_slides(
+    async def update_slide_count(self, presentation_id: UUID) -> None:
+        """
+        Update the slide count in the presentation.
+        
+        Args:
+            presentation_id: Presentation ID
+        """
+        await self.db.execute(
+            slide_count_statement(Presentation.__table__, Slide.__table__, presentation_id)
+        )
+    
+    async def _position_at(
         self,
         presentation_id: UUID,
-        from_position: int,
-        shift_by: int,
-    ) -> None:
+        slide_number: int,
+        exclude_id: Optional[UUID] = None,
+    ) -> int:
         """
-        Shift slide numbers within a presentation.
+        Get a free position for a slide to take the given slide number.
+        
+        Rebalances the presentation's positions if its neighbours are
+        adjacent.
         
         Args:
             presentation_id: Presentation ID
-            from_position: Starting position
-            shift_by: Amount to shift (positive or negative)
+            slide_number: 1-based slide number the slide should get
+            exclude_id: Slide being moved, which is not its own neighbour
+            
+        Returns:
+            Position between the neighbouring slides
         """
-        if shift_by == 0:
-            return
+        conditions = [
+            Slide.presentation_id == presentation_id,
+            Slide.deleted_at.is_(None)
+        ]
+        if exclude_id is not None:
+            conditions.append(Slide.id != exclude_id)
         
+        index = max(slide_number - 1, 0)
         stmt = (
-            update(Slide)
-            .where(
-                and_(
-                    Slide.presentation_id == presentation_id,
-                    Slide.slide_number >= from_position,
-                    Slide.deleted_at.is_(None)
-                )
-            )
-            .values(slide_number=Slide.slide_number + shift_by)
+            select(Slide.position)
+            .where(and_(*conditions))
+            .order_by(Slide.position)
+            .offset(max(index - 1, 0))
+            .limit(2 if index else 1)
         )
         
-        await self.db.execute(stmt)
+        for attempt in range(2):
+            neighbours = list((await self.db.execute(stmt)).scalars())
+            if index == 0:
+                before, after = None, (neighbours[0] if neighbours else None)
+            else:
+                before = neighbours[0] if neighbours else None
+                after = neighbours[1] if len(neighbours) > 1 else None
+            
+            position = position_between(before, after)
+            if position is not None:
+                return position
+            
+            await self._renumber(presentation_id, rebalance=True)
+        
+        raise RuntimeError(f"No free slide position in presentation {presentation_id}")
     
-    async def update_slide_count(self, presentation_id: UUID) -> None:
+    async def _renumber(
+        self,
+        presentation_id: UUID,
+        rebalance: bool = False,
+    ) -> None:
         """
-        Update the slide count in the presentation.
+        Make slide numbers dense and refresh the slide count.
         
         Args:
             presentation_id: Presentation ID
+            rebalance: Also respace positions evenly
         """
-        count_query = (
-            select(func.count(Slide.id))
-            .where(
-                and_(
-                    Slide.presentation_id == presentation_id,
-                    Slide.deleted_at.is_(None),
-                    Slide.is_hidden == False
-                )
-            )
-        )
-        
-        result = await self.db.execute(count_query)
-        count = result.scalar() or 0
-        
-        update_stmt = (
-            update(Presentation)
-            .where(Presentation.id == presentation_id)
-            .values(slide_count=count)
-        )
-        
-        await self.db.execute(update_stmt)
-
-
-# Import additional required modules
-from sqlalchemy import update, or_
\ No newline at end of file
+        dialect_name = self.db.get_bind().dialect.name
+        for stmt in renumber_statements(
+            Presentation.__table__,
+            Slide.__table__,
+            presentation_id,
+            dialect_name,
+            rebalance=rebalance
+        ):
+            await self.db.execute(stmt)
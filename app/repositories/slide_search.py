@@ -0,0 +1,65 @@
+"""
+Indexed in-deck slide search.
+
+Each slide stores the readable text of its JSONB content in search_text,
+extracted by the application whenever content is written, and PostgreSQL
+keeps search_vector generated from it. Both search_vector and the trigram
+indexes on title and speaker_notes are GIN indexes, so a search reads
+matching index entries instead of re-parsing every slide of the deck.
+"""
+from typing import List, Optional, Sequence
+
+from sqlalchemy import Table, func, or_
+from sqlalchemy.sql import ColumnElement
+
+from app.infrastructure.database.search_text import SEARCH_CONFIG
+
+
+LIKE_ESCAPE = "\\"
+
+
+def like_pattern(query: str) -> str:
+    """Build a substring LIKE pattern matching the query literally."""
+    escaped = (
+        query
+        .replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", LIKE_ESCAPE + "%")
+        .replace("_", LIKE_ESCAPE + "_")
+    )
+    return f"%{escaped}%"
+
+
+def search_condition(
+    slides: Table,
+    query: str,
+    search_in: Sequence[str],
+) -> Optional[ColumnElement]:
+    """
+    Build the match condition of an in-deck search.
+
+    Title and speaker notes match by case-insensitive substring, which the
+    trigram indexes serve; content matches by full text on search_vector.
+
+    Args:
+        slides: Slide table
+        query: Search query
+        search_in: Fields to search in: title, content and speaker_notes
+
+    Returns:
+        Condition, or None when no known field is searched
+    """
+    conditions: List[ColumnElement] = []
+    pattern = like_pattern(query)
+
+    if "title" in search_in:
+        conditions.append(slides.c.title.ilike(pattern, escape=LIKE_ESCAPE))
+
+    if "speaker_notes" in search_in:
+        conditions.append(slides.c.speaker_notes.ilike(pattern, escape=LIKE_ESCAPE))
+
+    if "content" in search_in:
+        conditions.append(
+            slides.c.search_vector.op("@@")(func.plainto_tsquery(SEARCH_CONFIG, query))
+        )
+
+    return or_(*conditions) if conditions else None
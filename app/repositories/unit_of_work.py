@@ -5,7 +5,7 @@ from typing import Type, TypeVar, Generic
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.infrastructure.database.base import AsyncSessionLocal
+from app.infrastructure.database.base import session_router
 from app.repositories.base import BaseRepository
 from app.repositories.user import UserRepository
 from app.repositories.presentation import PresentationRepository
@@ -38,7 +38,7 @@ class UnitOfWork:
     
     async def __aenter__(self):
         """Enter the context manager."""
-        self._session = AsyncSessionLocal()
+        self._session = session_router.primary_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -130,9 +130,16 @@ class ReadOnlyUnitOfWork(UnitOfWork):
     """
     Read-only Unit of Work for query operations.
     
-    Automatically rolls back any changes to prevent accidental writes.
+    Reads from a read replica when one is current, and from the primary
+    after this request committed. Automatically rolls back any changes to
+    prevent accidental writes.
     """
     
+    async def __aenter__(self):
+        """Enter the context manager."""
+        self._session = await session_router.read_session()
+        return self
+    
     async def commit(self):
         """Override commit to always rollback."""
         await self.rollback()
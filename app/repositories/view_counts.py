@@ -0,0 +1,61 @@
+"""
+Batched presentation view count updates.
+
+Views are counted outside the database and written periodically: one
+statement adds each presentation's pending views to view_count and moves
+last_accessed forward, for any number of presentations at once.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Mapping
+
+from sqlalchemy import Integer, Table, case, column, func, or_, update, values
+from sqlalchemy.sql import Executable
+
+
+@dataclass
+class ViewDelta:
+    """Views of one presentation not yet written."""
+    views: int
+    last_accessed: datetime
+
+
+def view_count_statement(
+    presentations: Table,
+    deltas: Mapping[Any, ViewDelta],
+) -> Executable:
+    """
+    Build one UPDATE applying pending views to presentations.
+
+    Args:
+        presentations: Presentation table
+        deltas: Pending views by presentation ID
+
+    Returns:
+        UPDATE ... FROM (VALUES ...) adding views and advancing last_accessed
+    """
+    view_delta = values(
+        column('id', presentations.c.id.type),
+        column('views', Integer),
+        column('last_accessed', presentations.c.last_accessed.type),
+        name='view_delta'
+    ).data([
+        (presentation_id, delta.views, delta.last_accessed)
+        for presentation_id, delta in deltas.items()
+    ]).cte('view_delta')
+
+    last_accessed = presentations.c.last_accessed
+    return (
+        update(presentations)
+        .where(presentations.c.id == view_delta.c.id)
+        .values(
+            view_count=func.coalesce(presentations.c.view_count, 0) + view_delta.c.views,
+            last_accessed=case(
+                (
+                    or_(last_accessed.is_(None), last_accessed < view_delta.c.last_accessed),
+                    view_delta.c.last_accessed
+                ),
+                else_=last_accessed
+            )
+        )
+    )
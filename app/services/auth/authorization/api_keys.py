@@ -8,10 +8,14 @@ for programmatic access to the SlideGenie platform.
 import hashlib
 import secrets
 import string
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Set
+from enum import Enum
+from typing import Any, Dict, List, Optional, Set, Tuple
 from uuid import UUID, uuid4
 
+import redis.asyncio as redis
 import structlog
 from pydantic import BaseModel, Field
 
@@ -21,6 +25,58 @@ from app.infrastructure.cache import get_redis_client
 logger = structlog.get_logger(__name__)
 settings = get_settings()
 
+# Checks every quota window of a key and consumes from all of them in one
+# atomic step. KEYS are the window counters; ARGV is the number of requests
+# to reserve (0 only checks), a refund of unused leased requests, then the
+# limit (<= 0 for unlimited) and expiry timestamp of each window. Returns
+# {granted, index of the first exhausted window or 0, counter values...}.
+QUOTA_SCRIPT = """
+local requested = tonumber(ARGV[1])
+local refund = tonumber(ARGV[2])
+local grant = requested
+local exceeded = 0
+local result = {0, 0}
+
+for i, key in ipairs(KEYS) do
+    local count = tonumber(redis.call('GET', key) or '0')
+    if refund > 0 and count > 0 then
+        count = redis.call('DECRBY', key, math.min(refund, count))
+    end
+    result[i + 2] = count
+
+    local limit = tonumber(ARGV[i * 2 + 1])
+    if limit > 0 then
+        local remaining = limit - count
+        if remaining < 1 then
+            if exceeded == 0 then
+                exceeded = i
+            end
+        elseif grant > 1 and remaining < grant * tonumber(ARGV[#ARGV]) then
+            -- Near a limit, only admit single requests
+            grant = 1
+        end
+    end
+end
+
+if exceeded > 0 then
+    result[2] = exceeded
+    return result
+end
+
+if grant > 0 then
+    for i, key in ipairs(KEYS) do
+        result[i + 2] = redis.call('INCRBY', key, grant)
+        redis.call('EXPIREAT', key, ARGV[i * 2 + 2])
+    end
+end
+result[1] = grant
+return result
+"""
+
+# A lease is only granted while every window has this many times the lease
+# size left, so keys close to a limit are always checked against Redis
+QUOTA_LEASE_HEADROOM = 4
+
 
 class APIKeyScope(str):
     """API key scopes for different access levels."""
@@ -53,7 +109,7 @@ class APIKeyScope(str):
     ADMIN_ANALYTICS = "admin:analytics"
 
 
-class APIKeyTier(str):
+class APIKeyTier(str, Enum):
     """API key tiers with different limits."""
     FREE = "free"
     ACADEMIC = "academic"
@@ -204,12 +260,68 @@ class APIKey(BaseModel):
         self.metadata.last_used_user_agent = user_agent
 
 
+@dataclass
+class QuotaWindow:
+    """One quota window of an API key."""
+    name: str
+    key: str
+    limit: Optional[int]
+    reset_at: datetime
+    
+    @classmethod
+    def for_key(cls, api_key: APIKey, now: datetime) -> List['QuotaWindow']:
+        """Get the current hourly, daily and monthly windows of a key."""
+        hour_start = now.replace(minute=0, second=0, microsecond=0)
+        day_start = hour_start.replace(hour=0)
+        month_start = day_start.replace(day=1)
+        next_month = (month_start + timedelta(days=32)).replace(day=1)
+        prefix = f"api_rate:{api_key.key_hash}"
+        
+        return [
+            cls("hourly", f"{prefix}:hour:{now.strftime('%Y%m%d%H')}",
+                api_key.metadata.rate_limit_per_hour, hour_start + timedelta(hours=1)),
+            cls("daily", f"{prefix}:day:{now.strftime('%Y%m%d')}",
+                api_key.metadata.rate_limit_per_day, day_start + timedelta(days=1)),
+            cls("monthly", f"{prefix}:month:{now.strftime('%Y%m')}",
+                api_key.metadata.monthly_requests_limit, next_month),
+        ]
+
+
+@dataclass
+class _QuotaLease:
+    """Requests reserved in Redis ahead of time for a hot API key."""
+    keys: Tuple[str, ...]
+    tokens: int
+    expires_at: float
+    quotas: Dict[str, Dict[str, Any]]
+
+
 class APIKeyService:
     """Service for managing API keys."""
     
-    def __init__(self):
+    def __init__(
+        self,
+        client: Optional[redis.Redis] = None,
+        quota_lease_size: int = 0,
+        quota_lease_ttl: float = 1.0,
+    ):
+        """
+        Initialize API key service.
+        
+        Args:
+            client: Redis client (defaults to the shared pool)
+            quota_lease_size: Requests reserved at once for hot keys, 0 disables leases
+            quota_lease_ttl: Seconds a lease may be used for
+        """
         self._keys: Dict[str, APIKey] = {}  # key_hash -> APIKey
         self._user_keys: Dict[UUID, List[APIKey]] = {}  # user_id -> [APIKey]
+        
+        self.client = client
+        self.quota_lease_size = quota_lease_size
+        self.quota_lease_ttl = quota_lease_ttl
+        self._quota_script = None
+        self._leases: Dict[str, _QuotaLease] = {}  # key_hash -> lease
+        self._last_checked: Dict[str, float] = {}  # key_hash -> monotonic time
     
     async def create_api_key(
         self,
@@ -294,52 +406,82 @@ class APIKeyService:
         self,
         api_key: APIKey,
         ip_address: str,
+        consume: bool = True,
     ) -> tuple[bool, Dict[str, Any]]:
-        """Check if API key has exceeded rate limits."""
-        redis = await get_redis_client()
+        """
+        Check the hourly, daily and monthly limits of an API key.
+        
+        All windows are checked, and consumed if the request is admitted, in
+        a single Redis round trip. With leases enabled, a key used again
+        within the lease TTL reserves several requests at once and admits
+        the following requests locally; reserved requests count against the
+        limits across processes, and unused ones are refunded.
+        
+        Args:
+            api_key: API key making the request
+            ip_address: Client IP address
+            consume: Count the request against the limits if admitted
+            
+        Returns:
+            Whether the request is within limits, and quota details
+        """
         now = datetime.now(timezone.utc)
-        
-        # Check hourly limit
-        hour_key = f"api_rate:{api_key.key_hash}:hour:{now.strftime('%Y%m%d%H')}"
-        hour_count = await redis.get(hour_key)
-        hour_count = int(hour_count) if hour_count else 0
-        
-        if hour_count >= api_key.metadata.rate_limit_per_hour:
-            return False, {
-                "limit_type": "hourly",
-                "limit": api_key.metadata.rate_limit_per_hour,
-                "current": hour_count,
-                "reset_at": now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1),
+        windows = QuotaWindow.for_key(api_key, now)
+        keys = tuple(window.key for window in windows)
+        
+        lease = self._leases.pop(api_key.key_hash, None)
+        if lease and lease.keys != keys:
+            # A window rolled over; its old counter is expiring anyway
+            lease = None
+        if consume and lease and lease.tokens > 0 and lease.expires_at > time.monotonic():
+            lease.tokens -= 1
+            self._leases[api_key.key_hash] = lease
+            return True, {"quotas": lease.quotas}
+        
+        requested = 0
+        if consume:
+            requested = self.quota_lease_size if self._is_hot(api_key.key_hash) else 1
+        
+        client = await self._get_client()
+        if self._quota_script is None:
+            self._quota_script = client.register_script(QUOTA_SCRIPT)
+        
+        args = [max(requested, 0), lease.tokens if lease else 0]
+        for window in windows:
+            args += [window.limit or 0, int(window.reset_at.timestamp())]
+        args.append(QUOTA_LEASE_HEADROOM)
+        
+        granted, exceeded, *counts = await self._quota_script(keys=keys, args=args, client=client)
+        
+        quotas = {
+            window.name: {
+                "limit": window.limit,
+                "current": count,
+                "remaining": max(0, window.limit - count) if window.limit else None,
+                "reset_at": window.reset_at,
             }
+            for window, count in zip(windows, counts)
+        }
         
-        # Check daily limit
-        day_key = f"api_rate:{api_key.key_hash}:day:{now.strftime('%Y%m%d')}"
-        day_count = await redis.get(day_key)
-        day_count = int(day_count) if day_count else 0
-        
-        if day_count >= api_key.metadata.rate_limit_per_day:
+        if exceeded:
+            window = windows[exceeded - 1]
             return False, {
-                "limit_type": "daily",
-                "limit": api_key.metadata.rate_limit_per_day,
-                "current": day_count,
-                "reset_at": now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1),
+                "limit_type": window.name,
+                "limit": window.limit,
+                "current": counts[exceeded - 1],
+                "reset_at": window.reset_at,
+                "quotas": quotas,
             }
         
-        # Check monthly limit
-        if api_key.metadata.monthly_requests_limit:
-            month_key = f"api_rate:{api_key.key_hash}:month:{now.strftime('%Y%m')}"
-            month_count = await redis.get(month_key)
-            month_count = int(month_count) if month_count else 0
-            
-            if month_count >= api_key.metadata.monthly_requests_limit:
-                return False, {
-                    "limit_type": "monthly",
-                    "limit": api_key.metadata.monthly_requests_limit,
-                    "current": month_count,
-                    "reset_at": now.replace(day=1, hour=0, minute=0, second=0, microsecond=0) + timedelta(days=32),
-                }
+        if granted > 1:
+            self._leases[api_key.key_hash] = _QuotaLease(
+                keys=keys,
+                tokens=granted - 1,
+                expires_at=time.monotonic() + self.quota_lease_ttl,
+                quotas=quotas,
+            )
         
-        return True, {}
+        return True, {"quotas": quotas}
     
     async def record_api_usage(
         self,
@@ -347,25 +489,12 @@ class APIKeyService:
         ip_address: str,
         user_agent: str,
     ) -> None:
-        """Record API key usage."""
-        redis = await get_redis_client()
-        now = datetime.now(timezone.utc)
-        
-        # Update usage counters
-        hour_key = f"api_rate:{api_key.key_hash}:hour:{now.strftime('%Y%m%d%H')}"
-        day_key = f"api_rate:{api_key.key_hash}:day:{now.strftime('%Y%m%d')}"
-        month_key = f"api_rate:{api_key.key_hash}:month:{now.strftime('%Y%m')}"
-        
-        # Increment counters with appropriate TTL
-        await redis.incr(hour_key)
-        await redis.expire(hour_key, 3600)  # 1 hour
-        
-        await redis.incr(day_key)
-        await redis.expire(day_key, 86400)  # 1 day
-        
-        await redis.incr(month_key)
-        await redis.expire(month_key, 2678400)  # 31 days
+        """
+        Record API key usage.
         
+        Quota counters are consumed by check_rate_limit; this records the
+        usage statistics on the key.
+        """
         # Update API key metadata
         api_key.update_usage(ip_address, user_agent)
         
@@ -410,17 +539,13 @@ class APIKeyService:
     
     async def get_api_key_usage_stats(self, api_key: APIKey) -> Dict[str, Any]:
         """Get usage statistics for API key."""
-        redis = await get_redis_client()
-        now = datetime.now(timezone.utc)
+        client = await self._get_client()
+        windows = QuotaWindow.for_key(api_key, datetime.now(timezone.utc))
         
         # Get current usage
-        hour_key = f"api_rate:{api_key.key_hash}:hour:{now.strftime('%Y%m%d%H')}"
-        day_key = f"api_rate:{api_key.key_hash}:day:{now.strftime('%Y%m%d')}"
-        month_key = f"api_rate:{api_key.key_hash}:month:{now.strftime('%Y%m')}"
-        
-        hour_count = await redis.get(hour_key)
-        day_count = await redis.get(day_key)
-        month_count = await redis.get(month_key)
+        hour_count, day_count, month_count = await client.mget(
+            [window.key for window in windows]
+        )
         
         return {
             "key_id": str(api_key.id),
@@ -444,6 +569,22 @@ class APIKeyService:
             },
         }
     
+    def _is_hot(self, key_hash: str) -> bool:
+        """Check whether a key was checked within the lease TTL, and mark it checked."""
+        if self.quota_lease_size <= 1:
+            return False
+        
+        now = time.monotonic()
+        last_checked = self._last_checked.get(key_hash)
+        if len(self._last_checked) >= 10000:
+            self._last_checked.clear()
+        self._last_checked[key_hash] = now
+        return last_checked is not None and now - last_checked <= self.quota_lease_ttl
+    
+    async def _get_client(self) -> redis.Redis:
+        """Get the Redis client."""
+        return self.client or await get_redis_client()
+    
     def _get_valid_scopes_for_tier(self, tier: APIKeyTier) -> Set[str]:
         """Get valid scopes for API key tier."""
         base_scopes = {
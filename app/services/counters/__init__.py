@@ -0,0 +1,18 @@
+"""
+Buffered counters written to the database in periodic batches.
+"""
+from .view_counter import (
+    RedisViewCounter,
+    ShardedViewCounter,
+    ViewCountBuffer,
+    ViewCounterBackend,
+    get_view_count_buffer,
+)
+
+__all__ = [
+    "RedisViewCounter",
+    "ShardedViewCounter",
+    "ViewCountBuffer",
+    "ViewCounterBackend",
+    "get_view_count_buffer",
+]
@@ -0,0 +1,322 @@
+"""
+Buffered presentation view counters.
+
+Counting each view with an UPDATE serializes popular decks on one row and
+leaves a dead tuple per view. Views are instead accumulated in a counter
+backend and flushed periodically as one batched statement, so a deck
+viewed a thousand times between flushes costs one row update. Reads add
+the pending views to the persisted count.
+
+Two backends are provided: Redis, shared by all API processes, and an
+in-process sharded counter for single-process deployments and tests.
+"""
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Protocol, Sequence
+from uuid import UUID
+
+from app.repositories.view_counts import ViewDelta
+
+
+logger = logging.getLogger(__name__)
+
+ViewWriter = Callable[[Dict[UUID, ViewDelta]], Awaitable[None]]
+
+
+class ViewCounterBackend(Protocol):
+    """Storage of views not yet written to the database."""
+
+    async def increment(self, presentation_id: UUID, timestamp: float) -> None:
+        ...
+
+    async def pending(self, presentation_ids: Sequence[UUID]) -> Dict[UUID, int]:
+        ...
+
+    async def drain(self) -> Dict[UUID, ViewDelta]:
+        ...
+
+    async def restore(self, deltas: Dict[UUID, ViewDelta]) -> None:
+        ...
+
+
+def _to_datetime(timestamp: float) -> datetime:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+
+class ShardedViewCounter:
+    """
+    In-process view counter.
+
+    Keys are spread over independently locked shards, so threads counting
+    different decks do not contend and a drain holds each lock briefly.
+    """
+
+    def __init__(self, shards: int = 16):
+        """
+        Initialize sharded counter.
+
+        Args:
+            shards: Number of shards
+        """
+        self._shards: List[Dict[Hashable, List[float]]] = [{} for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+
+    def _index(self, presentation_id: UUID) -> int:
+        return hash(presentation_id) % len(self._shards)
+
+    async def increment(self, presentation_id: UUID, timestamp: float) -> None:
+        """Count one view."""
+        index = self._index(presentation_id)
+        with self._locks[index]:
+            entry = self._shards[index].get(presentation_id)
+            if entry is None:
+                self._shards[index][presentation_id] = [1, timestamp]
+            else:
+                entry[0] += 1
+                entry[1] = max(entry[1], timestamp)
+
+    async def pending(self, presentation_ids: Sequence[UUID]) -> Dict[UUID, int]:
+        """Get pending views of presentations, omitting those with none."""
+        result = {}
+        for presentation_id in presentation_ids:
+            index = self._index(presentation_id)
+            with self._locks[index]:
+                entry = self._shards[index].get(presentation_id)
+            if entry is not None:
+                result[presentation_id] = int(entry[0])
+        return result
+
+    async def drain(self) -> Dict[UUID, ViewDelta]:
+        """Take all pending views."""
+        deltas = {}
+        for index, lock in enumerate(self._locks):
+            with lock:
+                shard, self._shards[index] = self._shards[index], {}
+            for presentation_id, (views, timestamp) in shard.items():
+                deltas[presentation_id] = ViewDelta(int(views), _to_datetime(timestamp))
+        return deltas
+
+    async def restore(self, deltas: Dict[UUID, ViewDelta]) -> None:
+        """Put back views whose write failed."""
+        for presentation_id, delta in deltas.items():
+            index = self._index(presentation_id)
+            timestamp = delta.last_accessed.timestamp()
+            with self._locks[index]:
+                entry = self._shards[index].setdefault(presentation_id, [0, timestamp])
+                entry[0] += delta.views
+                entry[1] = max(entry[1], timestamp)
+
+
+# Takes both hashes and clears them atomically, so views counted during a
+# flush land in the next one
+DRAIN_SCRIPT = """
+local counts = redis.call('HGETALL', KEYS[1])
+local last = redis.call('HGETALL', KEYS[2])
+redis.call('DEL', KEYS[1], KEYS[2])
+return {counts, last}
+"""
+
+
+class RedisViewCounter:
+    """
+    View counter shared through Redis.
+
+    Pending views and last-view times are two hashes keyed by presentation
+    ID; the hash tag keeps both on one cluster slot for the drain script.
+    """
+
+    def __init__(self, redis_client, prefix: str = "slidegenie:views"):
+        """
+        Initialize Redis counter.
+
+        Args:
+            redis_client: Redis client with decode_responses enabled
+            prefix: Key prefix
+        """
+        self.redis = redis_client
+        self.counts_key = f"{prefix}:{{pending}}:counts"
+        self.last_key = f"{prefix}:{{pending}}:last"
+        self._drain_script = redis_client.register_script(DRAIN_SCRIPT)
+
+    async def increment(self, presentation_id: UUID, timestamp: float) -> None:
+        """Count one view in a single round trip."""
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hincrby(self.counts_key, str(presentation_id), 1)
+        pipe.hset(self.last_key, str(presentation_id), repr(timestamp))
+        await pipe.execute()
+
+    async def pending(self, presentation_ids: Sequence[UUID]) -> Dict[UUID, int]:
+        """Get pending views of presentations, omitting those with none."""
+        if not presentation_ids:
+            return {}
+        counts = await self.redis.hmget(self.counts_key, [str(pid) for pid in presentation_ids])
+        return {
+            presentation_id: int(count)
+            for presentation_id, count in zip(presentation_ids, counts)
+            if count is not None
+        }
+
+    async def drain(self) -> Dict[UUID, ViewDelta]:
+        """Take all pending views."""
+        counts, last = await self._drain_script(keys=[self.counts_key, self.last_key])
+        timestamps = dict(zip(last[::2], last[1::2]))
+        now = time.time()
+        return {
+            UUID(key): ViewDelta(int(views), _to_datetime(float(timestamps.get(key, now))))
+            for key, views in zip(counts[::2], counts[1::2])
+        }
+
+    async def restore(self, deltas: Dict[UUID, ViewDelta]) -> None:
+        """Put back views whose write failed."""
+        if not deltas:
+            return
+        pipe = self.redis.pipeline(transaction=False)
+        for presentation_id, delta in deltas.items():
+            pipe.hincrby(self.counts_key, str(presentation_id), delta.views)
+            # A view counted since the drain is newer
+            pipe.hsetnx(self.last_key, str(presentation_id), repr(delta.last_accessed.timestamp()))
+        await pipe.execute()
+
+
+class ViewCountBuffer:
+    """
+    Counts views in a backend and writes them in periodic batches.
+    """
+
+    def __init__(
+        self,
+        backend: ViewCounterBackend,
+        writer: ViewWriter,
+        flush_interval: float = 10.0
+    ):
+        """
+        Initialize view count buffer.
+
+        Args:
+            backend: Counter holding unwritten views
+            writer: Applies pending views in one batch, e.g.
+                PresentationRepository.view_count_writer
+            flush_interval: Seconds between flushes
+        """
+        self.backend = backend
+        self.writer = writer
+        self.flush_interval = flush_interval
+
+        self._worker: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+
+    async def record_view(self, presentation_id: UUID) -> None:
+        """
+        Count a view of a presentation.
+
+        Views are best effort: a backend failure is logged, not raised.
+        """
+        try:
+            await self.backend.increment(presentation_id, time.time())
+        except Exception as e:
+            logger.warning(f"Failed to count view of presentation {presentation_id}: {e}")
+
+    async def pending_views(self, presentation_ids: Sequence[UUID]) -> Dict[UUID, int]:
+        """
+        Get views not yet written, by presentation.
+
+        Args:
+            presentation_ids: Presentation IDs
+
+        Returns:
+            Pending views, omitting presentations with none
+        """
+        try:
+            return await self.backend.pending(presentation_ids)
+        except Exception as e:
+            logger.warning(f"Failed to read pending views: {e}")
+            return {}
+
+    async def view_count(self, presentation_id: UUID, persisted: Optional[int]) -> int:
+        """
+        Get a presentation's view count including pending views.
+
+        Args:
+            presentation_id: Presentation ID
+            persisted: view_count stored on the presentation
+
+        Returns:
+            Current view count
+        """
+        pending = await self.pending_views([presentation_id])
+        return (persisted or 0) + pending.get(presentation_id, 0)
+
+    async def flush(self) -> int:
+        """
+        Write all pending views in one batch.
+
+        Returns:
+            Number of views written
+        """
+        deltas = await self.backend.drain()
+        if not deltas:
+            return 0
+
+        try:
+            await self.writer(deltas)
+        except Exception as e:
+            await self.backend.restore(deltas)
+            logger.error(f"Failed to write views of {len(deltas)} presentations: {e}")
+            return 0
+
+        return sum(delta.views for delta in deltas.values())
+
+    async def start(self) -> None:
+        """Start periodic flushing."""
+        if self._worker is None:
+            self._stopping.clear()
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop periodic flushing and write everything pending."""
+        if self._worker is not None:
+            self._stopping.set()
+            await self._worker
+            self._worker = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        """Flush every flush_interval."""
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"View count flush failed: {e}")
+
+
+_view_count_buffer: Optional[ViewCountBuffer] = None
+
+
+async def get_view_count_buffer() -> ViewCountBuffer:
+    """Get the view count buffer shared by this process."""
+    global _view_count_buffer
+    if _view_count_buffer is None:
+        # Imported here so the counters import without settings or Redis
+        from app.core.config import settings
+        from app.infrastructure.database.base import AsyncSessionLocal
+        from app.repositories.presentation import PresentationRepository
+
+        if settings.VIEW_COUNT_BACKEND == "memory":
+            backend = ShardedViewCounter()
+        else:
+            from app.infrastructure.cache.redis import get_redis
+            backend = RedisViewCounter(await get_redis())
+
+        _view_count_buffer = ViewCountBuffer(
+            backend,
+            PresentationRepository.view_count_writer(AsyncSessionLocal),
+            flush_interval=settings.VIEW_COUNT_FLUSH_INTERVAL
+        )
+    return _view_count_buffer
@@ -56,6 +56,10 @@ from app.services.document_processing.utils.latex_parser import (
     CrossReferenceResolver,
     TokenType
 )
+from app.services.document_processing.utils.latex_includes import (
+    LaTeXIncludeResolver,
+    ResolvedDocument
+)
 from app.services.document_processing.utils.equation_renderer import (
     EquationRenderer,
     EquationParser,
@@ -91,8 +95,14 @@ class LaTeXProcessor(BaseDocumentProcessor):
         self.bibtex_parser = BibTeXParser()
         self.citation_extractor = CitationExtractor()
         self.cross_ref_resolver = CrossReferenceResolver()
+        self.include_resolver = LaTeXIncludeResolver(
+            tokenizer=self.tokenizer,
+            cache=self.config.get('source_cache'),
+            max_concurrency=self.config.get('include_concurrency', 16)
+        )
         
         # Processing state
+        self.current_document: Optional[ResolvedDocument] = None
         self.current_source = ""
         self.current_tokens = []
         self.current_commands = []
@@ -179,7 +189,7 @@ class LaTeXProcessor(BaseDocumentProcessor):
             
             # Step 2: Tokenize LaTeX source
             self._update_progress(job_id, 16.6, "Tokenizing LaTeX source", 2, 12)
-            self.current_tokens = self.tokenizer.tokenize(source_content)
+            self.current_tokens = self.include_resolver.build_tokens(self.current_document)
             
             # Step 3: Parse commands and environments
             self._update_progress(job_id, 25.0, "Parsing commands and environments", 3, 12)
@@ -386,57 +396,18 @@ class LaTeXProcessor(BaseDocumentProcessor):
     
     async def _load_document(self, file_path: Path) -> str:
         """Load LaTeX document and handle includes."""
-        try:
-            # Try UTF-8 first
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except UnicodeDecodeError:
-            # Fallback to latin-1
-            with open(file_path, 'r', encoding='latin-1') as f:
-                content = f.read()
-        
-        self.current_source = content
+        # Reads the \\input/\\include graph concurrently; unchanged files are
+        # served from the shared scan cache
+        self.current_document = await self.include_resolver.load(file_path)
+        self.current_source = self.current_document.root_source
         
-        # Process includes and inputs
-        content = await self._process_includes(content, file_path.parent)
+        content = self.current_document.source
         
         # Extract document class and packages
         self._extract_preamble_info(content)
         
         return content
     
-    async def _process_includes(self, content: str, base_dir: Path) -> str:
-        """Process \\input and \\include commands."""
-        # Find all input/include commands
-        include_pattern = re.compile(r'\\(?:input|include)\{([^}]+)\}')
-        
-        def replace_include(match):
-            filename = match.group(1)
-            if not filename.endswith('.tex'):
-                filename += '.tex'
-            
-            include_path = base_dir / filename
-            if include_path.exists():
-                try:
-                    with open(include_path, 'r', encoding='utf-8') as f:
-                        included_content = f.read()
-                    logger.info(f"Included file: {include_path}")
-                    return included_content
-                except Exception as e:
-                    logger.warning(f"Failed to include file {include_path}: {e}")
-                    return match.group(0)  # Return original command
-            else:
-                logger.warning(f"Include file not found: {include_path}")
-                return match.group(0)
-        
-        # Process includes recursively (simple approach, could be improved)
-        old_content = ""
-        while old_content != content:
-            old_content = content
-            content = include_pattern.sub(replace_include, content)
-        
-        return content
-    
     def _extract_preamble_info(self, content: str):
         """Extract document class and package information."""
         # Extract document class
@@ -9,6 +9,7 @@ from .task_queue import (
     TaskInfo,
     QueueMetrics
 )
+from .fair_scheduler import FairShareScheduler, TenantPolicy
 
 __all__ = [
     "TaskQueue",
@@ -17,5 +18,7 @@ __all__ = [
     "TaskPriority",
     "TaskStatus",
     "TaskInfo",
-    "QueueMetrics"
+    "QueueMetrics",
+    "FairShareScheduler",
+    "TenantPolicy"
 ]
\ No newline at end of file
@@ -0,0 +1,333 @@
+"""
+Fair-share scheduling of tasks across tenants.
+
+The backend queues serve strictly by TaskPriority, so one tenant's burst of
+HIGH tasks can starve everyone else's NORMAL and LOW work. FairShareScheduler
+sits in front of a task queue (ARQ or Celery) and decides which submitted
+task is released to it next:
+
+- Tenants are served by stride scheduling (a weighted fair queuing variant):
+  every release advances the tenant's pass by cost / (weight * share of the
+  task's priority), and the backlogged tenant with the lowest pass goes next.
+  A tenant sending only HIGH work gets at most four times the releases of
+  an equally weighted tenant sending LOW work, and never starves it.
+- A waiting task gains one priority level per aging_interval, so within a
+  tenant LOW work reaches CRITICAL after three intervals and is then served
+  ahead of newer tasks.
+- A tenant never has more than its max_concurrency tasks released and not
+  yet finished.
+
+At most max_in_flight tasks are released at once, so the backend queue stays
+short and the order chosen here is the order workers see. One scheduler
+instance dispatches for a queue; completions are reported with
+task_finished() or discovered by run() from the backend's task status.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from .task_queue import BaseTaskQueue, TaskPriority, TaskStatus
+
+
+logger = logging.getLogger(__name__)
+
+# Priority levels from lowest to highest; aging moves tasks along this list
+PRIORITY_LEVELS = [TaskPriority.LOW, TaskPriority.NORMAL, TaskPriority.HIGH, TaskPriority.CRITICAL]
+
+# Relative share of a tenant's capacity used per task at each priority
+PRIORITY_SHARES = {
+    TaskPriority.LOW: 1.0,
+    TaskPriority.NORMAL: 2.0,
+    TaskPriority.HIGH: 4.0,
+    TaskPriority.CRITICAL: 8.0,
+}
+
+FINISHED_STATUSES = {TaskStatus.SUCCESS, TaskStatus.FAILURE, TaskStatus.CANCELLED}
+
+
+@dataclass
+class TenantPolicy:
+    """Scheduling policy for one tenant."""
+    weight: float = 1.0
+    max_concurrency: Optional[int] = None
+
+
+@dataclass
+class ScheduledTask:
+    """A submitted task waiting to be released to the queue."""
+    task_id: str
+    tenant_id: str
+    task_data: Dict[str, Any]
+    priority: TaskPriority
+    submitted_at: float
+    queue_name: Optional[str] = None
+    cost: float = 1.0
+
+
+@dataclass
+class _TenantState:
+    """Backlog and accounting for one tenant."""
+    policy: TenantPolicy
+    pending: Dict[TaskPriority, Deque[ScheduledTask]] = field(
+        default_factory=lambda: {priority: deque() for priority in PRIORITY_LEVELS}
+    )
+    pass_value: float = 0.0
+    in_flight: int = 0
+
+    @property
+    def backlog(self) -> int:
+        return sum(len(tasks) for tasks in self.pending.values())
+
+
+class FairShareScheduler:
+    """
+    Dispatcher releasing tasks to a task queue in fair-share order.
+    """
+
+    def __init__(
+        self,
+        queue: BaseTaskQueue,
+        max_in_flight: int = 10,
+        aging_interval: float = 60.0,
+        default_policy: Optional[TenantPolicy] = None,
+        tenant_policies: Optional[Dict[str, TenantPolicy]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize fair-share scheduler.
+
+        Args:
+            queue: Task queue tasks are released to
+            max_in_flight: Maximum tasks released and not yet finished
+            aging_interval: Seconds of waiting that raise a task one priority level (0 disables aging)
+            default_policy: Policy for tenants without their own
+            tenant_policies: Per-tenant policies
+            clock: Time source in seconds
+        """
+        self.queue = queue
+        self.max_in_flight = max_in_flight
+        self.aging_interval = aging_interval
+        self.default_policy = default_policy or TenantPolicy()
+        self.tenant_policies = dict(tenant_policies or {})
+        self.clock = clock
+
+        self._tenants: Dict[str, _TenantState] = {}
+        self._in_flight: Dict[str, str] = {}  # task_id -> tenant_id
+        self._lock = asyncio.Lock()
+
+        # Statistics
+        self.released = 0
+        self.aged_releases = 0
+        self.max_wait = 0.0
+
+    def set_tenant_policy(self, tenant_id: str, policy: TenantPolicy) -> None:
+        """Set the scheduling policy of a tenant."""
+        self.tenant_policies[tenant_id] = policy
+        if tenant_id in self._tenants:
+            self._tenants[tenant_id].policy = policy
+
+    async def enqueue_task(
+        self,
+        task_id: str,
+        task_data: Dict[str, Any],
+        tenant_id: str,
+        priority: TaskPriority = TaskPriority.NORMAL,
+        queue_name: Optional[str] = None,
+        cost: float = 1.0
+    ) -> bool:
+        """
+        Submit a task for fair-share release to the queue.
+
+        Args:
+            task_id: Task identifier
+            task_data: Task payload
+            tenant_id: Tenant (user or organization) the task belongs to
+            priority: Requested priority
+            queue_name: Backend queue name
+            cost: Relative cost of the task, e.g. expected duration
+
+        Returns:
+            Whether the task was accepted
+        """
+        tenant = self._get_tenant(tenant_id)
+        if tenant.backlog == 0 and tenant.in_flight == 0:
+            # A returning tenant starts level with the others instead of
+            # spending credit saved up while idle
+            tenant.pass_value = max(tenant.pass_value, self._min_active_pass())
+
+        tenant.pending[priority].append(ScheduledTask(
+            task_id=task_id,
+            tenant_id=tenant_id,
+            task_data=task_data,
+            priority=priority,
+            submitted_at=self.clock(),
+            queue_name=queue_name,
+            cost=cost
+        ))
+
+        await self.dispatch()
+        return True
+
+    async def task_finished(self, task_id: str) -> None:
+        """Report that a released task has finished, freeing its slots."""
+        tenant_id = self._in_flight.pop(task_id, None)
+        if tenant_id is not None:
+            self._tenants[tenant_id].in_flight -= 1
+            await self.dispatch()
+
+    async def dispatch(self) -> int:
+        """
+        Release tasks to the queue while there is capacity.
+
+        Returns:
+            Number of tasks released
+        """
+        released = 0
+        async with self._lock:
+            while len(self._in_flight) < self.max_in_flight:
+                selected = self._select_next()
+                if selected is None:
+                    break
+
+                tenant, task, effective_priority = selected
+                tenant.pending[task.priority].popleft()
+                tenant.in_flight += 1
+                self._in_flight[task.task_id] = task.tenant_id
+
+                try:
+                    accepted = await self.queue.enqueue_task(
+                        task_id=task.task_id,
+                        task_data=task.task_data,
+                        priority=effective_priority,
+                        queue_name=task.queue_name
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to release task {task.task_id} for tenant {task.tenant_id}: {e}")
+                    accepted = False
+
+                if not accepted:
+                    # Keep the task at the head of its tenant's backlog for
+                    # the next dispatch
+                    tenant.pending[task.priority].appendleft(task)
+                    tenant.in_flight -= 1
+                    del self._in_flight[task.task_id]
+                    break
+
+                tenant.pass_value += task.cost / (tenant.policy.weight * PRIORITY_SHARES[effective_priority])
+                wait = self.clock() - task.submitted_at
+                self.max_wait = max(self.max_wait, wait)
+                self.released += 1
+                if effective_priority != task.priority:
+                    self.aged_releases += 1
+                released += 1
+
+                logger.debug(
+                    f"Released task {task.task_id} for tenant {task.tenant_id} "
+                    f"at {effective_priority.value} after {wait:.1f}s"
+                )
+
+        return released
+
+    async def run(self, poll_interval: float = 1.0) -> None:
+        """Release tasks as released ones finish, polling the queue for completions."""
+        while True:
+            try:
+                for task_id in list(self._in_flight):
+                    task_info = await self.queue.get_task_status(task_id)
+                    if task_info is None or task_info.status in FINISHED_STATUSES:
+                        await self.task_finished(task_id)
+
+                await self.dispatch()
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in fair-share scheduler loop: {e}")
+
+            await asyncio.sleep(poll_interval)
+
+    def effective_priority(self, task: ScheduledTask, now: Optional[float] = None) -> TaskPriority:
+        """Get a task's priority raised by one level per aging interval waited."""
+        now = self.clock() if now is None else now
+        boost = int((now - task.submitted_at) // self.aging_interval) if self.aging_interval > 0 else 0
+        level = min(PRIORITY_LEVELS.index(task.priority) + boost, len(PRIORITY_LEVELS) - 1)
+        return PRIORITY_LEVELS[level]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduler statistics."""
+        return {
+            "released": self.released,
+            "aged_releases": self.aged_releases,
+            "max_wait": self.max_wait,
+            "in_flight": len(self._in_flight),
+            "tenants": {
+                tenant_id: {
+                    "backlog": tenant.backlog,
+                    "in_flight": tenant.in_flight,
+                    "weight": tenant.policy.weight,
+                }
+                for tenant_id, tenant in self._tenants.items()
+            },
+        }
+
+    def _select_next(self) -> Optional[Tuple[_TenantState, ScheduledTask, TaskPriority]]:
+        """Pick the next task: lowest-pass eligible tenant, then its most urgent task."""
+        now = self.clock()
+        best = None
+        best_key = None
+
+        for tenant in self._tenants.values():
+            cap = tenant.policy.max_concurrency
+            if cap is not None and tenant.in_flight >= cap:
+                continue
+
+            head = self._tenant_head(tenant, now)
+            if head is None:
+                continue
+
+            task, effective_priority = head
+            # Ties on pass go to the more urgent, then the older task
+            key = (tenant.pass_value, -PRIORITY_LEVELS.index(effective_priority), task.submitted_at)
+            if best_key is None or key < best_key:
+                best, best_key = (tenant, task, effective_priority), key
+
+        return best
+
+    def _tenant_head(self, tenant: _TenantState, now: float) -> Optional[Tuple[ScheduledTask, TaskPriority]]:
+        """
+        Get a tenant's most urgent task.
+
+        Only the oldest task of each requested priority can be the most
+        urgent, since older tasks of a priority have aged at least as far.
+        """
+        head = None
+        head_key = None
+
+        for tasks in tenant.pending.values():
+            if not tasks:
+                continue
+            task = tasks[0]
+            effective_priority = self.effective_priority(task, now)
+            key = (-PRIORITY_LEVELS.index(effective_priority), task.submitted_at)
+            if head_key is None or key < head_key:
+                head, head_key = (task, effective_priority), key
+
+        return head
+
+    def _get_tenant(self, tenant_id: str) -> _TenantState:
+        tenant = self._tenants.get(tenant_id)
+        if tenant is None:
+            policy = self.tenant_policies.get(tenant_id, self.default_policy)
+            tenant = self._tenants[tenant_id] = _TenantState(policy=policy)
+        return tenant
+
+    def _min_active_pass(self) -> float:
+        passes = [
+            tenant.pass_value for tenant in self._tenants.values()
+            if tenant.backlog or tenant.in_flight
+        ]
+        return min(passes) if passes else 0.0
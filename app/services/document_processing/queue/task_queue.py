@@ -8,11 +8,13 @@ including priority queues, retry mechanisms, and distributed processing.
 import asyncio
 import json
 import logging
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 from uuid import UUID, uuid4
 
 import redis.asyncio as redis
@@ -25,6 +27,89 @@ from app.core.config import get_settings
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Moves due delayed tasks of one queue to their priority lists, if this
+# promoter holds the queue's promoter lease (taken or renewed here).
+# KEYS: lease key, then delayed set and list of each priority.
+# ARGV: lease token, lease TTL in ms, current time, max tasks per priority.
+# Returns the number of promoted tasks, or -1 if another promoter holds the lease.
+PROMOTE_DELAYED_SCRIPT = """
+local holder = redis.call('GET', KEYS[1])
+if holder and holder ~= ARGV[1] then
+    return -1
+end
+redis.call('SET', KEYS[1], ARGV[1], 'PX', ARGV[2])
+
+local promoted = 0
+for i = 2, #KEYS, 2 do
+    local ready = redis.call('ZRANGEBYSCORE', KEYS[i], '-inf', ARGV[3], 'LIMIT', 0, ARGV[4])
+    if #ready > 0 then
+        redis.call('LPUSH', KEYS[i + 1], unpack(ready))
+        redis.call('ZREM', KEYS[i], unpack(ready))
+        promoted = promoted + #ready
+    end
+end
+return promoted
+"""
+
+# Applies the same status transition to each task hash, and the queue
+# counters for each task it applies to. A task is only updated if it exists
+# and its status is one of ARGV[1] (comma separated, empty for any).
+# KEYS: metrics hash, failed task set, then the task hashes. ARGV: allowed
+# statuses, task TTL, number of task fields, the task field/value pairs,
+# then metric field/increment pairs. Returns, per task, 1 if applied or
+# else its current status ('' for an unknown task).
+TRANSITION_SCRIPT = """
+local allowed = ',' .. ARGV[1] .. ','
+local n = tonumber(ARGV[3])
+local results = {}
+
+for k = 3, #KEYS do
+    local status = redis.call('HGET', KEYS[k], 'status')
+    if not status then
+        results[#results + 1] = ''
+    elseif ARGV[1] ~= '' and not string.find(allowed, ',' .. status .. ',', 1, true) then
+        results[#results + 1] = status
+    else
+        if n > 0 then
+            redis.call('HSET', KEYS[k], unpack(ARGV, 4, 3 + n * 2))
+            if redis.call('HGET', KEYS[k], 'status') == 'failure' then
+                local t = redis.call('TIME')
+                redis.call('ZADD', KEYS[2], t[1], redis.call('HGET', KEYS[k], 'task_id'))
+            end
+        end
+        redis.call('EXPIRE', KEYS[k], ARGV[2])
+
+        for i = 4 + n * 2, #ARGV, 2 do
+            redis.call('HINCRBYFLOAT', KEYS[1], ARGV[i], ARGV[i + 1])
+        end
+        results[#results + 1] = 1
+    end
+end
+return results
+"""
+
+# Upper bounds in seconds of the task duration histogram buckets
+DURATION_BUCKETS = (1, 5, 15, 30, 60, 120, 300, 600)
+
+# Pops up to ARGV[1] tasks from the priority lists in KEYS, highest first
+POP_BATCH_SCRIPT = """
+local remaining = tonumber(ARGV[1])
+local tasks = {}
+for _, key in ipairs(KEYS) do
+    if remaining == 0 then
+        break
+    end
+    local popped = redis.call('RPOP', key, remaining)
+    if popped then
+        for _, task in ipairs(popped) do
+            tasks[#tasks + 1] = task
+        end
+        remaining = remaining - #popped
+    end
+end
+return tasks
+"""
+
 
 class TaskPriority(str, Enum):
     """Task priority levels."""
@@ -64,6 +149,44 @@ class TaskInfo:
         if self.metadata is None:
             self.metadata = {}
 
+    def to_redis_hash(self) -> Dict[str, str]:
+        """Serialize to flat string fields for a Redis hash."""
+        return {
+            "task_id": self.task_id,
+            "queue_name": self.queue_name,
+            "priority": self.priority.value,
+            "status": self.status.value,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else "",
+            "completed_at": self.completed_at.isoformat() if self.completed_at else "",
+            "retry_count": str(self.retry_count),
+            "max_retries": str(self.max_retries),
+            "error_message": self.error_message or "",
+            "result": json.dumps(self.result) if self.result is not None else "",
+            "metadata": json.dumps(self.metadata),
+        }
+
+    @classmethod
+    def from_redis_hash(cls, data: Dict[str, str]) -> "TaskInfo":
+        """Deserialize from the fields of a Redis hash."""
+        def parse_datetime(value: str) -> Optional[datetime]:
+            return datetime.fromisoformat(value) if value else None
+
+        return cls(
+            task_id=data["task_id"],
+            queue_name=data["queue_name"],
+            priority=TaskPriority(data["priority"]),
+            status=TaskStatus(data["status"]),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            started_at=parse_datetime(data.get("started_at", "")),
+            completed_at=parse_datetime(data.get("completed_at", "")),
+            retry_count=int(data.get("retry_count", 0)),
+            max_retries=int(data.get("max_retries", 3)),
+            error_message=data.get("error_message") or None,
+            result=json.loads(data["result"]) if data.get("result") else None,
+            metadata=json.loads(data.get("metadata") or "{}"),
+        )
+
 
 class QueueMetrics(BaseModel):
     """Queue system metrics."""
@@ -76,6 +199,7 @@ class QueueMetrics(BaseModel):
     queue_lengths: Dict[str, int] = Field(default_factory=dict)
     worker_count: int = 0
     failed_tasks_last_hour: int = 0
+    duration_histogram: Dict[str, int] = Field(default_factory=dict)
 
 
 class BaseTaskQueue(ABC):
@@ -130,14 +254,35 @@ class ARQTaskQueue(BaseTaskQueue):
     
     Uses Redis as the backend with async/await support.
     Ideal for Python async applications.
+    
+    Each queue has one Redis list per priority. Workers wait on all of them
+    with a single BRPOP, which serves the lists in priority order. Delayed
+    tasks wait in a sorted set per priority and are moved to their list by
+    a background promoter; across processes, only the holder of a
+    per-queue lease promotes.
+    
+    Task state lives in one Redis hash per task (expiring task_ttl after
+    its last update) and counters in a metrics hash, so every process sees
+    the same status and metrics. Each status transition is a single script
+    call that checks the current status and updates task and counters
+    together. Task states read or written here are cached locally for
+    status_cache_ttl seconds.
     """
 
+    PRIORITY_ORDER = [TaskPriority.CRITICAL, TaskPriority.HIGH, TaskPriority.NORMAL, TaskPriority.LOW]
+
     def __init__(
         self,
         redis_url: Optional[str] = None,
         default_queue: str = "default",
         max_jobs: int = 10,
-        job_timeout: int = 300
+        job_timeout: int = 300,
+        redis_pool: Optional[redis.Redis] = None,
+        promote_interval: float = 0.5,
+        promote_batch_size: int = 100,
+        task_ttl: int = 86400,
+        status_cache_ttl: float = 1.0,
+        status_cache_size: int = 10000
     ):
         """
         Initialize ARQ task queue.
@@ -147,17 +292,36 @@ class ARQTaskQueue(BaseTaskQueue):
             default_queue: Default queue name
             max_jobs: Maximum concurrent jobs
             job_timeout: Job timeout in seconds
+            redis_pool: Existing Redis client to use instead of connecting
+            promote_interval: Seconds between delayed task promotions
+            promote_batch_size: Maximum delayed tasks promoted per priority at once
+            task_ttl: Seconds task state is kept after its last update
+            status_cache_ttl: Seconds a task state is reused locally before rereading it
+            status_cache_size: Maximum task states cached locally
         """
         self.redis_url = redis_url or settings.REDIS_URL
         self.default_queue = default_queue
         self.max_jobs = max_jobs
         self.job_timeout = job_timeout
+        self.promote_interval = promote_interval
+        self.promote_batch_size = promote_batch_size
+        self.task_ttl = task_ttl
+        self.status_cache_ttl = status_cache_ttl
+        self.status_cache_size = status_cache_size
+        self.metrics_key = f"queue:{default_queue}:metrics"
+        self.failed_tasks_key = f"queue:{default_queue}:failed"
         
         # Runtime state
-        self.redis_pool: Optional[redis.Redis] = None
-        self.task_registry: Dict[str, TaskInfo] = {}
-        self.metrics = QueueMetrics()
+        self.redis_pool: Optional[redis.Redis] = redis_pool
+        self.metrics = QueueMetrics()  # last metrics read from Redis
+        self._status_cache: OrderedDict[str, Tuple[float, TaskInfo]] = OrderedDict()
         self._initialized = False
+        self._queue_names = {default_queue}
+        self._promoter_id = uuid4().hex
+        self._promoter_task: Optional[asyncio.Task] = None
+        self._promote_script = None
+        self._pop_batch_script = None
+        self._transition_script = None
 
     async def initialize(self) -> None:
         """Initialize ARQ task queue."""
@@ -168,16 +332,24 @@ class ARQTaskQueue(BaseTaskQueue):
         
         try:
             # Create Redis connection pool
-            self.redis_pool = redis.from_url(
-                self.redis_url,
-                encoding="utf-8",
-                decode_responses=True,
-                max_connections=20
-            )
+            if self.redis_pool is None:
+                self.redis_pool = redis.from_url(
+                    self.redis_url,
+                    encoding="utf-8",
+                    decode_responses=True,
+                    max_connections=20
+                )
             
             # Test connection
             await self.redis_pool.ping()
             
+            self._promote_script = self.redis_pool.register_script(PROMOTE_DELAYED_SCRIPT)
+            self._pop_batch_script = self.redis_pool.register_script(POP_BATCH_SCRIPT)
+            self._transition_script = self.redis_pool.register_script(TRANSITION_SCRIPT)
+            for script in (PROMOTE_DELAYED_SCRIPT, POP_BATCH_SCRIPT, TRANSITION_SCRIPT):
+                await self.redis_pool.script_load(script)
+            self._promoter_task = asyncio.create_task(self._delayed_promoter_loop())
+            
             self._initialized = True
             logger.info("ARQ task queue initialized successfully")
             
@@ -190,6 +362,14 @@ class ARQTaskQueue(BaseTaskQueue):
         logger.info("Shutting down ARQ task queue")
         
         try:
+            if self._promoter_task:
+                self._promoter_task.cancel()
+                try:
+                    await self._promoter_task
+                except asyncio.CancelledError:
+                    pass
+                self._promoter_task = None
+            
             if self.redis_pool:
                 await self.redis_pool.close()
             
@@ -211,6 +391,7 @@ class ARQTaskQueue(BaseTaskQueue):
             raise RuntimeError("Task queue not initialized")
         
         queue_name = queue_name or self.default_queue
+        self._queue_names.add(queue_name)
         
         try:
             # Create task info
@@ -223,9 +404,6 @@ class ARQTaskQueue(BaseTaskQueue):
                 metadata={"task_data": task_data}
             )
             
-            # Store task info
-            self.task_registry[task_id] = task_info
-            
             # Prepare task payload
             task_payload = {
                 "task_id": task_id,
@@ -235,23 +413,17 @@ class ARQTaskQueue(BaseTaskQueue):
                 "queue_name": queue_name
             }
             
-            # Determine queue key based on priority
-            queue_key = self._get_priority_queue_key(queue_name, priority)
-            
-            if delay_seconds and delay_seconds > 0:
-                # Schedule task for later execution
-                execute_at = datetime.utcnow() + timedelta(seconds=delay_seconds)
-                await self.redis_pool.zadd(
-                    f"{queue_key}:delayed",
-                    {json.dumps(task_payload): execute_at.timestamp()}
-                )
-            else:
-                # Add to immediate execution queue
-                await self.redis_pool.lpush(queue_key, json.dumps(task_payload))
+            # Store task info, update metrics and queue the task atomically
+            async with self.redis_pool.pipeline(transaction=True) as pipe:
+                task_key = self._get_task_key(task_id)
+                pipe.hset(task_key, mapping=task_info.to_redis_hash())
+                pipe.expire(task_key, self.task_ttl)
+                pipe.hincrby(self.metrics_key, "total_tasks_enqueued", 1)
+                pipe.hincrby(self.metrics_key, "pending_tasks", 1)
+                self._queue_payload(pipe, task_payload, delay_seconds)
+                await pipe.execute()
             
-            # Update metrics
-            self.metrics.total_tasks_enqueued += 1
-            self.metrics.pending_tasks += 1
+            self._cache_task(task_info)
             
             logger.info(f"Enqueued task {task_id} to queue {queue_name} with priority {priority.value}")
             return True
@@ -260,41 +432,35 @@ class ARQTaskQueue(BaseTaskQueue):
             logger.error(f"Failed to enqueue task {task_id}: {e}")
             return False
 
-    async def dequeue_task(self, queue_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
-        """Dequeue the next available task."""
+    async def dequeue_task(
+        self,
+        queue_name: Optional[str] = None,
+        timeout: float = 1.0
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Dequeue the next available task, highest priority first.
+        
+        Args:
+            queue_name: Queue to take the task from
+            timeout: Seconds to wait for a task when all priorities are empty
+        """
         if not self._initialized or not self.redis_pool:
             raise RuntimeError("Task queue not initialized")
         
         queue_name = queue_name or self.default_queue
+        self._queue_names.add(queue_name)
         
         try:
-            # Check for delayed tasks that are ready
-            await self._process_delayed_tasks(queue_name)
+            # One blocking pop across all priorities; Redis pops from the
+            # first non-empty list in key order
+            result = await self.redis_pool.brpop(self._get_priority_queue_keys(queue_name), timeout=timeout)
             
-            # Try to get task from priority queues (highest priority first)
-            for priority in [TaskPriority.CRITICAL, TaskPriority.HIGH, TaskPriority.NORMAL, TaskPriority.LOW]:
-                queue_key = self._get_priority_queue_key(queue_name, priority)
-                
-                # Use blocking pop with timeout
-                result = await self.redis_pool.brpop(queue_key, timeout=1)
-                
-                if result:
-                    _, task_payload_str = result
-                    task_payload = json.loads(task_payload_str)
-                    task_id = task_payload["task_id"]
-                    
-                    # Update task status
-                    if task_id in self.task_registry:
-                        task_info = self.task_registry[task_id]
-                        task_info.status = TaskStatus.RUNNING
-                        task_info.started_at = datetime.utcnow()
-                        
-                        # Update metrics
-                        self.metrics.pending_tasks -= 1
-                        self.metrics.active_tasks += 1
-                    
-                    logger.debug(f"Dequeued task {task_id} from {queue_key}")
-                    return task_payload
+            if result:
+                queue_key, task_payload_str = result
+                tasks = await self._mark_dequeued([task_payload_str])
+                if tasks:
+                    logger.debug(f"Dequeued task {tasks[0]['task_id']} from {queue_key}")
+                    return tasks[0]
             
             return None
             
@@ -302,9 +468,96 @@ class ARQTaskQueue(BaseTaskQueue):
             logger.error(f"Failed to dequeue task: {e}")
             return None
 
+    async def dequeue_tasks(
+        self,
+        max_tasks: int,
+        queue_name: Optional[str] = None,
+        timeout: float = 1.0
+    ) -> List[Dict[str, Any]]:
+        """
+        Dequeue up to max_tasks tasks, highest priority first.
+        
+        Takes whatever is available in one round trip; only waits (up to
+        timeout) when every priority is empty.
+        
+        Args:
+            max_tasks: Maximum number of tasks to return
+            queue_name: Queue to take the tasks from
+            timeout: Seconds to wait for a first task when all priorities are empty
+        """
+        if not self._initialized or not self.redis_pool:
+            raise RuntimeError("Task queue not initialized")
+        
+        queue_name = queue_name or self.default_queue
+        self._queue_names.add(queue_name)
+        queue_keys = self._get_priority_queue_keys(queue_name)
+        
+        try:
+            payloads = await self._pop_batch_script(keys=queue_keys, args=[max_tasks])
+            
+            if not payloads:
+                result = await self.redis_pool.brpop(queue_keys, timeout=timeout)
+                if not result:
+                    return []
+                payloads = [result[1]]
+                if max_tasks > 1:
+                    payloads += await self._pop_batch_script(keys=queue_keys, args=[max_tasks - 1])
+            
+            tasks = await self._mark_dequeued(payloads)
+            logger.debug(f"Dequeued {len(tasks)} tasks from queue {queue_name}")
+            return tasks
+            
+        except Exception as e:
+            logger.error(f"Failed to dequeue tasks: {e}")
+            return []
+
+    async def _mark_dequeued(self, task_payload_strs: List[str]) -> List[Dict[str, Any]]:
+        """
+        Decode dequeued task payloads and mark the tasks running.
+        
+        Tasks cancelled while they were being popped are dropped.
+        """
+        task_payloads = [json.loads(payload) for payload in task_payload_strs]
+        
+        results = await self._transition(
+            [task_payload["task_id"] for task_payload in task_payloads],
+            allowed=[TaskStatus.PENDING, TaskStatus.RETRY],
+            fields={"status": TaskStatus.RUNNING.value, "started_at": datetime.utcnow().isoformat()},
+            counters={"pending_tasks": -1, "active_tasks": 1}
+        )
+        
+        tasks = []
+        for task_payload, applied in zip(task_payloads, results):
+            self._status_cache.pop(task_payload["task_id"], None)
+            if applied == TaskStatus.CANCELLED.value:
+                logger.debug(f"Dropped cancelled task {task_payload['task_id']}")
+                continue
+            tasks.append(task_payload)
+        
+        return tasks
+
     async def get_task_status(self, task_id: str) -> Optional[TaskInfo]:
         """Get the status of a specific task."""
-        return self.task_registry.get(task_id)
+        cached = self._status_cache.get(task_id)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        
+        if not self._initialized or not self.redis_pool:
+            return None
+        
+        try:
+            data = await self.redis_pool.hgetall(self._get_task_key(task_id))
+        except Exception as e:
+            logger.error(f"Failed to get status of task {task_id}: {e}")
+            return cached[1] if cached else None
+        
+        if not data:
+            self._status_cache.pop(task_id, None)
+            return None
+        
+        task_info = TaskInfo.from_redis_hash(data)
+        self._cache_task(task_info)
+        return task_info
 
     async def cancel_task(self, task_id: str) -> bool:
         """Cancel a pending task."""
@@ -312,14 +565,22 @@ class ARQTaskQueue(BaseTaskQueue):
             raise RuntimeError("Task queue not initialized")
         
         try:
-            if task_id not in self.task_registry:
-                return False
-            
-            task_info = self.task_registry[task_id]
-            
-            if task_info.status not in [TaskStatus.PENDING, TaskStatus.RETRY]:
+            # Mark cancelled first so a worker popping it concurrently drops it
+            [applied] = await self._transition(
+                [task_id],
+                allowed=[TaskStatus.PENDING, TaskStatus.RETRY],
+                fields={
+                    "status": TaskStatus.CANCELLED.value,
+                    "completed_at": datetime.utcnow().isoformat(),
+                },
+                counters={"pending_tasks": -1}
+            )
+            self._status_cache.pop(task_id, None)
+            if applied != 1:
                 return False  # Can only cancel pending tasks
             
+            task_info = await self.get_task_status(task_id)
+            
             # Remove from queue
             queue_key = self._get_priority_queue_key(task_info.queue_name, task_info.priority)
             
@@ -340,13 +601,6 @@ class ARQTaskQueue(BaseTaskQueue):
                     await self.redis_pool.zrem(delayed_key, item)
                     break
             
-            # Update task status
-            task_info.status = TaskStatus.CANCELLED
-            task_info.completed_at = datetime.utcnow()
-            
-            # Update metrics
-            self.metrics.pending_tasks -= 1
-            
             logger.info(f"Cancelled task {task_id}")
             return True
             
@@ -362,45 +616,57 @@ class ARQTaskQueue(BaseTaskQueue):
         error_message: Optional[str] = None
     ) -> None:
         """Mark a task as completed."""
-        if task_id not in self.task_registry:
+        task_info = await self.get_task_status(task_id)
+        if task_info is None:
             return
         
-        task_info = self.task_registry[task_id]
-        task_info.completed_at = datetime.utcnow()
-        task_info.result = result
-        task_info.error_message = error_message
+        completed_at = datetime.utcnow()
+        fields = {
+            "completed_at": completed_at.isoformat(),
+            "result": json.dumps(result) if result is not None else "",
+            "error_message": error_message or "",
+        }
+        counters = {"active_tasks": -1}
+        
+        # Record the task duration
+        if task_info.started_at:
+            counters.update(self._duration_counters(
+                (completed_at - task_info.started_at).total_seconds()
+            ))
         
         if success:
-            task_info.status = TaskStatus.SUCCESS
-            self.metrics.total_tasks_completed += 1
-        else:
-            if task_info.retry_count < task_info.max_retries:
-                # Retry the task
-                task_info.status = TaskStatus.RETRY
-                task_info.retry_count += 1
+            fields["status"] = TaskStatus.SUCCESS.value
+            counters["total_tasks_completed"] = 1
+            await self._transition([task_id], [TaskStatus.RUNNING], fields, counters)
+            
+        elif task_info.retry_count < task_info.max_retries:
+            # Retry the task with exponential backoff
+            retry_count = task_info.retry_count + 1
+            delay_seconds = min(300, 5 * (2 ** retry_count))
+            fields.update(status=TaskStatus.RETRY.value, retry_count=str(retry_count))
+            counters.update(total_tasks_enqueued=1, pending_tasks=1)
+            
+            [applied] = await self._transition([task_id], [TaskStatus.RUNNING], fields, counters)
+            if applied == 1:
+                task_payload = {
+                    "task_id": task_id,
+                    "task_data": task_info.metadata.get("task_data", {}),
+                    "priority": task_info.priority.value,
+                    "created_at": task_info.created_at.isoformat(),
+                    "queue_name": task_info.queue_name
+                }
+                async with self.redis_pool.pipeline(transaction=False) as pipe:
+                    self._queue_payload(pipe, task_payload, delay_seconds)
+                    await pipe.execute()
                 
-                # Re-enqueue with exponential backoff
-                delay_seconds = min(300, 5 * (2 ** task_info.retry_count))
-                await self.enqueue_task(
-                    task_id=task_id,
-                    task_data=task_info.metadata["task_data"],
-                    priority=task_info.priority,
-                    delay_seconds=delay_seconds,
-                    queue_name=task_info.queue_name
-                )
+                logger.info(f"Retrying task {task_id} in {delay_seconds} seconds (attempt {retry_count})")
                 
-                logger.info(f"Retrying task {task_id} in {delay_seconds} seconds (attempt {task_info.retry_count})")
-            else:
-                task_info.status = TaskStatus.FAILURE
-                self.metrics.total_tasks_failed += 1
-        
-        # Update metrics
-        self.metrics.active_tasks -= 1
+        else:
+            fields["status"] = TaskStatus.FAILURE.value
+            counters["total_tasks_failed"] = 1
+            await self._transition([task_id], [TaskStatus.RUNNING], fields, counters)
         
-        # Update average task duration
-        if task_info.started_at and task_info.completed_at:
-            duration = (task_info.completed_at - task_info.started_at).total_seconds()
-            self._update_average_duration(duration)
+        self._status_cache.pop(task_id, None)
 
     async def get_metrics(self) -> QueueMetrics:
         """Get comprehensive queue metrics."""
@@ -408,25 +674,46 @@ class ARQTaskQueue(BaseTaskQueue):
             return self.metrics
         
         try:
+            async with self.redis_pool.pipeline(transaction=False) as pipe:
+                pipe.hgetall(self.metrics_key)
+                pipe.zremrangebyscore(self.failed_tasks_key, "-inf", time.time() - 3600)
+                pipe.zcard(self.failed_tasks_key)
+                for priority in TaskPriority:
+                    pipe.llen(self._get_priority_queue_key(self.default_queue, priority))
+                counters, _, failed_count, *lengths = await pipe.execute()
+            
+            def counter(name: str) -> int:
+                return int(float(counters.get(name, 0)))
+            
             # Update queue lengths
-            queue_lengths = {}
-            for priority in TaskPriority:
-                queue_key = self._get_priority_queue_key(self.default_queue, priority)
-                length = await self.redis_pool.llen(queue_key)
-                if length > 0:
-                    queue_lengths[f"{self.default_queue}:{priority.value}"] = length
-            
-            self.metrics.queue_lengths = queue_lengths
-            
-            # Count failed tasks in last hour
-            cutoff_time = datetime.utcnow() - timedelta(hours=1)
-            failed_count = sum(
-                1 for task in self.task_registry.values()
-                if (task.status == TaskStatus.FAILURE and 
-                    task.completed_at and 
-                    task.completed_at > cutoff_time)
+            queue_lengths = {
+                f"{self.default_queue}:{priority.value}": length
+                for priority, length in zip(TaskPriority, lengths)
+                if length > 0
+            }
+            
+            # Cumulative duration histogram, Prometheus style
+            histogram = {}
+            cumulative = 0
+            for bound in [*DURATION_BUCKETS, "+Inf"]:
+                cumulative += counter(f"duration_bucket:{bound}")
+                histogram[str(bound)] = cumulative
+            
+            duration_count = counter("duration_count")
+            duration_sum = float(counters.get("duration_sum", 0))
+            
+            self.metrics = QueueMetrics(
+                total_tasks_enqueued=counter("total_tasks_enqueued"),
+                total_tasks_completed=counter("total_tasks_completed"),
+                total_tasks_failed=counter("total_tasks_failed"),
+                active_tasks=counter("active_tasks"),
+                pending_tasks=counter("pending_tasks"),
+                average_task_duration=duration_sum / duration_count if duration_count else 0.0,
+                queue_lengths=queue_lengths,
+                worker_count=self.metrics.worker_count,
+                failed_tasks_last_hour=failed_count,
+                duration_histogram=histogram
             )
-            self.metrics.failed_tasks_last_hour = failed_count
             
             return self.metrics
             
@@ -434,43 +721,106 @@ class ARQTaskQueue(BaseTaskQueue):
             logger.error(f"Failed to get queue metrics: {e}")
             return self.metrics
 
-    async def _process_delayed_tasks(self, queue_name: str) -> None:
-        """Move delayed tasks to immediate execution queues if ready."""
-        try:
-            current_time = datetime.utcnow().timestamp()
+    async def _transition(
+        self,
+        task_ids: List[str],
+        allowed: List[TaskStatus],
+        fields: Dict[str, str],
+        counters: Dict[str, float]
+    ) -> List[Union[int, str]]:
+        """
+        Apply a status transition to tasks and the queue counters in one call.
+        
+        Returns:
+            Per task, 1 if applied, otherwise its current status ('' if unknown)
+        """
+        args = [",".join(status.value for status in allowed), self.task_ttl, len(fields)]
+        for field, value in fields.items():
+            args += [field, value]
+        for field, increment in counters.items():
+            args += [field, increment]
+        
+        return await self._transition_script(
+            keys=[self.metrics_key, self.failed_tasks_key, *map(self._get_task_key, task_ids)],
+            args=args
+        )
+
+    def _queue_payload(self, pipe: Any, task_payload: Dict[str, Any], delay_seconds: Optional[int]) -> None:
+        """Add a task payload to its priority list, or its delayed set, on a pipeline."""
+        queue_key = self._get_priority_queue_key(
+            task_payload["queue_name"], TaskPriority(task_payload["priority"])
+        )
+        
+        if delay_seconds and delay_seconds > 0:
+            # Schedule task for later execution
+            pipe.zadd(f"{queue_key}:delayed", {json.dumps(task_payload): time.time() + delay_seconds})
+        else:
+            # Add to immediate execution queue
+            pipe.lpush(queue_key, json.dumps(task_payload))
+
+    def _cache_task(self, task_info: TaskInfo) -> None:
+        """Cache a task state locally for status polling."""
+        self._status_cache[task_info.task_id] = (time.monotonic() + self.status_cache_ttl, task_info)
+        self._status_cache.move_to_end(task_info.task_id)
+        while len(self._status_cache) > self.status_cache_size:
+            self._status_cache.popitem(last=False)
+
+    @staticmethod
+    def _duration_counters(duration: float) -> Dict[str, float]:
+        """Metric increments recording one task duration in the histogram."""
+        bucket = next((bound for bound in DURATION_BUCKETS if duration <= bound), "+Inf")
+        return {
+            f"duration_bucket:{bucket}": 1,
+            "duration_count": 1,
+            "duration_sum": round(duration, 6),
+        }
+
+    async def _process_delayed_tasks(self, queue_name: str) -> int:
+        """
+        Move delayed tasks to immediate execution queues if ready.
+        
+        Returns:
+            Number of tasks moved, or -1 if another process is promoting this queue
+        """
+        keys = [f"queue:{queue_name}:promoter"]
+        for priority in TaskPriority:
+            queue_key = self._get_priority_queue_key(queue_name, priority)
+            keys += [f"{queue_key}:delayed", queue_key]
+        
+        # The lease outlives a few intervals so a live promoter keeps it
+        lease_ms = int(self.promote_interval * 3000) + 1000
+        return await self._promote_script(
+            keys=keys,
+            args=[self._promoter_id, lease_ms, time.time(), self.promote_batch_size]
+        )
+
+    async def _delayed_promoter_loop(self) -> None:
+        """Promote due delayed tasks of every known queue in the background."""
+        while True:
+            try:
+                for queue_name in list(self._queue_names):
+                    promoted = await self._process_delayed_tasks(queue_name)
+                    if promoted > 0:
+                        logger.debug(f"Promoted {promoted} delayed tasks in queue {queue_name}")
+                        
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to process delayed tasks: {e}")
             
-            for priority in TaskPriority:
-                queue_key = self._get_priority_queue_key(queue_name, priority)
-                delayed_key = f"{queue_key}:delayed"
-                
-                # Get tasks ready for execution
-                ready_tasks = await self.redis_pool.zrangebyscore(
-                    delayed_key, 0, current_time, withscores=True
-                )
-                
-                for task_payload_str, score in ready_tasks:
-                    # Move to immediate queue
-                    await self.redis_pool.lpush(queue_key, task_payload_str)
-                    await self.redis_pool.zrem(delayed_key, task_payload_str)
-                    
-        except Exception as e:
-            logger.error(f"Failed to process delayed tasks: {e}")
+            await asyncio.sleep(self.promote_interval)
 
     def _get_priority_queue_key(self, queue_name: str, priority: TaskPriority) -> str:
         """Get the Redis key for a priority queue."""
         return f"queue:{queue_name}:{priority.value}"
 
-    def _update_average_duration(self, duration: float) -> None:
-        """Update average task duration metric."""
-        if self.metrics.average_task_duration == 0:
-            self.metrics.average_task_duration = duration
-        else:
-            # Exponential moving average
-            alpha = 0.1
-            self.metrics.average_task_duration = (
-                alpha * duration + 
-                (1 - alpha) * self.metrics.average_task_duration
-            )
+    def _get_task_key(self, task_id: str) -> str:
+        """Get the Redis key of a task's state hash."""
+        return f"queue:task:{task_id}"
+
+    def _get_priority_queue_keys(self, queue_name: str) -> List[str]:
+        """Get the Redis keys of a queue's priority lists, highest priority first."""
+        return [self._get_priority_queue_key(queue_name, priority) for priority in self.PRIORITY_ORDER]
 
 
 class CeleryTaskQueue(BaseTaskQueue):
@@ -321,6 +321,85 @@ class S3StorageManager:
             logger.error(f"Failed to download {key}: {e}")
             raise
 
+    async def upload_bytes(
+        self,
+        data: bytes,
+        key: str,
+        bucket: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None,
+        content_type: str = "application/octet-stream"
+    ) -> Dict[str, Any]:
+        """
+        Upload an in-memory object with a single PUT.
+        
+        Args:
+            data: Object content
+            key: S3 object key
+            bucket: Bucket name (uses default if not specified)
+            metadata: Custom metadata to attach
+            content_type: MIME type
+            
+        Returns:
+            Dict containing upload result information
+        """
+        bucket = bucket or self.bucket_name
+        
+        try:
+            async with self._get_client() as client:
+                response = await client.put_object(
+                    Bucket=bucket,
+                    Key=key,
+                    Body=data,
+                    ContentType=content_type,
+                    Metadata=metadata or {}
+                )
+            
+            self.metrics.total_uploads += 1
+            self.metrics.total_bytes_uploaded += len(data)
+            
+            return {
+                "key": key,
+                "bucket": bucket,
+                "size": len(data),
+                "etag": response["ETag"].strip('"')
+            }
+            
+        except Exception as e:
+            self.metrics.failed_uploads += 1
+            logger.error(f"Failed to upload {key}: {e}")
+            raise
+
+    async def stream_object(
+        self,
+        key: str,
+        bucket: Optional[str] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Stream an object, or an inclusive byte range of it, in chunks.
+        
+        Only one chunk is held at a time, so objects of any size can be
+        relayed to a client without buffering them.
+        
+        Args:
+            key: S3 object key
+            bucket: Bucket name (uses default if not specified)
+            start: First byte to return
+            end: Last byte to return (inclusive)
+        """
+        bucket = bucket or self.bucket_name
+        params = {"Bucket": bucket, "Key": key}
+        if start is not None or end is not None:
+            params["Range"] = f"bytes={start or 0}-{'' if end is None else end}"
+        
+        async with self._get_client() as client:
+            response = await client.get_object(**params)
+            async with response["Body"] as body:
+                async for chunk in body.iter_chunks(chunk_size=self.chunk_size):
+                    self.metrics.total_bytes_downloaded += len(chunk)
+                    yield chunk
+
     async def start_multipart_upload(
         self,
         key: str,
@@ -10,24 +10,27 @@ Provides functionality to render LaTeX equations to various formats:
 
 import re
 import base64
+import math
+import struct
+import threading
+from collections import OrderedDict
 from io import BytesIO
 from typing import List, Dict, Optional, Any, Tuple, Union
 from dataclasses import dataclass
 import structlog
 
-# Optional imports for equation rendering
+# Optional imports for equation rendering. Only the object-oriented API is
+# used (no pyplot), so rendering never touches global figure state.
 try:
-    import matplotlib.pyplot as plt
-    import matplotlib.patches as patches
-    from matplotlib.patches import Rectangle
-    import numpy as np
+    from matplotlib.figure import Figure
+    from matplotlib.font_manager import FontProperties
+    from matplotlib.mathtext import MathTextParser
     MATPLOTLIB_AVAILABLE = True
 except ImportError:
     MATPLOTLIB_AVAILABLE = False
-    plt = None
-    patches = None
-    Rectangle = None
-    np = None
+    Figure = None
+    FontProperties = None
+    MathTextParser = None
 
 try:
     from sympy import latex, sympify, symbols, parse_latex
@@ -75,6 +78,177 @@ class RenderedEquation:
     info: Optional[EquationInfo] = None
 
 
+# Math in slide text: display math ($$...$$) is matched before inline ($...$).
+# As in Pandoc, inline math opens with a $ followed by a non-space and closes
+# with a $ after a non-space that is not followed by a digit, so prices such
+# as "$5 and $10" stay text
+MATH_PATTERN = re.compile(
+    r'\$\$(.+?)\$\$'
+    r'|(?<![\\$])\$(?![\s$])((?:\\.|[^\\$])+?)(?<!\s)\$(?!\d)',
+    re.DOTALL
+)
+
+_DELIMITERS = (('$$', '$$'), ('\\[', '\\]'), ('\\(', '\\)'), ('$', '$'))
+_LATEX_TOKEN = re.compile(r'\\[a-zA-Z]+|\\.|\s+|.', re.DOTALL)
+_TEXT_COMMANDS = {'\\text', '\\mbox', '\\textrm', '\\textit', '\\textbf', '\\textsf', '\\texttt'}
+
+
+def normalize_latex(latex_code: str) -> str:
+    """
+    Canonical form of an expression, used for rendering and cache keys.
+
+    Strips surrounding math delimiters and drops whitespace that math mode
+    ignores, so "$a + b$", "\\[a+b\\]" and "a  +  b" are the same equation.
+    Spaces are kept where they end a control word ("\\alpha b") and inside
+    text-mode groups.
+    """
+    code = latex_code.strip()
+    for opening, closing in _DELIMITERS:
+        inner = code[len(opening):len(code) - len(closing)]
+        if (len(code) >= len(opening) + len(closing) and code.startswith(opening)
+                and code.endswith(closing) and closing not in inner):
+            code = inner.strip()
+            break
+
+    tokens = _LATEX_TOKEN.findall(code)
+    normalized: List[str] = []
+    text_depth = 0
+    after_text_command = False
+
+    for i, token in enumerate(tokens):
+        if token.isspace():
+            if text_depth:
+                normalized.append(' ')
+            elif (normalized and normalized[-1][1:].isalpha() and normalized[-1][:1] == '\\'
+                  and i + 1 < len(tokens) and tokens[i + 1][:1].isalpha()):
+                normalized.append(' ')
+            continue
+
+        if text_depth:
+            if token == '{':
+                text_depth += 1
+            elif token == '}':
+                text_depth -= 1
+        elif after_text_command and token == '{':
+            text_depth = 1
+
+        after_text_command = token in _TEXT_COMMANDS
+        normalized.append(token)
+
+    return ''.join(normalized)
+
+
+@dataclass(frozen=True)
+class EquationImage:
+    """An equation rendered to one output format."""
+    data: bytes
+    format: str
+    width: int  # pixels at dpi; points for vector formats
+    height: int
+    depth: int  # extent below the baseline, same units
+    dpi: int
+
+    @property
+    def width_inches(self) -> float:
+        return self.width / self.dpi
+
+    @property
+    def height_inches(self) -> float:
+        return self.height / self.dpi
+
+
+_MISSING = object()
+
+
+class EquationRenderCache:
+    """
+    Byte-bounded LRU of rendered equations.
+
+    Keys combine the normalized LaTeX with everything that changes the output
+    (equation type, font set, size, DPI, format, color). Expressions mathtext
+    cannot parse are remembered too, so a bad equation repeated on every
+    slide is parsed once. Thread-safe; exporters share one instance.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, max_entry_bytes: int = 2 * 1024 * 1024,
+                 max_failures: int = 1024):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.max_failures = max_failures
+        self._entries: "OrderedDict[Tuple, EquationImage]" = OrderedDict()
+        self._failures: "OrderedDict[Tuple, None]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Tuple, default: Any = None) -> Any:
+        """Get a cached image, None for a known failure, else default."""
+        with self._lock:
+            image = self._entries.get(key)
+            if image is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return image
+            if key in self._failures:
+                self.hits += 1
+                return None
+            self.misses += 1
+            return default
+
+    def put(self, key: Tuple, image: Optional[EquationImage]) -> None:
+        """Store a rendered image, or None to record a failure."""
+        with self._lock:
+            if image is None:
+                self._failures[key] = None
+                while len(self._failures) > self.max_failures:
+                    self._failures.popitem(last=False)
+                return
+
+            if len(image.data) > self.max_entry_bytes:
+                return
+
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous.data)
+            self._entries[key] = image
+            self._size += len(image.data)
+
+            while self._size > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.data)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all cached renders."""
+        with self._lock:
+            self._entries.clear()
+            self._failures.clear()
+            self._size = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache statistics."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "failures": len(self._failures),
+                "bytes": self._size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+# Shared by the LaTeX processor and the PPTX, PDF and HTML exporters of one
+# process; format export pool processes each keep their own
+default_equation_cache = EquationRenderCache()
+
+# mathtext's parser and font caches are not thread-safe
+_render_lock = threading.Lock()
+
+
 class EquationParser:
     """Parses LaTeX equations to extract structure and information."""
     
@@ -214,12 +388,34 @@ class EquationParser:
 
 
 class EquationRenderer:
-    """Renders LaTeX equations to various formats."""
-    
-    def __init__(self, dpi: int = 150, font_size: int = 12):
+    """
+    Renders LaTeX equations to various formats.
+
+    Layout uses matplotlib's mathtext, which brings its own TeX-style parser
+    and fonts, so no TeX installation is needed. PNG is produced at the
+    requested DPI and SVG/PDF as vector output; renders are memoized in a
+    shared EquationRenderCache.
+    """
+
+    VECTOR_FORMATS = {'svg', 'pdf'}
+    # Points of transparent margin around the ink
+    PADDING = 2.0
+    # Gap between lines of a multi-line display, in ems
+    LINE_GAP = 0.4
+
+    ENVIRONMENT_PATTERN = re.compile(r'\\(?:begin|end)\{(?:equation|align|gather|multline|eqnarray|split)\*?\}')
+    LINE_BREAK_PATTERN = re.compile(r'\\\\(?:\[[^\]]*\])?')
+    IGNORED_PATTERN = re.compile(r'\\label\{[^}]*\}|\\(?:nonumber|notag|displaystyle|textstyle)|&')
+
+    def __init__(self, dpi: int = 150, font_size: int = 12, fontset: str = 'cm',
+                 color: str = 'black', cache: Optional[EquationRenderCache] = None):
         self.dpi = dpi
         self.font_size = font_size
+        self.fontset = fontset
+        self.color = color
+        self.cache = cache if cache is not None else default_equation_cache
         self.parser = EquationParser()
+        self._math_parser = MathTextParser('path') if MATPLOTLIB_AVAILABLE else None
         
         if not MATPLOTLIB_AVAILABLE:
             logger.warning("matplotlib not available, image rendering disabled")
@@ -239,21 +435,18 @@ class EquationRenderer:
         )
         
         # Render to requested formats
-        if 'png' in formats and MATPLOTLIB_AVAILABLE:
-            try:
-                png_data, width, height, baseline = self._render_to_png(latex_code, equation_type)
-                rendered.png_data = png_data
-                rendered.width = width
-                rendered.height = height
-                rendered.baseline = baseline
-            except Exception as e:
-                logger.error(f"Failed to render equation to PNG: {e}")
-        
-        if 'svg' in formats and MATPLOTLIB_AVAILABLE:
-            try:
-                rendered.svg_data = self._render_to_svg(latex_code, equation_type)
-            except Exception as e:
-                logger.error(f"Failed to render equation to SVG: {e}")
+        if 'png' in formats:
+            image = self.render_image(latex_code, 'png', equation_type)
+            if image is not None:
+                rendered.png_data = image.data
+                rendered.width = image.width
+                rendered.height = image.height
+                rendered.baseline = image.height - image.depth
+        
+        if 'svg' in formats:
+            image = self.render_image(latex_code, 'svg', equation_type)
+            if image is not None:
+                rendered.svg_data = image.data.decode('utf-8')
         
         if 'mathml' in formats:
             try:
@@ -266,88 +459,86 @@ class EquationRenderer:
         
         return rendered
     
-    def _render_to_png(self, latex_code: str, equation_type: str) -> Tuple[bytes, int, int, int]:
-        """Render equation to PNG image."""
+    def render_image(self, latex_code: str, format: str = 'png', equation_type: str = 'display',
+                     dpi: Optional[int] = None, font_size: Optional[float] = None) -> Optional[EquationImage]:
+        """
+        Render an equation to a single format through the render cache.
+        
+        Returns None when matplotlib is unavailable or mathtext cannot lay
+        out the expression; callers fall back to text.
+        """
         if not MATPLOTLIB_AVAILABLE:
-            raise ImportError("matplotlib is not available")
-        
-        # Set up matplotlib for LaTeX rendering
-        plt.rcParams['text.usetex'] = True
-        plt.rcParams['font.family'] = 'serif'
-        plt.rcParams['font.size'] = self.font_size
+            return None
         
-        # Create figure
-        fig, ax = plt.subplots(figsize=(10, 3))
-        ax.axis('off')
+        code = normalize_latex(latex_code)
+        if not code:
+            return None
         
-        # Prepare LaTeX string
-        if equation_type == 'inline':
-            latex_string = f'${latex_code}$'
-        else:
-            latex_string = f'$\\displaystyle {latex_code}$'
+        # Vector output does not depend on DPI; it is measured in points
+        dpi = 72 if format in self.VECTOR_FORMATS else int(dpi or self.dpi)
+        font_size = float(font_size or self.font_size)
+        key = (code, equation_type, self.fontset, font_size, dpi, format, self.color)
         
-        # Render equation
-        text = ax.text(0.5, 0.5, latex_string, transform=ax.transAxes,
-                      fontsize=self.font_size, ha='center', va='center')
+        image = self.cache.get(key, _MISSING)
+        if image is not _MISSING:
+            return image
         
-        # Get tight bounding box
-        fig.canvas.draw()
-        bbox = text.get_window_extent(renderer=fig.canvas.get_renderer())
+        try:
+            image = self._render(code, format, equation_type, dpi, font_size)
+        except Exception as e:
+            logger.warning(f"Failed to render equation to {format}: {e}", latex=code)
+            image = None
         
-        # Convert to data coordinates
-        bbox_data = bbox.transformed(ax.transData.inverted())
-        
-        # Set figure size based on content
-        width_inches = bbox_data.width * 1.2
-        height_inches = bbox_data.height * 1.2
-        fig.set_size_inches(width_inches, height_inches)
-        
-        # Save to bytes
-        buffer = BytesIO()
-        fig.savefig(buffer, format='png', dpi=self.dpi, bbox_inches='tight', 
-                   pad_inches=0.1, transparent=True)
-        plt.close(fig)
-        
-        buffer.seek(0)
-        png_data = buffer.getvalue()
-        
-        # Calculate dimensions
-        width = int(width_inches * self.dpi)
-        height = int(height_inches * self.dpi)
-        baseline = int(height * 0.5)  # Approximation
-        
-        return png_data, width, height, baseline
+        self.cache.put(key, image)
+        return image
     
-    def _render_to_svg(self, latex_code: str, equation_type: str) -> str:
-        """Render equation to SVG format."""
-        if not MATPLOTLIB_AVAILABLE:
-            raise ImportError("matplotlib is not available")
-        
-        # Similar to PNG rendering but save as SVG
-        plt.rcParams['text.usetex'] = True
-        plt.rcParams['font.family'] = 'serif'
-        plt.rcParams['font.size'] = self.font_size
-        
-        fig, ax = plt.subplots(figsize=(10, 3))
-        ax.axis('off')
-        
-        if equation_type == 'inline':
-            latex_string = f'${latex_code}$'
+    def _render(self, code: str, format: str, equation_type: str, dpi: int,
+                font_size: float) -> EquationImage:
+        """Lay out an expression with mathtext and draw it on a bare Figure."""
+        if equation_type != 'inline':
+            code = re.sub(r'\\frac(?![a-zA-Z])', r'\\dfrac', code)
+        code = self.IGNORED_PATTERN.sub('', self.ENVIRONMENT_PATTERN.sub('', code))
+        lines = [f'${line.strip()}$' for line in self.LINE_BREAK_PATTERN.split(code) if line.strip()]
+        if not lines:
+            raise ValueError("empty equation")
+        
+        prop = FontProperties(size=font_size, math_fontfamily=self.fontset)
+        pad = self.PADDING
+        gap = font_size * self.LINE_GAP
+        
+        with _render_lock:
+            metrics = [self._math_parser.parse(line, dpi=72, prop=prop) for line in lines]
+            width = max(m.width for m in metrics) + 2 * pad
+            height = sum(m.height for m in metrics) + gap * (len(lines) - 1) + 2 * pad
+            
+            figure = Figure(figsize=(width / 72, height / 72))
+            top = height - pad
+            for line, m in zip(lines, metrics):
+                top -= m.height
+                x = pad if equation_type == 'inline' else (width - m.width) / 2
+                figure.text(x / width, (top + m.depth) / height, line, fontproperties=prop,
+                            color=self.color, usetex=False)
+                top -= gap
+            
+            buffer = BytesIO()
+            figure.savefig(buffer, format=format, dpi=dpi, transparent=True)
+        
+        data = buffer.getvalue()
+        scale = dpi / 72
+        if format == 'png':
+            # Exact raster size from the IHDR chunk
+            pixel_width, pixel_height = struct.unpack('>II', data[16:24])
         else:
-            latex_string = f'$\\displaystyle {latex_code}$'
-        
-        ax.text(0.5, 0.5, latex_string, transform=ax.transAxes,
-               fontsize=self.font_size, ha='center', va='center')
-        
-        buffer = BytesIO()
-        fig.savefig(buffer, format='svg', bbox_inches='tight', 
-                   pad_inches=0.1, transparent=True)
-        plt.close(fig)
-        
-        buffer.seek(0)
-        svg_data = buffer.getvalue().decode('utf-8')
-        
-        return svg_data
+            pixel_width, pixel_height = math.ceil(width), math.ceil(height)
+        
+        return EquationImage(
+            data=data,
+            format=format,
+            width=pixel_width,
+            height=pixel_height,
+            depth=round((metrics[-1].depth + pad) * scale),
+            dpi=dpi
+        )
     
     def _convert_to_mathml(self, latex_code: str) -> str:
         """Convert LaTeX to MathML (basic conversion)."""
@@ -9,7 +9,12 @@ Provides comprehensive parsing functionality for LaTeX documents including:
 - Bibliography parsing
 """
 
+import gc
 import re
+from bisect import bisect_left
+from contextlib import contextmanager
+from itertools import accumulate, repeat
+from operator import itemgetter
 from typing import List, Dict, Tuple, Optional, Any, Union, NamedTuple
 from dataclasses import dataclass
 from enum import Enum
@@ -17,6 +22,25 @@ import structlog
 
 logger = structlog.get_logger(__name__)
 
+_NEWLINE_PATTERN = re.compile(r'\n')
+
+
+@contextmanager
+def _gc_paused():
+    """
+    Suspend cyclic GC while allocating large batches of acyclic objects.
+    
+    Token tuples are GC-tracked, so building hundreds of thousands of them
+    otherwise triggers repeated young-generation collections.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
 
 class TokenType(Enum):
     """Types of LaTeX tokens."""
@@ -37,15 +61,87 @@ class TokenType(Enum):
     PARAMETER = "parameter"
 
 
-@dataclass
-class LaTeXToken:
-    """A LaTeX token with position information."""
-    type: TokenType
-    content: str
-    line: int
-    column: int
-    position: int
-    raw_content: str = ""
+class _LineIndex:
+    """Newline offset index used to derive line/column numbers on demand."""
+    
+    __slots__ = ("newlines",)
+    
+    def __init__(self, source: str):
+        self.newlines = [m.start() for m in _NEWLINE_PATTERN.finditer(source)]
+    
+    def locate(self, position: int) -> Tuple[int, int]:
+        """Return 1-based (line, column) for a source offset."""
+        line_idx = bisect_left(self.newlines, position)
+        line_start = self.newlines[line_idx - 1] + 1 if line_idx else 0
+        return line_idx + 1, position - line_start + 1
+
+
+class _FixedLocation:
+    """Locator for tokens constructed with an explicit line and column."""
+    
+    __slots__ = ("line", "column")
+    
+    def __init__(self, line: int, column: int):
+        self.line = line
+        self.column = column
+    
+    def locate(self, position: int) -> Tuple[int, int]:
+        return self.line, self.column
+
+
+class LaTeXToken(tuple):
+    """
+    A LaTeX token with position information.
+    
+    Stored as a compact (type, content, position, locator) tuple. Tokens from
+    one tokenizer run share a newline index, and line/column are only
+    resolved when asked for.
+    """
+    
+    __slots__ = ()
+    
+    def __new__(
+        cls,
+        type: TokenType,
+        content: str,
+        line: int = 0,
+        column: int = 0,
+        position: int = 0,
+        raw_content: str = ""
+    ):
+        return tuple.__new__(cls, (type, content, position, _FixedLocation(line, column)))
+    
+    type = property(itemgetter(0))
+    content = property(itemgetter(1))
+    position = property(itemgetter(2))
+    
+    @property
+    def line(self) -> int:
+        return self[3].locate(self[2])[0]
+    
+    @property
+    def column(self) -> int:
+        return self[3].locate(self[2])[1]
+    
+    @property
+    def raw_content(self) -> str:
+        return self[1]
+    
+    @property
+    def end_position(self) -> int:
+        return self[2] + len(self[1])
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, LaTeXToken):
+            return NotImplemented
+        return self[:3] == other[:3]
+    
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+    
+    def __hash__(self) -> int:
+        return hash(self[:3])
     
     def __repr__(self):
         return f"LaTeXToken({self.type.value}, {repr(self.content)}, {self.line}:{self.column})"
@@ -86,7 +182,13 @@ class LaTeXEnvironment:
 
 
 class LaTeXTokenizer:
-    """Tokenizes LaTeX source code into structured tokens."""
+    """
+    Tokenizes LaTeX source code into structured tokens.
+    
+    A single compiled master pattern scans the source; each alternative maps
+    to one token type, so the loop body is one regex match and one token
+    allocation.
+    """
     
     # LaTeX command pattern
     COMMAND_PATTERN = re.compile(r'\\([a-zA-Z]+\*?|[^a-zA-Z\s])')
@@ -98,6 +200,43 @@ class LaTeXTokenizer:
     # Special characters that need escaping
     SPECIAL_CHARS = {'{', '}', '[', ']', '%', '\\', '#', '$', '^', '_', '&', '~'}
     
+    # Alternatives start on disjoint characters (except the backslash forms,
+    # which are ordered), so the most frequent ones are tried first
+    TOKEN_PATTERN = re.compile(
+        r"""
+        [^{}\[\]%\\\#$^_&~\s]+             # plain text run
+        |[^\S\n]+                          # whitespace run
+        |\n
+        |\\[{}\[\]%\\\#$^_&~]             # escaped special character
+        |\\(?:[^\W\d_]+|[\s\S])             # command name or control symbol
+        |\\                               # trailing backslash
+        |[{}\[\]]
+        |%[^\n]*                           # comment up to end of line
+        |\$\$?                             # display or inline math delimiter
+        |\#[0-9]?                           # macro parameter or bare hash
+        |[\^_&~]                           # special character
+        """,
+        re.VERBOSE,
+    )
+    
+    # Token type by first character; None marks the ones that need a second look
+    _FIRST_CHAR_TYPES: Dict[str, Optional[TokenType]] = {
+        **{chr(c): TokenType.WHITESPACE for c in range(0x3001) if chr(c).isspace()},
+        '\n': TokenType.NEWLINE,
+        '{': TokenType.BRACE_OPEN,
+        '}': TokenType.BRACE_CLOSE,
+        '[': TokenType.BRACKET_OPEN,
+        ']': TokenType.BRACKET_CLOSE,
+        '%': TokenType.COMMENT,
+        '^': TokenType.SPECIAL_CHAR,
+        '_': TokenType.SPECIAL_CHAR,
+        '&': TokenType.SPECIAL_CHAR,
+        '~': TokenType.SPECIAL_CHAR,
+        '\\': None,
+        '$': None,
+        '#': None,
+    }
+    
     def __init__(self):
         self.tokens: List[LaTeXToken] = []
         self.position = 0
@@ -107,209 +246,62 @@ class LaTeXTokenizer:
         
     def tokenize(self, source: str) -> List[LaTeXToken]:
         """Tokenize LaTeX source code."""
+        contents, types = self.scan(source)
+        return self.build_tokens(contents, types, source)
+    
+    def scan(self, source: str) -> Tuple[List[str], List[TokenType]]:
+        """
+        Split source into parallel arrays of token contents and types.
+        
+        The arrays are the compact form of a token stream; they can be cached
+        and concatenated before being turned into tokens by build_tokens.
+        """
+        # Most types follow from the first character alone
+        contents = self.TOKEN_PATTERN.findall(source)
+        types = list(map(
+            self._FIRST_CHAR_TYPES.get,
+            map(itemgetter(0), contents),
+            repeat(TokenType.TEXT)
+        ))
+        for i in [i for i, token_type in enumerate(types) if token_type is None]:
+            types[i] = self._classify_token(contents[i])
+        
+        return contents, types
+    
+    def build_tokens(
+        self,
+        contents: List[str],
+        types: List[TokenType],
+        source: str
+    ) -> List[LaTeXToken]:
+        """Materialize tokens for source from its scanned arrays."""
         self.source = source
-        self.position = 0
-        self.line = 1
-        self.column = 1
-        self.tokens = []
+        line_index = _LineIndex(source)
         
-        while self.position < len(self.source):
-            self._tokenize_next()
-            
-        return self.tokens
-    
-    def _tokenize_next(self):
-        """Tokenize the next token."""
-        if self.position >= len(self.source):
-            return
-            
-        char = self.source[self.position]
-        
-        # Handle comments
-        if char == '%':
-            self._tokenize_comment()
-        # Handle commands
-        elif char == '\\':
-            # Check if it's a command or escaped character
-            if self.position + 1 < len(self.source):
-                next_char = self.source[self.position + 1]
-                if next_char.isalpha():
-                    self._tokenize_command()
-                elif next_char in self.SPECIAL_CHARS:
-                    self._tokenize_escaped_char()
-                else:
-                    self._tokenize_command()
-            else:
-                self._add_token(TokenType.SPECIAL_CHAR, char)
-                self._advance()
-        # Handle math delimiters
-        elif char == '$':
-            self._tokenize_math()
-        # Handle braces
-        elif char == '{':
-            self._add_token(TokenType.BRACE_OPEN, char)
-            self._advance()
-        elif char == '}':
-            self._add_token(TokenType.BRACE_CLOSE, char)
-            self._advance()
-        # Handle brackets
-        elif char == '[':
-            self._add_token(TokenType.BRACKET_OPEN, char)
-            self._advance()
-        elif char == ']':
-            self._add_token(TokenType.BRACKET_CLOSE, char)
-            self._advance()
-        # Handle newlines
-        elif char == '\n':
-            self._add_token(TokenType.NEWLINE, char)
-            self._advance_line()
-        # Handle whitespace
-        elif char.isspace():
-            self._tokenize_whitespace()
-        # Handle regular text
-        else:
-            self._tokenize_text()
-    
-    def _tokenize_comment(self):
-        """Tokenize a comment line."""
-        start_pos = self.position
-        start_line = self.line
-        start_col = self.column
-        
-        # Find end of line
-        while self.position < len(self.source) and self.source[self.position] != '\n':
-            self.position += 1
-            self.column += 1
-            
-        comment_text = self.source[start_pos:self.position]
-        self._add_token_at_position(TokenType.COMMENT, comment_text, start_line, start_col, start_pos)
-    
-    def _tokenize_command(self):
-        """Tokenize a LaTeX command."""
-        start_pos = self.position
-        start_line = self.line
-        start_col = self.column
-        
-        # Skip the backslash
-        self.position += 1
-        self.column += 1
-        
-        if self.position >= len(self.source):
-            self._add_token_at_position(TokenType.COMMAND, '\\', start_line, start_col, start_pos)
-            return
+        # Tokens are contiguous, so positions are the running sum of lengths
+        positions = accumulate(map(len, contents), initial=0)
         
-        # Get command name
-        command_start = self.position
-        char = self.source[self.position]
-        
-        if char.isalpha():
-            # Multi-character command
-            while (self.position < len(self.source) and 
-                   (self.source[self.position].isalpha() or 
-                    (self.position == command_start and self.source[self.position] == '*'))):
-                self.position += 1
-                self.column += 1
-        else:
-            # Single character command
-            self.position += 1
-            self.column += 1
-        
-        command_text = self.source[start_pos:self.position]
-        self._add_token_at_position(TokenType.COMMAND, command_text, start_line, start_col, start_pos)
-    
-    def _tokenize_escaped_char(self):
-        """Tokenize an escaped special character."""
-        start_pos = self.position
-        start_line = self.line
-        start_col = self.column
-        
-        # Include backslash and next character
-        self.position += 2
-        self.column += 2
-        
-        escaped_text = self.source[start_pos:self.position]
-        self._add_token_at_position(TokenType.SPECIAL_CHAR, escaped_text, start_line, start_col, start_pos)
-    
-    def _tokenize_math(self):
-        """Tokenize math delimiters."""
-        if self.position + 1 < len(self.source) and self.source[self.position + 1] == '$':
-            # Display math $$
-            self._add_token(TokenType.MATH_DISPLAY, '$$')
-            self.position += 2
-            self.column += 2
-        else:
-            # Inline math $
-            self._add_token(TokenType.MATH_INLINE, '$')
-            self._advance()
-    
-    def _tokenize_whitespace(self):
-        """Tokenize continuous whitespace."""
-        start_pos = self.position
-        start_line = self.line
-        start_col = self.column
-        
-        while (self.position < len(self.source) and 
-               self.source[self.position].isspace() and 
-               self.source[self.position] != '\n'):
-            self.position += 1
-            self.column += 1
-        
-        whitespace_text = self.source[start_pos:self.position]
-        self._add_token_at_position(TokenType.WHITESPACE, whitespace_text, start_line, start_col, start_pos)
-    
-    def _tokenize_text(self):
-        """Tokenize regular text."""
-        start_pos = self.position
-        start_line = self.line
-        start_col = self.column
-        
-        # Continue until we hit a special character
-        while (self.position < len(self.source)):
-            char = self.source[self.position]
-            if (char in self.SPECIAL_CHARS or char.isspace() or 
-                char in ['%'] or char == '\\'):
-                break
-            self.position += 1
-            self.column += 1
+        with _gc_paused():
+            self.tokens = list(map(
+                tuple.__new__,
+                repeat(LaTeXToken),
+                zip(types, contents, positions, repeat(line_index))
+            ))
         
-        text_content = self.source[start_pos:self.position]
-        if text_content:
-            self._add_token_at_position(TokenType.TEXT, text_content, start_line, start_col, start_pos)
-    
-    def _add_token(self, token_type: TokenType, content: str):
-        """Add a token at current position."""
-        token = LaTeXToken(
-            type=token_type,
-            content=content,
-            line=self.line,
-            column=self.column,
-            position=self.position,
-            raw_content=content
-        )
-        self.tokens.append(token)
-    
-    def _add_token_at_position(self, token_type: TokenType, content: str, line: int, column: int, position: int):
-        """Add a token at specified position."""
-        token = LaTeXToken(
-            type=token_type,
-            content=content,
-            line=line,
-            column=column,
-            position=position,
-            raw_content=content
-        )
-        self.tokens.append(token)
-    
-    def _advance(self):
-        """Advance position by one character."""
-        self.position += 1
-        self.column += 1
+        self.position = len(source)
+        self.line, self.column = line_index.locate(self.position)
+        return self.tokens
     
-    def _advance_line(self):
-        """Advance to next line."""
-        self.position += 1
-        self.line += 1
-        self.column = 1
+    def _classify_token(self, content: str) -> TokenType:
+        """Resolve the type of a token whose first character is ambiguous."""
+        first = content[0]
+        if first == '\\':
+            if len(content) == 1 or content[1] in self.SPECIAL_CHARS:
+                return TokenType.SPECIAL_CHAR
+            return TokenType.COMMAND
+        if first == '$':
+            return TokenType.MATH_DISPLAY if len(content) == 2 else TokenType.MATH_INLINE
+        return TokenType.PARAMETER if len(content) == 2 else TokenType.SPECIAL_CHAR
 
 
 class LaTeXParser:
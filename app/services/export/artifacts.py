@@ -0,0 +1,311 @@
+"""
+Streaming storage and delivery of export artifacts.
+
+Generators write into an ArtifactSink while they serialize (python-pptx
+zips straight into it, reportlab writes its document once) and the sink
+forwards bytes to their destination in fixed-size chunks:
+
+- LocalFileSink writes a temporary file beside the target and renames it
+  into place on commit, so readers never see a partial artifact.
+- S3MultipartSink uploads every full chunk as a multipart part through
+  S3StorageManager; artifacts smaller than one part are sent with one PUT.
+
+Memory held by a sink is bounded by its chunk size rather than the size of
+the artifact. Sinks are ordinary blocking file objects meant to be written
+from a worker thread; the S3 sink hands its uploads to the event loop it
+was created on.
+"""
+
+import asyncio
+import hashlib
+import io
+import os
+import re
+import tempfile
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# S3 rejects multipart parts smaller than this, except the last one
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+@dataclass
+class StoredArtifact:
+    """A committed export artifact and where it lives."""
+    size: int
+    sha256: str
+    content_type: str
+    file_path: Optional[str] = None
+    storage_key: Optional[str] = None
+    bucket: Optional[str] = None
+    etag: Optional[str] = None
+
+
+class ArtifactSink(io.RawIOBase):
+    """
+    Write-only, forward-only stream for an export artifact.
+
+    Used as a context manager the artifact is committed when the block
+    exits normally and discarded if it raises. Closing an uncommitted sink
+    discards it too.
+    """
+
+    def __init__(self, content_type: str = "application/octet-stream"):
+        super().__init__()
+        self.content_type = content_type
+        self.bytes_written = 0
+        self._digest = hashlib.sha256()
+        self._artifact: Optional[StoredArtifact] = None
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def tell(self) -> int:
+        return self.bytes_written
+
+    def write(self, data: Union[bytes, bytearray, memoryview]) -> int:
+        if self.closed:
+            raise ValueError("write to a closed artifact sink")
+
+        view = memoryview(data).cast("B")
+        if view.nbytes:
+            self._digest.update(view)
+            self._write(view)
+            self.bytes_written += view.nbytes
+        return view.nbytes
+
+    def commit(self) -> StoredArtifact:
+        """Finish the artifact and make it visible at its destination."""
+        if self._artifact is None:
+            if self.closed:
+                raise ValueError("artifact sink was aborted")
+            self._artifact = self._commit()
+            super().close()
+        return self._artifact
+
+    def abort(self) -> None:
+        """Discard everything written so far."""
+        if not self.closed:
+            try:
+                self._abort()
+            finally:
+                super().close()
+
+    def close(self) -> None:
+        self.abort()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+    @property
+    def sha256(self) -> str:
+        return self._digest.hexdigest()
+
+    def _write(self, view: memoryview) -> None:
+        raise NotImplementedError
+
+    def _commit(self) -> StoredArtifact:
+        raise NotImplementedError
+
+    def _abort(self) -> None:
+        raise NotImplementedError
+
+
+class LocalFileSink(ArtifactSink):
+    """Sink writing to a local file, renamed into place on commit."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        content_type: str = "application/octet-stream",
+        buffer_size: int = 1024 * 1024
+    ):
+        super().__init__(content_type)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".part"
+        )
+        self._tmp_path = Path(tmp_path)
+        self._file = os.fdopen(fd, "wb", buffering=buffer_size)
+
+    def _write(self, view: memoryview) -> None:
+        self._file.write(view)
+
+    def _commit(self) -> StoredArtifact:
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+        return StoredArtifact(
+            size=self.bytes_written,
+            sha256=self.sha256,
+            content_type=self.content_type,
+            file_path=str(self.path)
+        )
+
+    def _abort(self) -> None:
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+
+class S3MultipartSink(ArtifactSink):
+    """
+    Sink uploading to S3/MinIO as the artifact is written.
+
+    Each full part is uploaded while the generator keeps writing the next
+    one; at most one upload is in flight, so memory stays at about two
+    parts.
+    """
+
+    def __init__(
+        self,
+        storage: Any,
+        key: str,
+        loop: asyncio.AbstractEventLoop,
+        content_type: str = "application/octet-stream",
+        bucket: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None,
+        part_size: Optional[int] = None
+    ):
+        super().__init__(content_type)
+        self.storage = storage
+        self.key = key
+        self.bucket = bucket or storage.bucket_name
+        self.metadata = metadata or {}
+        self.part_size = max(part_size or storage.chunk_size, MIN_PART_SIZE)
+        self._loop = loop
+
+        self._buffer = bytearray()
+        self._upload_id: Optional[str] = None
+        self._part_number = 0
+        self._pending: Optional[Future] = None
+
+    def _write(self, view: memoryview) -> None:
+        self._buffer += view
+        while len(self._buffer) >= self.part_size:
+            self._upload_part(self.part_size)
+
+    def _commit(self) -> StoredArtifact:
+        if self._upload_id is None:
+            result = self._run(self.storage.upload_bytes(
+                bytes(self._buffer), self.key, self.bucket, self.metadata, self.content_type
+            ))
+        else:
+            if self._buffer:
+                self._upload_part(len(self._buffer))
+            self._wait_pending()
+            result = self._run(self.storage.complete_multipart_upload(self._upload_id))
+
+        self._buffer = bytearray()
+        logger.info(
+            "Streamed export artifact to storage",
+            key=self.key, size=self.bytes_written, parts=self._part_number
+        )
+
+        return StoredArtifact(
+            size=self.bytes_written,
+            sha256=self.sha256,
+            content_type=self.content_type,
+            storage_key=self.key,
+            bucket=self.bucket,
+            etag=result.get("etag")
+        )
+
+    def _abort(self) -> None:
+        self._buffer = bytearray()
+        if self._upload_id is None:
+            return
+
+        try:
+            self._wait_pending()
+        except Exception:
+            pass
+        try:
+            self._run(self.storage.abort_multipart_upload(self._upload_id))
+        except Exception as e:
+            logger.warning(f"Failed to abort multipart upload for {self.key}: {e}")
+
+    def _upload_part(self, size: int) -> None:
+        if self._upload_id is None:
+            self._upload_id = self._run(self.storage.start_multipart_upload(
+                key=self.key,
+                total_size=0,  # not known until the generator finishes
+                bucket=self.bucket,
+                metadata=self.metadata,
+                content_type=self.content_type
+            ))
+
+        part = bytes(self._buffer[:size])
+        del self._buffer[:size]
+
+        self._wait_pending()
+        self._part_number += 1
+        self._pending = asyncio.run_coroutine_threadsafe(
+            self.storage.upload_part(self._upload_id, self._part_number, part), self._loop
+        )
+
+    def _wait_pending(self) -> None:
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            pending.result()
+
+    def _run(self, coro) -> Any:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+
+def parse_range_header(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range HTTP Range header into an inclusive byte range.
+
+    Returns None when the whole representation should be sent: no header,
+    a header that is not a single bytes range (which servers may ignore),
+    or an empty artifact.
+
+    Raises:
+        ValueError: The range cannot be satisfied (respond with 416)
+    """
+    if not header or size == 0:
+        return None
+
+    match = RANGE_PATTERN.match(header.strip())
+    if not match or match.groups() == ("", ""):
+        return None
+
+    first, last = match.groups()
+    if first == "":
+        # Suffix range: the final N bytes
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+
+    if start >= size or start > end:
+        raise ValueError(f"Range not satisfiable for {size} bytes: {header}")
+    return start, end
+
+
+def iter_buffer(buffer: io.BytesIO, start: int = 0, end: Optional[int] = None,
+                chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+    """Yield an inclusive byte range of a buffer in chunks, without copying it whole."""
+    view = buffer.getbuffer()
+    try:
+        stop = view.nbytes if end is None else end + 1
+        for offset in range(start, stop, chunk_size):
+            yield bytes(view[offset:min(offset + chunk_size, stop)])
+    finally:
+        view.release()
@@ -30,10 +30,16 @@ from uuid import UUID
 
 from app.core.logging import get_logger
 from app.domain.schemas.generation import Citation, SlideContent
+from app.services.document_processing.storage.s3_manager import S3StorageManager
+from app.services.export.artifacts import ArtifactSink, LocalFileSink, S3MultipartSink
 from app.services.export.generators.pptx_generator import PPTXGenerator, AcademicTemplate
 from app.services.export.generators.beamer_generator import BeamerGenerator, BeamerTheme
 from app.services.export.generators.pdf_generator import PDFGenerator
 from app.services.export.generators.google_slides_generator import GoogleSlidesGenerator
+from app.services.export.generators.image_renditions import (
+    collect_image_sources,
+    default_rendition_service,
+)
 
 logger = get_logger(__name__)
 
@@ -100,6 +106,9 @@ class ExportResult:
     file_path: Optional[str] = None
     file_url: Optional[str] = None
     buffer: Optional[io.BytesIO] = None
+    storage_key: Optional[str] = None
+    storage_bucket: Optional[str] = None
+    content_sha256: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
     file_size: Optional[int] = None
     download_expires: Optional[datetime] = None
@@ -367,11 +376,20 @@ class ExportCoordinator:
     progress tracking, error recovery, resource management, and quality assurance.
     """
     
-    def __init__(self, max_concurrent_exports: int = 5):
+    def __init__(
+        self,
+        max_concurrent_exports: int = 5,
+        artifact_dir: Optional[str] = None,
+        storage: Optional[S3StorageManager] = None
+    ):
         self.logger = get_logger(self.__class__.__name__)
         self.resource_manager = ResourceManager(max_concurrent_exports)
         self.validator = ExportValidator()
         
+        # Where streamed artifacts go: object storage if configured, else local files
+        self.artifact_dir = Path(artifact_dir or Path(tempfile.gettempdir()) / "slidegenie-exports")
+        self.storage = storage
+        
         # Active jobs tracking
         self._jobs: Dict[str, ExportJob] = {}
         self._progress_callbacks: Dict[str, List[Callable]] = {}
@@ -562,6 +580,9 @@ class ExportCoordinator:
                     status=ExportStatus.COMPLETED,
                     file_path=output.get("file_path"),
                     buffer=output.get("buffer"),
+                    storage_key=output.get("storage_key"),
+                    storage_bucket=output.get("storage_bucket"),
+                    content_sha256=output.get("content_sha256"),
                     file_size=output.get("file_size"),
                     metadata=output.get("metadata", {})
                 )
@@ -590,7 +611,33 @@ class ExportCoordinator:
     
     async def _generate_file_export(self, generator, job: ExportJob) -> Dict[str, Any]:
         """Generate file-based export (PPTX, PDF, Beamer)."""
-        if hasattr(generator, 'export_to_buffer'):
+        # Fetch remote images concurrently so the generator only hits the cache
+        await default_rendition_service.prefetch(collect_image_sources(job.slides))
+        
+        if hasattr(generator, 'export_to_stream'):
+            # Serialize in a worker thread straight into storage, so the
+            # artifact is never held whole in memory
+            sink = self._open_artifact_sink(job)
+            
+            def write_artifact():
+                with sink:
+                    generator.export_to_stream(
+                        job.slides,
+                        sink,
+                        citations=job.citations,
+                        metadata=job.metadata
+                    )
+                return sink.commit()
+            
+            artifact = await asyncio.to_thread(write_artifact)
+            return {
+                "file_path": artifact.file_path,
+                "storage_key": artifact.storage_key,
+                "storage_bucket": artifact.bucket,
+                "content_sha256": artifact.sha256,
+                "file_size": artifact.size
+            }
+        elif hasattr(generator, 'export_to_buffer'):
             buffer = await generator.export_to_buffer(
                 slides=job.slides,
                 citations=job.citations,
@@ -622,6 +669,21 @@ class ExportCoordinator:
                 "file_size": file_size
             }
     
+    def _open_artifact_sink(self, job: ExportJob) -> ArtifactSink:
+        """Open a sink for a job's artifact in object storage or the artifact directory."""
+        format_info = job.config.format.value
+        name = f"{job.job_id}{format_info['extension']}"
+        
+        if self.storage is not None:
+            return S3MultipartSink(
+                self.storage,
+                key=f"exports/{name}",
+                loop=asyncio.get_running_loop(),
+                content_type=format_info["mime_type"],
+                metadata={"job_id": job.job_id, "format": job.config.format.name}
+            )
+        return LocalFileSink(self.artifact_dir / name, content_type=format_info["mime_type"])
+    
     async def _try_fallback_formats(self, job: ExportJob, original_error: Exception) -> ExportResult:
         """Try fallback formats when primary format fails."""
         for fallback_format in job.config.fallback_formats:
@@ -673,7 +735,7 @@ class ExportCoordinator:
     async def _finalize_export(self, job: ExportJob, result: ExportResult):
         """Finalize export (cleanup, file management, etc.)."""
         # Set download expiration
-        if result.file_path or result.buffer:
+        if result.file_path or result.buffer or result.storage_key:
             result.download_expires = datetime.now() + timedelta(hours=24)
         
         # Update file size in result
@@ -928,6 +990,10 @@ class ExportCoordinator:
 
 
 # Factory function for easy instantiation
-def create_export_coordinator(max_concurrent_exports: int = 5) -> ExportCoordinator:
+def create_export_coordinator(
+    max_concurrent_exports: int = 5,
+    artifact_dir: Optional[str] = None,
+    storage: Optional[S3StorageManager] = None
+) -> ExportCoordinator:
     """Create an export coordinator instance."""
-    return ExportCoordinator(max_concurrent_exports)
\ No newline at end of file
+    return ExportCoordinator(max_concurrent_exports, artifact_dir=artifact_dir, storage=storage)
\ No newline at end of file
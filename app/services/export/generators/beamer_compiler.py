@@ -0,0 +1,495 @@
+"""
+Incremental, cached compilation of Beamer documents.
+
+Compiling a deck from scratch costs two or three LaTeX passes plus a
+bibliography run. Most exports repeat a previous compile or change only
+slide text, so this service:
+- Returns the cached PDF when the .tex, .bib files and assets hash the same
+- Keeps a workspace per document, named by the caller, so .aux/.bbl state
+  carries over, reruns LaTeX only until that state reaches a fixed point,
+  and skips biber/bibtex when the citation set and .bib files are
+  unchanged; the least recently used workspaces are deleted beyond
+  max_workspaces
+- Dumps the preamble (theme, packages) into a format file with
+  mylatexformat and reuses it for every document sharing that preamble
+- Runs compiles as asyncio subprocesses under a concurrency cap
+
+The blocking compile_pdf wrapper runs each compile on an event loop of its
+own, so workspaces, formats and the concurrency cap are guarded with
+threading primitives that hold across every loop in the process.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Auxiliary files whose contents feed back into the next LaTeX pass
+STATE_EXTENSIONS = (".aux", ".toc", ".nav", ".snm", ".out", ".bbl")
+
+BIBTEX_AUX_PATTERN = re.compile(r'^\\(?:citation|bibdata|bibstyle)\{.*\}$', re.MULTILINE)
+
+# Longest wait between attempts to take a busy lock
+LOCK_POLL_INTERVAL = 0.05
+
+
+@dataclass
+class CompileResult:
+    """Outcome of a compile request."""
+    pdf_path: str
+    success: bool
+    cached: bool = False
+    latex_passes: int = 0
+    bibliography_runs: int = 0
+    used_format: bool = False
+    log: str = ""
+
+
+@dataclass
+class _Workspace:
+    """Per-document working directory kept between compiles."""
+    path: Path
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    bibliography_hash: Optional[str] = None
+    # Compiles holding the workspace; it is not evicted while in use
+    users: int = 0
+
+
+class BeamerCompileService:
+    """
+    Compiles LaTeX sources with output caching and incremental reruns.
+
+    Workspaces and formats live under cache_dir and survive across requests,
+    so the savings apply across exports handled by the same worker.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_concurrency: int = 2,
+        max_passes: int = 4,
+        max_cached_outputs: int = 256,
+        max_workspaces: int = 64,
+        use_preamble_formats: bool = True,
+        timeout: float = 120.0
+    ):
+        self.cache_dir = Path(cache_dir or Path(tempfile.gettempdir()) / "slidegenie_beamer")
+        self.max_concurrency = max_concurrency
+        self.max_passes = max_passes
+        self.max_cached_outputs = max_cached_outputs
+        self.max_workspaces = max_workspaces
+        self.use_preamble_formats = use_preamble_formats
+        self.timeout = timeout
+
+        self.outputs_dir = self.cache_dir / "outputs"
+        self.formats_dir = self.cache_dir / "formats"
+        self.workspaces_dir = self.cache_dir / "workspaces"
+        for directory in (self.outputs_dir, self.formats_dir, self.workspaces_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+
+        # Least recently used first; guarded by _workspaces_lock together
+        # with each workspace's users count
+        self._workspaces: OrderedDict[str, _Workspace] = OrderedDict()
+        self._workspaces_lock = threading.Lock()
+        self._failed_formats: Set[str] = set()
+        self._format_locks: Dict[str, threading.Lock] = {}
+        self._semaphore = threading.BoundedSemaphore(max_concurrency)
+
+        # Statistics
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.latex_passes = 0
+        self.bibliography_runs = 0
+        self.bibliography_skips = 0
+        self.format_builds = 0
+        self.workspace_evictions = 0
+
+    async def compile(
+        self,
+        tex_source: str,
+        job_name: str,
+        output_dir: Union[str, Path],
+        bib_files: Optional[Dict[str, bytes]] = None,
+        assets: Optional[Dict[str, Path]] = None,
+        compiler: str = "pdflatex",
+        bibliography_backend: Optional[str] = None,
+        workspace_key: Optional[str] = None
+    ) -> CompileResult:
+        """
+        Compile a document to output_dir/<job_name>.pdf.
+
+        Args:
+            tex_source: Complete LaTeX document
+            job_name: Base name of the output PDF
+            output_dir: Directory to place the PDF in
+            bib_files: Bibliography files by name relative to the document
+            assets: Files the document references, by the name used in the
+                source; absolute names are hashed but not copied
+            compiler: pdflatex or lualatex
+            bibliography_backend: biber, bibtex or None to skip bibliography
+            workspace_key: Identity of the document across edits, such as its
+                presentation ID, so edits reuse its auxiliary state; without
+                one only identical inputs share a workspace
+
+        Returns:
+            CompileResult with the PDF path and what work was done
+        """
+        bib_files = bib_files or {}
+        assets = assets or {}
+        output_pdf = Path(output_dir) / f"{job_name}.pdf"
+
+        key = self._output_key(tex_source, bib_files, assets, compiler, bibliography_backend)
+        cached_pdf = self.outputs_dir / f"{key}.pdf"
+        if cached_pdf.exists():
+            self.cache_hits += 1
+            await asyncio.to_thread(shutil.copy2, cached_pdf, output_pdf)
+            logger.info(f"Beamer compile cache hit for {job_name}")
+            return CompileResult(pdf_path=str(output_pdf), success=True, cached=True)
+        self.cache_misses += 1
+
+        preamble = _preamble(tex_source)
+        with self._workspaces_lock:
+            workspace = self._workspace(workspace_key or key)
+            workspace.users += 1
+            evicted = self._evict_workspaces()
+        try:
+            if evicted:
+                await asyncio.to_thread(self._remove_directories, evicted)
+
+            async with _hold(self._semaphore):
+                # Workspaces hold state for one document; serialize its compiles
+                async with _hold(workspace.lock):
+                    result = await self._compile_in_workspace(
+                        workspace, tex_source, job_name, bib_files, assets,
+                        compiler, bibliography_backend, preamble
+                    )
+                    if result.success:
+                        built_pdf = workspace.path / f"{job_name}.pdf"
+                        await asyncio.to_thread(self._store_output, built_pdf, cached_pdf, output_pdf)
+                        result.pdf_path = str(output_pdf)
+        finally:
+            with self._workspaces_lock:
+                workspace.users -= 1
+
+        return result
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get compile statistics."""
+        return {
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "latex_passes": self.latex_passes,
+            "bibliography_runs": self.bibliography_runs,
+            "bibliography_skips": self.bibliography_skips,
+            "format_builds": self.format_builds,
+            "workspaces": len(self._workspaces),
+            "workspace_evictions": self.workspace_evictions,
+        }
+
+    async def _compile_in_workspace(
+        self,
+        workspace: _Workspace,
+        tex_source: str,
+        job_name: str,
+        bib_files: Dict[str, bytes],
+        assets: Dict[str, Path],
+        compiler: str,
+        bibliography_backend: Optional[str],
+        preamble: str
+    ) -> CompileResult:
+        """Run LaTeX until its auxiliary state stops changing."""
+        await asyncio.to_thread(self._populate_workspace, workspace.path, tex_source, job_name, bib_files, assets)
+        result = CompileResult(pdf_path="", success=False)
+
+        fmt_name = None
+        if self.use_preamble_formats and compiler == "pdflatex" and preamble:
+            fmt_name = await self._ensure_format(preamble, workspace.path)
+            result.used_format = fmt_name is not None
+
+        command = [compiler, "-interaction=nonstopmode", "-halt-on-error"]
+        if fmt_name:
+            command.append(f"-fmt={fmt_name}")
+        command.append(f"{job_name}.tex")
+
+        bibliography_done = False
+        state = self._aux_state(workspace.path, job_name)
+
+        while result.latex_passes < self.max_passes:
+            returncode, output = await self._run(command, workspace.path)
+            result.latex_passes += 1
+            self.latex_passes += 1
+            result.log = output
+
+            if returncode != 0:
+                logger.error(f"LaTeX compilation failed for {job_name}: {output[-2000:]}")
+                return result
+
+            if bibliography_backend and not bibliography_done:
+                bibliography_done = True
+                if await self._update_bibliography(workspace, job_name, bib_files, bibliography_backend):
+                    result.bibliography_runs += 1
+
+            new_state = self._aux_state(workspace.path, job_name)
+            if new_state == state:
+                break
+            state = new_state
+
+        if not (workspace.path / f"{job_name}.pdf").exists():
+            logger.error("PDF file not found after compilation")
+            return result
+
+        result.success = True
+        logger.info(
+            f"Compiled {job_name}: {result.latex_passes} LaTeX passes, "
+            f"{result.bibliography_runs} bibliography runs"
+        )
+        return result
+
+    async def _update_bibliography(
+        self,
+        workspace: _Workspace,
+        job_name: str,
+        bib_files: Dict[str, bytes],
+        backend: str
+    ) -> bool:
+        """Run biber/bibtex unless its inputs match the previous run."""
+        if backend == "biber":
+            control_file = workspace.path / f"{job_name}.bcf"
+            citation_state = control_file.read_bytes() if control_file.exists() else b""
+        else:
+            aux_file = workspace.path / f"{job_name}.aux"
+            aux = aux_file.read_text(errors="replace") if aux_file.exists() else ""
+            citation_state = "\n".join(BIBTEX_AUX_PATTERN.findall(aux)).encode("utf-8")
+
+        if not citation_state:
+            return False
+
+        digest = hashlib.sha256(citation_state)
+        for name in sorted(bib_files):
+            digest.update(name.encode("utf-8"))
+            digest.update(bib_files[name])
+        bibliography_hash = digest.hexdigest()
+
+        if bibliography_hash == workspace.bibliography_hash and (workspace.path / f"{job_name}.bbl").exists():
+            self.bibliography_skips += 1
+            return False
+
+        returncode, output = await self._run([backend, job_name], workspace.path)
+        self.bibliography_runs += 1
+        if returncode != 0:
+            logger.warning(f"{backend} failed: {output[-2000:]}")
+            workspace.bibliography_hash = None
+        else:
+            workspace.bibliography_hash = bibliography_hash
+        return True
+
+    async def _ensure_format(self, preamble: str, workspace_path: Path) -> Optional[str]:
+        """Build (once) and link the preamble format into the workspace."""
+        fmt_name = f"preamble-{_hash_text(preamble)[:24]}"
+        if fmt_name in self._failed_formats:
+            return None
+
+        fmt_file = self.formats_dir / f"{fmt_name}.fmt"
+        lock = self._format_locks.setdefault(fmt_name, threading.Lock())
+        async with _hold(lock):
+            if not fmt_file.exists():
+                source = self.formats_dir / f"{fmt_name}.tex"
+                source.write_text(preamble + "\n\\begin{document}\n\\end{document}\n", encoding="utf-8")
+                returncode, output = await self._run(
+                    ["pdflatex", "-ini", "-interaction=nonstopmode", f"-jobname={fmt_name}",
+                     "&pdflatex", "mylatexformat.ltx", source.name],
+                    self.formats_dir
+                )
+                self.format_builds += 1
+                if returncode != 0 or not fmt_file.exists():
+                    logger.warning(f"Preamble format build failed, compiling without it: {output[-500:]}")
+                    self._failed_formats.add(fmt_name)
+                    return None
+
+        linked = workspace_path / fmt_file.name
+        if not linked.exists():
+            await asyncio.to_thread(shutil.copy2, fmt_file, linked)
+        return fmt_name
+
+    async def _run(self, command: List[str], cwd: Path) -> Tuple[int, str]:
+        """Run a TeX tool, returning its exit code and combined output."""
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                cwd=str(cwd),
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT
+            )
+        except FileNotFoundError as e:
+            return 127, str(e)
+
+        try:
+            output, _ = await asyncio.wait_for(process.communicate(), self.timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return -1, f"{command[0]} timed out after {self.timeout}s"
+
+        return process.returncode, output.decode("utf-8", errors="replace")
+
+    def _workspace(self, key: str) -> _Workspace:
+        name = re.sub(r'[^A-Za-z0-9_.-]', '_', key)
+        workspace = self._workspaces.get(name)
+        if workspace is None:
+            path = self.workspaces_dir / name
+            path.mkdir(parents=True, exist_ok=True)
+            workspace = _Workspace(path=path)
+            self._workspaces[name] = workspace
+        else:
+            self._workspaces.move_to_end(name)
+        return workspace
+
+    def _evict_workspaces(self) -> List[Path]:
+        """
+        Drop the least recently used idle workspaces beyond max_workspaces.
+
+        Evicted directories are renamed aside at once, so a workspace
+        recreated under the same name starts empty, and returned for
+        deletion off the event loop.
+        """
+        evicted = []
+        for name in list(self._workspaces):
+            if len(self._workspaces) <= self.max_workspaces:
+                break
+            workspace = self._workspaces[name]
+            if workspace.users:
+                continue
+            del self._workspaces[name]
+            self.workspace_evictions += 1
+            doomed = workspace.path.with_name(f".evicted-{uuid.uuid4().hex}")
+            try:
+                os.rename(workspace.path, doomed)
+            except OSError as e:
+                logger.warning(f"Could not evict Beamer workspace {workspace.path}: {e}")
+                continue
+            evicted.append(doomed)
+        return evicted
+
+    @staticmethod
+    def _remove_directories(paths: List[Path]) -> None:
+        for path in paths:
+            shutil.rmtree(path, ignore_errors=True)
+
+    def _output_key(
+        self,
+        tex_source: str,
+        bib_files: Dict[str, bytes],
+        assets: Dict[str, Path],
+        compiler: str,
+        bibliography_backend: Optional[str]
+    ) -> str:
+        """Hash everything that determines the PDF."""
+        digest = hashlib.sha256()
+        digest.update(f"{compiler}\0{bibliography_backend}\0".encode("utf-8"))
+        digest.update(tex_source.encode("utf-8"))
+        for name in sorted(bib_files):
+            digest.update(f"\0bib:{name}\0".encode("utf-8"))
+            digest.update(bib_files[name])
+        for name in sorted(assets):
+            digest.update(f"\0asset:{name}\0".encode("utf-8"))
+            with open(assets[name], "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _populate_workspace(
+        path: Path,
+        tex_source: str,
+        job_name: str,
+        bib_files: Dict[str, bytes],
+        assets: Dict[str, Path]
+    ) -> None:
+        """Write inputs, leaving auxiliary files from earlier compiles."""
+        (path / f"{job_name}.tex").write_text(tex_source, encoding="utf-8")
+        for name, content in bib_files.items():
+            target = path / name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(content)
+        for name, source in assets.items():
+            if Path(name).is_absolute():
+                continue
+            target = path / name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source, target)
+
+    @staticmethod
+    def _aux_state(path: Path, job_name: str) -> Dict[str, str]:
+        """Hashes of the auxiliary files LaTeX reads back on the next pass."""
+        state = {}
+        for extension in STATE_EXTENSIONS:
+            aux_file = path / f"{job_name}{extension}"
+            if aux_file.exists():
+                state[extension] = hashlib.sha256(aux_file.read_bytes()).hexdigest()
+        return state
+
+    def _store_output(self, built_pdf: Path, cached_pdf: Path, output_pdf: Path) -> None:
+        """Copy the PDF to the output cache and the requested location."""
+        tmp_path = cached_pdf.with_suffix(f".{os.getpid()}.tmp")
+        shutil.copy2(built_pdf, tmp_path)
+        os.replace(tmp_path, cached_pdf)
+        shutil.copy2(built_pdf, output_pdf)
+
+        outputs = sorted(self.outputs_dir.glob("*.pdf"), key=lambda p: p.stat().st_mtime)
+        for stale in outputs[:-self.max_cached_outputs]:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+
+
+def _preamble(tex_source: str) -> str:
+    """Everything before \\begin{document}."""
+    index = tex_source.find("\\begin{document}")
+    return tex_source[:index] if index >= 0 else ""
+
+
+def _hash_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@asynccontextmanager
+async def _hold(lock: Union[threading.Lock, threading.Semaphore]) -> AsyncIterator[None]:
+    """
+    Hold a threading lock or semaphore from a coroutine.
+
+    Waiting polls instead of parking a thread, so it neither blocks the
+    event loop nor ties up the executor, and stays cancellable.
+    """
+    delay = 0.001
+    while not lock.acquire(blocking=False):
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, LOCK_POLL_INTERVAL)
+    try:
+        yield
+    finally:
+        lock.release()
+
+
+_default_compile_service: Optional[BeamerCompileService] = None
+
+
+def get_compile_service() -> BeamerCompileService:
+    """Get the compile service shared by generators in this process."""
+    global _default_compile_service
+    if _default_compile_service is None:
+        _default_compile_service = BeamerCompileService()
+    return _default_compile_service
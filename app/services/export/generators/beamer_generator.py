@@ -11,11 +11,10 @@ This module provides a complete Beamer document generation system with:
 - Frame transitions and overlays
 """
 
+import asyncio
 import os
 import re
-import tempfile
-import shutil
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Tuple, Any
 from dataclasses import dataclass, field
@@ -23,6 +22,8 @@ from enum import Enum
 import logging
 from datetime import datetime
 
+from app.services.export.generators.beamer_compiler import BeamerCompileService, get_compile_service
+
 logger = logging.getLogger(__name__)
 
 
@@ -827,103 +828,100 @@ class BeamerGenerator:
         return output_path
     
     def compile_pdf(self, latex_path: str, output_dir: Optional[str] = None, 
-                   clean_aux: bool = True) -> Tuple[str, bool]:
+                   clean_aux: bool = True, workspace_key: Optional[str] = None) -> Tuple[str, bool]:
         """
         Compile LaTeX to PDF using pdflatex or lualatex.
         
+        Blocking wrapper around compile_pdf_async. Auxiliary files are kept
+        in the compile service's workspace (never next to the source) so the
+        next compile of the document with the same workspace_key can be
+        incremental.
+        
+        Returns:
+            Tuple of (pdf_path, success)
+        """
+        coroutine = self.compile_pdf_async(latex_path, output_dir, workspace_key=workspace_key)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        
+        # Called from inside an event loop: compile on a helper thread's loop
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+    
+    async def compile_pdf_async(self, latex_path: str, output_dir: Optional[str] = None,
+                                compile_service: Optional[BeamerCompileService] = None,
+                                workspace_key: Optional[str] = None) -> Tuple[str, bool]:
+        """
+        Compile LaTeX to PDF through the shared compile service.
+        
+        Unchanged documents are served from the output cache; edited ones
+        compiled under the same workspace_key (e.g. the presentation ID)
+        rerun only the LaTeX passes and bibliography runs they need.
+        
         Returns:
             Tuple of (pdf_path, success)
         """
+        service = compile_service or get_compile_service()
+        latex_dir = os.path.dirname(latex_path)
         if output_dir is None:
-            output_dir = os.path.dirname(latex_path)
+            output_dir = latex_dir
         
-        # Create temporary working directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Copy LaTeX file to temp directory
-            temp_latex = os.path.join(temp_dir, os.path.basename(latex_path))
-            shutil.copy2(latex_path, temp_latex)
+        try:
+            with open(latex_path, 'r', encoding='utf-8') as f:
+                tex_source = f.read()
             
-            # Copy bibliography file if exists
-            if self.config.bibliography.bib_file:
-                bib_source = os.path.join(os.path.dirname(latex_path), 
-                                        self.config.bibliography.bib_file)
+            # Bibliography file, if it exists next to the document
+            bib_files = {}
+            bib_file = self.config.bibliography.bib_file
+            if bib_file:
+                bib_source = os.path.join(latex_dir, bib_file)
                 if os.path.exists(bib_source):
-                    bib_dest = os.path.join(temp_dir, self.config.bibliography.bib_file)
-                    shutil.copy2(bib_source, bib_dest)
+                    with open(bib_source, 'rb') as f:
+                        bib_files[bib_file] = f.read()
             
-            try:
-                # Choose compiler
-                compiler = "pdflatex"
-                if any("fontspec" in cmd for cmd in self.config.custom_commands):
-                    compiler = "lualatex"
-                
-                # First compilation
-                result = subprocess.run([
-                    compiler,
-                    "-interaction=nonstopmode",
-                    "-output-directory", temp_dir,
-                    temp_latex
-                ], capture_output=True, text=True, cwd=temp_dir)
-                
-                if result.returncode != 0:
-                    logger.error(f"First LaTeX compilation failed: {result.stderr}")
-                    return "", False
-                
-                # Run bibliography if needed
-                if self.citations and self.config.bibliography.bib_file:
-                    if self.config.bibliography.backend == "biber":
-                        biber_result = subprocess.run([
-                            "biber",
-                            os.path.splitext(os.path.basename(temp_latex))[0]
-                        ], capture_output=True, text=True, cwd=temp_dir)
-                        
-                        if biber_result.returncode != 0:
-                            logger.warning(f"Biber failed: {biber_result.stderr}")
-                    else:
-                        bibtex_result = subprocess.run([
-                            "bibtex",
-                            os.path.splitext(os.path.basename(temp_latex))[0]
-                        ], capture_output=True, text=True, cwd=temp_dir)
-                        
-                        if bibtex_result.returncode != 0:
-                            logger.warning(f"BibTeX failed: {bibtex_result.stderr}")
-                    
-                    # Second compilation for bibliography
-                    subprocess.run([
-                        compiler,
-                        "-interaction=nonstopmode",
-                        "-output-directory", temp_dir,
-                        temp_latex
-                    ], capture_output=True, text=True, cwd=temp_dir)
-                
-                # Final compilation for cross-references
-                final_result = subprocess.run([
-                    compiler,
-                    "-interaction=nonstopmode", 
-                    "-output-directory", temp_dir,
-                    temp_latex
-                ], capture_output=True, text=True, cwd=temp_dir)
-                
-                if final_result.returncode != 0:
-                    logger.error(f"Final LaTeX compilation failed: {final_result.stderr}")
-                    return "", False
-                
-                # Copy PDF to output directory
-                pdf_name = os.path.splitext(os.path.basename(latex_path))[0] + ".pdf"
-                temp_pdf = os.path.join(temp_dir, pdf_name)
-                output_pdf = os.path.join(output_dir, pdf_name)
-                
-                if os.path.exists(temp_pdf):
-                    shutil.copy2(temp_pdf, output_pdf)
-                    logger.info(f"PDF compiled successfully: {output_pdf}")
-                    return output_pdf, True
-                else:
-                    logger.error("PDF file not found after compilation")
-                    return "", False
-                    
-            except Exception as e:
-                logger.error(f"Error during compilation: {str(e)}")
-                return "", False
+            backend = None
+            if self.citations and bib_file:
+                backend = self.config.bibliography.backend
+            
+            # Choose compiler
+            compiler = "pdflatex"
+            if any("fontspec" in cmd for cmd in self.config.custom_commands):
+                compiler = "lualatex"
+            
+            result = await service.compile(
+                tex_source=tex_source,
+                job_name=os.path.splitext(os.path.basename(latex_path))[0],
+                output_dir=output_dir,
+                bib_files=bib_files,
+                assets=self._collect_figure_assets(latex_dir),
+                compiler=compiler,
+                bibliography_backend=backend,
+                workspace_key=workspace_key
+            )
+            
+            if result.success:
+                logger.info(f"PDF compiled successfully: {result.pdf_path}")
+            return result.pdf_path, result.success
+            
+        except Exception as e:
+            logger.error(f"Error during compilation: {str(e)}")
+            return "", False
+    
+    def _collect_figure_assets(self, latex_dir: str) -> Dict[str, Path]:
+        """Map figure paths used in the document to the files they resolve to."""
+        assets = {}
+        for slide in self.slides:
+            for figure in slide.figures:
+                for fig in [figure] + list(figure.subfigures):
+                    # graphicx tries these extensions when none is given
+                    for extension in ("", ".pdf", ".png", ".jpg", ".jpeg", ".eps"):
+                        candidate = Path(latex_dir, fig.path + extension)
+                        if candidate.is_file():
+                            assets[fig.path + extension] = candidate
+                            break
+        return assets
     
     def generate_handout(self, latex_path: str, output_dir: Optional[str] = None) -> Tuple[str, bool]:
         """Generate handout version of the presentation."""
@@ -0,0 +1,505 @@
+"""
+Shared image rendition cache for presentation exporters.
+
+The PPTX and PDF generators both need source images resized and re-encoded
+for a target box. This module gives them one service that:
+- Identifies sources by content hash, so the same logo referenced by path,
+  URL or buffer is decoded once
+- Fetches remote images asynchronously ahead of generation (prefetch)
+- Decodes JPEGs in draft mode at a reduced scale when the target is small
+- Keeps renditions in a bounded memory LRU with an optional bounded disk tier
+"""
+
+import asyncio
+import hashlib
+import io
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import httpx
+from PIL import Image, ImageOps
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+ImageSource = Union[str, Path, bytes, io.BytesIO]
+
+
+@dataclass(frozen=True)
+class RenditionSpec:
+    """Target size, encoding and pixel adjustments for a rendition."""
+    size: Tuple[int, int]
+    fit: bool = True  # Keep aspect ratio within size; False resizes to exactly size
+    format: str = "JPEG"
+    quality: int = 90
+    optimize: bool = False
+    dpi: Optional[int] = None
+    autocontrast: bool = False
+    palette_colors: Optional[int] = None
+
+    def cache_key(self, digest: str) -> str:
+        """Cache key for this spec applied to a source content hash."""
+        return hashlib.sha256(f"{digest}:{self!r}".encode("utf-8")).hexdigest()
+
+
+class RenditionCache:
+    """
+    Two-tier cache of encoded renditions.
+
+    Memory is an LRU bounded by total bytes; the optional disk tier is a
+    directory of files bounded by total size, evicted oldest-first. Several
+    processes may share the directory: a rendition another process wrote is
+    read from disk on a miss, and each process trims the files it knows of.
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int = 32 * 1024 * 1024,
+        disk_dir: Optional[Union[str, Path]] = None,
+        max_disk_bytes: int = 512 * 1024 * 1024
+    ):
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_index: "OrderedDict[str, int]" = OrderedDict()
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            self._load_disk_index()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get an encoded rendition."""
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return data
+
+        if self.disk_dir:
+            try:
+                data = self._disk_path(key).read_bytes()
+            except OSError:
+                data = None
+            if data is not None:
+                with self._lock:
+                    self.disk_hits += 1
+                    if key in self._disk_index:
+                        self._disk_index.move_to_end(key, last=True)
+                        evicted = []
+                    else:
+                        # Written by another process sharing the directory
+                        self._disk_index[key] = len(data)
+                        self._disk_bytes += len(data)
+                        evicted = self._evict_disk()
+                    self._remember(key, data)
+                self._unlink_disk(evicted)
+                return data
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store an encoded rendition in memory and, if configured, on disk."""
+        with self._lock:
+            self._remember(key, data)
+
+        if self.disk_dir:
+            path = self._disk_path(key)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"Failed to write rendition to disk cache: {e}")
+                return
+
+            with self._lock:
+                self._disk_bytes -= self._disk_index.pop(key, 0)
+                self._disk_index[key] = len(data)
+                self._disk_bytes += len(data)
+                evicted = self._evict_disk()
+
+            self._unlink_disk(evicted)
+
+    def clear(self) -> None:
+        """Drop in-memory renditions."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "disk_entries": len(self._disk_index),
+            "disk_bytes": self._disk_bytes,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+        }
+
+    def _remember(self, key: str, data: bytes) -> None:
+        """Insert into the memory LRU (caller holds the lock)."""
+        if len(data) > self.max_memory_bytes:
+            return
+        self._memory_bytes -= len(self._memory.pop(key, b""))
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def _evict_disk(self) -> List[str]:
+        """Trim the disk index to its budget (caller holds the lock)."""
+        evicted = []
+        while self._disk_bytes > self.max_disk_bytes and self._disk_index:
+            key, size = self._disk_index.popitem(last=False)
+            self._disk_bytes -= size
+            evicted.append(key)
+        return evicted
+
+    def _unlink_disk(self, keys: List[str]) -> None:
+        for key in keys:
+            try:
+                self._disk_path(key).unlink()
+            except OSError:
+                pass
+
+    def _load_disk_index(self) -> None:
+        """Index renditions left on disk by earlier runs, oldest first."""
+        entries = []
+        for path in self.disk_dir.glob("*.rendition"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path.stem, stat.st_size))
+
+        for _, key, size in sorted(entries):
+            self._disk_index[key] = size
+            self._disk_bytes += size
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / f"{key}.rendition"
+
+
+class ImageRenditionService:
+    """
+    Produces resized, re-encoded images for exporters.
+
+    Sources are resolved to a content hash first: local files by path, mtime
+    and size; URLs by address (for url_ttl seconds); buffers by hashing. The
+    rendition cache is keyed on (content hash, spec), and the most recently
+    decoded images are kept so different specs of one source decode once.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[RenditionCache] = None,
+        max_source_bytes: int = 64 * 1024 * 1024,
+        max_decoded_bytes: int = 64 * 1024 * 1024,
+        url_ttl: float = 300.0,
+        fetch_timeout: float = 30.0,
+        max_concurrency: int = 8
+    ):
+        self.cache = cache if cache is not None else RenditionCache()
+        self.max_source_bytes = max_source_bytes
+        self.max_decoded_bytes = max_decoded_bytes
+        self.url_ttl = url_ttl
+        self.fetch_timeout = fetch_timeout
+        self.max_concurrency = max_concurrency
+
+        self._locators: "OrderedDict[Any, Tuple[str, float]]" = OrderedDict()
+        self._sources: "OrderedDict[str, bytes]" = OrderedDict()
+        self._source_bytes = 0
+        self._decoded: "OrderedDict[str, Tuple[Image.Image, bool]]" = OrderedDict()
+        self._decoded_bytes = 0
+        self._lock = threading.Lock()
+
+        self.fetches = 0
+        self.decodes = 0
+        self.renders = 0
+
+    def render(self, source: ImageSource, spec: RenditionSpec) -> bytes:
+        """
+        Get the encoded rendition of a source.
+
+        Raises:
+            OSError/httpx.HTTPError/PIL errors if the source cannot be loaded
+        """
+        digest, data = self._resolve(source)
+        key = spec.cache_key(digest)
+
+        rendition = self.cache.get(key)
+        if rendition is not None:
+            return rendition
+
+        if data is None:
+            data = self._source_data(digest) or self._reload(source, digest)
+
+        image = self._decoded_for(digest, data, spec)
+        rendition = self._encode(image, spec)
+        self.cache.put(key, rendition)
+        return rendition
+
+    async def prefetch(self, sources: Iterable[ImageSource]) -> int:
+        """
+        Fetch remote sources concurrently so later renders do not block.
+
+        Returns:
+            Number of URLs fetched
+        """
+        urls = []
+        for source in sources:
+            if isinstance(source, str) and _is_url(source) and source not in urls:
+                if self._locator_digest(source) is None:
+                    urls.append(source)
+        if not urls:
+            return 0
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with httpx.AsyncClient(timeout=self.fetch_timeout, follow_redirects=True) as client:
+            async def fetch_one(url: str) -> bool:
+                async with semaphore:
+                    try:
+                        response = await client.get(url)
+                        response.raise_for_status()
+                    except httpx.HTTPError as e:
+                        logger.warning(f"Failed to prefetch image {url}: {e}")
+                        return False
+                self._store_source(url, response.content)
+                return True
+
+            results = await asyncio.gather(*(fetch_one(url) for url in urls))
+
+        fetched = sum(results)
+        with self._lock:
+            self.fetches += fetched
+        return fetched
+
+    def clear(self) -> None:
+        """Drop source, decoded and in-memory rendition caches."""
+        with self._lock:
+            self._locators.clear()
+            self._sources.clear()
+            self._source_bytes = 0
+            self._decoded.clear()
+            self._decoded_bytes = 0
+        self.cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get service statistics."""
+        return {
+            "fetches": self.fetches,
+            "decodes": self.decodes,
+            "renders": self.renders,
+            "sources": len(self._sources),
+            "decoded": len(self._decoded),
+            **self.cache.get_stats(),
+        }
+
+    def _resolve(self, source: ImageSource) -> Tuple[str, Optional[bytes]]:
+        """Get the content hash of a source, reading it only if unknown."""
+        if isinstance(source, io.BytesIO):
+            data = source.getvalue()
+            return _digest(data), data
+        if isinstance(source, bytes):
+            return _digest(source), source
+
+        if _is_url(str(source)):
+            locator: Any = str(source)
+        else:
+            stat = os.stat(source)
+            locator = (os.path.abspath(source), stat.st_mtime_ns, stat.st_size)
+
+        digest = self._locator_digest(locator)
+        if digest is not None:
+            return digest, None
+
+        data = self._read(source)
+        return self._store_source(locator, data), data
+
+    def _reload(self, source: ImageSource, digest: str) -> bytes:
+        """Read a source again after its bytes were evicted."""
+        data = self._read(source)
+        self._store_source(str(source) if _is_url(str(source)) else None, data)
+        return data
+
+    def _read(self, source: ImageSource) -> bytes:
+        """Read source bytes, fetching URLs synchronously."""
+        if _is_url(str(source)):
+            response = httpx.get(str(source), timeout=self.fetch_timeout, follow_redirects=True)
+            response.raise_for_status()
+            with self._lock:
+                self.fetches += 1
+            return response.content
+        with open(source, "rb") as f:
+            return f.read()
+
+    def _locator_digest(self, locator: Any) -> Optional[str]:
+        with self._lock:
+            entry = self._locators.get(locator)
+            if entry is None:
+                return None
+            digest, stored_at = entry
+            if isinstance(locator, str) and time.monotonic() - stored_at > self.url_ttl:
+                del self._locators[locator]
+                return None
+            self._locators.move_to_end(locator)
+            return digest
+
+    def _store_source(self, locator: Any, data: bytes) -> str:
+        """Record source bytes under their hash and remember the locator."""
+        digest = _digest(data)
+        with self._lock:
+            if locator is not None:
+                self._locators[locator] = (digest, time.monotonic())
+                while len(self._locators) > 4096:
+                    self._locators.popitem(last=False)
+
+            if digest not in self._sources and len(data) <= self.max_source_bytes:
+                self._sources[digest] = data
+                self._source_bytes += len(data)
+                while self._source_bytes > self.max_source_bytes:
+                    _, evicted = self._sources.popitem(last=False)
+                    self._source_bytes -= len(evicted)
+        return digest
+
+    def _source_data(self, digest: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._sources.get(digest)
+            if data is not None:
+                self._sources.move_to_end(digest)
+            return data
+
+    def _decoded_for(self, digest: str, data: bytes, spec: RenditionSpec) -> Image.Image:
+        """Get a decoded RGB image large enough for spec, decoding if needed."""
+        with self._lock:
+            entry = self._decoded.get(digest)
+            if entry is not None:
+                image, full_size = entry
+                if full_size or (image.width >= spec.size[0] and image.height >= spec.size[1]):
+                    self._decoded.move_to_end(digest)
+                    return image
+
+        image = Image.open(io.BytesIO(data))
+        full_size = True
+        if image.format == "JPEG":
+            # Let libjpeg decode at 1/2, 1/4 or 1/8 scale when the box allows.
+            # Twice the box keeps LANCZOS quality and lets nearby sizes (the
+            # same logo in PPTX and PDF) reuse one decode.
+            original_size = image.size
+            image.draft("RGB", (spec.size[0] * 2, spec.size[1] * 2))
+            full_size = image.size == original_size
+        image.load()
+        image = _flatten(image)
+
+        with self._lock:
+            self.decodes += 1
+            previous = self._decoded.pop(digest, None)
+            if previous is not None:
+                self._decoded_bytes -= _pixel_bytes(previous[0])
+            self._decoded[digest] = (image, full_size)
+            self._decoded_bytes += _pixel_bytes(image)
+            while self._decoded_bytes > self.max_decoded_bytes and len(self._decoded) > 1:
+                _, (evicted, _) = self._decoded.popitem(last=False)
+                self._decoded_bytes -= _pixel_bytes(evicted)
+        return image
+
+    def _encode(self, image: Image.Image, spec: RenditionSpec) -> bytes:
+        """Resize, adjust and encode a decoded image."""
+        if spec.fit:
+            image = image.copy()
+            image.thumbnail(spec.size, Image.Resampling.LANCZOS)
+        else:
+            image = image.resize(spec.size, Image.Resampling.LANCZOS)
+
+        if spec.autocontrast:
+            image = ImageOps.autocontrast(image)
+        if spec.palette_colors:
+            image = image.quantize(colors=spec.palette_colors).convert("RGB")
+
+        save_kwargs: Dict[str, Any] = {"format": spec.format, "quality": spec.quality}
+        if spec.optimize:
+            save_kwargs["optimize"] = True
+        if spec.dpi:
+            save_kwargs["dpi"] = (spec.dpi, spec.dpi)
+
+        buffer = io.BytesIO()
+        image.save(buffer, **save_kwargs)
+        with self._lock:
+            self.renders += 1
+        return buffer.getvalue()
+
+
+def collect_image_sources(slides: Iterable[Any]) -> List[str]:
+    """Collect image paths and URLs referenced by slide content."""
+    sources: List[str] = []
+
+    def visit(value: Any) -> None:
+        if isinstance(value, dict):
+            for key in ("path", "url"):
+                candidate = value.get(key)
+                if isinstance(candidate, str) and candidate not in sources:
+                    if value.get("type") == "image" or _is_url(candidate):
+                        sources.append(candidate)
+            for item in value.values():
+                if isinstance(item, (dict, list)):
+                    visit(item)
+        elif isinstance(value, list):
+            for item in value:
+                visit(item)
+
+    for slide in slides:
+        visit(slide.model_dump() if hasattr(slide, "model_dump") else slide)
+    return sources
+
+
+def _is_url(source: str) -> bool:
+    return source.startswith(("http://", "https://"))
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _pixel_bytes(image: Image.Image) -> int:
+    return image.width * image.height * len(image.getbands())
+
+
+def _flatten(image: Image.Image) -> Image.Image:
+    """Convert to RGB, compositing transparency onto white."""
+    if image.mode == "P":
+        image = image.convert("RGBA")
+    if image.mode in ("RGBA", "LA"):
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.split()[-1])
+        return background
+    if image.mode != "RGB":
+        return image.convert("RGB")
+    return image
+
+
+# Shared by the PPTX and PDF generators so renditions are reused across
+# slides, formats and jobs within a process. Format export pool processes
+# give it a disk tier in one directory, so they reuse each other's work too
+default_rendition_service = ImageRenditionService()
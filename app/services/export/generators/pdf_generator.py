@@ -14,6 +14,7 @@ This module provides a complete PDF generation system with:
 - Table of contents generation
 """
 
+import hashlib
 import io
 import logging
 import math
@@ -23,13 +24,12 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 from uuid import UUID
 
 try:
-    import requests
-    from PIL import Image, ImageDraw, ImageFont, ImageOps
+    from PIL import ImageDraw, ImageFont
     from reportlab.graphics import renderPDF
     from reportlab.graphics.shapes import Drawing, Group, Rect, String
     from reportlab.lib import colors
@@ -37,7 +37,7 @@ try:
     from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT, TA_RIGHT
     from reportlab.lib.pagesizes import A4, LETTER, LEGAL, A3, A5, landscape, portrait
     from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-    from reportlab.lib.units import cm, inch, mm, pica, point
+    from reportlab.lib.units import cm, inch, mm, pica
     from reportlab.lib.utils import ImageReader
     from reportlab.pdfbase import pdfmetrics
     from reportlab.pdfbase.ttfonts import TTFont
@@ -45,6 +45,7 @@ try:
     from reportlab.platypus import (
         BaseDocTemplate, 
         Frame, 
+        Image as PlatypusImage,
         PageBreak, 
         PageTemplate, 
         Paragraph, 
@@ -68,11 +69,20 @@ try:
 except ImportError as e:
     raise ImportError(
         f"Required packages not installed: {e}. "
-        "Please install: pip install reportlab pillow requests weasyprint"
+        "Please install: pip install reportlab pillow httpx weasyprint"
     )
 
 from app.core.logging import get_logger
 from app.domain.schemas.generation import Citation, SlideContent
+from app.services.document_processing.utils.equation_renderer import (
+    MATH_PATTERN,
+    EquationRenderer,
+)
+from app.services.export.generators.image_renditions import (
+    ImageRenditionService,
+    RenditionSpec,
+    default_rendition_service,
+)
 
 logger = get_logger(__name__)
 
@@ -300,75 +310,41 @@ class PDFLayoutEngine:
 class PDFImageProcessor:
     """Image processing utilities for PDF generation."""
     
-    def __init__(self, config: PDFConfig):
+    def __init__(self, config: PDFConfig, rendition_service: Optional[ImageRenditionService] = None):
         self.config = config
+        self.renditions = rendition_service or default_rendition_service
     
     def process_image(self, image_path: str, max_width: float, max_height: float) -> ImageReader:
         """Process and optimize image for PDF inclusion."""
         try:
-            if image_path.startswith(('http://', 'https://')):
-                response = requests.get(image_path, timeout=30)
-                response.raise_for_status()
-                image = Image.open(io.BytesIO(response.content))
-            else:
-                image = Image.open(image_path)
-            
-            # Convert to RGB if needed
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
-            
-            # Apply high contrast if needed
-            if self.config.high_contrast:
-                image = ImageOps.autocontrast(image)
-            
-            # Resize if needed
-            image = self._resize_image(image, max_width, max_height)
-            
-            # Optimize quality
-            if self.config.compress_images:
-                image = self._compress_image(image)
-            
-            # Convert to ImageReader
-            img_buffer = io.BytesIO()
-            image.save(img_buffer, format='JPEG', quality=self.config.image_quality, dpi=(self.config.image_dpi, self.config.image_dpi))
-            img_buffer.seek(0)
-            
-            return ImageReader(img_buffer)
+            rendition = self.renditions.render(
+                image_path, self.rendition_spec(max_width, max_height)
+            )
+            return ImageReader(io.BytesIO(rendition))
             
         except Exception as e:
             logger.error(f"Error processing image {image_path}: {e}")
             return None
     
-    def _resize_image(self, image: Image.Image, max_width: float, max_height: float) -> Image.Image:
-        """Resize image while maintaining aspect ratio."""
-        width, height = image.size
-        
+    def rendition_spec(self, max_width: float, max_height: float) -> RenditionSpec:
+        """Rendition spec for a box given in points."""
         # Convert points to pixels
         max_width_px = int(max_width * self.config.image_dpi / 72)
         max_height_px = int(max_height * self.config.image_dpi / 72)
         
-        # Calculate scaling
-        width_ratio = max_width_px / width
-        height_ratio = max_height_px / height
-        scale_ratio = min(width_ratio, height_ratio, 1.0)  # Don't upscale
-        
-        if scale_ratio < 1.0:
-            new_width = int(width * scale_ratio)
-            new_height = int(height * scale_ratio)
-            return image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-        
-        return image
-    
-    def _compress_image(self, image: Image.Image) -> Image.Image:
-        """Apply compression optimizations."""
-        # Convert to optimized palette if appropriate
-        if self.config.quality == PDFQuality.DRAFT:
+        return RenditionSpec(
+            size=(max_width_px, max_height_px),
+            fit=True,  # Never upscales
+            format='JPEG',
+            quality=self.config.image_quality,
+            dpi=self.config.image_dpi,
+            autocontrast=self.config.high_contrast,
             # More aggressive compression for draft
-            if image.mode == 'RGB':
-                image = image.quantize(colors=64)
-                image = image.convert('RGB')
-        
-        return image
+            palette_colors=(
+                64 if self.config.compress_images and self.config.quality == PDFQuality.DRAFT
+                else None
+            )
+        )
 
 
 class PDFFontManager:
@@ -422,11 +398,24 @@ class PDFGenerator:
         self.layout_engine = PDFLayoutEngine(self.config)
         self.image_processor = PDFImageProcessor(self.config)
         self.font_manager = PDFFontManager(self.config)
+        # Print resolution at least; renders are shared with other exporters
+        self.equation_renderer = EquationRenderer(
+            dpi=max(self.config.image_dpi, 300), color=self.config.text_color
+        )
         self.toc_entries = []
+        # Files of typeset inline math, by image digest; reportlab's <img>
+        # markup opens files but no data: URLs
+        self._math_dir: Optional[tempfile.TemporaryDirectory] = None
+        self._math_files: Dict[str, str] = {}
         
-    def generate_pdf(self, slides: List[PDFSlide], output_path: str, 
+    def generate_pdf(self, slides: List[PDFSlide], output_path: Union[str, BinaryIO], 
                     metadata: Optional[Dict[str, Any]] = None) -> bool:
-        """Generate PDF with specified format and configuration."""
+        """
+        Generate PDF with specified format and configuration.
+        
+        output_path may be a writable stream such as an artifact sink; the
+        document is written to it once, when the build finishes.
+        """
         try:
             logger.info(f"Generating PDF with format: {self.config.format.value}")
             
@@ -633,7 +622,7 @@ class PDFGenerator:
             paragraphs = slide.content.split('\n\n')
             for para in paragraphs:
                 if para.strip():
-                    content.append(Paragraph(para.strip(), body_style))
+                    content.append(self._typeset_paragraph(para.strip(), body_style))
         
         # Images
         if slide.images and full_page:
@@ -668,6 +657,62 @@ class PDFGenerator:
         
         return content
     
+    def _typeset_paragraph(self, text: str, style: ParagraphStyle):
+        """
+        Create a paragraph flowable with its LaTeX math typeset.
+        
+        A paragraph that is a single display equation becomes an image
+        flowable; inline math is embedded as <img> markup, pointing at a file
+        of the render, sized in points and lowered onto the text baseline.
+        Math that cannot be typeset is left as source text.
+        """
+        display = MATH_PATTERN.fullmatch(text)
+        if display and display.group(1) is not None:
+            image = self.equation_renderer.render_image(
+                display.group(1), 'png', 'display', font_size=style.fontSize
+            )
+            if image is not None:
+                return PlatypusImage(
+                    io.BytesIO(image.data),
+                    width=image.width_inches * inch,
+                    height=image.height_inches * inch
+                )
+        
+        def typeset(match) -> str:
+            equation_type = 'display' if match.group(1) is not None else 'inline'
+            image = self.equation_renderer.render_image(
+                match.group(1) or match.group(2), 'png', equation_type, font_size=style.fontSize
+            )
+            if image is None:
+                return match.group(0)
+            
+            try:
+                path = self._math_image_path(image.data)
+            except OSError as e:
+                logger.warning(f"Could not store typeset math, keeping source: {e}")
+                return match.group(0)
+            
+            return (
+                f'<img src="{path}" '
+                f'width="{image.width_inches * inch:.2f}" height="{image.height_inches * inch:.2f}" '
+                f'valign="{-image.depth / image.dpi * inch:.2f}"/>'
+            )
+        
+        return Paragraph(MATH_PATTERN.sub(typeset, text), style)
+    
+    def _math_image_path(self, data: bytes) -> str:
+        """Get the path of a file holding a rendered equation, writing it once."""
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        path = self._math_files.get(digest)
+        if path is None:
+            if self._math_dir is None:
+                self._math_dir = tempfile.TemporaryDirectory(prefix='pdf-math-')
+            path = os.path.join(self._math_dir.name, f'{digest}.png')
+            with open(path, 'wb') as f:
+                f.write(data)
+            self._math_files[digest] = path
+        return path
+    
     def _create_handout_page(self, slides: List[PDFSlide], slide_width: float,
                            slide_height: float, cols: int, rows: int) -> List:
         """Create a handout page with multiple slides."""
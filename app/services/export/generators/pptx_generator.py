@@ -19,12 +19,11 @@ import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 from uuid import UUID
 
 try:
-    import requests
     from PIL import Image, ImageDraw, ImageFont
     from pptx import Presentation
     from pptx.chart.data import CategoryChartData
@@ -42,11 +41,20 @@ try:
 except ImportError as e:
     raise ImportError(
         f"Required packages not installed: {e}. "
-        "Please install: pip install python-pptx pillow requests"
+        "Please install: pip install python-pptx pillow httpx"
     )
 
 from app.core.logging import get_logger
 from app.domain.schemas.generation import Citation, SlideContent
+from app.services.document_processing.utils.equation_renderer import (
+    EquationImage,
+    EquationRenderer as MathRenderer,
+)
+from app.services.export.generators.image_renditions import (
+    ImageRenditionService,
+    RenditionSpec,
+    default_rendition_service,
+)
 
 logger = get_logger(__name__)
 
@@ -144,8 +152,25 @@ class TemplateConfig:
 class EquationRenderer:
     """Renders mathematical equations for presentations."""
     
-    def __init__(self):
+    def __init__(self, math_renderer: Optional[MathRenderer] = None, dpi: int = 300):
         self.logger = get_logger(self.__class__.__name__)
+        self.dpi = dpi
+        # Renders go through the shared equation cache, so an equation
+        # repeated across slides (or exported to PDF/HTML too) is laid out once
+        self.math_renderer = math_renderer or MathRenderer(dpi=dpi)
+    
+    def render_equation_image(
+        self, latex_code: str, font_size: int = 24, equation_type: str = 'display'
+    ) -> Optional[EquationImage]:
+        """
+        Render LaTeX equation to a PNG at the slide DPI.
+        
+        Returns:
+            Rendered image with its pixel size, or None if it cannot be typeset
+        """
+        return self.math_renderer.render_image(
+            latex_code, 'png', equation_type, dpi=self.dpi, font_size=font_size
+        )
     
     def render_latex_to_image(self, latex_code: str, font_size: int = 24) -> Optional[io.BytesIO]:
         """
@@ -158,14 +183,17 @@ class EquationRenderer:
         Returns:
             BytesIO object containing the rendered image
         """
+        image = self.render_equation_image(latex_code, font_size)
+        if image is not None:
+            return io.BytesIO(image.data)
+        return self._render_text_fallback(latex_code, font_size)
+    
+    def _render_text_fallback(self, latex_code: str, font_size: int) -> Optional[io.BytesIO]:
+        """Draw the equation source as plain text when it cannot be typeset."""
         try:
-            # For production, you might want to use matplotlib or a LaTeX service
-            # This is a simplified version using PIL
             img = Image.new('RGBA', (400, 100), (255, 255, 255, 0))
             draw = ImageDraw.Draw(img)
             
-            # Simple text rendering as fallback
-            # In production, integrate with matplotlib's mathtext or external LaTeX service
             clean_text = re.sub(r'[{}\\]', '', latex_code)
             try:
                 font = ImageFont.truetype("arial.ttf", font_size)
@@ -221,10 +249,11 @@ class EquationRenderer:
 class ImageProcessor:
     """Processes and optimizes images for presentations."""
     
-    def __init__(self):
+    def __init__(self, rendition_service: Optional[ImageRenditionService] = None):
         self.logger = get_logger(self.__class__.__name__)
         self.max_image_size = (1920, 1080)  # Max resolution
         self.supported_formats = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff'}
+        self.renditions = rendition_service or default_rendition_service
     
     def process_image(
         self, 
@@ -235,6 +264,10 @@ class ImageProcessor:
         """
         Process and optimize image for presentation.
         
+        Renditions come from the shared rendition cache, so an image reused
+        across slides (or already rendered for another export) is not
+        decoded again.
+        
         Args:
             image_path: Path to image file or BytesIO object
             target_size: Target size (width, height)
@@ -244,43 +277,14 @@ class ImageProcessor:
             Processed image as BytesIO
         """
         try:
-            if isinstance(image_path, str):
-                if image_path.startswith(('http://', 'https://')):
-                    # Download image
-                    response = requests.get(image_path, timeout=30)
-                    response.raise_for_status()
-                    img = Image.open(io.BytesIO(response.content))
-                else:
-                    img = Image.open(image_path)
-            else:
-                img = Image.open(image_path)
-            
-            # Convert to RGB if necessary
-            if img.mode in ('RGBA', 'LA', 'P'):
-                # Create white background
-                background = Image.new('RGB', img.size, (255, 255, 255))
-                if img.mode == 'P':
-                    img = img.convert('RGBA')
-                background.paste(img, mask=img.split()[-1])
-                img = background
-            elif img.mode != 'RGB':
-                img = img.convert('RGB')
-            
-            # Resize if needed
-            if target_size:
-                if maintain_aspect:
-                    img.thumbnail(target_size, Image.Resampling.LANCZOS)
-                else:
-                    img = img.resize(target_size, Image.Resampling.LANCZOS)
-            else:
-                # Apply max size constraint
-                img.thumbnail(self.max_image_size, Image.Resampling.LANCZOS)
-            
-            # Save to BytesIO
-            buffer = io.BytesIO()
-            img.save(buffer, format='JPEG', quality=90, optimize=True)
-            buffer.seek(0)
-            return buffer
+            spec = RenditionSpec(
+                size=target_size or self.max_image_size,
+                fit=maintain_aspect or not target_size,
+                format='JPEG',
+                quality=90,
+                optimize=True
+            )
+            return io.BytesIO(self.renditions.render(image_path, spec))
             
         except Exception as e:
             self.logger.error(f"Failed to process image: {e}")
@@ -807,12 +811,12 @@ class PPTXGenerator:
             self.logger.error(f"Failed to create presentation: {e}")
             raise
     
-    def save_presentation(self, output_path: Union[str, io.BytesIO]) -> None:
+    def save_presentation(self, output_path: Union[str, BinaryIO]) -> None:
         """
-        Save the presentation to file or buffer.
+        Save the presentation to file or stream.
         
         Args:
-            output_path: Output file path or BytesIO buffer
+            output_path: Output file path or writable binary stream
         """
         if not self.presentation:
             raise ValueError("No presentation to save. Call create_presentation first.")
@@ -1190,11 +1194,21 @@ class PPTXGenerator:
         """Add equation content to slide."""
         latex_code = item.get('latex', item.get('content', ''))
         
+        font_size = int(self.config.typography.body_size * 1.2)
+        
         try:
-            # Render equation to image
-            equation_image = self.equation_renderer.render_latex_to_image(
-                latex_code, font_size=int(self.config.typography.body_size * 1.2)
-            )
+            # Typeset at natural size, scaled down only to fit the box
+            rendered = self.equation_renderer.render_equation_image(latex_code, font_size)
+            if rendered is not None:
+                scale = min(1.0, width / rendered.width_inches, height / rendered.height_inches)
+                slide.shapes.add_picture(
+                    io.BytesIO(rendered.data), Inches(x), Inches(y),
+                    width=Inches(rendered.width_inches * scale),
+                    height=Inches(rendered.height_inches * scale)
+                )
+                return
+            
+            equation_image = self.equation_renderer.render_latex_to_image(latex_code, font_size)
             
             if equation_image:
                 # Add equation image
@@ -1535,16 +1549,34 @@ class PPTXGenerator:
         citations = kwargs.get('citations')
         metadata = kwargs.get('metadata')
         
-        # Create presentation
-        presentation = self.create_presentation(slides, citations, metadata)
-        
-        # Save to buffer
         buffer = io.BytesIO()
-        self.save_presentation(buffer)
+        self.export_to_stream(slides, buffer, **kwargs)
         buffer.seek(0)
         
         return buffer
     
+    def export_to_stream(self, slides: List[SlideContent], stream: BinaryIO, **kwargs) -> None:
+        """
+        Export presentation into a writable stream.
+        
+        The package is zipped straight into the stream, which need not be
+        seekable, so an artifact sink can forward it to storage as it is
+        produced.
+        
+        Args:
+            slides: List of slide content
+            stream: Writable binary stream
+            **kwargs: Additional parameters (citations, metadata, etc.)
+        """
+        citations = kwargs.get('citations')
+        metadata = kwargs.get('metadata')
+        
+        # Create presentation
+        presentation = self.create_presentation(slides, citations, metadata)
+        
+        # Save to stream
+        self.save_presentation(stream)
+    
     def export_to_file(
         self, 
         slides: List[SlideContent], 
@@ -445,7 +445,7 @@ class TestImageProcessor:
         assert isinstance(placeholder, io.BytesIO)
         assert placeholder.tell() > 0
     
-    @patch('requests.get')
+    @patch('app.services.export.generators.image_renditions.httpx.get')
     def test_url_image_processing(self, mock_get):
         """Test processing image from URL."""
         # Mock successful image download
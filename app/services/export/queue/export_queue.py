@@ -35,6 +35,7 @@ from app.domain.schemas.user import User
 from app.services.auth.email_service import EmailValidationService
 from app.services.document_processing.queue.task_queue import TaskQueue, TaskPriority, TaskStatus
 from app.services.export.export_service import ExportFormat, ExportService
+from app.services.export.queue.parallel_export import FormatExportPool, run_format_export
 from app.api.v1.endpoints.websocket import broadcast_job_progress, send_user_notification
 
 logger = structlog.get_logger(__name__)
@@ -131,6 +132,8 @@ class ExportJob(BaseModel):
     completed_at: Optional[datetime] = None
     progress_percent: float = 0.0
     current_stage: str = "queued"
+    format_progress: Dict[str, float] = Field(default_factory=dict)
+    format_errors: Dict[str, str] = Field(default_factory=dict)
     error_message: Optional[str] = None
     retry_count: int = 0
     max_retries: int = 3
@@ -579,7 +582,8 @@ class ExportQueueManager:
         self,
         task_queue: Optional[TaskQueue] = None,
         storage_path: Optional[Path] = None,
-        secret_key: Optional[str] = None
+        secret_key: Optional[str] = None,
+        format_pool: Optional[FormatExportPool] = None
     ):
         """
         Initialize export queue manager.
@@ -588,9 +592,11 @@ class ExportQueueManager:
             task_queue: Task queue implementation (defaults to ARQ)
             storage_path: Path for temporary file storage
             secret_key: Secret key for secure token generation
+            format_pool: Executor for format exports (defaults to a process pool)
         """
         self.task_queue = task_queue or TaskQueue(backend="arq")
         self.export_service = ExportService()
+        self.format_pool = format_pool or FormatExportPool()
         self.storage_path = storage_path or Path(settings.TEMP_STORAGE_PATH or "/tmp/slidegenie_exports")
         self.storage_path.mkdir(parents=True, exist_ok=True)
         
@@ -642,6 +648,7 @@ class ExportQueueManager:
                 pass
         
         await self.task_queue.shutdown()
+        await asyncio.to_thread(self.format_pool.shutdown)
         self._initialized = False
         logger.info("Export queue manager shutdown")
     
@@ -826,37 +833,37 @@ class ExportQueueManager:
             # Send progress update
             await self._update_job_progress(job, 10, "Initializing export")
             
-            # Process each format
-            results = []
-            formats_completed = 0
+            # Export formats in parallel; formats finished by an earlier
+            # attempt are kept and only the failed ones are retried
+            formats = [ExportFormat(format) for format in job.formats]
+            completed = {ExportFormat(result.format).value for result in job.results}
+            pending = [format for format in formats if format.value not in completed]
             
-            for format in job.formats:
-                try:
-                    await self._update_job_progress(
-                        job, 
-                        10 + (formats_completed * 80 // len(job.formats)), 
-                        f"Exporting to {format.value.upper()}"
-                    )
-                    
-                    # Export to format
-                    result = await self._export_format(job, format)
-                    results.append(result)
-                    
-                    formats_completed += 1
-                    
-                except Exception as e:
-                    logger.error("Format export failed", 
-                               job_id=str(job_id), 
-                               format=format.value, 
-                               error=str(e))
-                    job.error_message = f"Failed to export {format.value}: {str(e)}"
-                    raise
+            for format in formats:
+                job.format_progress[format.value] = 100.0 if format.value in completed else 0.0
+            
+            outcomes = await asyncio.gather(
+                *(self._export_format_tracked(job, format) for format in pending),
+                return_exceptions=True
+            )
+            
+            for format, outcome in zip(pending, outcomes):
+                if isinstance(outcome, BaseException):
+                    job.format_errors[format.value] = str(outcome)
+                else:
+                    job.results.append(outcome)
+                    job.format_errors.pop(format.value, None)
+            
+            if job.format_errors:
+                job.error_message = "Failed to export " + "; ".join(
+                    f"{format}: {error}" for format, error in sorted(job.format_errors.items())
+                )
+                raise ExportError(job.error_message)
             
             # Finalize job
             await self._update_job_progress(job, 90, "Finalizing export")
             
-            job.results = results
-            job.total_size = sum(r.file_size for r in results)
+            job.total_size = sum(r.file_size for r in job.results)
             job.status = ExportJobStatus.COMPLETED
             job.completed_at = datetime.utcnow()
             job.processing_time_seconds = (job.completed_at - job.started_at).total_seconds()
@@ -871,7 +878,7 @@ class ExportQueueManager:
                 user = await user_repo.get_by_id(job.user_id)
                 
                 if user:
-                    await self.email_service.send_completion_notification(job, user, results)
+                    await self.email_service.send_completion_notification(job, user, job.results)
             
             logger.info("Export job completed successfully", 
                        job_id=str(job_id),
@@ -920,7 +927,7 @@ class ExportQueueManager:
                     user = await user_repo.get_by_id(job.user_id)
                     
                     if user:
-                        await self.email_service.send_completion_notification(job, user, [])
+                        await self.email_service.send_completion_notification(job, user, job.results)
         
         finally:
             self.current_jobs = max(0, self.current_jobs - 1)
@@ -928,22 +935,59 @@ class ExportQueueManager:
             # Record analytics
             await self.analytics.record_job_completion(job)
     
+    async def _export_format_tracked(self, job: ExportJob, format: ExportFormat) -> ExportJobResult:
+        """
+        Export one format, reporting its progress and failure separately.
+        
+        The pool process reports nothing until it returns, so the format's
+        progress goes from 0 straight to 100.
+        """
+        await self._update_job_progress(
+            job, self._overall_progress(job), f"Exporting to {format.value.upper()}"
+        )
+        
+        try:
+            result = await self._export_format(job, format)
+        except Exception as e:
+            logger.error("Format export failed", 
+                        job_id=str(job.job_id), 
+                        format=format.value, 
+                        error=str(e))
+            await self._update_job_progress(
+                job, self._overall_progress(job), f"Failed to export {format.value.upper()}"
+            )
+            raise
+        
+        job.format_progress[format.value] = 100.0
+        await self._update_job_progress(
+            job, self._overall_progress(job), f"Exported {format.value.upper()}"
+        )
+        return result
+    
+    def _overall_progress(self, job: ExportJob) -> float:
+        """Job progress from per-format progress (export spans 10-90%)."""
+        if not job.format_progress:
+            return 10.0
+        done = sum(job.format_progress.values()) / (100.0 * len(job.format_progress))
+        return 10 + 80 * done
+    
     async def _export_format(self, job: ExportJob, format: ExportFormat) -> ExportJobResult:
-        """Export job to specific format."""
+        """Export job to specific format in the format pool."""
         try:
             # Generate output filename
             timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
             filename = f"export_{job.job_id}_{timestamp}.{format.value}"
             output_path = self.storage_path / filename
             
-            # Export presentation
-            result_path = self.export_service.export_presentation(
-                slides=job.slides,
-                format=format,
-                template_config=job.template_config,
-                citations=job.citations,
-                metadata=job.metadata,
-                output_path=str(output_path)
+            # Export presentation off the event loop
+            result_path = await self.format_pool.run(
+                run_format_export,
+                format.value,
+                [slide.model_dump() for slide in job.slides],
+                job.template_config,
+                [citation.model_dump() for citation in job.citations] if job.citations else None,
+                job.metadata,
+                str(output_path)
             )
             
             # Get file info
@@ -1152,7 +1196,8 @@ class ExportQueueManager:
             "max_concurrent_jobs": self.max_concurrent_jobs,
             "total_jobs": len(self.jobs),
             "active_batches": len(self.batch_jobs),
-            "storage_used_bytes": await self._calculate_storage_usage()
+            "storage_used_bytes": await self._calculate_storage_usage(),
+            "format_pool": self.format_pool.get_stats()
         }
         
         return {
@@ -1233,6 +1278,7 @@ class ExportQueueManager:
             "status": job.status.value,
             "progress_percent": progress,
             "current_stage": stage,
+            "format_progress": dict(job.format_progress),
             "updated_at": datetime.utcnow().isoformat()
         })
     
@@ -0,0 +1,166 @@
+"""
+Process pool for running format exports of one job in parallel.
+
+Generators (python-pptx, reportlab, pdflatex wrappers) are synchronous and
+CPU-heavy. Running them on the event loop serializes a multi-format job and
+stalls every other coroutine in the worker; running them here lets a
+PPTX+PDF+Beamer job finish in about the time of its slowest format.
+
+Pool processes do not share memory. Image renditions go through a disk
+cache in one directory, so a figure resized for the PPTX is read back for
+the PDF, but each process keeps its own ExportService and equation render
+cache. Generators report no progress while they run, so a format's
+progress only moves from 0 to 100 when its process returns.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# One ExportService per pool process, created on first use
+_worker_export_service = None
+
+
+def init_format_worker(rendition_dir: str) -> None:
+    """Give a pool process's rendition cache the disk tier shared by the pool."""
+    from app.services.export.generators.image_renditions import (
+        RenditionCache,
+        default_rendition_service,
+    )
+
+    default_rendition_service.cache = RenditionCache(disk_dir=rendition_dir)
+
+
+def run_format_export(
+    format_value: str,
+    slides: List[Dict[str, Any]],
+    template_config: Dict[str, Any],
+    citations: Optional[List[Dict[str, Any]]],
+    metadata: Dict[str, Any],
+    output_path: str
+) -> str:
+    """
+    Export one format inside a pool process.
+
+    Arguments are plain data so they pickle cheaply and independently of
+    model classes; they are rebuilt into schema objects here.
+
+    Returns:
+        Path of the written file
+    """
+    global _worker_export_service
+
+    from app.domain.schemas.generation import Citation, SlideContent
+    from app.services.export.export_service import ExportFormat, ExportService
+
+    if _worker_export_service is None:
+        _worker_export_service = ExportService()
+
+    return _worker_export_service.export_presentation(
+        slides=[SlideContent(**slide) for slide in slides],
+        format=ExportFormat(format_value),
+        template_config=template_config,
+        citations=[Citation(**citation) for citation in citations] if citations else None,
+        metadata=metadata,
+        output_path=output_path
+    )
+
+
+class FormatExportPool:
+    """
+    Bounded executor for format exports.
+
+    Uses a spawn-context process pool by default (forking a process that
+    holds an event loop and open sockets is unsafe); use_processes=False
+    falls back to a thread pool, e.g. where subprocesses are not allowed.
+    Pool processes share renditions through rendition_dir; threads share
+    the in-memory caches and do not need it.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        use_processes: bool = True,
+        mp_context: str = "spawn",
+        rendition_dir: Optional[Union[str, Path]] = None
+    ):
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.use_processes = use_processes
+        self.mp_context = mp_context
+        self.rendition_dir = Path(rendition_dir or Path(tempfile.gettempdir()) / "slidegenie_renditions")
+        self._executor: Optional[Executor] = None
+
+        # Statistics
+        self.submitted = 0
+        self.failed = 0
+        self.pool_restarts = 0
+
+    @property
+    def executor(self) -> Executor:
+        """The underlying executor, created on first use."""
+        if self._executor is None:
+            if self.use_processes:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context(self.mp_context),
+                    initializer=init_format_worker,
+                    initargs=(str(self.rendition_dir),)
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="format-export"
+                )
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a picklable function in the pool without blocking the loop.
+
+        A pool broken by a crashed worker is replaced so later calls succeed;
+        the call that hit it still fails.
+        """
+        loop = asyncio.get_running_loop()
+        self.submitted += 1
+
+        try:
+            return await loop.run_in_executor(self.executor, func, *args)
+        except BrokenProcessPool:
+            self.failed += 1
+            self.pool_restarts += 1
+            logger.warning("Format export pool broken, restarting", max_workers=self.max_workers)
+            self._discard_executor()
+            raise
+        except Exception:
+            self.failed += 1
+            raise
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics."""
+        return {
+            "max_workers": self.max_workers,
+            "use_processes": self.use_processes,
+            "submitted": self.submitted,
+            "failed": self.failed,
+            "pool_restarts": self.pool_restarts,
+        }
+
+    def _discard_executor(self) -> None:
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
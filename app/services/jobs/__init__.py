@@ -0,0 +1,11 @@
+"""
+Job services shared by the generation and slide pipelines.
+"""
+from .progress_sink import TERMINAL_STATUSES, JobProgressSink, ProgressWriter, SinkStats
+
+__all__ = [
+    "JobProgressSink",
+    "ProgressWriter",
+    "SinkStats",
+    "TERMINAL_STATUSES",
+]
@@ -0,0 +1,263 @@
+"""
+Coalescing sink for generation job progress.
+
+Pipelines report progress many times per second, but each report used to
+load the job and rewrite its processing steps. The sink keeps the latest
+fields of each step in memory and writes a job's pending steps as one
+partial update when:
+
+- the job's oldest unwritten tick is flush_interval old;
+- max_pending_steps steps are waiting;
+- a step changes status, e.g. starts or completes;
+- the job itself changes status, which is written in the same update.
+
+Database writes per job are therefore bounded by time and by the number of
+step and job transitions, not by the number of ticks. Terminal job states
+are never dropped: a failed write is kept pending and retried.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from uuid import UUID
+
+
+logger = logging.getLogger(__name__)
+
+ProgressWriter = Callable[[UUID, List[Dict[str, Any]], Dict[str, Any]], Awaitable[None]]
+
+TERMINAL_STATUSES = frozenset({'completed', 'failed', 'cancelled'})
+
+
+@dataclass
+class SinkStats:
+    """Counters of the progress sink."""
+    ticks: int = 0
+    writes: int = 0
+    failed_writes: int = 0
+
+
+@dataclass
+class _StepState:
+    """Last known status of one job step."""
+    status: str
+    started: float
+
+
+@dataclass
+class _PendingJob:
+    """Unwritten progress of one job."""
+    first_buffered: float
+    steps: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    values: Dict[str, Any] = field(default_factory=dict)
+
+    def merge_newer(self, newer: "_PendingJob") -> None:
+        """Apply progress buffered after this, keeping the older buffer time."""
+        for step, patch in newer.steps.items():
+            self.steps.setdefault(step, {}).update(patch)
+        self.values.update(newer.values)
+
+
+class JobProgressSink:
+    """
+    Buffers job progress and writes it in coalesced partial updates.
+    """
+
+    def __init__(
+        self,
+        writer: ProgressWriter,
+        flush_interval: float = 1.0,
+        max_pending_steps: int = 20,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize progress sink.
+
+        Args:
+            writer: Applies (job ID, step patches, job values) in one
+                write, e.g. GenerationJobRepository.progress_writer
+            flush_interval: Seconds a tick may wait before it is written
+            max_pending_steps: Pending steps per job forcing a write
+            clock: Monotonic time source
+        """
+        self.writer = writer
+        self.flush_interval = flush_interval
+        self.max_pending_steps = max_pending_steps
+        self.clock = clock
+
+        self.stats = SinkStats()
+        self._pending: Dict[UUID, _PendingJob] = {}
+        self._steps: Dict[UUID, Dict[str, _StepState]] = {}
+        self._locks: Dict[UUID, asyncio.Lock] = {}
+        self._worker: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+
+    @property
+    def pending_jobs(self) -> int:
+        return len(self._pending)
+
+    async def record(
+        self,
+        job_id: UUID,
+        step: str,
+        progress: float,
+        step_status: str = 'processing'
+    ) -> None:
+        """
+        Record progress of a job step.
+
+        Args:
+            job_id: Job ID
+            step: Step name
+            progress: Progress (0.0 to 1.0)
+            step_status: Step status
+        """
+        self.stats.ticks += 1
+        now = self.clock()
+
+        pending = self._pending.get(job_id)
+        if pending is None:
+            pending = self._pending[job_id] = _PendingJob(first_buffered=now)
+
+        patch = pending.steps.setdefault(step, {'step': step})
+        steps = self._steps.setdefault(job_id, {})
+        state = steps.get(step)
+        if state is None:
+            state = steps[step] = _StepState(status='', started=now)
+            patch['started_at'] = datetime.now(timezone.utc).isoformat()
+        patch['status'] = step_status
+        patch['progress'] = progress
+        if step_status == 'completed':
+            patch['duration_ms'] = int((now - state.started) * 1000)
+
+        status_changed = state.status != step_status
+        state.status = step_status
+
+        if (
+            status_changed
+            or len(pending.steps) >= self.max_pending_steps
+            or now - pending.first_buffered >= self.flush_interval
+        ):
+            await self.flush(job_id)
+
+    async def transition(self, job_id: UUID, status: str, **values: Any) -> None:
+        """
+        Change a job's status, writing pending progress in the same update.
+
+        Args:
+            job_id: Job ID
+            status: New job status
+            **values: Other job columns, e.g. completed_at
+
+        Raises:
+            Exception: The write failed; the transition stays pending and
+                is retried by the next flush
+        """
+        pending = self._pending.get(job_id)
+        if pending is None:
+            pending = self._pending[job_id] = _PendingJob(first_buffered=self.clock())
+        pending.values.update(values, status=status)
+
+        await self._write(job_id, raise_errors=True)
+
+    async def flush(self, job_id: Optional[UUID] = None) -> int:
+        """
+        Write pending progress now.
+
+        Args:
+            job_id: Job to flush, all jobs when None
+
+        Returns:
+            Number of writes
+        """
+        job_ids = [job_id] if job_id is not None else list(self._pending)
+        writes = 0
+        for pending_job_id in job_ids:
+            writes += await self._write(pending_job_id)
+        return writes
+
+    async def flush_due(self) -> int:
+        """
+        Write jobs whose oldest pending tick reached flush_interval.
+
+        Returns:
+            Number of writes
+        """
+        now = self.clock()
+        due = [
+            job_id for job_id, pending in self._pending.items()
+            if now - pending.first_buffered >= self.flush_interval
+        ]
+        writes = 0
+        for job_id in due:
+            writes += await self._write(job_id)
+        return writes
+
+    async def start(self) -> None:
+        """Start the background flusher for jobs that stop reporting."""
+        if self._worker is None:
+            self._stopping.clear()
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background flusher and write everything pending."""
+        if self._worker is not None:
+            self._stopping.set()
+            await self._worker
+            self._worker = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        """Flush due jobs, so none waits much past flush_interval."""
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.flush_interval / 2)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush_due()
+
+    async def _write(self, job_id: UUID, raise_errors: bool = False) -> int:
+        """
+        Write one job's pending progress.
+
+        Writes of a job are serialized, so a slow write never lands after
+        a newer one.
+
+        Args:
+            job_id: Job ID
+            raise_errors: Re-raise a failed write instead of logging it
+
+        Returns:
+            Number of writes, 0 or 1
+        """
+        lock = self._locks.setdefault(job_id, asyncio.Lock())
+        async with lock:
+            pending = self._pending.pop(job_id, None)
+            if pending is None:
+                return 0
+
+            try:
+                await self.writer(job_id, list(pending.steps.values()), pending.values)
+            except Exception as e:
+                self.stats.failed_writes += 1
+                # Keep the progress, under anything recorded meanwhile
+                newer = self._pending.get(job_id)
+                if newer is not None:
+                    pending.merge_newer(newer)
+                self._pending[job_id] = pending
+                if raise_errors:
+                    raise
+                logger.error(f"Failed to write progress of job {job_id}: {e}")
+                return 0
+
+            self.stats.writes += 1
+            finished = pending.values.get('status') in TERMINAL_STATUSES
+
+        if finished:
+            # Drop the step history of the finished job
+            self._steps.pop(job_id, None)
+            if job_id not in self._pending and not lock.locked():
+                self._locks.pop(job_id, None)
+        return 1
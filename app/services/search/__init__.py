@@ -0,0 +1,16 @@
+"""
+Similarity search services: approximate nearest neighbour indexing and the
+batched embedding pipeline.
+"""
+from .ann_index import IVFIndex, exact_search, recall_at_k
+from .embedding_pipeline import EmbeddingPipeline, EmbeddingStore, PipelineStats, content_hash
+
+__all__ = [
+    "IVFIndex",
+    "exact_search",
+    "recall_at_k",
+    "EmbeddingPipeline",
+    "EmbeddingStore",
+    "PipelineStats",
+    "content_hash",
+]
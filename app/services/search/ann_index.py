@@ -0,0 +1,265 @@
+"""
+In-process approximate nearest neighbour index.
+
+IVFIndex mirrors what pgvector's IVFFlat index does in the database: vectors
+are partitioned around nlist k-means centroids and a query only scans the
+nprobe partitions closest to it. nprobe is the recall/latency knob; probing
+every partition is an exact search. It backs similarity search in tests and
+deployments without pgvector, and is the reference for recall benchmarks.
+"""
+import logging
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+
+class IVFIndex:
+    """
+    Inverted-file index over L2 distance.
+    """
+
+    def __init__(
+        self,
+        dimensions: int,
+        nlist: int = 64,
+        nprobe: int = 8,
+        kmeans_iterations: int = 10,
+        seed: int = 0
+    ):
+        """
+        Initialize IVF index.
+
+        Args:
+            dimensions: Vector dimensions
+            nlist: Number of partitions
+            nprobe: Partitions scanned per query by default
+            kmeans_iterations: Iterations when training centroids
+            seed: Random seed for centroid training
+        """
+        self.dimensions = dimensions
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.kmeans_iterations = kmeans_iterations
+        self._rng = np.random.default_rng(seed)
+
+        self._centroids: Optional[np.ndarray] = None
+        self._list_ids: List[List[Hashable]] = []
+        self._list_vectors: List[List[np.ndarray]] = []
+        self._packed: List[Optional[np.ndarray]] = []
+        self._location: Dict[Hashable, Tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._location)
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    def train(self, vectors: np.ndarray) -> None:
+        """
+        Fit partition centroids with k-means, re-partitioning indexed vectors.
+
+        Args:
+            vectors: Sample of vectors, shape (n, dimensions)
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        nlist = min(self.nlist, len(vectors))
+        centroids = vectors[self._rng.choice(len(vectors), nlist, replace=False)].copy()
+
+        for _ in range(self.kmeans_iterations):
+            assignments = self._nearest_centroids(vectors, centroids, 1)[:, 0]
+            for c in range(nlist):
+                members = vectors[assignments == c]
+                if len(members):
+                    centroids[c] = members.mean(axis=0)
+
+        existing_ids = list(self._location)
+        existing_vectors = [
+            self._list_vectors[c][slot] for c, slot in self._location.values()
+        ]
+
+        self._centroids = centroids
+        self._list_ids = [[] for _ in range(nlist)]
+        self._list_vectors = [[] for _ in range(nlist)]
+        self._packed = [None] * nlist
+        self._location = {}
+
+        if existing_ids:
+            self.add(existing_ids, np.stack(existing_vectors))
+        logger.debug(f"Trained IVF index with {nlist} partitions on {len(vectors)} vectors")
+
+    def add(self, ids: Sequence[Hashable], vectors: np.ndarray) -> None:
+        """
+        Add or replace vectors.
+
+        Trains the index on the first batch if it is not trained yet.
+
+        Args:
+            ids: Vector identifiers
+            vectors: Vectors, shape (len(ids), dimensions)
+        """
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(ids), self.dimensions)
+        if not self.is_trained:
+            self.train(vectors)
+
+        for vector_id in ids:
+            self.remove(vector_id)
+
+        assignments = self._nearest_centroids(vectors, self._centroids, 1)[:, 0]
+        for vector_id, vector, c in zip(ids, vectors, assignments):
+            self._location[vector_id] = (int(c), len(self._list_ids[c]))
+            self._list_ids[c].append(vector_id)
+            self._list_vectors[c].append(vector)
+            self._packed[c] = None
+
+    def remove(self, vector_id: Hashable) -> bool:
+        """Remove a vector, returning whether it was present."""
+        location = self._location.pop(vector_id, None)
+        if location is None:
+            return False
+
+        c, slot = location
+        last = len(self._list_ids[c]) - 1
+        if slot != last:
+            # Move the last entry into the freed slot
+            moved_id = self._list_ids[c][last]
+            self._list_ids[c][slot] = moved_id
+            self._list_vectors[c][slot] = self._list_vectors[c][last]
+            self._location[moved_id] = (c, slot)
+        self._list_ids[c].pop()
+        self._list_vectors[c].pop()
+        self._packed[c] = None
+        return True
+
+    def search(
+        self,
+        query: Sequence[float],
+        k: int = 10,
+        nprobe: Optional[int] = None,
+        exclude: Iterable[Hashable] = ()
+    ) -> List[Tuple[Hashable, float]]:
+        """
+        Find approximate nearest neighbours of a vector.
+
+        Args:
+            query: Query vector
+            k: Number of neighbours
+            nprobe: Partitions to scan, defaults to the index's nprobe
+            exclude: Identifiers to leave out of the results
+
+        Returns:
+            List of (id, L2 distance), nearest first
+        """
+        return self.search_batch(np.asarray(query, dtype=np.float32)[None, :], k, nprobe, exclude)[0]
+
+    def search_batch(
+        self,
+        queries: np.ndarray,
+        k: int = 10,
+        nprobe: Optional[int] = None,
+        exclude: Iterable[Hashable] = ()
+    ) -> List[List[Tuple[Hashable, float]]]:
+        """
+        Find approximate nearest neighbours of several vectors.
+
+        Args:
+            queries: Query vectors, shape (n, dimensions)
+            k: Number of neighbours
+            nprobe: Partitions to scan, defaults to the index's nprobe
+            exclude: Identifiers to leave out of the results
+
+        Returns:
+            Neighbour lists per query
+        """
+        if not self.is_trained or not self._location:
+            return [[] for _ in range(len(queries))]
+
+        queries = np.asarray(queries, dtype=np.float32)
+        nprobe = min(nprobe or self.nprobe, len(self._centroids))
+        exclude = set(exclude)
+        probes = self._nearest_centroids(queries, self._centroids, nprobe)
+
+        results = []
+        for query, lists in zip(queries, probes):
+            candidate_ids: List[Hashable] = []
+            candidate_vectors = []
+            for c in lists:
+                packed = self._packed_list(c)
+                if packed is not None:
+                    candidate_ids.extend(self._list_ids[c])
+                    candidate_vectors.append(packed)
+
+            if not candidate_vectors:
+                results.append([])
+                continue
+
+            vectors = np.concatenate(candidate_vectors)
+            distances = np.einsum("ij,ij->i", vectors - query, vectors - query)
+            wanted = min(k + len(exclude), len(distances))
+            nearest = np.argpartition(distances, wanted - 1)[:wanted]
+            nearest = nearest[np.argsort(distances[nearest])]
+
+            neighbours = [
+                (candidate_ids[i], float(np.sqrt(distances[i])))
+                for i in nearest
+                if candidate_ids[i] not in exclude
+            ]
+            results.append(neighbours[:k])
+
+        return results
+
+    def _packed_list(self, c: int) -> Optional[np.ndarray]:
+        """Get a partition's vectors as one array, packing it after changes."""
+        if not self._list_vectors[c]:
+            return None
+        if self._packed[c] is None:
+            self._packed[c] = np.stack(self._list_vectors[c])
+        return self._packed[c]
+
+    @staticmethod
+    def _nearest_centroids(vectors: np.ndarray, centroids: np.ndarray, count: int) -> np.ndarray:
+        """Get the indexes of the count nearest centroids of each vector."""
+        distances = (
+            (vectors ** 2).sum(axis=1)[:, None]
+            - 2 * vectors @ centroids.T
+            + (centroids ** 2).sum(axis=1)[None, :]
+        )
+        if count >= len(centroids):
+            return np.argsort(distances, axis=1)
+        nearest = np.argpartition(distances, count - 1, axis=1)[:, :count]
+        order = np.take_along_axis(distances, nearest, axis=1).argsort(axis=1)
+        return np.take_along_axis(nearest, order, axis=1)
+
+
+def exact_search(
+    ids: Sequence[Hashable],
+    vectors: np.ndarray,
+    queries: np.ndarray,
+    k: int = 10
+) -> List[List[Hashable]]:
+    """
+    Find exact nearest neighbours by brute force.
+
+    Args:
+        ids: Vector identifiers
+        vectors: Vectors, shape (len(ids), dimensions)
+        queries: Query vectors
+        k: Number of neighbours
+
+    Returns:
+        Neighbour ids per query, nearest first
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    nearest = IVFIndex._nearest_centroids(np.asarray(queries, dtype=np.float32), vectors, k)
+    return [[ids[i] for i in row] for row in nearest]
+
+
+def recall_at_k(approximate: Sequence[Sequence[Hashable]], exact: Sequence[Sequence[Hashable]]) -> float:
+    """Get the fraction of true nearest neighbours found, averaged over queries."""
+    if not exact:
+        return 1.0
+    found = sum(len(set(a) & set(e)) for a, e in zip(approximate, exact))
+    return found / sum(len(e) for e in exact)
@@ -0,0 +1,208 @@
+"""
+Batched background pipeline keeping presentation embeddings current.
+
+Callers submit presentation IDs whenever searchable text changes. The
+pipeline collects them into batches and per batch:
+
+- drops repeated submissions of the same presentation;
+- skips presentations whose text hash matches the stored embedding;
+- embeds identical texts once, in a single provider call;
+- upserts the one "combined" embedding row per presentation.
+"""
+import asyncio
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import AsyncContextManager, Awaitable, Callable, Dict, List, Optional, Protocol, Sequence, Tuple
+from uuid import UUID
+
+
+logger = logging.getLogger(__name__)
+
+EmbedBatch = Callable[[List[str]], Awaitable[List[List[float]]]]
+
+
+class EmbeddingStore(Protocol):
+    """Storage the pipeline reads texts from and writes embeddings to."""
+
+    async def get_embedding_sources(self, presentation_ids: Sequence[UUID]) -> Dict[UUID, str]:
+        ...
+
+    async def get_content_hashes(self, presentation_ids: Sequence[UUID]) -> Dict[UUID, str]:
+        ...
+
+    async def upsert_combined_embeddings(
+        self,
+        rows: Sequence[Tuple[UUID, List[float], str]],
+        model: str
+    ) -> None:
+        ...
+
+
+@dataclass
+class PipelineStats:
+    """Counters of the embedding pipeline."""
+    submitted: int = 0
+    duplicate_submissions: int = 0
+    unchanged: int = 0
+    embedded: int = 0
+    embedded_texts: int = 0
+    provider_calls: int = 0
+    batches: int = 0
+    failed: int = 0
+
+
+def content_hash(model: str, text: str) -> str:
+    """Hash the text an embedding was generated from, per model."""
+    return hashlib.sha256(f"{model}\0{text}".encode()).hexdigest()
+
+
+class EmbeddingPipeline:
+    """
+    Background batcher of embedding updates.
+    """
+
+    def __init__(
+        self,
+        embed_batch: EmbedBatch,
+        store_factory: Callable[[], AsyncContextManager[EmbeddingStore]],
+        model: str,
+        batch_size: int = 64,
+        max_wait: float = 0.5
+    ):
+        """
+        Initialize embedding pipeline.
+
+        Args:
+            embed_batch: Provider call embedding a list of texts
+            store_factory: Opens the store used for one batch
+            model: Embedding model name, stored with each embedding
+            batch_size: Maximum presentations per batch
+            max_wait: Seconds to wait for a batch to fill
+        """
+        self.embed_batch = embed_batch
+        self.store_factory = store_factory
+        self.model = model
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+
+        self.stats = PipelineStats()
+        self._pending: Dict[UUID, None] = {}
+        self._wakeup = asyncio.Event()
+        self._worker: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def submit(self, presentation_id: UUID) -> None:
+        """Queue a presentation for re-embedding."""
+        self.stats.submitted += 1
+        if presentation_id in self._pending:
+            self.stats.duplicate_submissions += 1
+            return
+
+        self._pending[presentation_id] = None
+        if len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+
+    async def start(self) -> None:
+        """Start the background worker."""
+        if self._worker is None:
+            self._stopping = False
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background worker after embedding everything pending."""
+        if self._worker is not None:
+            # Let the worker finish the batch it holds
+            self._stopping = True
+            self._wakeup.set()
+            await self._worker
+            self._worker = None
+        await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Embed everything pending now.
+
+        Returns:
+            Number of presentations embedded
+        """
+        embedded = 0
+        while self._pending:
+            embedded += await self._process_batch(self._take_batch())
+        return embedded
+
+    async def _run(self) -> None:
+        """Process batches as they fill or max_wait elapses."""
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.max_wait)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            while self._pending and not self._stopping:
+                await self._process_batch(self._take_batch())
+                if len(self._pending) < self.batch_size:
+                    break
+
+    def _take_batch(self) -> List[UUID]:
+        batch = list(self._pending)[:self.batch_size]
+        for presentation_id in batch:
+            del self._pending[presentation_id]
+        return batch
+
+    async def _process_batch(self, presentation_ids: List[UUID]) -> int:
+        """
+        Embed one batch of presentations.
+
+        Args:
+            presentation_ids: Presentations to embed
+
+        Returns:
+            Number of presentations embedded
+        """
+        self.stats.batches += 1
+        try:
+            async with self.store_factory() as store:
+                sources = await store.get_embedding_sources(presentation_ids)
+                stored_hashes = await store.get_content_hashes(list(sources))
+
+                changed: Dict[UUID, Tuple[str, str]] = {}
+                for presentation_id, text in sources.items():
+                    text_hash = content_hash(self.model, text)
+                    if stored_hashes.get(presentation_id) == text_hash:
+                        self.stats.unchanged += 1
+                    else:
+                        changed[presentation_id] = (text, text_hash)
+
+                if not changed:
+                    return 0
+
+                # Identical texts (e.g. copies of a presentation) are embedded once
+                texts = list(dict.fromkeys(text for text, _ in changed.values()))
+                vectors = await self.embed_batch(texts)
+                self.stats.provider_calls += 1
+                self.stats.embedded_texts += len(texts)
+                vector_by_text = dict(zip(texts, vectors))
+
+                await store.upsert_combined_embeddings(
+                    [
+                        (presentation_id, vector_by_text[text], text_hash)
+                        for presentation_id, (text, text_hash) in changed.items()
+                    ],
+                    self.model
+                )
+
+            self.stats.embedded += len(changed)
+            return len(changed)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.stats.failed += len(presentation_ids)
+            logger.error(f"Failed to embed batch of {len(presentation_ids)} presentations: {e}")
+            return 0
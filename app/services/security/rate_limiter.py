@@ -4,28 +4,141 @@ Rate limiting service using Redis for SlideGenie authentication system.
 Provides flexible rate limiting with multiple strategies:
 - Fixed window rate limiting
 - Sliding window rate limiting  
+- Token bucket and GCRA rate limiting
 - Distributed rate limiting across multiple servers
 - Per-IP, per-user, and per-endpoint rate limits
 """
 
 import asyncio
 import time
+import uuid
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Dict, List, Optional, Tuple, Union
 
+import redis.asyncio as redis
+from redis.commands.core import AsyncScript
+
 from app.core.config import settings
 from app.core.logging import get_logger
 from app.infrastructure.cache.redis import RedisCache, get_redis
 
 logger = get_logger(__name__)
 
+# Rate limit checks run as Lua scripts so each one is a single atomic round
+# trip. Time comes from the Redis server, so app servers with skewed clocks
+# still agree. Every script returns
+# {allowed, remaining, reset_after_ms, retry_after_ms}.
+
+FIXED_WINDOW_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window_ms = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = t[1] * 1000 + math.floor(t[2] / 1000)
+
+local ttl = redis.call('PTTL', KEYS[1])
+local count = 0
+if ttl > 0 then
+    count = tonumber(redis.call('GET', KEYS[1]))
+else
+    ttl = window_ms - (now % window_ms)
+end
+
+if count >= limit then
+    return {0, 0, ttl, ttl}
+end
+
+count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('PEXPIRE', KEYS[1], ttl)
+end
+return {1, limit - count, ttl, 0}
+"""
+
+SLIDING_WINDOW_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window_ms = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = t[1] * 1000 + math.floor(t[2] / 1000)
+
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window_ms)
+local count = redis.call('ZCARD', KEYS[1])
+
+if count >= limit then
+    local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+    local retry = window_ms
+    if oldest[2] then
+        retry = tonumber(oldest[2]) + window_ms - now
+    end
+    return {0, 0, retry, retry}
+end
+
+redis.call('ZADD', KEYS[1], now, ARGV[3])
+redis.call('PEXPIRE', KEYS[1], window_ms)
+return {1, limit - count - 1, window_ms, 0}
+"""
+
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = capacity / tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = t[1] * 1000 + math.floor(t[2] / 1000)
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+if tokens == nil then
+    tokens = capacity
+else
+    tokens = math.min(capacity, tokens + math.max(0, now - tonumber(state[2])) * rate)
+end
+
+local allowed = 0
+local retry = 0
+if tokens >= 1 then
+    allowed = 1
+    tokens = tokens - 1
+else
+    retry = math.ceil((1 - tokens) / rate)
+end
+
+local refill = math.ceil((capacity - tokens) / rate)
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], refill + 1000)
+return {allowed, math.floor(tokens), refill, retry}
+"""
+
+# Generic cell rate algorithm: one timestamp per key (the theoretical
+# arrival time), allowing `limit` requests per window with bursts of up to
+# `limit` and requests spaced evenly after that
+GCRA_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window_ms = tonumber(ARGV[2])
+local interval = window_ms / limit
+local t = redis.call('TIME')
+local now = t[1] * 1000 + math.floor(t[2] / 1000)
+
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+tat = math.max(tat, now)
+local new_tat = tat + interval
+local allow_at = new_tat - window_ms
+
+if now < allow_at then
+    local retry = math.ceil(allow_at - now)
+    return {0, 0, math.ceil(tat - now), retry}
+end
+
+local reset = math.ceil(new_tat - now)
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', reset)
+return {1, math.floor((window_ms - (new_tat - now)) / interval), reset, 0}
+"""
+
 
 class RateLimitStrategy(str, Enum):
     """Rate limiting strategies."""
     FIXED_WINDOW = "fixed_window"
     SLIDING_WINDOW = "sliding_window"
     TOKEN_BUCKET = "token_bucket"
+    GCRA = "gcra"
 
 
 class RateLimitResult:
@@ -64,14 +177,26 @@ class RateLimiter:
     - Fixed window: Simple counter within time windows
     - Sliding window: More accurate limiting using sorted sets
     - Token bucket: Smooth rate limiting with burst capacity
+    - GCRA: Token-bucket behaviour with a single timestamp per key
+    
+    Every check is one EVALSHA of a script loaded once per server, so it
+    costs a single round trip and is exact under concurrency.
     """
     
+    SCRIPTS = {
+        RateLimitStrategy.FIXED_WINDOW: ("fixed", FIXED_WINDOW_SCRIPT),
+        RateLimitStrategy.SLIDING_WINDOW: ("sliding", SLIDING_WINDOW_SCRIPT),
+        RateLimitStrategy.TOKEN_BUCKET: ("bucket", TOKEN_BUCKET_SCRIPT),
+        RateLimitStrategy.GCRA: ("gcra", GCRA_SCRIPT),
+    }
+    
     def __init__(
         self,
         cache: Optional[RedisCache] = None,
         default_limit: int = 60,
         default_window: int = 60,
         strategy: RateLimitStrategy = RateLimitStrategy.SLIDING_WINDOW,
+        client: Optional[redis.Redis] = None,
     ):
         """
         Initialize rate limiter.
@@ -81,11 +206,15 @@ class RateLimiter:
             default_limit: Default requests per window
             default_window: Default window size in seconds
             strategy: Rate limiting strategy
+            client: Redis client (defaults to the shared pool)
         """
         self.cache = cache or RedisCache(prefix="rate_limit")
         self.default_limit = default_limit
         self.default_window = default_window
         self.strategy = strategy
+        self.client = client
+        self._scripts: Dict[RateLimitStrategy, AsyncScript] = {}
+        self._scripts_loaded = False
         
         # Predefined rate limits for different endpoints
         self.endpoint_limits = {
@@ -127,63 +256,22 @@ class RateLimiter:
         limit = limit or self.default_limit
         window = window or self.default_window
         
-        # Choose strategy
-        if self.strategy == RateLimitStrategy.FIXED_WINDOW:
-            return await self._fixed_window_check(identifier, limit, window)
-        elif self.strategy == RateLimitStrategy.SLIDING_WINDOW:
-            return await self._sliding_window_check(identifier, limit, window)
-        elif self.strategy == RateLimitStrategy.TOKEN_BUCKET:
-            return await self._token_bucket_check(identifier, limit, window)
-        else:
-            # Fallback to sliding window
-            return await self._sliding_window_check(identifier, limit, window)
-    
-    async def _fixed_window_check(
-        self,
-        identifier: str,
-        limit: int,
-        window: int,
-    ) -> RateLimitResult:
-        """
-        Fixed window rate limiting using simple counter.
-        
-        Args:
-            identifier: Unique identifier
-            limit: Request limit
-            window: Window size in seconds
-            
-        Returns:
-            RateLimitResult
-        """
-        now = int(time.time())
-        window_start = now - (now % window)
-        key = f"fixed:{identifier}:{window_start}"
+        strategy = self.strategy if self.strategy in self.SCRIPTS else RateLimitStrategy.SLIDING_WINDOW
+        key_prefix, _ = self.SCRIPTS[strategy]
+        args = [limit, window * 1000]
+        if strategy == RateLimitStrategy.SLIDING_WINDOW:
+            # Unique member so concurrent requests are all counted
+            args.append(uuid.uuid4().hex)
         
         try:
-            client = await get_redis()
-            
-            # Use pipeline for atomic operations
-            async with client.pipeline() as pipe:
-                pipe.incr(key)
-                pipe.expire(key, window)
-                results = await pipe.execute()
-            
-            current_count = results[0]
-            remaining = max(0, limit - current_count)
-            allowed = current_count <= limit
-            reset_time = datetime.fromtimestamp(window_start + window)
-            retry_after = None if allowed else window - (now % window)
-            
-            return RateLimitResult(
-                allowed=allowed,
-                limit=limit,
-                remaining=remaining,
-                reset_time=reset_time,
-                retry_after=retry_after,
+            client = await self._get_client()
+            script = await self._get_script(client, strategy)
+            allowed, remaining, reset_ms, retry_ms = await script(
+                keys=[f"{key_prefix}:{identifier}"], args=args, client=client
             )
             
         except Exception as e:
-            logger.error(f"Fixed window rate limit error: {e}")
+            logger.error(f"{strategy.value} rate limit error: {e}")
             # Fail open - allow request if Redis is down
             return RateLimitResult(
                 allowed=True,
@@ -191,151 +279,37 @@ class RateLimiter:
                 remaining=limit,
                 reset_time=datetime.now() + timedelta(seconds=window),
             )
-    
-    async def _sliding_window_check(
-        self,
-        identifier: str,
-        limit: int,
-        window: int,
-    ) -> RateLimitResult:
-        """
-        Sliding window rate limiting using sorted sets.
-        
-        Args:
-            identifier: Unique identifier
-            limit: Request limit
-            window: Window size in seconds
-            
-        Returns:
-            RateLimitResult
-        """
-        now = time.time()
-        window_start = now - window
-        key = f"sliding:{identifier}"
         
-        try:
-            client = await get_redis()
-            
-            # Use pipeline for atomic operations
-            async with client.pipeline() as pipe:
-                # Remove old entries
-                pipe.zremrangebyscore(key, 0, window_start)
-                
-                # Count current requests
-                pipe.zcard(key)
-                
-                # Add current request with timestamp as score
-                pipe.zadd(key, {str(now): now})
-                
-                # Set expiration
-                pipe.expire(key, window)
-                
-                results = await pipe.execute()
-            
-            current_count = results[1] + 1  # +1 for the request we just added
-            remaining = max(0, limit - current_count)
-            allowed = current_count <= limit
-            reset_time = datetime.fromtimestamp(now + window)
-            
-            # If not allowed, remove the request we just added
-            if not allowed:
-                await client.zrem(key, str(now))
-                retry_after = int(window)
-            else:
-                retry_after = None
-            
-            return RateLimitResult(
-                allowed=allowed,
-                limit=limit,
-                remaining=remaining,
-                reset_time=reset_time,
-                retry_after=retry_after,
-            )
-            
-        except Exception as e:
-            logger.error(f"Sliding window rate limit error: {e}")
-            # Fail open - allow request if Redis is down
-            return RateLimitResult(
-                allowed=True,
-                limit=limit,
-                remaining=limit,
-                reset_time=datetime.now() + timedelta(seconds=window),
-            )
+        return RateLimitResult(
+            allowed=bool(allowed),
+            limit=limit,
+            remaining=max(0, int(remaining)),
+            reset_time=datetime.now() + timedelta(milliseconds=int(reset_ms)),
+            retry_after=None if allowed else max(1, -(-int(retry_ms) // 1000)),
+        )
     
-    async def _token_bucket_check(
-        self,
-        identifier: str,
-        limit: int,
-        window: int,
-    ) -> RateLimitResult:
+    async def preload_scripts(self, client: Optional[redis.Redis] = None) -> None:
         """
-        Token bucket rate limiting for smooth rate limiting.
+        Load all rate limit scripts into the server's script cache.
         
-        Args:
-            identifier: Unique identifier
-            limit: Token bucket capacity
-            window: Time to refill bucket (in seconds)
-            
-        Returns:
-            RateLimitResult
+        Checks call scripts by SHA and reload them if the server has lost
+        them (e.g. after a restart), so this only saves the first miss.
         """
-        now = time.time()
-        key = f"bucket:{identifier}"
-        refill_rate = limit / window  # tokens per second
-        
-        try:
-            client = await get_redis()
-            
-            # Get current bucket state
-            bucket_data = await client.hmget(
-                key,
-                ["tokens", "last_refill"]
-            )
-            
-            current_tokens = float(bucket_data[0] or limit)
-            last_refill = float(bucket_data[1] or now)
-            
-            # Calculate tokens to add based on elapsed time
-            elapsed = now - last_refill
-            tokens_to_add = elapsed * refill_rate
-            current_tokens = min(limit, current_tokens + tokens_to_add)
-            
-            # Check if we have tokens available
-            allowed = current_tokens >= 1.0
-            
-            if allowed:
-                current_tokens -= 1.0
-            
-            # Update bucket state
-            await client.hmset(key, {
-                "tokens": current_tokens,
-                "last_refill": now,
-            })
-            await client.expire(key, window * 2)
-            
-            remaining = int(current_tokens)
-            reset_time = datetime.fromtimestamp(
-                now + ((limit - current_tokens) / refill_rate)
-            )
-            retry_after = None if allowed else int((1.0 - current_tokens) / refill_rate)
-            
-            return RateLimitResult(
-                allowed=allowed,
-                limit=limit,
-                remaining=remaining,
-                reset_time=reset_time,
-                retry_after=retry_after,
-            )
-            
-        except Exception as e:
-            logger.error(f"Token bucket rate limit error: {e}")
-            # Fail open - allow request if Redis is down
-            return RateLimitResult(
-                allowed=True,
-                limit=limit,
-                remaining=limit,
-                reset_time=datetime.now() + timedelta(seconds=window),
-            )
+        client = client or await self._get_client()
+        for strategy, (_, source) in self.SCRIPTS.items():
+            self._scripts[strategy] = client.register_script(source)
+            await client.script_load(source)
+        self._scripts_loaded = True
+    
+    async def _get_script(self, client: redis.Redis, strategy: RateLimitStrategy) -> AsyncScript:
+        """Get the script for a strategy, loading all scripts on first use."""
+        if not self._scripts_loaded:
+            await self.preload_scripts(client)
+        return self._scripts[strategy]
+    
+    async def _get_client(self) -> redis.Redis:
+        """Get the Redis client."""
+        return self.client or await get_redis()
     
     async def get_rate_limit_status(
         self,
@@ -363,11 +337,11 @@ class RateLimiter:
         
         try:
             if self.strategy == RateLimitStrategy.SLIDING_WINDOW:
-                now = time.time()
-                window_start = now - window
+                # Scores are server milliseconds, see SLIDING_WINDOW_SCRIPT
+                window_start = int((time.time() - window) * 1000)
                 key = f"sliding:{identifier}"
                 
-                client = await get_redis()
+                client = await self._get_client()
                 
                 # Clean old entries and count current
                 async with client.pipeline() as pipe:
@@ -413,21 +387,10 @@ class RateLimiter:
             Success status
         """
         try:
-            client = await get_redis()
-            patterns = [
-                f"fixed:{identifier}:*",
-                f"sliding:{identifier}",
-                f"bucket:{identifier}",
-            ]
-            
-            keys_deleted = 0
-            for pattern in patterns:
-                keys = []
-                async for key in client.scan_iter(match=pattern):
-                    keys.append(key)
-                
-                if keys:
-                    keys_deleted += await client.delete(*keys)
+            client = await self._get_client()
+            keys_deleted = await client.delete(
+                *(f"{key_prefix}:{identifier}" for key_prefix, _ in self.SCRIPTS.values())
+            )
             
             logger.info(f"Reset rate limit for {identifier}, deleted {keys_deleted} keys")
             return True
@@ -458,7 +421,7 @@ class RateLimiter:
         key = f"counter:{counter_name}:{identifier}"
         
         try:
-            client = await get_redis()
+            client = await self._get_client()
             
             async with client.pipeline() as pipe:
                 pipe.incrby(key, increment)
@@ -490,7 +453,7 @@ class RateLimiter:
         key = f"counter:{counter_name}:{identifier}"
         
         try:
-            client = await get_redis()
+            client = await self._get_client()
             value = await client.get(key)
             return int(value) if value else 0
             
@@ -26,7 +26,10 @@ from .export_pipeline import (
     ExportPipeline,
     ExportFormat,
     ExportOptions,
-    ExportResult
+    ExportResult,
+    ExportResultCache,
+    RedisExportCacheStore,
+    DiskExportCacheStore
 )
 from .progress import (
     ProgressTracker,
@@ -70,6 +73,9 @@ __all__ = [
     "ExportFormat",
     "ExportOptions",
     "ExportResult",
+    "ExportResultCache",
+    "RedisExportCacheStore",
+    "DiskExportCacheStore",
     
     # Progress Tracking
     "ProgressTracker",
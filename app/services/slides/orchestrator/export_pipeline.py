@@ -1,14 +1,24 @@
 """Export pipeline for preparing presentations for various formats."""
 
-from typing import Dict, List, Any, Optional, Set, Tuple, BinaryIO
-from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Set, Tuple, BinaryIO, Protocol
+from dataclasses import dataclass, field, asdict, replace
+from collections import OrderedDict
 from datetime import datetime
+from pathlib import Path
 import logging
 import asyncio
+import hashlib
 from enum import Enum
 import json
 import base64
+import os
 from io import BytesIO
+from html import escape
+
+from app.services.document_processing.utils.equation_renderer import (
+    MATH_PATTERN,
+    EquationRenderer,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -49,15 +59,224 @@ class ExportResult:
     created_at: datetime = field(default_factory=datetime.utcnow)
 
 
+class ExportCacheStore(Protocol):
+    """Shared backing store for export results (Redis, disk, ...)."""
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        ...
+        
+    async def set(self, key: str, value: bytes) -> None:
+        ...
+        
+    async def delete(self, key: str) -> None:
+        ...
+
+
+class RedisExportCacheStore:
+    """Export cache store backed by a Redis client."""
+    
+    def __init__(self, client: Any, prefix: str = "slidegenie:export:", ttl: int = 86400):
+        """Initialize with an asyncio Redis client."""
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+        
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.client.get(f"{self.prefix}{key}")
+        
+    async def set(self, key: str, value: bytes) -> None:
+        await self.client.set(f"{self.prefix}{key}", value, ex=self.ttl)
+        
+    async def delete(self, key: str) -> None:
+        await self.client.delete(f"{self.prefix}{key}")
+
+
+class DiskExportCacheStore:
+    """Export cache store backed by a local directory."""
+    
+    def __init__(self, directory: Path):
+        """Initialize the store, creating the directory if needed."""
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.export"
+        
+    async def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            return await asyncio.to_thread(path.read_bytes)
+        except FileNotFoundError:
+            return None
+            
+    async def set(self, key: str, value: bytes) -> None:
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        
+        def write():
+            tmp_path.write_bytes(value)
+            os.replace(tmp_path, path)
+            
+        await asyncio.to_thread(write)
+        
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self._path(key).unlink, True)
+
+
+class ExportResultCache:
+    """
+    Content-addressed cache of export results.
+    
+    Keeps an in-memory LRU bounded by the total size of exported data.
+    Results too large for memory, and every result when a backing store is
+    configured, are also written to the store so other workers can reuse them.
+    """
+    
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_entry_bytes: Optional[int] = None,
+        store: Optional[ExportCacheStore] = None
+    ):
+        """Initialize the cache."""
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes if max_entry_bytes is not None else max_bytes // 4
+        self.store = store
+        self._entries: "OrderedDict[str, ExportResult]" = OrderedDict()
+        self._current_bytes = 0
+        
+        # Metrics
+        self.hits = 0
+        self.store_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.store_errors = 0
+        
+    def __len__(self) -> int:
+        return len(self._entries)
+        
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+        
+    async def get(self, key: str) -> Optional[ExportResult]:
+        """Get a cached result, falling back to the backing store."""
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+            
+        if self.store is not None:
+            try:
+                payload = await self.store.get(key)
+            except Exception as e:
+                self.store_errors += 1
+                logger.warning(f"Export cache store read failed: {e}")
+                payload = None
+                
+            if payload is not None:
+                result = self._deserialize(payload)
+                self._remember(key, result)
+                self.store_hits += 1
+                return result
+                
+        self.misses += 1
+        return None
+        
+    async def set(self, key: str, result: ExportResult) -> None:
+        """Cache a result in memory and in the backing store."""
+        self._remember(key, result)
+        
+        if self.store is not None:
+            try:
+                await self.store.set(key, self._serialize(result))
+            except Exception as e:
+                self.store_errors += 1
+                logger.warning(f"Export cache store write failed: {e}")
+                
+    def clear(self) -> None:
+        """Drop all in-memory entries."""
+        self._entries.clear()
+        self._current_bytes = 0
+        
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self.hits + self.store_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "store_hits": self.store_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "store_errors": self.store_errors,
+            "hit_rate": (self.hits + self.store_hits) / lookups if lookups else 0.0
+        }
+        
+    def _remember(self, key: str, result: ExportResult) -> None:
+        """Insert into the in-memory LRU, evicting to stay under max_bytes."""
+        size = self._entry_size(result)
+        if size > self.max_entry_bytes:
+            return
+            
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._current_bytes -= self._entry_size(previous)
+            
+        self._entries[key] = result
+        self._current_bytes += size
+        
+        while self._current_bytes > self.max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._current_bytes -= self._entry_size(evicted)
+            self.evictions += 1
+            
+    @staticmethod
+    def _entry_size(result: ExportResult) -> int:
+        return len(result.data) if result.data else 0
+        
+    @staticmethod
+    def _serialize(result: ExportResult) -> bytes:
+        """Serialize as a length-prefixed JSON header followed by the raw data."""
+        header = json.dumps({
+            "format": result.format.value,
+            "file_path": result.file_path,
+            "warnings": result.warnings,
+            "metadata": result.metadata,
+            "created_at": result.created_at.isoformat(),
+            "has_data": result.data is not None
+        }, default=str).encode("utf-8")
+        return len(header).to_bytes(4, "big") + header + (result.data or b"")
+        
+    @staticmethod
+    def _deserialize(payload: bytes) -> ExportResult:
+        header_length = int.from_bytes(payload[:4], "big")
+        header = json.loads(payload[4:4 + header_length])
+        return ExportResult(
+            format=ExportFormat(header["format"]),
+            data=payload[4 + header_length:] if header["has_data"] else None,
+            file_path=header["file_path"],
+            warnings=header["warnings"],
+            metadata=header["metadata"],
+            created_at=datetime.fromisoformat(header["created_at"])
+        )
+
+
 class ExportPipeline:
     """Pipeline for exporting presentations to various formats."""
     
-    def __init__(self):
+    def __init__(
+        self,
+        cache: Optional[ExportResultCache] = None,
+        equation_renderer: Optional[EquationRenderer] = None
+    ):
         """Initialize the export pipeline."""
         self.formatters: Dict[ExportFormat, Any] = {}
         self.processors: List[Any] = []
         self.validators: Dict[ExportFormat, List[Any]] = {}
-        self._export_cache: Dict[str, ExportResult] = {}
+        self._export_cache = cache if cache is not None else ExportResultCache()
+        self.equation_renderer = equation_renderer or EquationRenderer(font_size=20)
         self._init_default_formatters()
         
     def _init_default_formatters(self):
@@ -76,6 +295,12 @@ class ExportPipeline:
         logger.info(f"Preparing export for format: {options.format.value}")
         
         try:
+            # Unchanged decks are served from the cache
+            cache_key = self._generate_cache_key(presentation_data, options)
+            cached = await self._export_cache.get(cache_key)
+            if cached is not None:
+                return replace(cached, metadata={**cached.metadata, "cache_hit": True})
+                
             # Validate export options
             validation_errors = await self._validate_export(presentation_data, options)
             if validation_errors:
@@ -116,8 +341,7 @@ class ExportPipeline:
             )
             
             # Cache result if applicable
-            cache_key = self._generate_cache_key(presentation_data, options)
-            self._export_cache[cache_key] = result
+            await self._export_cache.set(cache_key, result)
             
             return result
             
@@ -434,14 +658,14 @@ class ExportPipeline:
         
         # Add body text
         if "body" in content:
-            html += f'    <p>{content["body"]}</p>\n'
+            html += f'    <p>{self._typeset_math_html(content["body"])}</p>\n'
             
         # Add bullets
         if "bullets" in content:
             html += '    <ul>\n'
             for bullet in content["bullets"]:
                 text = bullet if isinstance(bullet, str) else bullet.get("text", "")
-                html += f'      <li>{text}</li>\n'
+                html += f'      <li>{self._typeset_math_html(text)}</li>\n'
             html += '    </ul>\n'
             
         html += '  </div>\n'
@@ -454,6 +678,28 @@ class ExportPipeline:
         
         return html
         
+    def _typeset_math_html(self, text: Any) -> Any:
+        """Replace LaTeX math in text with inline SVG images."""
+        if not isinstance(text, str) or "$" not in text:
+            return text
+            
+        def typeset(match) -> str:
+            equation_type = "display" if match.group(1) is not None else "inline"
+            image = self.equation_renderer.render_image(
+                match.group(1) or match.group(2), "svg", equation_type
+            )
+            if image is None:
+                return match.group(0)
+                
+            encoded = base64.b64encode(image.data).decode("ascii")
+            return (
+                f'<img class="math math-{equation_type}" alt="{escape(match.group(0))}" '
+                f'src="data:image/svg+xml;base64,{encoded}" '
+                f'style="width:{image.width}pt;height:{image.height}pt;vertical-align:-{image.depth}pt">'
+            )
+            
+        return MATH_PATTERN.sub(typeset, text)
+        
     async def _export_to_markdown(
         self,
         presentation_data: Dict[str, Any],
@@ -523,13 +769,31 @@ class ExportPipeline:
         presentation_data: Dict[str, Any],
         options: ExportOptions
     ) -> str:
-        """Generate cache key for export result."""
-        # Simple hash based on presentation ID and options
-        presentation_id = presentation_data.get("id", "unknown")
-        options_str = f"{options.format.value}_{options.include_notes}_{options.include_animations}_{options.image_quality}"
-        return f"{presentation_id}_{options_str}"
+        """
+        Generate cache key for export result.
+        
+        Hashes the normalized presentation content together with every export
+        option, so edited decks never hit stale results.
+        """
+        normalized_options = asdict(options)
+        normalized_options["format"] = options.format.value
+        
+        content = {
+            key: value for key, value in presentation_data.items()
+            if key != "export_metadata"
+        }
+        serialized = json.dumps(
+            {"presentation": content, "options": normalized_options},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str
+        )
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
         
     def clear_cache(self):
-        """Clear export cache."""
+        """Clear in-memory export cache."""
         self._export_cache.clear()
-        logger.info("Export cache cleared")
\ No newline at end of file
+        
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get export cache statistics."""
+        return self._export_cache.get_stats()
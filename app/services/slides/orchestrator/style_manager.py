@@ -2,6 +2,8 @@
 
 from typing import Dict, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field
+import hashlib
+import json
 import logging
 from copy import deepcopy
 import re
@@ -9,6 +11,60 @@ import re
 logger = logging.getLogger(__name__)
 
 
+class FrozenStyleMap(dict):
+    """
+    Read-only style map.
+    
+    Merges build new maps that reuse every unchanged sub-map, so slides can
+    share style structure instead of each holding a deep copy. Use thaw()
+    to get an independent, mutable copy.
+    """
+    
+    __slots__ = ()
+    
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("FrozenStyleMap is read-only; use thaw() for a mutable copy")
+    
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    
+    def __copy__(self):
+        return self
+    
+    def __deepcopy__(self, memo):
+        return self
+    
+    def __reduce__(self):
+        return (FrozenStyleMap, (dict(self),))
+    
+    def thaw(self) -> Dict[str, Any]:
+        """Return a mutable deep copy."""
+        return {
+            key: value.thaw() if isinstance(value, FrozenStyleMap) else deepcopy(value)
+            for key, value in self.items()
+        }
+
+
+EMPTY_STYLE = FrozenStyleMap()
+
+
+def freeze_style(value: Any) -> Any:
+    """Convert nested dicts to FrozenStyleMap; already-frozen maps are reused."""
+    if isinstance(value, FrozenStyleMap):
+        return value
+    if isinstance(value, dict):
+        return FrozenStyleMap({key: freeze_style(item) for key, item in value.items()})
+    return value
+
+
+@dataclass
+class _CompiledCascade:
+    """Theme, global and slide-type styles merged once per (theme, slide type)."""
+    style: FrozenStyleMap
+    components: FrozenStyleMap
+    animations: Optional[Dict[str, Any]]
+
+
 @dataclass
 class StyleRule:
     """Defines a style rule."""
@@ -41,7 +97,10 @@ class StyleManager:
         self.global_styles: Dict[str, Any] = {}
         self.slide_type_styles: Dict[str, Dict[str, Any]] = {}
         self.custom_rules: List[StyleRule] = []
-        self._style_cache: Dict[str, Dict[str, Any]] = {}
+        self._style_cache: Dict[Tuple[Any, ...], FrozenStyleMap] = {}
+        self._cascade_cache: Dict[Tuple[Any, ...], _CompiledCascade] = {}
+        self._resolved_components: Dict[str, FrozenStyleMap] = {}
+        self.max_cache_entries = 1024
         self._init_default_themes()
         
     def _init_default_themes(self):
@@ -177,16 +236,17 @@ class StyleManager:
     def add_theme(self, theme: StyleTheme) -> None:
         """Add a custom theme."""
         self.themes[theme.id] = theme
+        self._invalidate_cache()
         logger.info(f"Added theme: {theme.name}")
         
     def set_global_styles(self, styles: Dict[str, Any]) -> None:
         """Set global styles that apply to all slides."""
-        self.global_styles = deepcopy(styles)
+        self.global_styles = freeze_style(deepcopy(styles))
         self._invalidate_cache()
         
     def set_slide_type_styles(self, slide_type: str, styles: Dict[str, Any]) -> None:
         """Set styles for a specific slide type."""
-        self.slide_type_styles[slide_type] = deepcopy(styles)
+        self.slide_type_styles[slide_type] = freeze_style(deepcopy(styles))
         self._invalidate_cache()
         
     def add_style_rule(self, rule: StyleRule) -> None:
@@ -200,24 +260,26 @@ class StyleManager:
         theme_id: str,
         override_styles: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Apply a theme to a slide."""
+        """
+        Apply a theme to a slide.
+        
+        Returns a new slide dict; the input slide is not modified. Style maps
+        in the result are read-only and shared with other slides of the same
+        theme and type where they are unchanged.
+        """
         theme = self.themes.get(theme_id)
         if not theme:
             logger.warning(f"Theme {theme_id} not found")
             return slide
             
-        # Start with theme base styles
-        styled_slide = deepcopy(slide)
         slide_type = slide.get("type", "content")
+        compiled = self._compile_theme_cascade(theme, slide_type)
         
-        # Apply theme component styles
-        component_styles = theme.components.get(f"{slide_type}_slide", {})
+        styled_slide = dict(slide)
         
-        # Process slide content with theme styles
+        # Only the slide's own styles and overrides are merged per slide
         styled_slide["style"] = self._merge_styles(
-            theme_styles=self._resolve_theme_variables(component_styles, theme),
-            global_styles=self.global_styles,
-            type_styles=self.slide_type_styles.get(slide_type, {}),
+            theme_styles=compiled.style,
             slide_styles=slide.get("style", {}),
             override_styles=override_styles or {}
         )
@@ -225,13 +287,12 @@ class StyleManager:
         # Apply theme to content elements
         styled_slide["content"] = await self._style_content_elements(
             slide.get("content", {}),
-            theme,
-            component_styles
+            compiled.components
         )
         
         # Add animation styles if defined
-        if theme.animations:
-            styled_slide["animations"] = self._prepare_animations(theme.animations, slide_type)
+        if compiled.animations is not None:
+            styled_slide["animations"] = compiled.animations
             
         return styled_slide
         
@@ -243,41 +304,88 @@ class StyleManager:
     ) -> Dict[str, Any]:
         """Finalize slide styling with all applied rules."""
         slide_type = slide.get("type", "content")
-        cache_key = f"{slide.get('slide_index')}_{slide_type}_{hash(str(theme))}"
+        base_key = (
+            "finalize",
+            self._fingerprint(theme),
+            self._fingerprint(global_style),
+            slide_type
+        )
         
-        # Check cache
-        if cache_key in self._style_cache:
-            cached_style = self._style_cache[cache_key]
-            slide["style"] = deepcopy(cached_style)
-            return slide
-            
-        # Apply cascading styles
-        final_style = self._cascade_styles(
-            base=theme,
-            global_style=global_style,
-            type_style=self.slide_type_styles.get(slide_type, {}),
-            slide_style=slide.get("style", {})
+        base = self._cascade_cache.get(base_key)
+        if base is None:
+            base = _CompiledCascade(
+                style=self._cascade_styles(
+                    base=theme,
+                    global_style=global_style,
+                    type_style=self.slide_type_styles.get(slide_type, {})
+                ),
+                components=EMPTY_STYLE,
+                animations=None
+            )
+            self._store(self._cascade_cache, base_key, base)
+        
+        slide_style = slide.get("style") or EMPTY_STYLE
+        applicable_rules = tuple(
+            i for i, rule in enumerate(self.custom_rules)
+            if self._should_apply_rule(rule, slide)
+        )
+        cache_key = (
+            base_key,
+            self._fingerprint(slide_style) if slide_style else None,
+            applicable_rules
         )
         
-        # Apply custom rules
-        for rule in self.custom_rules:
-            if self._should_apply_rule(rule, slide):
-                final_style = self._apply_style_rule(final_style, rule)
+        # Slides with identical inputs share one finalized style map
+        final_style = self._style_cache.get(cache_key)
+        if final_style is None:
+            final_style = self._deep_merge(base.style, slide_style)
+            
+            for i in applicable_rules:
+                final_style = self._apply_style_rule(final_style, self.custom_rules[i])
                 
-        # Process responsive styles
-        final_style = self._process_responsive_styles(final_style)
-        
-        # Optimize and clean styles
-        final_style = self._optimize_styles(final_style)
+            # Process responsive styles
+            final_style = self._process_responsive_styles(final_style)
+            
+            # Optimize and clean styles
+            final_style = self._optimize_styles(final_style)
+            
+            self._store(self._style_cache, cache_key, final_style)
         
         slide["style"] = final_style
-        self._style_cache[cache_key] = deepcopy(final_style)
-        
         return slide
+    
+    def _compile_theme_cascade(self, theme: StyleTheme, slide_type: str) -> _CompiledCascade:
+        """Get the precompiled theme/global/type cascade for a slide type."""
+        key = ("theme", theme.id, slide_type)
+        compiled = self._cascade_cache.get(key)
+        if compiled is not None:
+            return compiled
+        
+        components = self._resolved_components.get(theme.id)
+        if components is None:
+            # Theme variables are resolved once per theme version
+            components = freeze_style(self._resolve_theme_variables(theme.components, theme))
+            self._resolved_components[theme.id] = components
+        
+        component_styles = components.get(f"{slide_type}_slide", EMPTY_STYLE)
+        compiled = _CompiledCascade(
+            style=self._merge_styles(
+                theme_styles=component_styles,
+                global_styles=self.global_styles,
+                type_styles=self.slide_type_styles.get(slide_type, {})
+            ),
+            components=component_styles,
+            animations=(
+                self._prepare_animations(theme.animations, slide_type)
+                if theme.animations else None
+            )
+        )
+        self._store(self._cascade_cache, key, compiled)
+        return compiled
         
-    def _merge_styles(self, **style_sources) -> Dict[str, Any]:
+    def _merge_styles(self, **style_sources) -> FrozenStyleMap:
         """Merge multiple style sources with proper precedence."""
-        merged = {}
+        merged = EMPTY_STYLE
         
         # Order matters: later sources override earlier ones
         for source in ["theme_styles", "global_styles", "type_styles", "slide_styles", "override_styles"]:
@@ -286,17 +394,34 @@ class StyleManager:
                 
         return merged
         
-    def _deep_merge(self, base: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
-        """Deep merge two dictionaries."""
-        result = deepcopy(base)
+    def _deep_merge(self, base: Dict[str, Any], update: Dict[str, Any]) -> FrozenStyleMap:
+        """
+        Deep merge two style maps without copying unchanged branches.
+        
+        Only the maps along paths that the update touches are rebuilt;
+        everything else is shared with the inputs.
+        """
+        base = freeze_style(base)
+        if not update:
+            return base
+        if not base:
+            return freeze_style(update)
+        
+        result = dict(base)
+        changed = False
         
         for key, value in update.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
+            current = result.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                merged = self._deep_merge(current, value)
             else:
-                result[key] = deepcopy(value)
+                merged = freeze_style(value)
+            
+            if merged is not current or key not in result:
+                result[key] = merged
+                changed = True
                 
-        return result
+        return FrozenStyleMap(result) if changed else base
         
     def _resolve_theme_variables(self, styles: Dict[str, Any], theme: StyleTheme) -> Dict[str, Any]:
         """Resolve theme variables in styles."""
@@ -325,37 +450,34 @@ class StyleManager:
     async def _style_content_elements(
         self,
         content: Dict[str, Any],
-        theme: StyleTheme,
-        component_styles: Dict[str, Any]
+        component_styles: FrozenStyleMap
     ) -> Dict[str, Any]:
-        """Apply styling to content elements."""
-        styled_content = deepcopy(content)
+        """Apply resolved component styling to content elements."""
+        styled_content = dict(content)
         
         # Style title
         if "title" in styled_content and "title" in component_styles:
-            styled_content["title_style"] = self._resolve_theme_variables(
-                component_styles["title"], 
-                theme
-            )
+            styled_content["title_style"] = component_styles["title"]
             
         # Style headings
         if "headings" in styled_content:
-            heading_style = component_styles.get("heading", {})
-            for i, heading in enumerate(styled_content["headings"]):
-                if isinstance(heading, dict):
-                    heading["style"] = self._resolve_theme_variables(heading_style, theme)
+            heading_style = component_styles.get("heading", EMPTY_STYLE)
+            styled_content["headings"] = [
+                {**heading, "style": heading_style} if isinstance(heading, dict) else heading
+                for heading in styled_content["headings"]
+            ]
                     
         # Style bullets
         if "bullets" in styled_content:
-            bullet_style = component_styles.get("bullet", {})
-            for bullet in styled_content["bullets"]:
-                if isinstance(bullet, dict):
-                    bullet["style"] = self._resolve_theme_variables(bullet_style, theme)
+            bullet_style = component_styles.get("bullet", EMPTY_STYLE)
+            styled_content["bullets"] = [
+                {**bullet, "style": bullet_style} if isinstance(bullet, dict) else bullet
+                for bullet in styled_content["bullets"]
+            ]
                     
         # Style body text
         if "body" in styled_content:
-            body_style = component_styles.get("body", {})
-            styled_content["body_style"] = self._resolve_theme_variables(body_style, theme)
+            styled_content["body_style"] = component_styles.get("body", EMPTY_STYLE)
             
         return styled_content
         
@@ -364,11 +486,11 @@ class StyleManager:
         base: Dict[str, Any],
         global_style: Dict[str, Any],
         type_style: Dict[str, Any],
-        slide_style: Dict[str, Any]
-    ) -> Dict[str, Any]:
+        slide_style: Optional[Dict[str, Any]] = None
+    ) -> FrozenStyleMap:
         """Apply cascading style rules."""
         # Start with base
-        cascaded = deepcopy(base)
+        cascaded = freeze_style(base)
         
         # Apply in order of increasing specificity
         for styles in [global_style, type_style, slide_style]:
@@ -393,23 +515,26 @@ class StyleManager:
             
         return False
         
-    def _apply_style_rule(self, styles: Dict[str, Any], rule: StyleRule) -> Dict[str, Any]:
+    def _apply_style_rule(self, styles: Dict[str, Any], rule: StyleRule) -> FrozenStyleMap:
         """Apply a style rule to existing styles."""
-        result = deepcopy(styles)
-        
-        # Navigate to the property path
-        path_parts = rule.property.split(".")
-        current = result
-        
-        for part in path_parts[:-1]:
-            if part not in current:
-                current[part] = {}
-            current = current[part]
+        return self._assoc_path(freeze_style(styles), rule.property.split("."), freeze_style(rule.value))
+    
+    def _assoc_path(self, styles: FrozenStyleMap, path: List[str], value: Any) -> FrozenStyleMap:
+        """Return styles with value set at path, copying only the maps on that path."""
+        result = dict(styles)
+        head = path[0]
+        
+        if len(path) == 1:
+            result[head] = value
+        else:
+            child = styles.get(head)
+            result[head] = self._assoc_path(
+                child if isinstance(child, dict) else EMPTY_STYLE,
+                path[1:],
+                value
+            )
             
-        # Apply the rule value
-        current[path_parts[-1]] = rule.value
-        
-        return result
+        return FrozenStyleMap(result)
         
     def _prepare_animations(self, animations: Dict[str, Any], slide_type: str) -> Dict[str, Any]:
         """Prepare animation definitions for a slide."""
@@ -431,9 +556,13 @@ class StyleManager:
                 
         return slide_animations
         
-    def _process_responsive_styles(self, styles: Dict[str, Any]) -> Dict[str, Any]:
+    def _process_responsive_styles(self, styles: Dict[str, Any]) -> FrozenStyleMap:
         """Process responsive style definitions."""
-        processed = deepcopy(styles)
+        styles = freeze_style(styles)
+        if "responsive" not in styles:
+            return styles
+        
+        processed = dict(styles)
         
         # Define breakpoints
         breakpoints = {
@@ -444,24 +573,27 @@ class StyleManager:
         }
         
         # Process responsive properties
-        if "responsive" in processed:
-            responsive_styles = processed.pop("responsive")
-            processed["@media"] = {}
-            
-            for breakpoint, bp_styles in responsive_styles.items():
-                if breakpoint in breakpoints:
-                    media_query = f"(min-width: {breakpoints[breakpoint]})"
-                    processed["@media"][media_query] = bp_styles
-                    
-        return processed
+        responsive_styles = processed.pop("responsive")
+        media_queries = {}
+        
+        for breakpoint, bp_styles in responsive_styles.items():
+            if breakpoint in breakpoints:
+                media_query = f"(min-width: {breakpoints[breakpoint]})"
+                media_queries[media_query] = bp_styles
+                
+        processed["@media"] = FrozenStyleMap(media_queries)
+        return FrozenStyleMap(processed)
         
-    def _optimize_styles(self, styles: Dict[str, Any]) -> Dict[str, Any]:
+    def _optimize_styles(self, styles: Dict[str, Any]) -> FrozenStyleMap:
         """Optimize and clean style definitions."""
+        styles = freeze_style(styles)
         optimized = {}
+        changed = False
         
         for key, value in styles.items():
             # Remove empty values
             if value is None or value == "":
+                changed = True
                 continue
                 
             # Optimize nested objects
@@ -469,21 +601,33 @@ class StyleManager:
                 nested_optimized = self._optimize_styles(value)
                 if nested_optimized:  # Only include non-empty objects
                     optimized[key] = nested_optimized
+                    changed = changed or nested_optimized is not value
+                else:
+                    changed = True
             else:
                 optimized[key] = value
                 
         # Combine similar properties
-        optimized = self._combine_similar_properties(optimized)
+        combined = self._combine_similar_properties(optimized)
         
-        return optimized
+        if not changed and combined is optimized:
+            return styles
+        return FrozenStyleMap(combined)
         
     def _combine_similar_properties(self, styles: Dict[str, Any]) -> Dict[str, Any]:
-        """Combine similar CSS properties for efficiency."""
-        combined = deepcopy(styles)
+        """
+        Combine similar CSS properties for efficiency.
+        
+        Returns styles itself when there is nothing to combine.
+        """
+        sides = ["Top", "Right", "Bottom", "Left"]
+        if not any(f"{prop}{side}" in styles for prop in ("margin", "padding") for side in sides):
+            return styles
+        
+        combined = dict(styles)
         
         # Combine margin/padding properties
         for prop in ["margin", "padding"]:
-            sides = ["Top", "Right", "Bottom", "Left"]
             values = []
             
             for side in sides:
@@ -504,9 +648,27 @@ class StyleManager:
                     
         return combined
         
+    def _fingerprint(self, value: Any) -> str:
+        """
+        Stable content hash for a style input.
+        
+        Hashed on every call, so dicts edited in place between calls key
+        the caches by their current content.
+        """
+        serialized = json.dumps(value, sort_keys=True, default=str, separators=(",", ":"))
+        return hashlib.blake2b(serialized.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def _store(self, cache: Dict[Any, Any], key: Any, value: Any) -> None:
+        """Insert into a bounded cache, starting over when it is full."""
+        if len(cache) >= self.max_cache_entries:
+            cache.clear()
+        cache[key] = value
+        
     def _invalidate_cache(self):
         """Invalidate the style cache."""
         self._style_cache.clear()
+        self._cascade_cache.clear()
+        self._resolved_components.clear()
         
     def get_theme_preview(self, theme_id: str) -> Optional[Dict[str, Any]]:
         """Get a preview of a theme."""
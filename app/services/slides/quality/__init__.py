@@ -5,8 +5,11 @@ This package provides comprehensive quality checking for generated presentations
 ensuring they meet academic standards and provide excellent user experience.
 """
 
+from typing import Optional
+
 from .base import (
     BaseQualityAssurance,
+    IncrementalQualityChecker,
     QualityChecker,
     QualityDimension,
     QualityIssue,
@@ -14,23 +17,33 @@ from .base import (
     QualityMetrics,
     QualityReport
 )
+from .cache import QualityCheckCache, slide_fingerprint
 from .citations import CitationChecker
 from .coherence import CoherenceChecker
 from .metrics import QualityMetricsCalculator
 from .readability import ReadabilityScorer
+from .text_index import SlideText, SlideTextIndex
 from .timing import TimingValidator
 from .transitions import TransitionValidator
 from .visual_balance import VisualBalanceAssessor
 
 # Convenience function to create a fully configured QA system
-def create_quality_assurance_system() -> BaseQualityAssurance:
+def create_quality_assurance_system(
+    cache: Optional[QualityCheckCache] = None,
+    max_workers: int = 1
+) -> BaseQualityAssurance:
     """
     Create a quality assurance system with all default checkers.
     
+    Args:
+        cache: Optional result cache, to reassess edited presentations
+            from the slides that changed
+        max_workers: Checkers run at once, in a thread pool when above 1
+    
     Returns:
         Configured BaseQualityAssurance instance
     """
-    qa_system = BaseQualityAssurance()
+    qa_system = BaseQualityAssurance(cache=cache, max_workers=max_workers)
     
     # Register all quality checkers
     qa_system.register_checker(CoherenceChecker())
@@ -47,6 +60,7 @@ def create_quality_assurance_system() -> BaseQualityAssurance:
 __all__ = [
     # Base classes
     'BaseQualityAssurance',
+    'IncrementalQualityChecker',
     'QualityChecker',
     'QualityDimension',
     'QualityIssue',
@@ -64,6 +78,10 @@ __all__ = [
     
     # Metrics and utilities
     'QualityMetricsCalculator',
+    'QualityCheckCache',
+    'SlideText',
+    'SlideTextIndex',
+    'slide_fingerprint',
     
     # Factory function
     'create_quality_assurance_system'
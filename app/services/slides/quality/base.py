@@ -5,14 +5,19 @@ This module provides the foundation for comprehensive quality checking
 of generated presentations, ensuring they meet academic standards.
 """
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from app.domain.schemas.presentation import PresentationResponse, SlideResponse
 from app.domain.schemas.generation import Citation
+from .text_index import SlideText, SlideTextIndex
+
+if TYPE_CHECKING:
+    from .cache import QualityCheckCache
 
 
 class QualityLevel(Enum):
@@ -155,6 +160,30 @@ class QualityChecker(ABC):
         """
         pass
     
+    def check_indexed(
+        self,
+        presentation: PresentationResponse,
+        slides: List[SlideResponse],
+        text_index: SlideTextIndex,
+        references: Optional[List[Citation]] = None
+    ) -> Tuple[float, List[QualityIssue], Dict[str, Any]]:
+        """
+        Perform quality check reading slide text from a shared index.
+        
+        Checkers reading slide text override this, and check() then builds
+        an index of its own. By default the index is unused.
+        
+        Args:
+            presentation: The presentation metadata
+            slides: List of slides in the presentation
+            text_index: Text of the slides, shared by the assessment's checkers
+            references: Optional list of citations
+        
+        Returns:
+            Tuple of (score, issues, metadata)
+        """
+        return self.check(presentation, slides, references)
+    
     @property
     @abstractmethod
     def dimension(self) -> QualityDimension:
@@ -167,19 +196,97 @@ class QualityChecker(ABC):
         return 1.0
 
 
+class IncrementalQualityChecker(QualityChecker):
+    """
+    Quality checker split into a slide-local summary and a deck-level check.
+    
+    summarize_slide sees one slide and nothing else, not even its position,
+    so its result can be cached by the slide's content. check_summaries
+    combines the summaries of all slides, in deck order, with the
+    presentation and references; the summaries are its only view of the
+    slides.
+    """
+    
+    @abstractmethod
+    def summarize_slide(self, slide: SlideResponse, text: SlideText) -> Any:
+        """
+        Summarize what the deck-level check needs from one slide.
+        
+        Args:
+            slide: The slide to summarize
+            text: The slide's entry in the assessment's text index
+        
+        Returns:
+            Summary, read but never modified by check_summaries
+        """
+        pass
+    
+    @abstractmethod
+    def check_summaries(
+        self,
+        presentation: PresentationResponse,
+        summaries: List[Any],
+        references: Optional[List[Citation]] = None
+    ) -> Tuple[float, List[QualityIssue], Dict[str, Any]]:
+        """
+        Perform quality check from per-slide summaries.
+        
+        Args:
+            presentation: The presentation metadata
+            summaries: Summaries of the slides, in deck order
+            references: Optional list of citations
+        
+        Returns:
+            Tuple of (score, issues, metadata)
+        """
+        pass
+    
+    def check(
+        self,
+        presentation: PresentationResponse,
+        slides: List[SlideResponse],
+        references: Optional[List[Citation]] = None
+    ) -> Tuple[float, List[QualityIssue], Dict[str, Any]]:
+        """Perform quality check on presentation."""
+        return self.check_indexed(presentation, slides, SlideTextIndex(slides), references)
+    
+    def check_indexed(
+        self,
+        presentation: PresentationResponse,
+        slides: List[SlideResponse],
+        text_index: SlideTextIndex,
+        references: Optional[List[Citation]] = None
+    ) -> Tuple[float, List[QualityIssue], Dict[str, Any]]:
+        """Perform quality check reading slide text from a shared index."""
+        summaries = [self.summarize_slide(slide, text) for slide, text in zip(slides, text_index)]
+        return self.check_summaries(presentation, summaries, references)
+
+
 class BaseQualityAssurance:
     """
     Base quality assurance system that orchestrates multiple quality checkers.
     """
     
-    def __init__(self, checkers: Optional[List[QualityChecker]] = None):
+    def __init__(
+        self,
+        checkers: Optional[List[QualityChecker]] = None,
+        cache: Optional["QualityCheckCache"] = None,
+        max_workers: int = 1
+    ):
         """
         Initialize quality assurance system.
         
         Args:
             checkers: List of quality checkers to use
+            cache: Optional cache of checker results, for reassessing
+                edited presentations
+            max_workers: Checkers run at once. Above 1, checkers run
+                concurrently in a thread pool of this size.
         """
         self.checkers: Dict[QualityDimension, QualityChecker] = {}
+        self.cache = cache
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
         if checkers:
             for checker in checkers:
                 self.register_checker(checker)
@@ -187,6 +294,9 @@ class BaseQualityAssurance:
     def register_checker(self, checker: QualityChecker) -> None:
         """Register a quality checker."""
         self.checkers[checker.dimension] = checker
+        if self.cache is not None:
+            # Results of a replaced checker no longer apply
+            self.cache.clear(checker.dimension)
     
     def assess_quality(
         self,
@@ -212,9 +322,19 @@ class BaseQualityAssurance:
         all_issues = []
         detailed_analysis = {}
         
-        # Run each quality checker
-        for dimension, checker in self.checkers.items():
-            score, issues, metadata = checker.check(presentation, slides, references)
+        # Run each quality checker, all reading slide text from one index
+        checkers = list(self.checkers.values())
+        text_index = SlideTextIndex(slides)
+        executor = self._get_executor() if len(checkers) > 1 else None
+        if self.cache is not None:
+            results = self.cache.run(checkers, presentation, slides, references, text_index, executor)
+        else:
+            def run(checker: QualityChecker) -> Tuple[float, List[QualityIssue], Dict[str, Any]]:
+                return checker.check_indexed(presentation, slides, text_index, references)
+            
+            results = list(executor.map(run, checkers)) if executor else [run(checker) for checker in checkers]
+        
+        for dimension, (score, issues, metadata) in zip(self.checkers, results):
             dimension_scores[dimension] = score
             all_issues.extend(issues)
             detailed_analysis[dimension] = metadata
@@ -256,6 +376,23 @@ class BaseQualityAssurance:
             estimated_revision_time=revision_time
         )
     
+    def shutdown(self) -> None:
+        """Shut down the checker thread pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
+    def _get_executor(self) -> Optional[ThreadPoolExecutor]:
+        """Get the bounded checker thread pool, or None to run checkers in turn."""
+        if self.max_workers <= 1:
+            return None
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="quality-check"
+            )
+        return self._executor
+    
     def _calculate_overall_score(self, dimension_scores: Dict[QualityDimension, float]) -> float:
         """Calculate weighted overall quality score."""
         if not dimension_scores:
@@ -0,0 +1,207 @@
+"""
+Result cache for reassessing edited presentations.
+
+Incremental checkers keep a summary per slide, keyed by a fingerprint of
+the slide fields checkers read, so after an edit only the changed slides
+are summarized again before each deck-level check combines the summaries.
+Other checkers need the whole deck; their results are reused only while
+the slides, the presentation and the references are all unchanged.
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.domain.schemas.presentation import PresentationResponse, SlideResponse
+from app.domain.schemas.generation import Citation
+from .base import IncrementalQualityChecker, QualityChecker, QualityDimension, QualityIssue
+from .text_index import SlideTextIndex
+
+
+CheckResult = Tuple[float, List[QualityIssue], Dict[str, Any]]
+
+# Slide fields checkers may read. Identity, position and timestamps are
+# left out, so moving or re-saving a slide keeps its summaries.
+SLIDE_FINGERPRINT_FIELDS = (
+    'title', 'content', 'layout_type', 'speaker_notes', 'section',
+    'duration_seconds', 'transitions', 'animations', 'contains_equations',
+    'contains_code', 'contains_citations', 'figure_count', 'is_hidden', 'is_backup'
+)
+
+# Presentation fields checkers may read
+PRESENTATION_FINGERPRINT_FIELDS = (
+    'title', 'subtitle', 'description', 'abstract', 'presentation_type',
+    'academic_level', 'field_of_study', 'keywords', 'duration_minutes', 'language'
+)
+
+_MISSING = object()
+
+
+def _encode(value: Any) -> Any:
+    """Encode values json cannot, for fingerprints."""
+    if hasattr(value, 'model_dump'):
+        return value.model_dump(mode='json')
+    if hasattr(value, '__dict__'):
+        return vars(value)
+    return str(value)
+
+
+def fingerprint(value: Any) -> str:
+    """Fingerprint JSON-like data independent of dict key order."""
+    encoded = json.dumps(value, sort_keys=True, separators=(',', ':'), default=_encode)
+    return hashlib.blake2b(encoded.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def slide_fingerprint(slide: SlideResponse) -> str:
+    """Fingerprint the fields of a slide that checkers read."""
+    return fingerprint([getattr(slide, name, None) for name in SLIDE_FINGERPRINT_FIELDS])
+
+
+class QualityCheckCache:
+    """
+    LRU caches of per-slide summaries and whole-deck checker results.
+    
+    A cache serves one quality assurance system: entries are kept per
+    dimension, and registering a checker clears its dimension. Checkers of
+    different dimensions may run concurrently.
+    """
+    
+    def __init__(self, max_slides: int = 4096, max_decks: int = 64):
+        """
+        Initialize cache.
+        
+        Args:
+            max_slides: Slide summaries kept per dimension
+            max_decks: Whole-deck results kept per dimension
+        """
+        self.max_slides = max_slides
+        self.max_decks = max_decks
+        
+        self._summaries: Dict[QualityDimension, OrderedDict[str, Any]] = {}
+        self._results: Dict[QualityDimension, OrderedDict[str, CheckResult]] = {}
+        
+        self.summary_hits = 0
+        self.summary_misses = 0
+        self.result_hits = 0
+        self.result_misses = 0
+        self._lock = threading.Lock()
+    
+    def run(
+        self,
+        checkers: List[QualityChecker],
+        presentation: PresentationResponse,
+        slides: List[SlideResponse],
+        references: Optional[List[Citation]] = None,
+        text_index: Optional[SlideTextIndex] = None,
+        executor: Optional[Executor] = None
+    ) -> List[CheckResult]:
+        """
+        Run checkers, reusing what unchanged slides and decks allow.
+        
+        Args:
+            checkers: Checkers to run, at most one per dimension
+            presentation: The presentation metadata
+            slides: List of slides in the presentation
+            references: Optional list of citations
+            text_index: Text index of the slides, built here if not given
+            executor: Optional executor to run the checkers concurrently
+        
+        Returns:
+            Result of each checker, in order. Whole-deck results are shared
+            between calls and must not be modified.
+        """
+        if text_index is None:
+            text_index = SlideTextIndex(slides)
+        slide_keys = [slide_fingerprint(slide) for slide in slides]
+        deck_key = None
+        if not all(isinstance(checker, IncrementalQualityChecker) for checker in checkers):
+            deck_key = fingerprint([
+                slide_keys,
+                [getattr(presentation, name, None) for name in PRESENTATION_FINGERPRINT_FIELDS],
+                references or []
+            ])
+        
+        def run(checker: QualityChecker) -> CheckResult:
+            if isinstance(checker, IncrementalQualityChecker):
+                summaries = self._slide_summaries(checker, slides, slide_keys, text_index)
+                return checker.check_summaries(presentation, summaries, references)
+            return self._deck_result(checker, presentation, slides, references, text_index, deck_key)
+        
+        if executor is None:
+            return [run(checker) for checker in checkers]
+        return list(executor.map(run, checkers))
+    
+    def clear(self, dimension: Optional[QualityDimension] = None) -> None:
+        """Drop cached entries of one dimension, or of all."""
+        if dimension is None:
+            self._summaries.clear()
+            self._results.clear()
+        else:
+            self._summaries.pop(dimension, None)
+            self._results.pop(dimension, None)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            'summaries': sum(len(entries) for entries in self._summaries.values()),
+            'results': sum(len(entries) for entries in self._results.values()),
+            'summary_hits': self.summary_hits,
+            'summary_misses': self.summary_misses,
+            'result_hits': self.result_hits,
+            'result_misses': self.result_misses,
+        }
+    
+    def _slide_summaries(
+        self,
+        checker: IncrementalQualityChecker,
+        slides: List[SlideResponse],
+        slide_keys: List[str],
+        text_index: SlideTextIndex
+    ) -> List[Any]:
+        """Summarize slides, summarizing only those not cached."""
+        entries = self._summaries.setdefault(checker.dimension, OrderedDict())
+        summaries = []
+        misses = 0
+        for slide, text, key in zip(slides, text_index, slide_keys):
+            summary = entries.get(key, _MISSING)
+            if summary is _MISSING:
+                summary = entries[key] = checker.summarize_slide(slide, text)
+                misses += 1
+                if len(entries) > self.max_slides:
+                    entries.popitem(last=False)
+            else:
+                entries.move_to_end(key)
+            summaries.append(summary)
+        
+        with self._lock:
+            self.summary_misses += misses
+            self.summary_hits += len(summaries) - misses
+        return summaries
+    
+    def _deck_result(
+        self,
+        checker: QualityChecker,
+        presentation: PresentationResponse,
+        slides: List[SlideResponse],
+        references: Optional[List[Citation]],
+        text_index: SlideTextIndex,
+        deck_key: str
+    ) -> CheckResult:
+        """Run a whole-deck checker unless the deck is unchanged."""
+        entries = self._results.setdefault(checker.dimension, OrderedDict())
+        result = entries.get(deck_key)
+        if result is not None:
+            entries.move_to_end(deck_key)
+            with self._lock:
+                self.result_hits += 1
+            return result
+        
+        result = checker.check_indexed(presentation, slides, text_index, references)
+        with self._lock:
+            self.result_misses += 1
+        entries[deck_key] = result
+        if len(entries) > self.max_decks:
+            entries.popitem(last=False)
+        return result
@@ -11,6 +11,7 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 from app.domain.schemas.presentation import PresentationResponse, SlideResponse
 from app.domain.schemas.generation import Citation
 from .base import QualityChecker, QualityDimension, QualityIssue
+from .text_index import CITATION_TEXT, SlideTextIndex
 
 
 class CitationChecker(QualityChecker):
@@ -77,19 +78,34 @@ class CitationChecker(QualityChecker):
         """
         Check citation completeness and accuracy.
         
+        Returns:
+            Tuple of (score, issues, metadata)
+        """
+        return self.check_indexed(presentation, slides, SlideTextIndex(slides), references)
+    
+    def check_indexed(
+        self,
+        presentation: PresentationResponse,
+        slides: List[SlideResponse],
+        text_index: SlideTextIndex,
+        references: Optional[List[Citation]] = None
+    ) -> Tuple[float, List[QualityIssue], Dict[str, Any]]:
+        """
+        Check citation completeness and accuracy, reading slide text from an index.
+        
         Returns:
             Tuple of (score, issues, metadata)
         """
         issues = []
         metadata = {}
         
-        # Extract all text content and citations
-        slide_texts = self._extract_slide_texts(slides)
-        all_citations = self._extract_all_citations(slides, slide_texts)
+        # Citations found in the text of each slide, by format
+        slide_citations = [text.citations(self.citation_patterns) for text in text_index]
+        all_citations = self._extract_all_citations(slides, slide_citations)
         
         # Check for uncited claims
         uncited_score, uncited_issues, uncited_metadata = self._check_uncited_claims(
-            slides, slide_texts, all_citations
+            text_index, slide_citations
         )
         issues.extend(uncited_issues)
         metadata['uncited_claims'] = uncited_metadata
@@ -107,9 +123,7 @@ class CitationChecker(QualityChecker):
         issues.extend(consistency_issues)
         
         # Check citation formatting
-        format_score, format_issues = self._check_citation_formatting(
-            slides, slide_texts
-        )
+        format_score, format_issues = self._check_citation_formatting(slide_citations)
         issues.extend(format_issues)
         
         # Check citation coverage
@@ -153,40 +167,10 @@ class CitationChecker(QualityChecker):
         
         return overall_score, issues, metadata
     
-    def _extract_slide_texts(self, slides: List[SlideResponse]) -> List[str]:
-        """Extract text content from slides."""
-        texts = []
-        
-        for slide in slides:
-            text_parts = []
-            
-            if slide.title:
-                text_parts.append(slide.title)
-            
-            if slide.content:
-                if 'subtitle' in slide.content:
-                    text_parts.append(slide.content['subtitle'])
-                
-                if 'body' in slide.content:
-                    for item in slide.content['body']:
-                        if item.get('type') == 'text':
-                            text_parts.append(item.get('content', ''))
-                        elif item.get('type') == 'bullet_list':
-                            text_parts.extend(item.get('items', []))
-                        elif item.get('type') == 'caption':
-                            text_parts.append(item.get('content', ''))
-            
-            if slide.speaker_notes:
-                text_parts.append(slide.speaker_notes)
-            
-            texts.append(' '.join(text_parts))
-        
-        return texts
-    
     def _extract_all_citations(
         self,
         slides: List[SlideResponse],
-        slide_texts: List[str]
+        slide_citations: List[Dict[str, List[str]]]
     ) -> List[str]:
         """Extract all citations from slides."""
         citations = []
@@ -198,19 +182,17 @@ class CitationChecker(QualityChecker):
                     if item.get('type') == 'citation':
                         citations.extend(item.get('keys', []))
         
-        # Extract from text using patterns
-        for text in slide_texts:
-            for pattern_name, pattern in self.citation_patterns.items():
-                matches = re.findall(pattern, text)
+        # Add those found in text using patterns
+        for found in slide_citations:
+            for matches in found.values():
                 citations.extend(matches)
         
         return citations
     
     def _check_uncited_claims(
         self,
-        slides: List[SlideResponse],
-        slide_texts: List[str],
-        all_citations: List[str]
+        text_index: SlideTextIndex,
+        slide_citations: List[Dict[str, List[str]]]
     ) -> Tuple[float, List[QualityIssue], Dict[str, Any]]:
         """Check for claims that need citations."""
         issues = []
@@ -220,7 +202,14 @@ class CitationChecker(QualityChecker):
             'uncited_claims': []
         }
         
-        for i, text in enumerate(slide_texts):
+        for i, text in enumerate(text_index.texts(CITATION_TEXT)):
+            # Citation patterns match text wherever it appears, so only
+            # formats found in the slide can be near a claim
+            slide_patterns = [
+                self.citation_patterns[name]
+                for name, matches in slide_citations[i].items() if matches
+            ]
+            
             # Find potential claims
             claims_in_slide = []
             for pattern in self.claim_patterns:
@@ -237,7 +226,7 @@ class CitationChecker(QualityChecker):
                 nearby_text = text[max(0, pos-50):pos+100]
                 has_citation = False
                 
-                for pattern in self.citation_patterns.values():
+                for pattern in slide_patterns:
                     if re.search(pattern, nearby_text):
                         has_citation = True
                         metadata['cited_claims'] += 1
@@ -364,17 +353,15 @@ class CitationChecker(QualityChecker):
     
     def _check_citation_formatting(
         self,
-        slides: List[SlideResponse],
-        slide_texts: List[str]
+        slide_citations: List[Dict[str, List[str]]]
     ) -> Tuple[float, List[QualityIssue]]:
         """Check citation format consistency."""
         issues = []
         format_counts = defaultdict(int)
         
         # Count citation formats used
-        for text in slide_texts:
-            for format_name, pattern in self.citation_patterns.items():
-                matches = re.findall(pattern, text)
+        for found in slide_citations:
+            for format_name, matches in found.items():
                 if matches:
                     format_counts[format_name] += len(matches)
         
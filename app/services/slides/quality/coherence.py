@@ -10,11 +10,11 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 
 import nltk
 from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize, sent_tokenize
 
 from app.domain.schemas.presentation import PresentationResponse, SlideResponse
 from app.domain.schemas.generation import Citation
 from .base import QualityChecker, QualityDimension, QualityIssue
+from .text_index import SlideText, SlideTextIndex
 
 
 class CoherenceChecker(QualityChecker):
@@ -86,21 +86,37 @@ class CoherenceChecker(QualityChecker):
         """
         Check content coherence across slides.
         
+        Returns:
+            Tuple of (score, issues, metadata)
+        """
+        return self.check_indexed(presentation, slides, SlideTextIndex(slides), references)
+    
+    def check_indexed(
+        self,
+        presentation: PresentationResponse,
+        slides: List[SlideResponse],
+        text_index: SlideTextIndex,
+        references: Optional[List[Citation]] = None
+    ) -> Tuple[float, List[QualityIssue], Dict[str, Any]]:
+        """
+        Check content coherence across slides, reading their text from an index.
+        
         Returns:
             Tuple of (score, issues, metadata)
         """
         issues = []
         metadata = {}
         
-        # Extract text content from all slides
-        slide_texts = self._extract_slide_texts(slides)
+        # Keywords and transition phrases of each slide, read by several checks
+        slide_keywords = [self._extract_keywords(text.term_frequencies) for text in text_index]
+        transitions = [self._has_transition_phrase(text.text()) for text in text_index]
         
         # Check logical flow
-        flow_score, flow_issues = self._check_logical_flow(slides, slide_texts)
+        flow_score, flow_issues = self._check_logical_flow(slides, slide_keywords, transitions)
         issues.extend(flow_issues)
         
         # Check terminology consistency
-        term_score, term_issues, term_metadata = self._check_terminology_consistency(slide_texts)
+        term_score, term_issues, term_metadata = self._check_terminology_consistency(text_index)
         issues.extend(term_issues)
         metadata['terminology'] = term_metadata
         
@@ -109,12 +125,12 @@ class CoherenceChecker(QualityChecker):
         issues.extend(structure_issues)
         
         # Check topic coherence
-        topic_score, topic_issues, topic_metadata = self._check_topic_coherence(slide_texts)
+        topic_score, topic_issues, topic_metadata = self._check_topic_coherence(text_index, slide_keywords)
         issues.extend(topic_issues)
         metadata['topics'] = topic_metadata
         
         # Check transition quality
-        transition_score, transition_issues = self._check_transitions(slide_texts)
+        transition_score, transition_issues = self._check_transitions(transitions)
         issues.extend(transition_issues)
         
         # Calculate overall coherence score
@@ -134,7 +150,7 @@ class CoherenceChecker(QualityChecker):
             'topic_score': topic_score,
             'transition_score': transition_score,
             'slide_count': len(slides),
-            'avg_words_per_slide': sum(len(text.split()) for text in slide_texts) / len(slides) if slides else 0
+            'avg_words_per_slide': sum(text.word_count() for text in text_index) / len(slides) if slides else 0
         })
         
         # Identify strengths
@@ -150,56 +166,20 @@ class CoherenceChecker(QualityChecker):
         
         return overall_score, issues, metadata
     
-    def _extract_slide_texts(self, slides: List[SlideResponse]) -> List[str]:
-        """Extract text content from slides."""
-        texts = []
-        
-        for slide in slides:
-            text_parts = []
-            
-            # Add title
-            if slide.title:
-                text_parts.append(slide.title)
-            
-            # Extract text from content
-            if slide.content:
-                # Add subtitle if present
-                if 'subtitle' in slide.content:
-                    text_parts.append(slide.content['subtitle'])
-                
-                # Extract body text
-                if 'body' in slide.content:
-                    for item in slide.content['body']:
-                        if item.get('type') == 'text':
-                            text_parts.append(item.get('content', ''))
-                        elif item.get('type') == 'bullet_list':
-                            for bullet in item.get('items', []):
-                                text_parts.append(bullet)
-            
-            # Add speaker notes
-            if slide.speaker_notes:
-                text_parts.append(slide.speaker_notes)
-            
-            texts.append(' '.join(text_parts))
-        
-        return texts
-    
     def _check_logical_flow(
         self,
         slides: List[SlideResponse],
-        slide_texts: List[str]
+        slide_keywords: List[Set[str]],
+        transitions: List[bool]
     ) -> Tuple[float, List[QualityIssue]]:
         """Check logical flow between slides."""
         issues = []
         flow_scores = []
         
         for i in range(1, len(slides)):
-            prev_text = slide_texts[i-1]
-            curr_text = slide_texts[i]
-            
             # Check for abrupt topic changes
-            prev_keywords = self._extract_keywords(prev_text)
-            curr_keywords = self._extract_keywords(curr_text)
+            prev_keywords = slide_keywords[i-1]
+            curr_keywords = slide_keywords[i]
             
             # Calculate keyword overlap
             if prev_keywords and curr_keywords:
@@ -216,7 +196,7 @@ class CoherenceChecker(QualityChecker):
                     ))
             
             # Check for missing transitions
-            if not self._has_transition_phrase(curr_text):
+            if not transitions[i]:
                 if i > 1 and i < len(slides) - 2:  # Not first/last few slides
                     issues.append(QualityIssue(
                         dimension=self.dimension,
@@ -233,7 +213,7 @@ class CoherenceChecker(QualityChecker):
     
     def _check_terminology_consistency(
         self,
-        slide_texts: List[str]
+        text_index: SlideTextIndex
     ) -> Tuple[float, List[QualityIssue], Dict[str, Any]]:
         """Check for consistent use of terminology."""
         issues = []
@@ -241,7 +221,7 @@ class CoherenceChecker(QualityChecker):
         
         # Extract all terms (nouns and technical terms)
         all_terms = []
-        for text in slide_texts:
+        for text in text_index:
             terms = self._extract_technical_terms(text)
             all_terms.extend(terms)
         
@@ -331,25 +311,24 @@ class CoherenceChecker(QualityChecker):
     
     def _check_topic_coherence(
         self,
-        slide_texts: List[str]
+        text_index: SlideTextIndex,
+        slide_keywords: List[Set[str]]
     ) -> Tuple[float, List[QualityIssue], Dict[str, Any]]:
         """Check overall topic coherence using keyword analysis."""
         issues = []
         metadata = {}
         
         # Extract keywords from entire presentation
-        all_text = ' '.join(slide_texts)
-        main_keywords = self._extract_keywords(all_text, top_n=10)
+        main_keywords = self._extract_keywords(text_index.term_frequencies, top_n=10)
         
         # Check keyword distribution across slides
         slide_keyword_counts = []
-        for i, text in enumerate(slide_texts):
-            slide_keywords = self._extract_keywords(text)
-            main_keyword_count = len(slide_keywords & main_keywords)
+        for i, text in enumerate(text_index):
+            main_keyword_count = len(slide_keywords[i] & main_keywords)
             slide_keyword_counts.append(main_keyword_count)
             
             # Flag slides with no connection to main topics
-            if main_keyword_count == 0 and len(text.split()) > 20:
+            if main_keyword_count == 0 and text.word_count() > 20:
                 issues.append(QualityIssue(
                     dimension=self.dimension,
                     severity="minor",
@@ -368,17 +347,13 @@ class CoherenceChecker(QualityChecker):
         
         return coherence_score, issues, metadata
     
-    def _check_transitions(self, slide_texts: List[str]) -> Tuple[float, List[QualityIssue]]:
+    def _check_transitions(self, transitions: List[bool]) -> Tuple[float, List[QualityIssue]]:
         """Check quality of transitions between slides."""
         issues = []
-        transition_count = 0
-        
-        for i, text in enumerate(slide_texts):
-            if self._has_transition_phrase(text):
-                transition_count += 1
+        transition_count = sum(transitions)
         
         # Calculate transition score
-        expected_transitions = max(1, len(slide_texts) // 3)  # Expect transitions in 1/3 of slides
+        expected_transitions = max(1, len(transitions) // 3)  # Expect transitions in 1/3 of slides
         transition_score = min(1.0, transition_count / expected_transitions)
         
         if transition_score < 0.5:
@@ -391,27 +366,27 @@ class CoherenceChecker(QualityChecker):
         
         return transition_score, issues
     
-    def _extract_keywords(self, text: str, top_n: int = 15) -> Set[str]:
-        """Extract keywords from text."""
-        # Tokenize and filter
-        words = word_tokenize(text.lower())
-        words = [w for w in words if w.isalnum() and len(w) > 3]
-        words = [w for w in words if w not in self.stop_words]
+    def _extract_keywords(self, term_frequencies: Counter, top_n: int = 15) -> Set[str]:
+        """Extract keywords from term frequencies."""
+        # Filter stop words, keeping terms in order of first use
+        word_freq = Counter({
+            word: count for word, count in term_frequencies.items()
+            if word not in self.stop_words
+        })
         
         # Get most common words
-        word_freq = Counter(words)
         keywords = {word for word, _ in word_freq.most_common(top_n)}
         
         return keywords
     
-    def _extract_technical_terms(self, text: str) -> List[str]:
+    def _extract_technical_terms(self, slide_text: SlideText) -> List[str]:
         """Extract technical terms and important nouns."""
         # Simple extraction based on capitalization and patterns
         terms = []
+        text = slide_text.text()
         
         # Find capitalized terms (not at sentence start)
-        sentences = sent_tokenize(text)
-        for sentence in sentences:
+        for sentence in slide_text.sentences:
             words = sentence.split()
             for i, word in enumerate(words[1:], 1):  # Skip first word
                 if word and word[0].isupper() and word.lower() not in self.stop_words:
@@ -11,10 +11,11 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from app.domain.schemas.presentation import PresentationResponse, SlideResponse
 from app.domain.schemas.generation import Citation
-from .base import QualityChecker, QualityDimension, QualityIssue
+from .base import IncrementalQualityChecker, QualityDimension, QualityIssue
+from .text_index import VISIBLE_TEXT, SlideText
 
 
-class ReadabilityScorer(QualityChecker):
+class ReadabilityScorer(IncrementalQualityChecker):
     """
     Scores readability and clarity of presentation content.
     """
@@ -76,10 +77,63 @@ class ReadabilityScorer(QualityChecker):
         """Weight of readability in overall quality."""
         return 1.0
     
-    def check(
+    def summarize_slide(self, slide: SlideResponse, text: SlideText) -> Dict[str, Any]:
+        """
+        Summarize the text measures of a slide.
+        
+        Sentences may run across slides in the deck's text, so the summary
+        keeps the word counts of the slide's sentence fragments, which the
+        deck-level check joins at slide boundaries.
+        """
+        # Speaker notes are part of the deck's text, not of what the slide shows
+        deck_text = text.text()
+        slide_text = text.text(VISIBLE_TEXT)
+        
+        slide_sentences = re.split(r'[.!?]+', slide_text)
+        slide_sentences = [s.strip() for s in slide_sentences if s.strip()]
+        
+        words = re.findall(r'\b[a-zA-Z]+\b', deck_text.lower())
+        
+        # Title case style
+        title_case = None
+        if slide.title:
+            if slide.title.istitle():
+                title_case = 'title'
+            elif slide.title.isupper():
+                title_case = 'upper'
+            elif slide.title.islower():
+                title_case = 'lower'
+            else:
+                title_case = 'mixed'
+        
+        # Bullet point punctuation styles
+        bullet_styles = []
+        if slide.content and 'body' in slide.content:
+            for item in slide.content['body']:
+                if item.get('type') == 'bullet_list':
+                    for bullet in item.get('items', []):
+                        bullet_styles.append('period' if bullet.endswith('.') else 'no_period')
+        
+        return {
+            'has_text': bool(text.text_parts()),
+            'total_words': text.word_count(),
+            'fragment_words': [len(fragment.split()) for fragment in re.split(r'[.!?]+', deck_text)],
+            'slide_sentence_words': [len(sentence.split()) for sentence in slide_sentences],
+            'words': len(words),
+            'unique_words': frozenset(words),
+            'complex_words': sum(1 for w in words if len(w) >= 8),
+            'academic_terms': sum(1 for w in words if w in self.academic_words),
+            'jargon_words': sum(1 for w in words if w in self.readability_patterns['jargon_indicators']),
+            'clarity': self._assess_slide_clarity(slide_text),
+            'visual': self._assess_slide_visual_text(slide, text.word_count(VISIBLE_TEXT)),
+            'title_case': title_case,
+            'bullet_styles': bullet_styles
+        }
+    
+    def check_summaries(
         self,
         presentation: PresentationResponse,
-        slides: List[SlideResponse],
+        summaries: List[Dict[str, Any]],
         references: Optional[List[Citation]] = None
     ) -> Tuple[float, List[QualityIssue], Dict[str, Any]]:
         """
@@ -91,31 +145,28 @@ class ReadabilityScorer(QualityChecker):
         issues = []
         metadata = {}
         
-        # Extract text content
-        all_text = self._extract_all_text(slides)
-        
         # Calculate readability metrics
-        sentence_metrics, sentence_issues = self._analyze_sentences(slides, all_text)
+        sentence_metrics, sentence_issues = self._analyze_sentences(summaries)
         issues.extend(sentence_issues)
         metadata['sentence_metrics'] = sentence_metrics
         
         # Check vocabulary complexity
         vocab_score, vocab_issues, vocab_metadata = self._analyze_vocabulary(
-            all_text, presentation.academic_level or 'research'
+            summaries, presentation.academic_level or 'research'
         )
         issues.extend(vocab_issues)
         metadata['vocabulary'] = vocab_metadata
         
         # Check text clarity
-        clarity_score, clarity_issues = self._check_text_clarity(slides)
+        clarity_score, clarity_issues = self._check_text_clarity(summaries)
         issues.extend(clarity_issues)
         
         # Check visual text elements
-        visual_score, visual_issues = self._check_visual_text_elements(slides)
+        visual_score, visual_issues = self._check_visual_text_elements(summaries)
         issues.extend(visual_issues)
         
         # Check consistency
-        consistency_score, consistency_issues = self._check_text_consistency(slides)
+        consistency_score, consistency_issues = self._check_text_consistency(summaries)
         issues.extend(consistency_issues)
         
         # Calculate overall readability score
@@ -135,7 +186,7 @@ class ReadabilityScorer(QualityChecker):
             'visual_score': visual_score,
             'consistency_score': consistency_score,
             'academic_level': presentation.academic_level or 'research',
-            'total_words': len(all_text.split())
+            'total_words': sum(summary['total_words'] for summary in summaries)
         })
         
         # Identify strengths
@@ -151,74 +202,65 @@ class ReadabilityScorer(QualityChecker):
         
         return overall_score, issues, metadata
     
-    def _extract_all_text(self, slides: List[SlideResponse]) -> str:
-        """Extract all text content from slides."""
-        text_parts = []
-        
-        for slide in slides:
-            if slide.title:
-                text_parts.append(slide.title)
-            
-            if slide.content:
-                if 'subtitle' in slide.content:
-                    text_parts.append(slide.content['subtitle'])
-                
-                if 'body' in slide.content:
-                    for item in slide.content['body']:
-                        if item.get('type') == 'text':
-                            text_parts.append(item.get('content', ''))
-                        elif item.get('type') == 'bullet_list':
-                            text_parts.extend(item.get('items', []))
-            
-            if slide.speaker_notes:
-                text_parts.append(slide.speaker_notes)
+    def _deck_sentence_lengths(self, summaries: List[Dict[str, Any]]) -> List[int]:
+        """
+        Word counts of the sentences of all slides' text joined by spaces.
         
-        return ' '.join(text_parts)
+        A space never continues a sentence delimiter, so the fragments of the
+        joined text are those of each slide, with the last fragment of a
+        slide and the first of the next one merged.
+        """
+        fragments = []
+        for summary in summaries:
+            if not summary['has_text']:
+                continue
+            slide_fragments = summary['fragment_words']
+            if fragments:
+                fragments[-1] += slide_fragments[0]
+                fragments.extend(slide_fragments[1:])
+            else:
+                fragments.extend(slide_fragments)
+        
+        # Fragments without words are blank
+        return [length for length in fragments if length > 0]
     
     def _analyze_sentences(
         self,
-        slides: List[SlideResponse],
-        all_text: str
+        summaries: List[Dict[str, Any]]
     ) -> Tuple[Dict[str, Any], List[QualityIssue]]:
         """Analyze sentence structure and length."""
         issues = []
         
-        # Split into sentences
-        sentences = re.split(r'[.!?]+', all_text)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        # Calculate sentence lengths
+        sentence_lengths = self._deck_sentence_lengths(summaries)
         
-        if not sentences:
+        if not sentence_lengths:
             return {'score': 0.5, 'avg_length': 0}, issues
         
-        # Calculate sentence lengths
-        sentence_lengths = [len(sentence.split()) for sentence in sentences]
         avg_length = statistics.mean(sentence_lengths)
         max_length = max(sentence_lengths) if sentence_lengths else 0
         
         # Check for overly long sentences
         long_sentences = [i for i, length in enumerate(sentence_lengths) if length > 35]
+        long_sentence_indices = set(long_sentences)
         
         # Find which slides have long sentences
         sentence_count = 0
-        for i, slide in enumerate(slides):
-            slide_text = self._extract_slide_text(slide)
-            slide_sentences = re.split(r'[.!?]+', slide_text)
-            slide_sentences = [s.strip() for s in slide_sentences if s.strip()]
-            
-            for j, sentence in enumerate(slide_sentences):
-                if sentence_count in long_sentences:
+        for i, summary in enumerate(summaries):
+            for length in summary['slide_sentence_words']:
+                if sentence_count in long_sentence_indices:
                     issues.append(QualityIssue(
                         dimension=self.dimension,
                         severity="minor",
                         slide_number=i + 1,
-                        description=f"Overly long sentence ({len(sentence.split())} words)",
+                        description=f"Overly long sentence ({length} words)",
                         suggestion="Break into shorter, clearer sentences"
                     ))
                 sentence_count += 1
         
         # Check for very short sentences in content
         very_short = sum(1 for length in sentence_lengths if length < 5)
-        if very_short > len(sentences) * 0.3:
+        if very_short > len(sentence_lengths) * 0.3:
             issues.append(QualityIssue(
                 dimension=self.dimension,
                 severity="minor",
@@ -236,7 +278,7 @@ class ReadabilityScorer(QualityChecker):
             'score': score,
             'avg_length': avg_length,
             'max_length': max_length,
-            'total_sentences': len(sentences),
+            'total_sentences': len(sentence_lengths),
             'long_sentences': len(long_sentences)
         }
         
@@ -244,7 +286,7 @@ class ReadabilityScorer(QualityChecker):
     
     def _analyze_vocabulary(
         self,
-        text: str,
+        summaries: List[Dict[str, Any]],
         academic_level: str
     ) -> Tuple[float, List[QualityIssue], Dict[str, Any]]:
         """Analyze vocabulary complexity and appropriateness."""
@@ -257,18 +299,18 @@ class ReadabilityScorer(QualityChecker):
             self.level_requirements['research']
         )
         
-        # Tokenize words
-        words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
-        if not words:
+        # Count words
+        word_count = sum(summary['words'] for summary in summaries)
+        if not word_count:
             return 0.5, issues, metadata
         
         # Count complex words (>= 3 syllables, simplified by length)
-        complex_words = [w for w in words if len(w) >= 8]
-        complex_ratio = len(complex_words) / len(words)
+        complex_count = sum(summary['complex_words'] for summary in summaries)
+        complex_ratio = complex_count / word_count
         
         # Count technical/academic terms
-        academic_terms = [w for w in words if w in self.academic_words]
-        academic_ratio = len(academic_terms) / len(words)
+        academic_count = sum(summary['academic_terms'] for summary in summaries)
+        academic_ratio = academic_count / word_count
         
         # Check vocabulary appropriateness
         if complex_ratio > requirements['complex_words_ratio'] * 1.5:
@@ -288,8 +330,8 @@ class ReadabilityScorer(QualityChecker):
                 ))
         
         # Check for jargon
-        jargon_words = [w for w in words if w in self.readability_patterns['jargon_indicators']]
-        if len(jargon_words) > len(words) * 0.05:  # More than 5% jargon
+        jargon_count = sum(summary['jargon_words'] for summary in summaries)
+        if jargon_count > word_count * 0.05:  # More than 5% jargon
             issues.append(QualityIssue(
                 dimension=self.dimension,
                 severity="minor",
@@ -300,138 +342,155 @@ class ReadabilityScorer(QualityChecker):
         # Calculate vocabulary score
         complexity_score = 1.0 - abs(complex_ratio - requirements['complex_words_ratio']) * 2
         academic_score = min(1.0, academic_ratio / requirements['technical_terms_ratio'])
-        jargon_penalty = len(jargon_words) / len(words) * 2
+        jargon_penalty = jargon_count / word_count * 2
         
         vocab_score = max(0, (complexity_score + academic_score) / 2 - jargon_penalty)
         
         metadata = {
-            'total_words': len(words),
-            'unique_words': len(set(words)),
-            'complex_words': len(complex_words),
+            'total_words': word_count,
+            'unique_words': len(frozenset().union(*(summary['unique_words'] for summary in summaries))),
+            'complex_words': complex_count,
             'complex_ratio': complex_ratio,
-            'academic_terms': len(academic_terms),
+            'academic_terms': academic_count,
             'academic_ratio': academic_ratio,
-            'jargon_words': len(jargon_words)
+            'jargon_words': jargon_count
         }
         
         return vocab_score, issues, metadata
     
-    def _check_text_clarity(self, slides: List[SlideResponse]) -> Tuple[float, List[QualityIssue]]:
+    def _assess_slide_clarity(self, slide_text: str) -> Optional[Tuple[float, List[Tuple[str, str, str]]]]:
+        """
+        Check text clarity and directness of one slide.
+        
+        Returns:
+            Tuple of (score, issues as (severity, description, suggestion)),
+            or None for a slide without text
+        """
+        if not slide_text.strip():
+            return None
+        
+        issues = []
+        slide_score = 1.0
+        
+        # Check for passive voice
+        passive_count = len(re.findall(self.readability_patterns['passive_voice'], slide_text))
+        sentences = len(re.split(r'[.!?]+', slide_text))
+        if sentences > 0 and passive_count / sentences > 0.3:
+            issues.append((
+                "minor",
+                "Heavy use of passive voice",
+                "Use active voice for clearer communication"
+            ))
+            slide_score -= 0.2
+        
+        # Check for wordy phrases
+        wordy_count = 0
+        for phrase in self.readability_patterns['complex_phrases']:
+            wordy_count += slide_text.lower().count(phrase)
+        
+        if wordy_count > 2:
+            issues.append((
+                "minor",
+                "Use of wordy phrases reduces clarity",
+                "Replace wordy phrases with concise alternatives"
+            ))
+            slide_score -= 0.1
+        
+        # Check for unclear pronouns
+        unclear_pronouns = ['this', 'that', 'these', 'those', 'it']
+        for pronoun in unclear_pronouns:
+            # Simple check for pronoun at sentence start
+            pattern = r'\.\s+' + pronoun.capitalize() + r'\s+'
+            if re.search(pattern, slide_text):
+                issues.append((
+                    "suggestion",
+                    f"Unclear pronoun reference: '{pronoun}'",
+                    "Be specific about what the pronoun refers to"
+                ))
+                slide_score -= 0.05
+        
+        return max(0, slide_score), issues
+    
+    def _check_text_clarity(self, summaries: List[Dict[str, Any]]) -> Tuple[float, List[QualityIssue]]:
         """Check text clarity and directness."""
         issues = []
         clarity_scores = []
         
-        for i, slide in enumerate(slides):
-            slide_text = self._extract_slide_text(slide)
-            if not slide_text.strip():
+        for i, summary in enumerate(summaries):
+            if summary['clarity'] is None:
                 continue
-                
-            slide_score = 1.0
             
-            # Check for passive voice
-            passive_count = len(re.findall(self.readability_patterns['passive_voice'], slide_text))
-            sentences = len(re.split(r'[.!?]+', slide_text))
-            if sentences > 0 and passive_count / sentences > 0.3:
-                issues.append(QualityIssue(
-                    dimension=self.dimension,
-                    severity="minor",
-                    slide_number=i + 1,
-                    description="Heavy use of passive voice",
-                    suggestion="Use active voice for clearer communication"
-                ))
-                slide_score -= 0.2
-            
-            # Check for wordy phrases
-            wordy_count = 0
-            for phrase in self.readability_patterns['complex_phrases']:
-                wordy_count += slide_text.lower().count(phrase)
-            
-            if wordy_count > 2:
-                issues.append(QualityIssue(
-                    dimension=self.dimension,
-                    severity="minor",
-                    slide_number=i + 1,
-                    description="Use of wordy phrases reduces clarity",
-                    suggestion="Replace wordy phrases with concise alternatives"
-                ))
-                slide_score -= 0.1
-            
-            # Check for unclear pronouns
-            unclear_pronouns = ['this', 'that', 'these', 'those', 'it']
-            for pronoun in unclear_pronouns:
-                # Simple check for pronoun at sentence start
-                pattern = r'\.\s+' + pronoun.capitalize() + r'\s+'
-                if re.search(pattern, slide_text):
-                    issues.append(QualityIssue(
-                        dimension=self.dimension,
-                        severity="suggestion",
-                        slide_number=i + 1,
-                        description=f"Unclear pronoun reference: '{pronoun}'",
-                        suggestion="Be specific about what the pronoun refers to"
-                    ))
-                    slide_score -= 0.05
-            
-            clarity_scores.append(max(0, slide_score))
+            slide_score, slide_issues = summary['clarity']
+            issues.extend(self._slide_issues(slide_issues, i + 1))
+            clarity_scores.append(slide_score)
         
         # Calculate overall clarity score
         clarity_score = statistics.mean(clarity_scores) if clarity_scores else 0.5
         
         return clarity_score, issues
     
+    def _assess_slide_visual_text(
+        self,
+        slide: SlideResponse,
+        word_count: int
+    ) -> Tuple[float, List[Tuple[str, str, str]]]:
+        """
+        Check visual aspects of the text of one slide.
+        
+        Returns:
+            Tuple of (score, issues as (severity, description, suggestion))
+        """
+        issues = []
+        slide_score = 1.0
+        
+        # Check title length
+        if slide.title and len(slide.title) > 80:
+            issues.append((
+                "minor",
+                "Title too long for easy reading",
+                "Shorten title to under 80 characters"
+            ))
+            slide_score -= 0.2
+        
+        # Check bullet point length
+        if slide.content and 'body' in slide.content:
+            for item in slide.content['body']:
+                if item.get('type') == 'bullet_list':
+                    long_bullets = [
+                        bullet for bullet in item.get('items', [])
+                        if len(bullet) > 100
+                    ]
+                    if long_bullets:
+                        issues.append((
+                            "minor",
+                            f"{len(long_bullets)} bullet points are too long",
+                            "Keep bullet points under 100 characters"
+                        ))
+                        slide_score -= 0.1
+        
+        # Check for text density
+        if word_count > 150:  # Too many words for a slide
+            issues.append((
+                "major",
+                f"Too much text ({word_count} words) on single slide",
+                "Split content across multiple slides"
+            ))
+            slide_score -= 0.3
+        
+        return max(0, slide_score), issues
+    
     def _check_visual_text_elements(
         self,
-        slides: List[SlideResponse]
+        summaries: List[Dict[str, Any]]
     ) -> Tuple[float, List[QualityIssue]]:
         """Check visual aspects of text presentation."""
         issues = []
         visual_scores = []
         
-        for i, slide in enumerate(slides):
-            slide_score = 1.0
-            
-            # Check title length
-            if slide.title and len(slide.title) > 80:
-                issues.append(QualityIssue(
-                    dimension=self.dimension,
-                    severity="minor",
-                    slide_number=i + 1,
-                    description="Title too long for easy reading",
-                    suggestion="Shorten title to under 80 characters"
-                ))
-                slide_score -= 0.2
-            
-            # Check bullet point length
-            if slide.content and 'body' in slide.content:
-                for item in slide.content['body']:
-                    if item.get('type') == 'bullet_list':
-                        long_bullets = [
-                            bullet for bullet in item.get('items', [])
-                            if len(bullet) > 100
-                        ]
-                        if long_bullets:
-                            issues.append(QualityIssue(
-                                dimension=self.dimension,
-                                severity="minor",
-                                slide_number=i + 1,
-                                description=f"{len(long_bullets)} bullet points are too long",
-                                suggestion="Keep bullet points under 100 characters"
-                            ))
-                            slide_score -= 0.1
-            
-            # Check for text density
-            text_content = self._extract_slide_text(slide)
-            word_count = len(text_content.split())
-            if word_count > 150:  # Too many words for a slide
-                issues.append(QualityIssue(
-                    dimension=self.dimension,
-                    severity="major",
-                    slide_number=i + 1,
-                    description=f"Too much text ({word_count} words) on single slide",
-                    suggestion="Split content across multiple slides"
-                ))
-                slide_score -= 0.3
-            
-            visual_scores.append(max(0, slide_score))
+        for i, summary in enumerate(summaries):
+            slide_score, slide_issues = summary['visual']
+            issues.extend(self._slide_issues(slide_issues, i + 1))
+            visual_scores.append(slide_score)
         
         # Calculate visual score
         visual_score = statistics.mean(visual_scores) if visual_scores else 0.5
@@ -440,23 +499,13 @@ class ReadabilityScorer(QualityChecker):
     
     def _check_text_consistency(
         self,
-        slides: List[SlideResponse]
+        summaries: List[Dict[str, Any]]
     ) -> Tuple[float, List[QualityIssue]]:
         """Check consistency in text style and formatting."""
         issues = []
         
         # Check title case consistency
-        title_cases = []
-        for slide in slides:
-            if slide.title:
-                if slide.title.istitle():
-                    title_cases.append('title')
-                elif slide.title.isupper():
-                    title_cases.append('upper')
-                elif slide.title.islower():
-                    title_cases.append('lower')
-                else:
-                    title_cases.append('mixed')
+        title_cases = [summary['title_case'] for summary in summaries if summary['title_case']]
         
         if len(set(title_cases)) > 2:
             issues.append(QualityIssue(
@@ -467,17 +516,7 @@ class ReadabilityScorer(QualityChecker):
             ))
         
         # Check bullet point style consistency
-        bullet_styles = []
-        for slide in slides:
-            if slide.content and 'body' in slide.content:
-                for item in slide.content['body']:
-                    if item.get('type') == 'bullet_list':
-                        bullets = item.get('items', [])
-                        for bullet in bullets:
-                            if bullet.endswith('.'):
-                                bullet_styles.append('period')
-                            else:
-                                bullet_styles.append('no_period')
+        bullet_styles = [style for summary in summaries for style in summary['bullet_styles']]
         
         if len(set(bullet_styles)) > 1 and len(bullet_styles) > 3:
             issues.append(QualityIssue(
@@ -498,22 +537,19 @@ class ReadabilityScorer(QualityChecker):
         
         return max(0, consistency_score), issues
     
-    def _extract_slide_text(self, slide: SlideResponse) -> str:
-        """Extract all text from a single slide."""
-        text_parts = []
-        
-        if slide.title:
-            text_parts.append(slide.title)
-        
-        if slide.content:
-            if 'subtitle' in slide.content:
-                text_parts.append(slide.content['subtitle'])
-            
-            if 'body' in slide.content:
-                for item in slide.content['body']:
-                    if item.get('type') == 'text':
-                        text_parts.append(item.get('content', ''))
-                    elif item.get('type') == 'bullet_list':
-                        text_parts.extend(item.get('items', []))
-        
-        return ' '.join(text_parts)
\ No newline at end of file
+    def _slide_issues(
+        self,
+        slide_issues: List[Tuple[str, str, str]],
+        slide_number: int
+    ) -> List[QualityIssue]:
+        """Create the issues found on a slide at its position in the deck."""
+        return [
+            QualityIssue(
+                dimension=self.dimension,
+                severity=severity,
+                slide_number=slide_number,
+                description=description,
+                suggestion=suggestion
+            )
+            for severity, description, suggestion in slide_issues
+        ]
@@ -0,0 +1,189 @@
+"""
+Shared slide text index for SlideGenie quality assessment.
+
+Checkers read the same slide text in overlapping ways: with or without
+speaker notes, bullets or captions, as words, sentences, terms or
+citations. A SlideTextIndex is built once per assessment and handed to
+every checker; each slide's text parts are extracted once, and each
+derived form is computed on first use and kept for the other checkers.
+"""
+import re
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from nltk.tokenize import sent_tokenize, word_tokenize
+
+from app.domain.schemas.presentation import SlideResponse
+
+
+# Kinds of text parts
+TITLE = 'title'
+SUBTITLE = 'subtitle'
+TEXT = 'text'
+BULLET = 'bullet'
+CAPTION = 'caption'
+NOTES = 'notes'
+
+# Text shown on the slide
+VISIBLE_TEXT = (TITLE, SUBTITLE, TEXT, BULLET)
+# Shown text and speaker notes, what most checkers read
+SLIDE_TEXT = VISIBLE_TEXT + (NOTES,)
+# Slide text with figure and table captions, where citations also appear
+CITATION_TEXT = SLIDE_TEXT + (CAPTION,)
+
+
+class SlideText:
+    """
+    Text of one slide, extracted on first use and kept with its derived forms.
+    
+    Derived forms are computed at most once per kinds or patterns. Checkers
+    running concurrently may race to compute one; both compute the same
+    value, so either is kept.
+    """
+    
+    def __init__(self, slide: SlideResponse):
+        """
+        Initialize slide text.
+        
+        Args:
+            slide: The slide to read
+        """
+        self.slide = slide
+        self._parts: Optional[List[Tuple[str, str]]] = None
+        self._texts: Dict[Sequence[str], str] = {}
+        self._word_counts: Dict[Sequence[str], int] = {}
+        self._citations: Dict[Tuple[Tuple[str, str], ...], Dict[str, List[str]]] = {}
+        self._tokens: Optional[List[str]] = None
+        self._sentences: Optional[List[str]] = None
+        self._term_frequencies: Optional[Counter] = None
+    
+    @property
+    def parts(self) -> List[Tuple[str, str]]:
+        """Text parts of the slide as (kind, text), in reading order."""
+        if self._parts is None:
+            self._parts = self._extract_parts(self.slide)
+        return self._parts
+    
+    def text_parts(self, kinds: Sequence[str] = SLIDE_TEXT) -> List[str]:
+        """Get the text parts of the given kinds, in reading order."""
+        return [part for kind, part in self.parts if kind in kinds]
+    
+    def text(self, kinds: Sequence[str] = SLIDE_TEXT) -> str:
+        """Get the text parts of the given kinds joined by spaces."""
+        text = self._texts.get(kinds)
+        if text is None:
+            text = self._texts[kinds] = ' '.join(self.text_parts(kinds))
+        return text
+    
+    def word_count(self, kinds: Sequence[str] = SLIDE_TEXT) -> int:
+        """Count the whitespace-separated words of the given kinds of text."""
+        count = self._word_counts.get(kinds)
+        if count is None:
+            count = self._word_counts[kinds] = len(self.text(kinds).split())
+        return count
+    
+    @property
+    def tokens(self) -> List[str]:
+        """Word tokens of the lowercased slide text."""
+        if self._tokens is None:
+            self._tokens = word_tokenize(self.text().lower())
+        return self._tokens
+    
+    @property
+    def sentences(self) -> List[str]:
+        """Sentences of the slide text."""
+        if self._sentences is None:
+            self._sentences = sent_tokenize(self.text())
+        return self._sentences
+    
+    @property
+    def term_frequencies(self) -> Counter:
+        """Frequencies of alphanumeric tokens longer than three characters, by first use."""
+        if self._term_frequencies is None:
+            self._term_frequencies = Counter(
+                token for token in self.tokens if token.isalnum() and len(token) > 3
+            )
+        return self._term_frequencies
+    
+    def citations(self, patterns: Dict[str, str]) -> Dict[str, List[str]]:
+        """
+        Find citations in the slide text, captions included.
+        
+        Args:
+            patterns: Citation patterns by format name
+        
+        Returns:
+            re.findall matches of each pattern, by format name
+        """
+        key = tuple(patterns.items())
+        found = self._citations.get(key)
+        if found is None:
+            text = self.text(CITATION_TEXT)
+            found = self._citations[key] = {
+                name: re.findall(pattern, text) for name, pattern in patterns.items()
+            }
+        return found
+    
+    def _extract_parts(self, slide: SlideResponse) -> List[Tuple[str, str]]:
+        """Extract the text parts of a slide."""
+        parts = []
+        
+        if slide.title:
+            parts.append((TITLE, slide.title))
+        
+        if slide.content:
+            if 'subtitle' in slide.content:
+                parts.append((SUBTITLE, slide.content['subtitle']))
+            
+            if 'body' in slide.content:
+                for item in slide.content['body']:
+                    if item.get('type') == 'text':
+                        parts.append((TEXT, item.get('content', '')))
+                    elif item.get('type') == 'bullet_list':
+                        parts.extend((BULLET, bullet) for bullet in item.get('items', []))
+                    elif item.get('type') == 'caption':
+                        parts.append((CAPTION, item.get('content', '')))
+        
+        if slide.speaker_notes:
+            parts.append((NOTES, slide.speaker_notes))
+        
+        return parts
+
+
+class SlideTextIndex:
+    """
+    Text of a presentation's slides, shared by the checkers of one assessment.
+    """
+    
+    def __init__(self, slides: List[SlideResponse]):
+        """
+        Initialize index.
+        
+        Args:
+            slides: List of slides in the presentation
+        """
+        self.slides = [SlideText(slide) for slide in slides]
+        self._term_frequencies: Optional[Counter] = None
+    
+    def __len__(self) -> int:
+        return len(self.slides)
+    
+    def __iter__(self) -> Iterator[SlideText]:
+        return iter(self.slides)
+    
+    def __getitem__(self, index: int) -> SlideText:
+        return self.slides[index]
+    
+    def texts(self, kinds: Sequence[str] = SLIDE_TEXT) -> List[str]:
+        """Get the text of every slide."""
+        return [slide.text(kinds) for slide in self.slides]
+    
+    @property
+    def term_frequencies(self) -> Counter:
+        """Term frequencies of the whole presentation, by first use."""
+        if self._term_frequencies is None:
+            frequencies = Counter()
+            for slide in self.slides:
+                frequencies.update(slide.term_frequencies)
+            self._term_frequencies = frequencies
+        return self._term_frequencies
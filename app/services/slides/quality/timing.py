@@ -9,10 +9,14 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from app.domain.schemas.presentation import PresentationResponse, SlideResponse
 from app.domain.schemas.generation import Citation
-from .base import QualityChecker, QualityDimension, QualityIssue
+from .base import IncrementalQualityChecker, QualityDimension, QualityIssue
+from .text_index import SUBTITLE, TEXT, TITLE, SlideText
 
+# Text read for timing; bullets are timed per bullet instead
+PROSE_TEXT = (TITLE, SUBTITLE, TEXT)
 
-class TimingValidator(QualityChecker):
+
+class TimingValidator(IncrementalQualityChecker):
     """
     Validates timing estimates for presentation slides.
     """
@@ -62,10 +66,29 @@ class TimingValidator(QualityChecker):
         """Weight of timing in overall quality."""
         return 0.8
     
-    def check(
+    def summarize_slide(self, slide: SlideResponse, text: SlideText) -> Dict[str, Any]:
+        """Estimate a slide's type, time and content density."""
+        # Determine slide type
+        slide_type = self._determine_slide_type(slide)
+        
+        # Calculate base time
+        if slide.duration_seconds:
+            # Use provided duration
+            estimated_time = slide.duration_seconds
+        else:
+            # Estimate based on content
+            estimated_time = self._estimate_slide_time(slide, slide_type, text)
+        
+        return {
+            'estimated_time': estimated_time,
+            'slide_type': slide_type,
+            'content_density': self._calculate_content_density(slide, text)
+        }
+    
+    def check_summaries(
         self,
         presentation: PresentationResponse,
-        slides: List[SlideResponse],
+        summaries: List[Dict[str, Any]],
         references: Optional[List[Citation]] = None
     ) -> Tuple[float, List[QualityIssue], Dict[str, Any]]:
         """
@@ -77,14 +100,12 @@ class TimingValidator(QualityChecker):
         issues = []
         metadata = {}
         
-        # Calculate timing estimates
-        timing_data = self._calculate_slide_timings(slides)
+        # Collect timing estimates
+        timing_data = self._calculate_slide_timings(summaries)
         metadata['timing_breakdown'] = timing_data
         
         # Check individual slide timings
-        individual_score, individual_issues = self._check_individual_timings(
-            slides, timing_data
-        )
+        individual_score, individual_issues = self._check_individual_timings(timing_data)
         issues.extend(individual_issues)
         
         # Check total presentation timing
@@ -101,9 +122,7 @@ class TimingValidator(QualityChecker):
         issues.extend(distribution_issues)
         
         # Check pacing consistency
-        pacing_score, pacing_issues = self._check_pacing_consistency(
-            slides, timing_data
-        )
+        pacing_score, pacing_issues = self._check_pacing_consistency(timing_data)
         issues.extend(pacing_issues)
         
         # Calculate overall score
@@ -137,35 +156,12 @@ class TimingValidator(QualityChecker):
         
         return overall_score, issues, metadata
     
-    def _calculate_slide_timings(self, slides: List[SlideResponse]) -> Dict[str, Any]:
-        """Calculate estimated timing for each slide."""
-        estimated_times = []
-        slide_types = []
-        content_densities = []
-        
-        for slide in slides:
-            # Determine slide type
-            slide_type = self._determine_slide_type(slide)
-            slide_types.append(slide_type)
-            
-            # Calculate base time
-            if slide.duration_seconds:
-                # Use provided duration
-                estimated_time = slide.duration_seconds
-            else:
-                # Estimate based on content
-                estimated_time = self._estimate_slide_time(slide, slide_type)
-            
-            estimated_times.append(estimated_time)
-            
-            # Calculate content density
-            density = self._calculate_content_density(slide)
-            content_densities.append(density)
-        
+    def _calculate_slide_timings(self, summaries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Collect the estimated timing of each slide."""
         return {
-            'estimated_times': estimated_times,
-            'slide_types': slide_types,
-            'content_densities': content_densities
+            'estimated_times': [summary['estimated_time'] for summary in summaries],
+            'slide_types': [summary['slide_type'] for summary in summaries],
+            'content_densities': [summary['content_density'] for summary in summaries]
         }
     
     def _determine_slide_type(self, slide: SlideResponse) -> str:
@@ -187,7 +183,7 @@ class TimingValidator(QualityChecker):
         
         return 'content'
     
-    def _estimate_slide_time(self, slide: SlideResponse, slide_type: str) -> int:
+    def _estimate_slide_time(self, slide: SlideResponse, slide_type: str, text: SlideText) -> int:
         """Estimate time needed for a slide in seconds."""
         base_time = 0
         
@@ -202,8 +198,7 @@ class TimingValidator(QualityChecker):
         # Add time for text content
         if slide.content:
             # Count words for reading time
-            text_content = self._extract_all_text(slide)
-            word_count = len(text_content.split())
+            word_count = text.word_count(PROSE_TEXT)
             reading_time = (word_count / self.reading_speeds['academic']) * 60
             base_time += reading_time
             
@@ -232,34 +227,12 @@ class TimingValidator(QualityChecker):
         
         return int(base_time)
     
-    def _extract_all_text(self, slide: SlideResponse) -> str:
-        """Extract all text from slide."""
-        text_parts = []
-        
-        if slide.title:
-            text_parts.append(slide.title)
-        
-        if slide.content:
-            if 'subtitle' in slide.content:
-                text_parts.append(slide.content['subtitle'])
-            
-            if 'body' in slide.content:
-                for item in slide.content['body']:
-                    if item.get('type') == 'text':
-                        text_parts.append(item.get('content', ''))
-                    elif item.get('type') == 'bullet_list':
-                        # Don't include bullets in word count, handled separately
-                        pass
-        
-        return ' '.join(text_parts)
-    
-    def _calculate_content_density(self, slide: SlideResponse) -> float:
+    def _calculate_content_density(self, slide: SlideResponse, text: SlideText) -> float:
         """Calculate content density score (0-1)."""
         density_score = 0.0
         
         # Word count factor
-        text = self._extract_all_text(slide)
-        word_count = len(text.split())
+        word_count = text.word_count(PROSE_TEXT)
         density_score += min(word_count / 150, 1.0) * 0.3
         
         # Visual elements factor
@@ -287,15 +260,14 @@ class TimingValidator(QualityChecker):
     
     def _check_individual_timings(
         self,
-        slides: List[SlideResponse],
         timing_data: Dict[str, Any]
     ) -> Tuple[float, List[QualityIssue]]:
         """Check if individual slide timings are appropriate."""
         issues = []
         appropriate_count = 0
+        slide_count = len(timing_data['estimated_times'])
         
-        for i, (slide, estimated_time, slide_type, density) in enumerate(zip(
-            slides,
+        for i, (estimated_time, slide_type, density) in enumerate(zip(
             timing_data['estimated_times'],
             timing_data['slide_types'],
             timing_data['content_densities']
@@ -332,7 +304,7 @@ class TimingValidator(QualityChecker):
                 appropriate_count += 1
         
         # Calculate score
-        score = appropriate_count / len(slides) if slides else 0.5
+        score = appropriate_count / slide_count if slide_count else 0.5
         
         return score, issues
     
@@ -433,7 +405,6 @@ class TimingValidator(QualityChecker):
     
     def _check_pacing_consistency(
         self,
-        slides: List[SlideResponse],
         timing_data: Dict[str, Any]
     ) -> Tuple[float, List[QualityIssue]]:
         """Check for consistent pacing throughout presentation."""
@@ -442,7 +413,7 @@ class TimingValidator(QualityChecker):
         densities = timing_data['content_densities']
         
         # Group slides into thirds
-        third_size = len(slides) // 3
+        third_size = len(times) // 3
         if third_size < 2:
             return 0.8, issues
         
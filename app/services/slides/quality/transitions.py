@@ -8,10 +8,11 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from app.domain.schemas.presentation import PresentationResponse, SlideResponse
 from app.domain.schemas.generation import Citation
-from .base import QualityChecker, QualityDimension, QualityIssue
+from .base import IncrementalQualityChecker, QualityDimension, QualityIssue
+from .text_index import SlideText
 
 
-class TransitionValidator(QualityChecker):
+class TransitionValidator(IncrementalQualityChecker):
     """
     Validates slide transitions for smooth flow and logical progression.
     """
@@ -77,10 +78,40 @@ class TransitionValidator(QualityChecker):
         """Weight of transitions in overall quality."""
         return 1.0
     
-    def check(
+    def summarize_slide(self, slide: SlideResponse, text: SlideText) -> Dict[str, Any]:
+        """Summarize the type indicators, effect, phrasing and density of a slide."""
+        title_lower = slide.title.lower() if slide.title else ''
+        
+        # Type from indicators, used unless the slide's position decides it
+        indicated_type = 'content'  # Default
+        for type_name, indicators in self.slide_type_indicators.items():
+            if any(indicator in title_lower for indicator in indicators):
+                indicated_type = type_name
+                break
+        
+        # Check layout type
+        if slide.layout_type in ['section', 'title']:
+            indicated_type = slide.layout_type
+        
+        text_lower = text.text().lower()
+        intro_phrases = ['in this section', 'we will', 'let us', 'now we']
+        
+        return {
+            'indicated_type': indicated_type,
+            'references_title': 'reference' in title_lower,
+            'has_title': bool(slide.title),
+            'has_transition': bool(slide.transitions),
+            'transition_type': slide.transitions.get('type', 'fade') if slide.transitions else None,
+            'transition_duration': slide.transitions.get('duration', 1.0) if slide.transitions else None,
+            'concluding': self._has_concluding_phrase(text_lower),
+            'introducing': any(phrase in text_lower for phrase in intro_phrases),
+            'density': self._estimate_content_density(slide, text)
+        }
+    
+    def check_summaries(
         self,
         presentation: PresentationResponse,
-        slides: List[SlideResponse],
+        summaries: List[Dict[str, Any]],
         references: Optional[List[Citation]] = None
     ) -> Tuple[float, List[QualityIssue], Dict[str, Any]]:
         """
@@ -93,23 +124,23 @@ class TransitionValidator(QualityChecker):
         metadata = {}
         
         # Identify slide types
-        slide_types = self._identify_slide_types(slides)
+        slide_types = self._identify_slide_types(summaries)
         metadata['slide_types'] = slide_types
         
         # Check transition flow
-        flow_score, flow_issues = self._check_transition_flow(slides, slide_types)
+        flow_score, flow_issues = self._check_transition_flow(summaries, slide_types)
         issues.extend(flow_issues)
         
         # Check transition effects
-        effects_score, effects_issues = self._check_transition_effects(slides, slide_types)
+        effects_score, effects_issues = self._check_transition_effects(summaries, slide_types)
         issues.extend(effects_issues)
         
         # Check pacing
-        pacing_score, pacing_issues = self._check_transition_pacing(slides)
+        pacing_score, pacing_issues = self._check_transition_pacing(summaries)
         issues.extend(pacing_issues)
         
         # Check section transitions
-        section_score, section_issues = self._check_section_transitions(slides, slide_types)
+        section_score, section_issues = self._check_section_transitions(summaries, slide_types)
         issues.extend(section_issues)
         
         # Calculate overall score
@@ -126,7 +157,7 @@ class TransitionValidator(QualityChecker):
             'effects_score': effects_score,
             'pacing_score': pacing_score,
             'section_score': section_score,
-            'total_transitions': len(slides) - 1 if slides else 0,
+            'total_transitions': len(summaries) - 1 if summaries else 0,
             'smooth_transitions': sum(1 for i in issues if i.severity != 'critical')
         })
         
@@ -143,31 +174,18 @@ class TransitionValidator(QualityChecker):
         
         return overall_score, issues, metadata
     
-    def _identify_slide_types(self, slides: List[SlideResponse]) -> List[str]:
+    def _identify_slide_types(self, summaries: List[Dict[str, Any]]) -> List[str]:
         """Identify the type of each slide."""
         slide_types = []
         
-        for i, slide in enumerate(slides):
-            slide_type = 'content'  # Default
-            
-            # Check title and content for type indicators
-            title_lower = slide.title.lower() if slide.title else ''
-            
+        for i, summary in enumerate(summaries):
             # Special handling for first and last slides
             if i == 0:
                 slide_type = 'title'
-            elif i == len(slides) - 1 and 'reference' in title_lower:
+            elif i == len(summaries) - 1 and summary['references_title']:
                 slide_type = 'references'
             else:
-                # Check against indicators
-                for type_name, indicators in self.slide_type_indicators.items():
-                    if any(indicator in title_lower for indicator in indicators):
-                        slide_type = type_name
-                        break
-                
-                # Check layout type
-                if slide.layout_type in ['section', 'title']:
-                    slide_type = slide.layout_type
+                slide_type = summary['indicated_type']
             
             slide_types.append(slide_type)
         
@@ -175,13 +193,13 @@ class TransitionValidator(QualityChecker):
     
     def _check_transition_flow(
         self,
-        slides: List[SlideResponse],
+        summaries: List[Dict[str, Any]],
         slide_types: List[str]
     ) -> Tuple[float, List[QualityIssue]]:
         """Check logical flow of transitions."""
         issues = []
         good_transitions = 0
-        total_transitions = len(slides) - 1
+        total_transitions = len(summaries) - 1
         
         for i in range(total_transitions):
             current_type = slide_types[i]
@@ -218,8 +236,7 @@ class TransitionValidator(QualityChecker):
             # Check for abrupt section changes
             if current_type == 'content' and next_type == 'section':
                 # Check if previous content is properly concluded
-                current_content = self._extract_slide_text(slides[i])
-                if not self._has_concluding_phrase(current_content):
+                if not summaries[i]['concluding']:
                     issues.append(QualityIssue(
                         dimension=self.dimension,
                         severity="minor",
@@ -235,7 +252,7 @@ class TransitionValidator(QualityChecker):
     
     def _check_transition_effects(
         self,
-        slides: List[SlideResponse],
+        summaries: List[Dict[str, Any]],
         slide_types: List[str]
     ) -> Tuple[float, List[QualityIssue]]:
         """Check appropriateness of transition effects."""
@@ -243,13 +260,13 @@ class TransitionValidator(QualityChecker):
         appropriate_count = 0
         effects_count = 0
         
-        for i, slide in enumerate(slides):
-            if slide.transitions:
+        for i, summary in enumerate(summaries):
+            if summary['has_transition']:
                 effects_count += 1
                 slide_type = slide_types[i]
                 
                 # Check if transition effect is appropriate
-                transition_type = slide.transitions.get('type', 'fade')
+                transition_type = summary['transition_type']
                 appropriate_effects = self.appropriate_effects.get(slide_type, ['fade'])
                 
                 if transition_type not in appropriate_effects:
@@ -264,8 +281,7 @@ class TransitionValidator(QualityChecker):
                     appropriate_count += 1
                 
                 # Check transition duration
-                duration = slide.transitions.get('duration', 1.0)
-                if duration > 2.0:
+                if summary['transition_duration'] > 2.0:
                     issues.append(QualityIssue(
                         dimension=self.dimension,
                         severity="minor",
@@ -276,8 +292,10 @@ class TransitionValidator(QualityChecker):
         
         # Check for consistency
         if effects_count > 0:
-            all_effects = [s.transitions.get('type', 'fade') for s in slides if s.transitions]
-            unique_effects = set(all_effects)
+            unique_effects = {
+                summary['transition_type'] for summary in summaries
+                if summary['has_transition']
+            }
             if len(unique_effects) > 3:
                 issues.append(QualityIssue(
                     dimension=self.dimension,
@@ -293,22 +311,15 @@ class TransitionValidator(QualityChecker):
     
     def _check_transition_pacing(
         self,
-        slides: List[SlideResponse]
+        summaries: List[Dict[str, Any]]
     ) -> Tuple[float, List[QualityIssue]]:
         """Check pacing of transitions based on content density."""
         issues = []
         pacing_scores = []
         
-        for i in range(len(slides) - 1):
-            current_slide = slides[i]
-            next_slide = slides[i + 1]
-            
-            # Estimate content density
-            current_density = self._estimate_content_density(current_slide)
-            next_density = self._estimate_content_density(next_slide)
-            
+        for i in range(len(summaries) - 1):
             # Check for dramatic density changes
-            density_change = abs(next_density - current_density)
+            density_change = abs(summaries[i + 1]['density'] - summaries[i]['density'])
             if density_change > 0.7:
                 issues.append(QualityIssue(
                     dimension=self.dimension,
@@ -330,18 +341,18 @@ class TransitionValidator(QualityChecker):
     
     def _check_section_transitions(
         self,
-        slides: List[SlideResponse],
+        summaries: List[Dict[str, Any]],
         slide_types: List[str]
     ) -> Tuple[float, List[QualityIssue]]:
         """Check transitions at section boundaries."""
         issues = []
         section_transitions = []
         
-        for i in range(len(slides) - 1):
+        for i in range(len(summaries) - 1):
             if slide_types[i] == 'section' or slide_types[i + 1] == 'section':
                 # This is a section boundary
                 transition_quality = self._evaluate_section_transition(
-                    slides[i], slides[i + 1], slide_types[i], slide_types[i + 1]
+                    summaries[i], summaries[i + 1], slide_types[i], slide_types[i + 1]
                 )
                 section_transitions.append(transition_quality)
                 
@@ -362,29 +373,6 @@ class TransitionValidator(QualityChecker):
         
         return section_score, issues
     
-    def _extract_slide_text(self, slide: SlideResponse) -> str:
-        """Extract all text from a slide."""
-        text_parts = []
-        
-        if slide.title:
-            text_parts.append(slide.title)
-        
-        if slide.content:
-            if 'subtitle' in slide.content:
-                text_parts.append(slide.content['subtitle'])
-            
-            if 'body' in slide.content:
-                for item in slide.content['body']:
-                    if item.get('type') == 'text':
-                        text_parts.append(item.get('content', ''))
-                    elif item.get('type') == 'bullet_list':
-                        text_parts.extend(item.get('items', []))
-        
-        if slide.speaker_notes:
-            text_parts.append(slide.speaker_notes)
-        
-        return ' '.join(text_parts)
-    
     def _has_concluding_phrase(self, text: str) -> bool:
         """Check if text contains concluding phrases."""
         concluding_phrases = [
@@ -394,13 +382,12 @@ class TransitionValidator(QualityChecker):
         text_lower = text.lower()
         return any(phrase in text_lower for phrase in concluding_phrases)
     
-    def _estimate_content_density(self, slide: SlideResponse) -> float:
+    def _estimate_content_density(self, slide: SlideResponse, text: SlideText) -> float:
         """Estimate content density of a slide (0-1)."""
         density_factors = 0.0
         
         # Word count factor
-        text = self._extract_slide_text(slide)
-        word_count = len(text.split())
+        word_count = text.word_count()
         density_factors += min(word_count / 100, 1.0) * 0.3
         
         # Visual elements factor
@@ -425,8 +412,8 @@ class TransitionValidator(QualityChecker):
     
     def _evaluate_section_transition(
         self,
-        slide1: SlideResponse,
-        slide2: SlideResponse,
+        summary1: Dict[str, Any],
+        summary2: Dict[str, Any],
         type1: str,
         type2: str
     ) -> float:
@@ -434,20 +421,15 @@ class TransitionValidator(QualityChecker):
         score = 0.5  # Base score
         
         # Check if section slide has clear title
-        if type2 == 'section' and slide2.title:
+        if type2 == 'section' and summary2['has_title']:
             score += 0.2
         
         # Check if previous slide has concluding remarks
-        if type1 != 'section':
-            text1 = self._extract_slide_text(slide1)
-            if self._has_concluding_phrase(text1):
-                score += 0.2
+        if type1 != 'section' and summary1['concluding']:
+            score += 0.2
         
         # Check if new section has introduction
-        if type2 != 'section':
-            text2 = self._extract_slide_text(slide2)
-            intro_phrases = ['in this section', 'we will', 'let us', 'now we']
-            if any(phrase in text2.lower() for phrase in intro_phrases):
-                score += 0.1
+        if type2 != 'section' and summary2['introducing']:
+            score += 0.1
         
         return min(score, 1.0)
\ No newline at end of file
@@ -9,10 +9,11 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from app.domain.schemas.presentation import PresentationResponse, SlideResponse
 from app.domain.schemas.generation import Citation
-from .base import QualityChecker, QualityDimension, QualityIssue
+from .base import IncrementalQualityChecker, QualityDimension, QualityIssue
+from .text_index import TEXT, SlideText
 
 
-class VisualBalanceAssessor(QualityChecker):
+class VisualBalanceAssessor(IncrementalQualityChecker):
     """
     Assesses visual balance and design consistency across slides.
     """
@@ -62,10 +63,20 @@ class VisualBalanceAssessor(QualityChecker):
         """Weight of visual balance in overall quality."""
         return 1.0
     
-    def check(
+    def summarize_slide(self, slide: SlideResponse, text: SlideText) -> Dict[str, Any]:
+        """Summarize the elements, density and layout of a slide."""
+        elements = self._count_slide_elements(slide)
+        return {
+            'elements': elements,
+            'density': self._calculate_content_density(elements, text),
+            'layout': slide.content.get('layout', 'single') if slide.content else 'single',
+            'layout_type': slide.layout_type
+        }
+    
+    def check_summaries(
         self,
         presentation: PresentationResponse,
-        slides: List[SlideResponse],
+        summaries: List[Dict[str, Any]],
         references: Optional[List[Citation]] = None
     ) -> Tuple[float, List[QualityIssue], Dict[str, Any]]:
         """
@@ -79,25 +90,25 @@ class VisualBalanceAssessor(QualityChecker):
         
         # Check element distribution
         distribution_score, distribution_issues, distribution_metadata = (
-            self._check_element_distribution(slides)
+            self._check_element_distribution(summaries)
         )
         issues.extend(distribution_issues)
         metadata['element_distribution'] = distribution_metadata
         
         # Check content density
-        density_score, density_issues = self._check_content_density(slides)
+        density_score, density_issues = self._check_content_density(summaries)
         issues.extend(density_issues)
         
         # Check visual consistency
-        consistency_score, consistency_issues = self._check_visual_consistency(slides)
+        consistency_score, consistency_issues = self._check_visual_consistency(summaries)
         issues.extend(consistency_issues)
         
         # Check layout appropriateness
-        layout_score, layout_issues = self._check_layout_appropriateness(slides)
+        layout_score, layout_issues = self._check_layout_appropriateness(summaries)
         issues.extend(layout_issues)
         
         # Check text-visual balance
-        balance_score, balance_issues, balance_metadata = self._check_text_visual_balance(slides)
+        balance_score, balance_issues, balance_metadata = self._check_text_visual_balance(summaries)
         issues.extend(balance_issues)
         metadata['text_visual_balance'] = balance_metadata
         
@@ -117,7 +128,7 @@ class VisualBalanceAssessor(QualityChecker):
             'consistency_score': consistency_score,
             'layout_score': layout_score,
             'balance_score': balance_score,
-            'total_slides': len(slides)
+            'total_slides': len(summaries)
         })
         
         # Identify strengths
@@ -135,7 +146,7 @@ class VisualBalanceAssessor(QualityChecker):
     
     def _check_element_distribution(
         self,
-        slides: List[SlideResponse]
+        summaries: List[Dict[str, Any]]
     ) -> Tuple[float, List[QualityIssue], Dict[str, Any]]:
         """Check distribution of visual elements across slides."""
         issues = []
@@ -146,16 +157,13 @@ class VisualBalanceAssessor(QualityChecker):
             'element_counts': []
         }
         
-        element_counts = []
-        
-        for i, slide in enumerate(slides):
-            # Count elements on slide
-            element_count = self._count_slide_elements(slide)
-            element_counts.append(element_count)
-            metadata['element_counts'].append(element_count)
+        for i, summary in enumerate(summaries):
+            # Elements on slide, copied since summaries are shared
+            element_count = summary['elements']
+            metadata['element_counts'].append(dict(element_count))
             
             # Check for text-only slides
-            if element_count['visuals'] == 0 and i > 0 and i < len(slides) - 1:
+            if element_count['visuals'] == 0 and i > 0 and i < len(summaries) - 1:
                 metadata['slides_text_only'] += 1
                 if element_count['text'] > 3:
                     issues.append(QualityIssue(
@@ -191,7 +199,7 @@ class VisualBalanceAssessor(QualityChecker):
                 ))
         
         # Check overall distribution
-        visual_ratio = metadata['slides_with_visuals'] / len(slides) if slides else 0
+        visual_ratio = metadata['slides_with_visuals'] / len(summaries) if summaries else 0
         if visual_ratio < 0.3:
             issues.append(QualityIssue(
                 dimension=self.dimension,
@@ -204,24 +212,23 @@ class VisualBalanceAssessor(QualityChecker):
         score = 0.5  # Base score
         if visual_ratio >= 0.4:
             score += 0.2
-        if metadata['slides_overloaded'] < len(slides) * 0.1:
+        if metadata['slides_overloaded'] < len(summaries) * 0.1:
             score += 0.2
-        if metadata['slides_text_only'] < len(slides) * 0.3:
+        if metadata['slides_text_only'] < len(summaries) * 0.3:
             score += 0.1
         
         return score, issues, metadata
     
     def _check_content_density(
         self,
-        slides: List[SlideResponse]
+        summaries: List[Dict[str, Any]]
     ) -> Tuple[float, List[QualityIssue]]:
         """Check content density on slides."""
         issues = []
         density_scores = []
         
-        for i, slide in enumerate(slides):
-            # Calculate content density
-            density = self._calculate_content_density(slide)
+        for i, summary in enumerate(summaries):
+            density = summary['density']
             density_scores.append(density)
             
             # Check for overcrowded slides
@@ -233,7 +240,7 @@ class VisualBalanceAssessor(QualityChecker):
                     description="Slide appears overcrowded",
                     suggestion="Reduce content or use larger font sizes"
                 ))
-            elif density < 0.3 and slide.layout_type == 'content':
+            elif density < 0.3 and summary['layout_type'] == 'content':
                 issues.append(QualityIssue(
                     dimension=self.dimension,
                     severity="minor",
@@ -264,16 +271,13 @@ class VisualBalanceAssessor(QualityChecker):
     
     def _check_visual_consistency(
         self,
-        slides: List[SlideResponse]
+        summaries: List[Dict[str, Any]]
     ) -> Tuple[float, List[QualityIssue]]:
         """Check visual design consistency."""
         issues = []
         
         # Track layout usage
-        layout_counter = Counter()
-        for slide in slides:
-            layout = slide.content.get('layout', 'single') if slide.content else 'single'
-            layout_counter[layout] += 1
+        layout_counter = Counter(summary['layout'] for summary in summaries)
         
         # Check for too many different layouts
         if len(layout_counter) > 4:
@@ -284,16 +288,9 @@ class VisualBalanceAssessor(QualityChecker):
                 suggestion="Limit to 3-4 layout types for consistency"
             ))
         
-        # Check for consistent element positioning
-        title_positions = []
-        for slide in slides:
-            if slide.title and slide.content:
-                # Simple check - in real implementation would analyze actual positions
-                title_positions.append('top')  # Placeholder
-        
         # Check for orphaned layout types
         for layout, count in layout_counter.items():
-            if count == 1 and len(slides) > 5:
+            if count == 1 and len(summaries) > 5:
                 issues.append(QualityIssue(
                     dimension=self.dimension,
                     severity="minor",
@@ -303,22 +300,22 @@ class VisualBalanceAssessor(QualityChecker):
         
         # Calculate consistency score
         most_common_count = layout_counter.most_common(1)[0][1] if layout_counter else 0
-        consistency_ratio = most_common_count / len(slides) if slides else 0
+        consistency_ratio = most_common_count / len(summaries) if summaries else 0
         score = min(1.0, consistency_ratio * 1.5)  # Boost score for consistency
         
         return score, issues
     
     def _check_layout_appropriateness(
         self,
-        slides: List[SlideResponse]
+        summaries: List[Dict[str, Any]]
     ) -> Tuple[float, List[QualityIssue]]:
         """Check if layouts are appropriate for content."""
         issues = []
         appropriate_count = 0
         
-        for i, slide in enumerate(slides):
-            layout = slide.content.get('layout', 'single') if slide.content else 'single'
-            elements = self._count_slide_elements(slide)
+        for i, summary in enumerate(summaries):
+            layout = summary['layout']
+            elements = summary['elements']
             
             # Check layout-content match
             if layout in self.layout_patterns:
@@ -358,13 +355,13 @@ class VisualBalanceAssessor(QualityChecker):
                 appropriate_count += 1
         
         # Calculate score
-        score = appropriate_count / len(slides) if slides else 0.5
+        score = appropriate_count / len(summaries) if summaries else 0.5
         
         return score, issues
     
     def _check_text_visual_balance(
         self,
-        slides: List[SlideResponse]
+        summaries: List[Dict[str, Any]]
     ) -> Tuple[float, List[QualityIssue], Dict[str, Any]]:
         """Check balance between text and visual content."""
         issues = []
@@ -376,9 +373,9 @@ class VisualBalanceAssessor(QualityChecker):
         
         text_ratios = []
         
-        for i, slide in enumerate(slides):
+        for i, summary in enumerate(summaries):
             # Calculate text-to-visual ratio
-            elements = self._count_slide_elements(slide)
+            elements = summary['elements']
             total_content = elements['text'] + elements['bullets'] + elements['visuals']
             
             if total_content > 0:
@@ -388,7 +385,7 @@ class VisualBalanceAssessor(QualityChecker):
                 # Check for imbalance
                 if text_ratio > 0.85:
                     metadata['slides_text_heavy'] += 1
-                    if slide.layout_type != 'title':
+                    if summary['layout_type'] != 'title':
                         issues.append(QualityIssue(
                             dimension=self.dimension,
                             severity="minor",
@@ -456,27 +453,20 @@ class VisualBalanceAssessor(QualityChecker):
         
         return counts
     
-    def _calculate_content_density(self, slide: SlideResponse) -> float:
-        """Calculate content density (0-1) for a slide."""
+    def _calculate_content_density(self, elements: Dict[str, int], text: SlideText) -> float:
+        """Calculate content density (0-1) for a slide from its element counts."""
         density = 0.0
         
-        # Count all elements
-        elements = self._count_slide_elements(slide)
         total_elements = sum(elements.values())
         
         # Base density on element count
         density += min(total_elements / 8, 1.0) * 0.4
         
         # Factor in text length
-        if slide.content:
-            text_length = 0
-            if 'body' in slide.content:
-                for item in slide.content['body']:
-                    if item.get('type') == 'text':
-                        text_length += len(item.get('content', ''))
-            
-            # Assume ~150 chars per "unit" of space
-            density += min(text_length / 600, 1.0) * 0.3
+        text_length = sum(len(part) for part in text.text_parts((TEXT,)))
+        
+        # Assume ~150 chars per "unit" of space
+        density += min(text_length / 600, 1.0) * 0.3
         
         # Factor in special content
         if elements['equations'] > 0:
@@ -11,14 +11,18 @@ Provides comprehensive validation for academic presentations including:
 # Base classes and types
 from app.services.slides.rules.base import (
     Rule,
+    FeatureRule,
     CompositeRule,
     RuleEngine,
+    RulePlan,
     RuleCategory,
     RuleSeverity,
     RuleContext,
     RuleViolation,
     get_rule_engine
 )
+from app.services.slides.rules.features import SlideFeatures, TextEntry
+from app.services.slides.rules.incremental import IncrementalValidator, content_fingerprint
 
 # Specific rule implementations
 from app.services.slides.rules.text_rules import (
@@ -74,13 +78,19 @@ from app.services.slides.rules.validators import (
 __all__ = [
     # Base classes
     "Rule",
+    "FeatureRule",
     "CompositeRule",
     "RuleEngine",
+    "RulePlan",
     "RuleCategory",
     "RuleSeverity",
     "RuleContext",
     "RuleViolation",
     "get_rule_engine",
+    "SlideFeatures",
+    "TextEntry",
+    "IncrementalValidator",
+    "content_fingerprint",
     
     # Text rules
     "BulletPointCountRule",
@@ -2,9 +2,10 @@
 Academic tone and citation rules for ensuring scholarly quality.
 """
 import re
-from typing import Any, Dict, List, Set
+from typing import Any, List, Set
 
 from app.services.slides.rules.base import (
+    FeatureRule,
     Rule,
     RuleCategory,
     RuleContext,
@@ -12,9 +13,10 @@ from app.services.slides.rules.base import (
     RuleViolation,
     get_rule_engine
 )
+from app.services.slides.rules.features import SlideFeatures, compile_all
 
 
-class AcademicToneRule(Rule):
+class AcademicToneRule(FeatureRule):
     """Ensures content maintains academic tone and avoids informal language."""
     
     def __init__(self):
@@ -97,63 +99,49 @@ class AcademicToneRule(Rule):
             "a number of", "a variety of", "a range of"
         }
     
-    def validate(self, content: Any, context: RuleContext) -> List[RuleViolation]:
+    def validate_features(self, features: SlideFeatures, context: RuleContext) -> List[RuleViolation]:
         violations = []
         
-        if isinstance(content, dict) and "content" in content:
-            slide_content = content.get("content", {})
-            slide_num = content.get("slide_number")
-            
-            # Check all text elements
-            texts_to_check = []
-            
-            # Title and subtitle
-            if "title" in slide_content:
-                texts_to_check.append(("title", slide_content["title"]))
-            if "subtitle" in slide_content:
-                texts_to_check.append(("subtitle", slide_content["subtitle"]))
+        if features.is_slide:
+            slide_num = features.slide_number
+            # Only phrases somewhere on the slide need checking per entry
+            slide_text = features.entries_lower
+            informal_on_slide = [
+                (informal, formal)
+                for informal, formal in self.informal_phrases.items()
+                if informal in slide_text
+            ]
             
-            # Body elements
-            for idx, element in enumerate(slide_content.get("body", [])):
-                if element.get("type") == "text":
-                    texts_to_check.append((f"text_{idx}", element.get("content", "")))
-                elif element.get("type") == "bullet_list":
-                    for bullet_idx, item in enumerate(element.get("items", [])):
-                        texts_to_check.append(
-                            (f"bullet_{idx}_{bullet_idx}", item.get("text", ""))
-                        )
-            
-            # Check each text
-            for location, text in texts_to_check:
-                text_lower = text.lower()
+            # Check title, subtitle, text elements and bullet points
+            for entry in features.entries:
+                text_lower = entry.lower
                 
                 # Check for informal phrases
-                for informal, formal in self.informal_phrases.items():
+                for informal, formal in informal_on_slide:
                     if informal in text_lower:
                         violations.append(self.create_violation(
                             message=f"Informal phrase '{informal}' detected",
                             suggestion=f"Consider using '{formal}' instead",
-                            context={"phrase": informal, "suggestion": formal, "text": text},
-                            location={"slide_number": slide_num, "element": location}
+                            context={"phrase": informal, "suggestion": formal, "text": entry.text},
+                            location={"slide_number": slide_num, "element": entry.location}
                         ))
                 
                 # Check for first-person pronouns (warning for certain presentation types)
                 if context.presentation_type in ["conference", "defense"]:
-                    words = set(text_lower.split())
-                    used_pronouns = words.intersection(self.first_person_pronouns)
+                    used_pronouns = entry.lower_words.intersection(self.first_person_pronouns)
                     if used_pronouns:
                         violations.append(self.create_violation(
                             message=f"First-person pronoun(s) detected: {', '.join(used_pronouns)}",
                             suggestion="Consider using passive voice or third-person perspective",
                             context={"pronouns": list(used_pronouns)},
-                            location={"slide_number": slide_num, "element": location},
+                            location={"slide_number": slide_num, "element": entry.location},
                             severity=RuleSeverity.INFO
                         ))
         
         return violations
 
 
-class CitationPresenceRule(Rule):
+class CitationPresenceRule(FeatureRule):
     """Ensures slides with claims have proper citations."""
     
     def __init__(self):
@@ -199,61 +187,60 @@ class CitationPresenceRule(Rule):
     
     def _needs_citation(self, text: str) -> bool:
         """Check if text contains claims that need citations."""
-        text_lower = text.lower()
-        for pattern in self.citation_triggers:
-            if re.search(pattern, text_lower):
+        return self._needs_citation_lower(text.lower())
+    
+    def _needs_citation_lower(self, text_lower: str) -> bool:
+        for pattern in compile_all(tuple(self.citation_triggers)):
+            if pattern.search(text_lower):
                 return True
         return False
     
     def _has_citation(self, text: str) -> bool:
         """Check if text contains a citation."""
-        for pattern in self.citation_patterns:
-            if re.search(pattern, text):
+        for pattern in compile_all(tuple(self.citation_patterns)):
+            if pattern.search(text):
                 return True
         return False
     
-    def validate(self, content: Any, context: RuleContext) -> List[RuleViolation]:
+    def validate_features(self, features: SlideFeatures, context: RuleContext) -> List[RuleViolation]:
         violations = []
         
         # Skip citation checks for certain presentation types
         if context.presentation_type in ["lecture", "workshop"]:
             return violations
         
-        if isinstance(content, dict) and "content" in content:
-            slide_content = content.get("content", {})
-            slide_num = content.get("slide_number")
+        if features.is_slide:
+            slide_num = features.slide_number
             
             # Check body elements
-            for idx, element in enumerate(slide_content.get("body", [])):
-                if element.get("type") == "text":
-                    text = element.get("content", "")
-                    if self._needs_citation(text) and not self._has_citation(text):
-                        violations.append(self.create_violation(
-                            message="Statement appears to need citation",
-                            suggestion="Add appropriate citation for the claim or data presented",
-                            context={"text": text[:100] + "..." if len(text) > 100 else text},
-                            location={"slide_number": slide_num, "element_index": idx}
-                        ))
+            for entry in features.body_entries:
+                text = entry.text
+                if not self._needs_citation_lower(entry.lower) or self._has_citation(text):
+                    continue
                 
-                elif element.get("type") == "bullet_list":
-                    for bullet_idx, item in enumerate(element.get("items", [])):
-                        text = item.get("text", "")
-                        if self._needs_citation(text) and not self._has_citation(text):
-                            violations.append(self.create_violation(
-                                message="Bullet point appears to need citation",
-                                suggestion="Add citation for the claim or data",
-                                context={"text": text},
-                                location={
-                                    "slide_number": slide_num,
-                                    "element_index": idx,
-                                    "bullet_index": bullet_idx
-                                }
-                            ))
+                if entry.kind == "text":
+                    violations.append(self.create_violation(
+                        message="Statement appears to need citation",
+                        suggestion="Add appropriate citation for the claim or data presented",
+                        context={"text": text[:100] + "..." if len(text) > 100 else text},
+                        location={"slide_number": slide_num, "element_index": entry.element_index}
+                    ))
+                else:
+                    violations.append(self.create_violation(
+                        message="Bullet point appears to need citation",
+                        suggestion="Add citation for the claim or data",
+                        context={"text": text},
+                        location={
+                            "slide_number": slide_num,
+                            "element_index": entry.element_index,
+                            "bullet_index": entry.bullet_index
+                        }
+                    ))
         
         return violations
 
 
-class CitationFormatRule(Rule):
+class CitationFormatRule(FeatureRule):
     """Validates citation format consistency."""
     
     def __init__(self, preferred_style: str = "APA"):
@@ -276,12 +263,11 @@ class CitationFormatRule(Rule):
             "Vancouver": r'\(\d+\)'
         }
     
-    def validate(self, content: Any, context: RuleContext) -> List[RuleViolation]:
+    def validate_features(self, features: SlideFeatures, context: RuleContext) -> List[RuleViolation]:
         violations = []
         
-        if isinstance(content, dict) and "content" in content:
-            slide_content = content.get("content", {})
-            all_text = self._extract_all_text(slide_content)
+        if features.is_slide:
+            all_text = features.body_text
             
             # Find all citations
             found_styles = {}
@@ -297,7 +283,7 @@ class CitationFormatRule(Rule):
                     message=f"Mixed citation styles detected: {', '.join(styles_used)}",
                     suggestion=f"Use consistent {self.preferred_style} citation format throughout",
                     context={"styles_found": found_styles},
-                    location={"slide_number": content.get("slide_number")}
+                    location={"slide_number": features.slide_number}
                 ))
             
             # Check if non-preferred style is used
@@ -307,27 +293,14 @@ class CitationFormatRule(Rule):
                     message=f"Using {used_style} style instead of preferred {self.preferred_style}",
                     suggestion=f"Convert citations to {self.preferred_style} format",
                     context={"current_style": used_style},
-                    location={"slide_number": content.get("slide_number")},
+                    location={"slide_number": features.slide_number},
                     severity=RuleSeverity.INFO
                 ))
         
         return violations
-    
-    def _extract_all_text(self, content: Dict[str, Any]) -> str:
-        """Extract all text from slide content."""
-        texts = []
-        
-        for element in content.get("body", []):
-            if element.get("type") == "text":
-                texts.append(element.get("content", ""))
-            elif element.get("type") == "bullet_list":
-                for item in element.get("items", []):
-                    texts.append(item.get("text", ""))
-        
-        return " ".join(texts)
 
 
-class AcademicVocabularyRule(Rule):
+class AcademicVocabularyRule(FeatureRule):
     """Ensures appropriate academic vocabulary level."""
     
     def __init__(self):
@@ -354,25 +327,23 @@ class AcademicVocabularyRule(Rule):
             "demonstrably", "empirically", "theoretically", "conceptually"
         }
     
-    def validate(self, content: Any, context: RuleContext) -> List[RuleViolation]:
+    def validate_features(self, features: SlideFeatures, context: RuleContext) -> List[RuleViolation]:
         violations = []
         
         # Only check for higher academic levels
         if context.academic_level not in ["graduate", "research", "professional"]:
             return violations
         
-        if isinstance(content, dict) and "content" in content:
-            slide_content = content.get("content", {})
-            all_text = self._extract_all_text(slide_content).lower()
-            words = set(all_text.split())
+        if features.is_slide:
+            words = features.all_lower_words
             
             # Check for academic transition usage
             transitions_used = words.intersection(self.academic_transitions)
-            if not transitions_used and len(all_text.split()) > 50:
+            if not transitions_used and features.word_count() > 50:
                 violations.append(self.create_violation(
                     message="Consider using academic transition words for better flow",
                     suggestion=f"Add transitions like: {', '.join(list(self.academic_transitions)[:5])}",
-                    location={"slide_number": content.get("slide_number")},
+                    location={"slide_number": features.slide_number},
                     severity=RuleSeverity.INFO
                 ))
             
@@ -384,27 +355,11 @@ class AcademicVocabularyRule(Rule):
                     message=f"Vague intensifiers found: {', '.join(vague_found)}",
                     suggestion="Use more precise academic language",
                     context={"vague_words": vague_found},
-                    location={"slide_number": content.get("slide_number")},
+                    location={"slide_number": features.slide_number},
                     severity=RuleSeverity.INFO
                 ))
         
         return violations
-    
-    def _extract_all_text(self, content: Dict[str, Any]) -> str:
-        """Extract all text from slide content."""
-        texts = []
-        
-        texts.append(content.get("title", ""))
-        texts.append(content.get("subtitle", ""))
-        
-        for element in content.get("body", []):
-            if element.get("type") == "text":
-                texts.append(element.get("content", ""))
-            elif element.get("type") == "bullet_list":
-                for item in element.get("items", []):
-                    texts.append(item.get("text", ""))
-        
-        return " ".join(texts)
 
 
 class ReferencesSlideRule(Rule):
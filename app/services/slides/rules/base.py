@@ -4,7 +4,9 @@ Base rule class and engine for content validation.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Type, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union
+
+from app.services.slides.rules.features import SlideFeatures
 
 
 class RuleSeverity(Enum):
@@ -82,10 +84,24 @@ class Rule(ABC):
         """
         pass
     
+    def validate_features(self, features: SlideFeatures, context: RuleContext) -> List[RuleViolation]:
+        """
+        Validate content whose features were already extracted.
+        
+        The engine extracts features once per slide and passes the same
+        record to every rule. Override to use them instead of walking
+        features.content again.
+        """
+        return self.validate(features.content, context)
+    
     def is_applicable(self, context: RuleContext) -> bool:
         """
         Check if this rule applies to the given context.
         Override to add custom applicability logic.
+        
+        The engine caches the result per presentation type, academic level,
+        duration and slide count; checks on the current slide belong in
+        validate.
         """
         return self.enabled
     
@@ -108,6 +124,18 @@ class Rule(ABC):
         )
 
 
+class FeatureRule(Rule):
+    """Rule that validates from extracted slide features."""
+    
+    def validate(self, content: Any, context: RuleContext) -> List[RuleViolation]:
+        """Extract features of content and validate them."""
+        return self.validate_features(SlideFeatures(content), context)
+    
+    @abstractmethod
+    def validate_features(self, features: SlideFeatures, context: RuleContext) -> List[RuleViolation]:
+        pass
+
+
 class CompositeRule(Rule):
     """Rule that combines multiple sub-rules."""
     
@@ -127,19 +155,31 @@ class CompositeRule(Rule):
     
     def validate(self, content: Any, context: RuleContext) -> List[RuleViolation]:
         """Validate using all sub-rules."""
+        return self.validate_features(SlideFeatures(content), context)
+    
+    def validate_features(self, features: SlideFeatures, context: RuleContext) -> List[RuleViolation]:
+        """Validate using all sub-rules, sharing the extracted features."""
         violations = []
         for rule in self.sub_rules:
             if rule.is_applicable(context):
-                violations.extend(rule.validate(content, context))
+                violations.extend(rule.validate_features(features, context))
         return violations
 
 
+@dataclass(frozen=True)
+class RulePlan:
+    """Applicable rules resolved once for a context signature."""
+    signature: Tuple[Any, ...]
+    rules: Tuple[Rule, ...]
+
+
 class RuleEngine:
     """Engine for managing and executing content rules."""
     
     def __init__(self):
         self.rules: Dict[str, Rule] = {}
         self.rule_sets: Dict[str, Set[str]] = {}
+        self._plans: Dict[Tuple[Any, ...], RulePlan] = {}
         self._initialize_default_rule_sets()
     
     def _initialize_default_rule_sets(self):
@@ -156,6 +196,7 @@ class RuleEngine:
     def register_rule(self, rule: Rule, rule_sets: Optional[List[str]] = None):
         """Register a rule with the engine."""
         self.rules[rule.rule_id] = rule
+        self._plans.clear()
         
         # Add to specified rule sets or default
         if rule_sets:
@@ -169,27 +210,54 @@ class RuleEngine:
         """Remove a rule from the engine."""
         if rule_id in self.rules:
             del self.rules[rule_id]
+            self._plans.clear()
             # Remove from all rule sets
             for rule_set in self.rule_sets.values():
                 rule_set.discard(rule_id)
     
     def get_rules_for_context(self, context: RuleContext) -> List[Rule]:
         """Get applicable rules for the given context."""
+        return list(self.compile_plan(context).rules)
+    
+    def compile_plan(self, context: RuleContext) -> RulePlan:
+        """
+        Resolve the applicable rules for a context, once per signature.
+        
+        The signature is the rule set, presentation type, academic level,
+        duration, slide count and the enabled flags of the candidate rules,
+        so enabling or disabling a rule takes effect on the next call.
+        
+        Args:
+            context: Validation context
+            
+        Returns:
+            Cached plan for the context's signature
+        """
         # Get rules from appropriate rule set
         rule_set_name = context.presentation_type.lower()
         if rule_set_name not in self.rule_sets:
             rule_set_name = "default"
         
         rule_ids = self.rule_sets[rule_set_name] | self.rule_sets["default"]
+        candidates = [self.rules[rule_id] for rule_id in rule_ids if rule_id in self.rules]
         
-        # Filter by applicability
-        applicable_rules = []
-        for rule_id in rule_ids:
-            rule = self.rules.get(rule_id)
-            if rule and rule.is_applicable(context):
-                applicable_rules.append(rule)
-        
-        return applicable_rules
+        signature = (
+            rule_set_name,
+            context.presentation_type,
+            context.academic_level,
+            context.duration_minutes,
+            context.slide_count,
+            tuple((rule.rule_id, rule.enabled) for rule in candidates)
+        )
+        plan = self._plans.get(signature)
+        if plan is None:
+            # Filter by applicability
+            plan = RulePlan(
+                signature=signature,
+                rules=tuple(rule for rule in candidates if rule.is_applicable(context))
+            )
+            self._plans[signature] = plan
+        return plan
     
     def validate_content(
         self,
@@ -207,19 +275,45 @@ class RuleEngine:
             categories: Only validate rules in these categories (None = all)
             stop_on_error: Stop validation on first ERROR severity violation
             
+        Returns:
+            Dictionary with validation results
+        """
+        return self.run_plan(self.compile_plan(context), SlideFeatures(content), context, categories, stop_on_error)
+    
+    def run_plan(
+        self,
+        plan: RulePlan,
+        features: SlideFeatures,
+        context: RuleContext,
+        categories: Optional[List[RuleCategory]] = None,
+        stop_on_error: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Validate content against a compiled plan.
+        
+        All rules share one features record, so the content is traversed
+        once however many rules run.
+        
+        Args:
+            plan: Plan from compile_plan
+            features: Features of the content to validate
+            context: Validation context
+            categories: Only validate rules in these categories (None = all)
+            stop_on_error: Stop validation on first ERROR severity violation
+            
         Returns:
             Dictionary with validation results
         """
         violations = []
         rules_checked = 0
         
-        for rule in self.get_rules_for_context(context):
+        for rule in plan.rules:
             # Filter by category if specified
             if categories and rule.category not in categories:
                 continue
             
             rules_checked += 1
-            rule_violations = rule.validate(content, context)
+            rule_violations = rule.validate_features(features, context)
             violations.extend(rule_violations)
             
             # Stop if we hit an error and stop_on_error is True
@@ -259,9 +353,15 @@ class RuleEngine:
             "total_violations": 0
         }
         
+        # Resolve the rules once for the deck; slide features are shared
+        # by presentation-level and slide-level rules
+        plan = self.compile_plan(context)
+        features = SlideFeatures(presentation)
+        
         # Validate presentation-level rules
-        pres_result = self.validate_content(
-            presentation,
+        pres_result = self.run_plan(
+            plan,
+            features,
             context,
             categories=[RuleCategory.STRUCTURE, RuleCategory.TIMING]
         )
@@ -269,11 +369,12 @@ class RuleEngine:
         results["presentation_valid"] = pres_result["valid"]
         
         # Validate each slide
-        for slide in presentation.get("slides", []):
+        for slide_features in features.slides:
+            slide = slide_features.content
             slide_num = slide.get("slide_number", 0)
             context.current_slide = slide
             
-            slide_result = self.validate_content(slide, context)
+            slide_result = self.run_plan(plan, slide_features, context)
             results["slide_results"][slide_num] = slide_result
             
             if not slide_result["valid"]:
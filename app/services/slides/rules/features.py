@@ -0,0 +1,236 @@
+"""
+Text features of slide content, extracted once and shared by rules.
+
+Most slide rules walk the same body elements and split, lowercase and
+scan the same strings. SlideFeatures walks the content once and computes
+each feature (words, sentences, syllables, citations) on first use, so
+every rule run against the same record reuses the work.
+"""
+import functools
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Set, Tuple
+
+# Author-year citations, left out of bullet word counts
+CITATION_PATTERNS = (
+    re.compile(r'\([^)]*\d{4}[^)]*\)'),
+    re.compile(r'\[[^\]]*\d{4}[^\]]*\]'),
+)
+SENTENCE_BOUNDARY = re.compile(r'[.!?]+')
+VOWEL_GROUP = re.compile(r'[aeiouy]+')
+
+
+@functools.lru_cache(maxsize=256)
+def compile_all(patterns: Tuple[str, ...]) -> Tuple[Pattern[str], ...]:
+    """
+    Compile regular expressions once per distinct tuple of patterns.
+
+    Args:
+        patterns: Regular expressions
+
+    Returns:
+        Compiled patterns, in order
+    """
+    return tuple(re.compile(pattern) for pattern in patterns)
+
+
+class cached_feature:
+    """
+    Compute an attribute on first access and store it on the instance.
+
+    Like functools.cached_property without its per-instance lock, which
+    costs more than most features here take to compute.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = instance.__dict__[self.name] = self.func(instance)
+        return value
+
+
+@functools.lru_cache(maxsize=65536)
+def count_syllables(word: str) -> int:
+    """Count syllables in a word (simplified): vowel groups less a silent e."""
+    word = word.lower()
+    syllables = len(VOWEL_GROUP.findall(word))
+    if word.endswith('e'):
+        syllables -= 1
+    return max(1, syllables)
+
+
+def flesch_kincaid_grade(text: str) -> float:
+    """Calculate the Flesch-Kincaid Grade Level of text."""
+    sentences = [s for s in SENTENCE_BOUNDARY.split(text) if s.strip()]
+    if not sentences:
+        return 0.0
+
+    words = text.split()
+    syllables = sum(count_syllables(word) for word in words)
+    score = 0.39 * (len(words) / len(sentences)) + 11.8 * (syllables / len(words)) - 15.59
+    return max(0.0, score)
+
+
+@dataclass
+class TextEntry:
+    """One piece of slide text: a heading, text element or bullet point."""
+    location: str  # title, subtitle, text_<element>, bullet_<element>_<bullet>
+    kind: str      # title, subtitle, text or bullet
+    text: str
+    element_index: Optional[int] = None
+    bullet_index: Optional[int] = None
+
+    @cached_feature
+    def lower(self) -> str:
+        return self.text.lower()
+
+    @cached_feature
+    def word_count(self) -> int:
+        return len(self.text.split())
+
+    @cached_feature
+    def lower_words(self) -> Set[str]:
+        return set(self.lower.split())
+
+    @cached_feature
+    def citation_free_word_count(self) -> int:
+        text = self.text
+        for pattern in CITATION_PATTERNS:
+            text = pattern.sub('', text)
+        return len(text.split())
+
+
+class SlideFeatures:
+    """
+    Lazily extracted text features of one piece of content.
+
+    Content that is not a slide yields empty text features; rules still
+    reach it through content, and a presentation's slides through slides.
+    """
+
+    def __init__(self, content: Any, slides: Optional[List["SlideFeatures"]] = None):
+        """
+        Initialize features.
+
+        Args:
+            content: Slide, presentation or other content
+            slides: Features of a presentation's slides, when already extracted
+        """
+        self.content = content
+        self.is_slide = isinstance(content, dict) and "content" in content
+        self.slide_content: Dict[str, Any] = content.get("content", {}) if isinstance(content, dict) else {}
+        if slides is not None:
+            self.slides = slides
+
+    @property
+    def slide_number(self) -> Optional[int]:
+        return self.content.get("slide_number") if isinstance(self.content, dict) else None
+
+    @property
+    def title(self) -> str:
+        return self.slide_content.get("title", "")
+
+    @property
+    def subtitle(self) -> str:
+        return self.slide_content.get("subtitle", "")
+
+    @property
+    def body(self) -> List[Dict[str, Any]]:
+        return self.slide_content.get("body", [])
+
+    @cached_feature
+    def slides(self) -> List["SlideFeatures"]:
+        """Features of each slide of a presentation, in order."""
+        slides = self.content.get("slides", []) if isinstance(self.content, dict) else []
+        return [SlideFeatures(slide) for slide in slides]
+
+    @cached_feature
+    def body_entries(self) -> List[TextEntry]:
+        """Text elements and bullet points, in slide order."""
+        entries = []
+        for idx, element in enumerate(self.body):
+            if element.get("type") == "text":
+                entries.append(TextEntry(f"text_{idx}", "text", element.get("content", ""), idx))
+            elif element.get("type") == "bullet_list":
+                for bullet_idx, item in enumerate(element.get("items", [])):
+                    entries.append(TextEntry(
+                        f"bullet_{idx}_{bullet_idx}", "bullet", item.get("text", ""), idx, bullet_idx
+                    ))
+        return entries
+
+    @cached_feature
+    def entries(self) -> List[TextEntry]:
+        """Title and subtitle, where set, followed by the body entries."""
+        headings = [
+            TextEntry(key, key, self.slide_content[key])
+            for key in ("title", "subtitle")
+            if key in self.slide_content
+        ]
+        return headings + self.body_entries
+
+    @cached_feature
+    def entries_lower(self) -> str:
+        """Lowercased entries, one per line, to test for phrases in one pass."""
+        return "\n".join(entry.lower for entry in self.entries)
+
+    @cached_feature
+    def bullet_count(self) -> int:
+        return sum(1 for entry in self.body_entries if entry.kind == "bullet")
+
+    @cached_feature
+    def caption_words(self) -> Dict[str, int]:
+        """Caption words by element type, for elements other than text."""
+        counts: Dict[str, int] = {}
+        for element in self.body:
+            element_type = element.get("type")
+            if element_type not in ("text", "bullet_list"):
+                counts[element_type] = counts.get(element_type, 0) + len(element.get("caption", "").split())
+        return counts
+
+    @cached_feature
+    def heading_and_body_words(self) -> int:
+        return (
+            len(self.title.split())
+            + len(self.subtitle.split())
+            + sum(entry.word_count for entry in self.body_entries)
+        )
+
+    def word_count(self, caption_types: Iterable[str] = ()) -> int:
+        """
+        Count words of headings and body text.
+
+        Args:
+            caption_types: Element types whose captions are counted too
+
+        Returns:
+            Word count
+        """
+        return self.heading_and_body_words + sum(
+            self.caption_words.get(element_type, 0) for element_type in caption_types
+        )
+
+    @cached_feature
+    def body_text(self) -> str:
+        return " ".join(entry.text for entry in self.body_entries)
+
+    @cached_feature
+    def all_text(self) -> str:
+        return " ".join([self.title, self.subtitle] + [entry.text for entry in self.body_entries])
+
+    @cached_feature
+    def all_text_lower(self) -> str:
+        return self.all_text.lower()
+
+    @cached_feature
+    def all_lower_words(self) -> Set[str]:
+        return set(self.all_text_lower.split())
+
+    @cached_feature
+    def readability_grade(self) -> float:
+        """Flesch-Kincaid Grade Level of the body text."""
+        return flesch_kincaid_grade(self.body_text)
@@ -0,0 +1,187 @@
+"""
+Incremental validation of edited presentations.
+
+Slide-level results depend only on the compiled plan and the slide, so
+they are cached by the plan signature and a fingerprint of the slide's
+content. Presentation-level rules read every slide; they are rerun over
+the cached features of each slide, which keep the text already extracted
+from unchanged slides, and their results are reused while no slide or
+presentation field changed. After a one-slide edit, only that slide is
+extracted and validated again.
+"""
+import copy
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.services.slides.rules.base import (
+    RuleCategory,
+    RuleContext,
+    RuleEngine,
+    RulePlan,
+    get_rule_engine
+)
+from app.services.slides.rules.features import SlideFeatures
+
+# Categories validated against the whole presentation, as in
+# RuleEngine.validate_presentation
+PRESENTATION_CATEGORIES = [RuleCategory.STRUCTURE, RuleCategory.TIMING]
+
+
+def content_fingerprint(content: Any) -> str:
+    """Fingerprint JSON-like content independent of dict key order."""
+    encoded = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@dataclass
+class ValidatedSlide:
+    """Features and plan results of one slide."""
+    features: SlideFeatures
+    result: Dict[str, Any]
+
+
+@dataclass
+class IncrementalStats:
+    """Counters of validation work done and reused."""
+    slides_validated: int = 0
+    slides_reused: int = 0
+    presentations_validated: int = 0
+    presentations_reused: int = 0
+
+
+class IncrementalValidator:
+    """
+    Validates presentations, revalidating only what changed since earlier runs.
+    
+    Results have the shape of RuleEngine.validate_presentation. They are
+    shared with later runs and must not be modified.
+    """
+    
+    def __init__(
+        self,
+        engine: Optional[RuleEngine] = None,
+        max_slides: int = 4096,
+        max_presentations: int = 256
+    ):
+        """
+        Initialize validator.
+        
+        Args:
+            engine: Rule engine, the shared one by default
+            max_slides: Slide results kept
+            max_presentations: Presentation-level results kept
+        """
+        self.engine = engine or get_rule_engine()
+        self.max_slides = max_slides
+        self.max_presentations = max_presentations
+        
+        self._slides: OrderedDict[Tuple[Any, str], ValidatedSlide] = OrderedDict()
+        self._presentations: OrderedDict[Tuple[Any, str], Dict[str, Any]] = OrderedDict()
+        self.stats = IncrementalStats()
+    
+    def validate_presentation(
+        self,
+        presentation: Dict[str, Any],
+        context: RuleContext
+    ) -> Dict[str, Any]:
+        """
+        Validate an entire presentation.
+        
+        Args:
+            presentation: Presentation data with slides
+            context: Validation context
+        
+        Returns:
+            Dictionary with validation results
+        """
+        plan = self.engine.compile_plan(context)
+        
+        slide_data = presentation.get("slides", [])
+        fingerprints = [content_fingerprint(slide) for slide in slide_data]
+        slides = [
+            self._validate_slide(plan, slide, fingerprint, context)
+            for slide, fingerprint in zip(slide_data, fingerprints)
+        ]
+        pres_result = self._validate_presentation_rules(plan, presentation, slides, fingerprints, context)
+        
+        results = {
+            "presentation_valid": pres_result["valid"],
+            "slide_results": {},
+            "presentation_violations": pres_result["violations"],
+            "total_violations": 0
+        }
+        
+        for validated in slides:
+            slide_result = validated.result
+            results["slide_results"][validated.features.content.get("slide_number", 0)] = slide_result
+            
+            if not slide_result["valid"]:
+                results["presentation_valid"] = False
+            
+            results["total_violations"] += slide_result["summary"]["total_violations"]
+        
+        return results
+    
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._slides.clear()
+        self._presentations.clear()
+    
+    def _validate_slide(
+        self,
+        plan: RulePlan,
+        slide: Dict[str, Any],
+        fingerprint: str,
+        context: RuleContext
+    ) -> ValidatedSlide:
+        """Validate a slide unless a slide with the same content was validated."""
+        key = (plan.signature, fingerprint)
+        validated = self._slides.get(key)
+        if validated is not None:
+            self._slides.move_to_end(key)
+            self.stats.slides_reused += 1
+            return validated
+        
+        # Features keep reading their content lazily, so they get a copy
+        # the caller cannot change under the cache
+        features = SlideFeatures(copy.deepcopy(slide))
+        context.current_slide = slide
+        validated = ValidatedSlide(features, self.engine.run_plan(plan, features, context))
+        self.stats.slides_validated += 1
+        
+        self._slides[key] = validated
+        if len(self._slides) > self.max_slides:
+            self._slides.popitem(last=False)
+        return validated
+    
+    def _validate_presentation_rules(
+        self,
+        plan: RulePlan,
+        presentation: Dict[str, Any],
+        slides: List[ValidatedSlide],
+        fingerprints: List[str],
+        context: RuleContext
+    ) -> Dict[str, Any]:
+        """Run presentation-level rules unless the presentation is unchanged."""
+        fields = {name: value for name, value in presentation.items() if name != "slides"}
+        key = (plan.signature, content_fingerprint([fields, fingerprints]))
+        result = self._presentations.get(key)
+        if result is not None:
+            self._presentations.move_to_end(key)
+            self.stats.presentations_reused += 1
+            return result
+        
+        features = SlideFeatures(
+            {**fields, "slides": [validated.features.content for validated in slides]},
+            slides=[validated.features for validated in slides]
+        )
+        result = self.engine.run_plan(plan, features, context, categories=PRESENTATION_CATEGORIES)
+        self.stats.presentations_validated += 1
+        
+        self._presentations[key] = result
+        if len(self._presentations) > self.max_presentations:
+            self._presentations.popitem(last=False)
+        return result
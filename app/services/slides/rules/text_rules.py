@@ -1,10 +1,10 @@
 """
 Text constraint rules for slide content validation.
 """
-import re
-from typing import Any, Dict, List, Optional
+from typing import Any, List, Optional
 
 from app.services.slides.rules.base import (
+    FeatureRule,
     Rule,
     RuleCategory,
     RuleContext,
@@ -12,9 +12,15 @@ from app.services.slides.rules.base import (
     RuleViolation,
     get_rule_engine
 )
+from app.services.slides.rules.features import (
+    SlideFeatures,
+    TextEntry,
+    count_syllables,
+    flesch_kincaid_grade
+)
 
 
-class BulletPointCountRule(Rule):
+class BulletPointCountRule(FeatureRule):
     """Ensures slides don't exceed maximum bullet points."""
     
     def __init__(self, max_bullets: int = 5):
@@ -28,30 +34,24 @@ class BulletPointCountRule(Rule):
         )
         self.max_bullets = max_bullets
     
-    def validate(self, content: Any, context: RuleContext) -> List[RuleViolation]:
+    def validate_features(self, features: SlideFeatures, context: RuleContext) -> List[RuleViolation]:
         violations = []
         
-        if isinstance(content, dict) and "content" in content:
-            # Count bullet points in slide content
-            bullet_count = 0
-            slide_content = content.get("content", {})
-            
-            for element in slide_content.get("body", []):
-                if element.get("type") == "bullet_list":
-                    bullet_count += len(element.get("items", []))
+        if features.is_slide:
+            bullet_count = features.bullet_count
             
             if bullet_count > self.max_bullets:
                 violations.append(self.create_violation(
                     message=f"Slide has {bullet_count} bullet points, exceeding the limit of {self.max_bullets}",
                     suggestion=f"Consider splitting content across multiple slides or consolidating points",
                     context={"bullet_count": bullet_count, "limit": self.max_bullets},
-                    location={"slide_number": content.get("slide_number")}
+                    location={"slide_number": features.slide_number}
                 ))
         
         return violations
 
 
-class BulletPointLengthRule(Rule):
+class BulletPointLengthRule(FeatureRule):
     """Ensures bullet points don't exceed word count."""
     
     def __init__(self, max_words: int = 10):
@@ -67,34 +67,28 @@ class BulletPointLengthRule(Rule):
     
     def _count_words(self, text: str) -> int:
         """Count words in text, excluding citations."""
-        # Remove citations in parentheses or brackets
-        text = re.sub(r'\([^)]*\d{4}[^)]*\)', '', text)
-        text = re.sub(r'\[[^\]]*\d{4}[^\]]*\]', '', text)
-        # Count words
-        return len(text.split())
+        return TextEntry("text", "text", text).citation_free_word_count
     
-    def validate(self, content: Any, context: RuleContext) -> List[RuleViolation]:
+    def validate_features(self, features: SlideFeatures, context: RuleContext) -> List[RuleViolation]:
         violations = []
         
-        if isinstance(content, dict) and "content" in content:
-            slide_content = content.get("content", {})
-            slide_num = content.get("slide_number")
-            
-            for idx, element in enumerate(slide_content.get("body", [])):
-                if element.get("type") == "bullet_list":
-                    for bullet_idx, item in enumerate(element.get("items", [])):
-                        word_count = self._count_words(item.get("text", ""))
-                        if word_count > self.max_words:
-                            violations.append(self.create_violation(
-                                message=f"Bullet point has {word_count} words, exceeding limit of {self.max_words}",
-                                suggestion="Shorten the bullet point to be more concise",
-                                context={"word_count": word_count, "text": item.get("text", "")},
-                                location={
-                                    "slide_number": slide_num,
-                                    "element_index": idx,
-                                    "bullet_index": bullet_idx
-                                }
-                            ))
+        if features.is_slide:
+            for entry in features.body_entries:
+                if entry.kind != "bullet":
+                    continue
+                # Citations do not count towards the limit
+                word_count = entry.citation_free_word_count
+                if word_count > self.max_words:
+                    violations.append(self.create_violation(
+                        message=f"Bullet point has {word_count} words, exceeding limit of {self.max_words}",
+                        suggestion="Shorten the bullet point to be more concise",
+                        context={"word_count": word_count, "text": entry.text},
+                        location={
+                            "slide_number": features.slide_number,
+                            "element_index": entry.element_index,
+                            "bullet_index": entry.bullet_index
+                        }
+                    ))
         
         return violations
 
@@ -129,7 +123,7 @@ class TitleLengthRule(Rule):
         return violations
 
 
-class TextDensityRule(Rule):
+class TextDensityRule(FeatureRule):
     """Ensures slides don't have too much text."""
     
     def __init__(self, max_words_per_slide: int = 100):
@@ -143,47 +137,25 @@ class TextDensityRule(Rule):
         )
         self.max_words = max_words_per_slide
     
-    def _count_all_words(self, content: Dict[str, Any]) -> int:
-        """Count all words in slide content."""
-        word_count = 0
-        
-        # Title and subtitle
-        word_count += len(content.get("title", "").split())
-        word_count += len(content.get("subtitle", "").split())
-        
-        # Body elements
-        for element in content.get("body", []):
-            if element.get("type") == "text":
-                word_count += len(element.get("content", "").split())
-            elif element.get("type") == "bullet_list":
-                for item in element.get("items", []):
-                    word_count += len(item.get("text", "").split())
-            elif element.get("type") in ["table", "chart"]:
-                # Count caption words
-                caption = element.get("caption", "")
-                word_count += len(caption.split())
-        
-        return word_count
-    
-    def validate(self, content: Any, context: RuleContext) -> List[RuleViolation]:
+    def validate_features(self, features: SlideFeatures, context: RuleContext) -> List[RuleViolation]:
         violations = []
         
-        if isinstance(content, dict) and "content" in content:
-            slide_content = content.get("content", {})
-            word_count = self._count_all_words(slide_content)
+        if features.is_slide:
+            # Headings, body text and table and chart captions
+            word_count = features.word_count(caption_types=("table", "chart"))
             
             if word_count > self.max_words:
                 violations.append(self.create_violation(
                     message=f"Slide has {word_count} words, exceeding limit of {self.max_words}",
                     suggestion="Reduce text content or split across multiple slides",
                     context={"word_count": word_count},
-                    location={"slide_number": content.get("slide_number")}
+                    location={"slide_number": features.slide_number}
                 ))
         
         return violations
 
 
-class ReadabilityScoreRule(Rule):
+class ReadabilityScoreRule(FeatureRule):
     """Ensures text maintains appropriate readability level."""
     
     def __init__(self, target_level: str = "college", max_score: float = 16.0):
@@ -201,74 +173,31 @@ class ReadabilityScoreRule(Rule):
     def _calculate_flesch_kincaid(self, text: str) -> float:
         """Calculate Flesch-Kincaid Grade Level score."""
         # Simple implementation - in production, use textstat library
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        
-        if not sentences:
-            return 0.0
-        
-        words = text.split()
-        syllables = sum(self._count_syllables(word) for word in words)
-        
-        if len(words) == 0:
-            return 0.0
-        
-        # Flesch-Kincaid Grade Level formula
-        score = 0.39 * (len(words) / len(sentences)) + 11.8 * (syllables / len(words)) - 15.59
-        return max(0.0, score)
+        return flesch_kincaid_grade(text)
     
     def _count_syllables(self, word: str) -> int:
         """Count syllables in a word (simplified)."""
-        word = word.lower()
-        vowels = "aeiouy"
-        syllables = 0
-        previous_was_vowel = False
-        
-        for char in word:
-            is_vowel = char in vowels
-            if is_vowel and not previous_was_vowel:
-                syllables += 1
-            previous_was_vowel = is_vowel
-        
-        # Adjust for silent e
-        if word.endswith('e'):
-            syllables -= 1
-        
-        # Ensure at least one syllable
-        return max(1, syllables)
+        return count_syllables(word)
     
-    def validate(self, content: Any, context: RuleContext) -> List[RuleViolation]:
+    def validate_features(self, features: SlideFeatures, context: RuleContext) -> List[RuleViolation]:
         violations = []
         
-        if isinstance(content, dict) and "content" in content:
-            slide_content = content.get("content", {})
-            
-            # Collect all text
-            all_text = []
-            for element in slide_content.get("body", []):
-                if element.get("type") == "text":
-                    all_text.append(element.get("content", ""))
-                elif element.get("type") == "bullet_list":
-                    for item in element.get("items", []):
-                        all_text.append(item.get("text", ""))
+        if features.is_slide and features.body_entries:
+            score = features.readability_grade
             
-            if all_text:
-                combined_text = " ".join(all_text)
-                score = self._calculate_flesch_kincaid(combined_text)
-                
-                if score > self.max_score:
-                    violations.append(self.create_violation(
-                        message=f"Text complexity score {score:.1f} may be too high for {self.target_level} level",
-                        suggestion="Simplify sentence structure and use shorter words",
-                        context={"readability_score": score, "target_level": self.target_level},
-                        location={"slide_number": content.get("slide_number")},
-                        severity=RuleSeverity.INFO
-                    ))
+            if score > self.max_score:
+                violations.append(self.create_violation(
+                    message=f"Text complexity score {score:.1f} may be too high for {self.target_level} level",
+                    suggestion="Simplify sentence structure and use shorter words",
+                    context={"readability_score": score, "target_level": self.target_level},
+                    location={"slide_number": features.slide_number},
+                    severity=RuleSeverity.INFO
+                ))
         
         return violations
 
 
-class ConsistentTerminologyRule(Rule):
+class ConsistentTerminologyRule(FeatureRule):
     """Ensures consistent use of terminology across slides."""
     
     def __init__(self):
@@ -282,7 +211,7 @@ class ConsistentTerminologyRule(Rule):
         self.term_variations = {}
         self.first_occurrences = {}
     
-    def validate(self, content: Any, context: RuleContext) -> List[RuleViolation]:
+    def validate_features(self, features: SlideFeatures, context: RuleContext) -> List[RuleViolation]:
         violations = []
         
         # This rule needs to track state across slides
@@ -297,9 +226,8 @@ class ConsistentTerminologyRule(Rule):
             ("co-ordinate", "coordinate")
         ]
         
-        if isinstance(content, dict) and "content" in content:
-            slide_content = content.get("content", {})
-            text_content = self._extract_all_text(slide_content)
+        if features.is_slide:
+            text_content = features.all_text_lower
             
             for variant1, variant2 in common_variations:
                 if variant1 in text_content and variant2 in text_content:
@@ -307,27 +235,11 @@ class ConsistentTerminologyRule(Rule):
                         message=f"Inconsistent terminology: both '{variant1}' and '{variant2}' used",
                         suggestion=f"Choose one form and use it consistently",
                         context={"terms": [variant1, variant2]},
-                        location={"slide_number": content.get("slide_number")},
+                        location={"slide_number": features.slide_number},
                         severity=RuleSeverity.INFO
                     ))
         
         return violations
-    
-    def _extract_all_text(self, content: Dict[str, Any]) -> str:
-        """Extract all text from slide content."""
-        texts = []
-        
-        texts.append(content.get("title", ""))
-        texts.append(content.get("subtitle", ""))
-        
-        for element in content.get("body", []):
-            if element.get("type") == "text":
-                texts.append(element.get("content", ""))
-            elif element.get("type") == "bullet_list":
-                for item in element.get("items", []):
-                    texts.append(item.get("text", ""))
-        
-        return " ".join(texts).lower()
 
 
 def register_text_rules(engine=None):
@@ -4,6 +4,7 @@ Presentation timing and pacing rules.
 from typing import Any, Dict, List
 
 from app.services.slides.rules.base import (
+    FeatureRule,
     Rule,
     RuleCategory,
     RuleContext,
@@ -11,6 +12,7 @@ from app.services.slides.rules.base import (
     RuleViolation,
     get_rule_engine
 )
+from app.services.slides.rules.features import SlideFeatures
 
 
 class SlideCountRule(Rule):
@@ -63,7 +65,7 @@ class SlideCountRule(Rule):
         return violations
 
 
-class SlideTimingEstimateRule(Rule):
+class SlideTimingEstimateRule(FeatureRule):
     """Estimates time needed for each slide based on content."""
     
     def __init__(self):
@@ -93,40 +95,16 @@ class SlideTimingEstimateRule(Rule):
             "video": 30  # Placeholder, actual time from metadata
         }
     
-    def _count_words(self, content: Dict[str, Any]) -> int:
-        """Count speakable words in slide content."""
-        word_count = 0
-        
-        # Title and subtitle (usually spoken)
-        word_count += len(content.get("title", "").split())
-        word_count += len(content.get("subtitle", "").split())
-        
-        # Body elements
-        for element in content.get("body", []):
-            if element.get("type") == "text":
-                word_count += len(element.get("content", "").split())
-            elif element.get("type") == "bullet_list":
-                for item in element.get("items", []):
-                    word_count += len(item.get("text", "").split())
-            elif element.get("type") in ["table", "chart", "image"]:
-                # Add caption words
-                caption = element.get("caption", "")
-                word_count += len(caption.split())
-        
-        return word_count
-    
-    def _calculate_slide_time(self, slide: Dict[str, Any], pace: str = "normal") -> float:
+    def _calculate_slide_time(self, slide: SlideFeatures, pace: str = "normal") -> float:
         """Calculate estimated time for a slide in seconds."""
-        content = slide.get("content", {})
-        
-        # Base time from word count
-        word_count = self._count_words(content)
+        # Base time from speakable words: headings, body text and captions
+        word_count = slide.word_count(caption_types=("table", "chart", "image"))
         words_per_second = self.speaking_rates[pace] / 60
         base_time = word_count / words_per_second
         
         # Add time for visual elements
         visual_time = 0
-        for element in content.get("body", []):
+        for element in slide.body:
             element_type = element.get("type")
             if element_type in self.element_times:
                 visual_time += self.element_times[element_type]
@@ -141,12 +119,13 @@ class SlideTimingEstimateRule(Rule):
         
         return base_time + visual_time + transition_time
     
-    def validate(self, content: Any, context: RuleContext) -> List[RuleViolation]:
+    def validate_features(self, features: SlideFeatures, context: RuleContext) -> List[RuleViolation]:
         violations = []
+        content = features.content
         
         if isinstance(content, dict) and "slide_number" in content:
             # Single slide validation
-            estimated_time = self._calculate_slide_time(content)
+            estimated_time = self._calculate_slide_time(features)
             
             if estimated_time > 120:  # More than 2 minutes per slide
                 violations.append(self.create_violation(
@@ -162,11 +141,11 @@ class SlideTimingEstimateRule(Rule):
             total_time = 0
             slide_times = []
             
-            for slide in content.get("slides", []):
+            for slide in features.slides:
                 slide_time = self._calculate_slide_time(slide)
                 total_time += slide_time
                 slide_times.append({
-                    "slide_number": slide.get("slide_number"),
+                    "slide_number": slide.slide_number,
                     "estimated_seconds": slide_time
                 })
             
@@ -186,7 +165,7 @@ class SlideTimingEstimateRule(Rule):
         return violations
 
 
-class PacingConsistencyRule(Rule):
+class PacingConsistencyRule(FeatureRule):
     """Ensures consistent pacing throughout presentation."""
     
     def __init__(self):
@@ -198,26 +177,27 @@ class PacingConsistencyRule(Rule):
             severity=RuleSeverity.INFO
         )
     
-    def validate(self, content: Any, context: RuleContext) -> List[RuleViolation]:
+    def validate_features(self, features: SlideFeatures, context: RuleContext) -> List[RuleViolation]:
         violations = []
+        content = features.content
         
         # This rule works at presentation level
         if isinstance(content, dict) and "slides" in content:
             slide_densities = []
             
-            for slide in content.get("slides", []):
+            for slide in features.slides:
                 # Skip title and conclusion slides
-                title = slide.get("content", {}).get("title", "").lower()
+                title = slide.title.lower()
                 if any(skip in title for skip in ["title", "outline", "conclusion", "questions", "thank"]):
                     continue
                 
                 # Calculate content density (words + visual elements)
-                word_count = self._count_words(slide.get("content", {}))
-                visual_count = self._count_visual_elements(slide.get("content", {}))
+                word_count = slide.word_count()
+                visual_count = self._count_visual_elements(slide.slide_content)
                 density = word_count + (visual_count * 20)  # Visual elements count as ~20 words
                 
                 slide_densities.append({
-                    "slide_number": slide.get("slide_number"),
+                    "slide_number": slide.slide_number,
                     "density": density,
                     "word_count": word_count,
                     "visual_count": visual_count
@@ -250,22 +230,6 @@ class PacingConsistencyRule(Rule):
         
         return violations
     
-    def _count_words(self, content: Dict[str, Any]) -> int:
-        """Count words in slide content."""
-        word_count = 0
-        
-        word_count += len(content.get("title", "").split())
-        word_count += len(content.get("subtitle", "").split())
-        
-        for element in content.get("body", []):
-            if element.get("type") == "text":
-                word_count += len(element.get("content", "").split())
-            elif element.get("type") == "bullet_list":
-                for item in element.get("items", []):
-                    word_count += len(item.get("text", "").split())
-        
-        return word_count
-    
     def _count_visual_elements(self, content: Dict[str, Any]) -> int:
         """Count visual elements in slide."""
         visual_types = {"image", "chart", "table", "diagram", "video", "equation", "code"}
@@ -9,6 +9,7 @@ from app.services.slides.rules.base import (
     RuleSeverity,
     get_rule_engine
 )
+from app.services.slides.rules.features import SlideFeatures
 from app.services.slides.rules.text_rules import register_text_rules
 from app.services.slides.rules.academic_rules import register_academic_rules
 from app.services.slides.rules.timing_rules import register_timing_rules
@@ -58,9 +59,14 @@ class PresentationValidator:
             slide_count=len(presentation.get("slides", []))
         )
         
+        # Resolve the rules and extract slide features once for the deck
+        plan = self.engine.compile_plan(context)
+        features = SlideFeatures(presentation)
+        
         # Validate presentation-level rules
-        pres_result = self.engine.validate_content(
-            presentation,
+        pres_result = self.engine.run_plan(
+            plan,
+            features,
             context,
             categories=[RuleCategory.STRUCTURE, RuleCategory.TIMING, RuleCategory.ACADEMIC]
         )
@@ -71,12 +77,13 @@ class PresentationValidator:
         total_warnings = 0
         total_info = 0
         
-        for slide in presentation.get("slides", []):
+        for slide_features in features.slides:
+            slide = slide_features.content
             slide_num = slide.get("slide_number", 0)
             context.current_slide = slide
             
             # Validate slide
-            slide_result = self.engine.validate_content(slide, context)
+            slide_result = self.engine.run_plan(plan, slide_features, context)
             slide_results[slide_num] = slide_result
             
             # Update totals
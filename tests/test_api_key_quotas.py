@@ -0,0 +1,161 @@
+"""
+Tests for single round trip API key quota checks.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from app.services.auth.authorization.api_keys import (
+    APIKey,
+    APIKeyScope,
+    APIKeyService,
+    APIKeyTier,
+    QuotaWindow,
+)
+
+
+class CountingRedis(FakeAsyncRedis):
+    """Fake Redis client counting the commands sent to the server."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.commands = []
+
+    async def execute_command(self, *args, **options):
+        self.commands.append(args[0])
+        return await super().execute_command(*args, **options)
+
+
+@pytest.fixture
+def client():
+    return CountingRedis()
+
+
+def make_key(per_hour=100, per_day=1000, per_month=5000):
+    api_key, _ = APIKey.create(
+        user_id=uuid4(),
+        name="test",
+        scopes={APIKeyScope.READ_PRESENTATIONS},
+        tier=APIKeyTier.FREE,
+    )
+    api_key.metadata.rate_limit_per_hour = per_hour
+    api_key.metadata.rate_limit_per_day = per_day
+    api_key.metadata.monthly_requests_limit = per_month
+    return api_key
+
+
+async def counters(client, api_key):
+    windows = QuotaWindow.for_key(api_key, datetime.now(timezone.utc))
+    values = await client.mget([window.key for window in windows])
+    return [int(value or 0) for value in values]
+
+
+class TestAPIKeyQuotas:
+    """Test multi-window quota checks."""
+
+    @pytest.mark.asyncio
+    async def test_check_consumes_all_windows_in_one_round_trip(self, client):
+        """Test that an admitted request counts in every window with one EVALSHA."""
+        service = APIKeyService(client=client)
+        api_key = make_key()
+        await service.check_rate_limit(api_key, "127.0.0.1")
+        client.commands.clear()
+
+        allowed, info = await service.check_rate_limit(api_key, "127.0.0.1")
+
+        assert allowed is True
+        assert client.commands == ["EVALSHA"]
+        assert await counters(client, api_key) == [2, 2, 2]
+        assert info["quotas"]["hourly"]["remaining"] == 98
+        assert info["quotas"]["monthly"]["reset_at"].day == 1
+
+    @pytest.mark.asyncio
+    async def test_reports_first_exhausted_window(self, client):
+        """Test that a rejection names the exhausted window and consumes nothing."""
+        service = APIKeyService(client=client)
+        api_key = make_key(per_hour=100, per_day=3)
+
+        for _ in range(3):
+            assert (await service.check_rate_limit(api_key, "127.0.0.1"))[0]
+        allowed, info = await service.check_rate_limit(api_key, "127.0.0.1")
+
+        assert allowed is False
+        assert info["limit_type"] == "daily"
+        assert info["limit"] == 3
+        assert info["current"] == 3
+        assert await counters(client, api_key) == [3, 3, 3]
+
+    @pytest.mark.asyncio
+    async def test_exact_under_contention(self, client):
+        """Test that concurrent requests never exceed the smallest limit."""
+        service = APIKeyService(client=client)
+        api_key = make_key(per_hour=25, per_month=None)
+
+        results = await asyncio.gather(
+            *(service.check_rate_limit(api_key, "127.0.0.1") for _ in range(100))
+        )
+
+        assert sum(allowed for allowed, _ in results) == 25
+        # Unlimited windows are still counted for usage statistics
+        assert await counters(client, api_key) == [25, 25, 25]
+
+    @pytest.mark.asyncio
+    async def test_check_without_consuming(self, client):
+        """Test that consume=False only reads the counters."""
+        service = APIKeyService(client=client)
+        api_key = make_key()
+
+        allowed, info = await service.check_rate_limit(api_key, "127.0.0.1", consume=False)
+
+        assert allowed is True
+        assert info["quotas"]["daily"]["current"] == 0
+        assert await counters(client, api_key) == [0, 0, 0]
+
+
+class TestQuotaLeases:
+    """Test local pre-admission for hot keys."""
+
+    @pytest.mark.asyncio
+    async def test_hot_key_is_admitted_locally(self, client):
+        """Test that a hot key reserves a lease and skips Redis while it lasts."""
+        service = APIKeyService(client=client, quota_lease_size=10, quota_lease_ttl=5)
+        api_key = make_key()
+
+        await service.check_rate_limit(api_key, "127.0.0.1")
+        client.commands.clear()
+        for _ in range(29):
+            assert (await service.check_rate_limit(api_key, "127.0.0.1"))[0]
+
+        # First check is cold, then one lease of 10 per 10 requests
+        assert client.commands == ["EVALSHA"] * 3
+        assert (await counters(client, api_key))[0] == 1 + 10 * 3
+
+    @pytest.mark.asyncio
+    async def test_unused_lease_is_refunded(self, client):
+        """Test that unused leased requests are returned on the next check."""
+        service = APIKeyService(client=client, quota_lease_size=10, quota_lease_ttl=0.05)
+        api_key = make_key()
+
+        await service.check_rate_limit(api_key, "127.0.0.1")
+        await service.check_rate_limit(api_key, "127.0.0.1")
+        assert (await counters(client, api_key))[0] == 11
+
+        await asyncio.sleep(0.1)
+        await service.check_rate_limit(api_key, "127.0.0.1", consume=False)
+
+        assert await counters(client, api_key) == [2, 2, 2]
+
+    @pytest.mark.asyncio
+    async def test_no_lease_near_limit(self, client):
+        """Test that keys close to a limit are checked one request at a time."""
+        service = APIKeyService(client=client, quota_lease_size=10, quota_lease_ttl=5)
+        api_key = make_key(per_hour=30)
+
+        results = [(await service.check_rate_limit(api_key, "127.0.0.1"))[0] for _ in range(40)]
+
+        assert results.count(True) == 30
+        assert (await counters(client, api_key))[0] == 30
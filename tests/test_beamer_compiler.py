@@ -0,0 +1,231 @@
+"""
+Tests for the incremental Beamer compile service.
+
+A fake pdflatex/biber pair stands in for TeX: pdflatex writes an .aux with
+the document's labels and citations (resolved citations only once a .bbl
+exists, as biblatex does) and a .bcf listing cited keys; biber turns the
+.bcf into a .bbl. Every invocation is appended to a log.
+"""
+import asyncio
+import os
+import stat
+import sys
+import textwrap
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.services.export.generators.beamer_compiler import BeamerCompileService
+
+
+FAKE_PDFLATEX = textwrap.dedent('''
+    import os, re, sys
+    args = sys.argv[1:]
+    with open(os.environ["FAKE_TEX_LOG"], "a") as log:
+        log.write("pdflatex " + " ".join(args) + "\\n")
+    if "-ini" in args:
+        job = next(a.split("=", 1)[1] for a in args if a.startswith("-jobname="))
+        open(job + ".fmt", "w").write("format")
+        sys.exit(0)
+    job = args[-1][:-4]
+    source = open(args[-1]).read()
+    if "\\\\fail" in source:
+        sys.exit(1)
+    labels = sorted(set(re.findall(r"\\\\label\\{([^}]*)\\}", source)))
+    cites = sorted(set(re.findall(r"\\\\cite\\{([^}]*)\\}", source)))
+    bbl = open(job + ".bbl").read() if os.path.exists(job + ".bbl") else ""
+    aux = "".join("\\\\newlabel{%s}\\n" % l for l in labels)
+    aux += "".join("\\\\citation{%s}\\n" % c for c in cites)
+    aux += "".join("\\\\abx@aux@cite{%s}\\n" % c for c in cites if c in bbl)
+    open(job + ".aux", "w").write(aux)
+    if cites:
+        open(job + ".bcf", "w").write("\\n".join(cites))
+    open(job + ".pdf", "w").write("%PDF " + source)
+''')
+
+FAKE_BIBER = textwrap.dedent('''
+    import os, sys
+    with open(os.environ["FAKE_TEX_LOG"], "a") as log:
+        log.write("biber " + " ".join(sys.argv[1:]) + "\\n")
+    job = sys.argv[1]
+    open(job + ".bbl", "w").write("bbl:" + open(job + ".bcf").read())
+''')
+
+PREAMBLE = "\\documentclass{beamer}\n\\usetheme{Berlin}\n"
+
+
+def _document(body):
+    return PREAMBLE + "\\begin{document}\n" + body + "\n\\end{document}\n"
+
+
+@pytest.fixture
+def fake_tex(tmp_path, monkeypatch):
+    """Put fake pdflatex and biber first on PATH and return the call log."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    for name, script in (("pdflatex", FAKE_PDFLATEX), ("biber", FAKE_BIBER)):
+        path = bin_dir / name
+        path.write_text(f"#!{sys.executable}\n{script}")
+        path.chmod(path.stat().st_mode | stat.S_IEXEC)
+
+    log = tmp_path / "tex.log"
+    log.write_text("")
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_TEX_LOG", str(log))
+    return log
+
+
+def _calls(log):
+    return [line.split()[0] + (" -ini" if "-ini" in line else "") for line in log.read_text().splitlines()]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fake TeX tools rely on shebang scripts")
+class TestBeamerCompileService:
+    """Test cache hits, pass counts and bibliography skipping."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_compile_reaches_fixed_point(self, tmp_path, fake_tex):
+        """Test that a fresh compile with citations runs three passes and biber once."""
+        service = BeamerCompileService(cache_dir=tmp_path / "cache", use_preamble_formats=False)
+
+        result = await service.compile(
+            _document("\\cite{knuth} \\label{intro}"), "talk", tmp_path,
+            bib_files={"refs.bib": b"@book{knuth}"}, bibliography_backend="biber"
+        )
+
+        assert result.success and not result.cached
+        assert (result.latex_passes, result.bibliography_runs) == (3, 1)
+        assert _calls(fake_tex) == ["pdflatex", "biber", "pdflatex", "pdflatex"]
+        assert (tmp_path / "talk.pdf").exists()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_document_is_served_from_cache(self, tmp_path, fake_tex):
+        """Test that recompiling identical inputs runs no tools."""
+        service = BeamerCompileService(cache_dir=tmp_path / "cache", use_preamble_formats=False)
+        source = _document("Hello \\label{intro}")
+
+        await service.compile(source, "talk", tmp_path)
+        calls = len(_calls(fake_tex))
+        result = await service.compile(source, "talk", tmp_path)
+
+        assert result.cached
+        assert len(_calls(fake_tex)) == calls
+        assert service.get_stats()["cache_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_text_edit_skips_biber_and_extra_passes(self, tmp_path, fake_tex):
+        """Test that an edit not touching labels or citations needs one pass."""
+        service = BeamerCompileService(cache_dir=tmp_path / "cache", use_preamble_formats=False)
+        bib = {"refs.bib": b"@book{knuth}"}
+
+        await service.compile(_document("Old \\cite{knuth}"), "talk", tmp_path,
+                              bib_files=bib, bibliography_backend="biber", workspace_key="deck-1")
+        edited = await service.compile(_document("New \\cite{knuth}"), "talk", tmp_path,
+                                       bib_files=bib, bibliography_backend="biber", workspace_key="deck-1")
+        cited = await service.compile(_document("New \\cite{knuth} \\cite{lamport}"), "talk", tmp_path,
+                                      bib_files=bib, bibliography_backend="biber", workspace_key="deck-1")
+
+        assert (edited.latex_passes, edited.bibliography_runs) == (1, 0)
+        assert (cited.latex_passes, cited.bibliography_runs) == (3, 1)
+        assert service.get_stats()["bibliography_skips"] == 1
+
+    @pytest.mark.asyncio
+    async def test_preamble_format_built_once(self, tmp_path, fake_tex):
+        """Test that documents sharing a preamble reuse one format."""
+        service = BeamerCompileService(cache_dir=tmp_path / "cache")
+
+        first = await service.compile(_document("One"), "one", tmp_path)
+        second = await service.compile(_document("Two"), "two", tmp_path)
+
+        assert first.used_format and second.used_format
+        assert _calls(fake_tex).count("pdflatex -ini") == 1
+        assert "-fmt=" in fake_tex.read_text().splitlines()[-1]
+
+    @pytest.mark.asyncio
+    async def test_failed_compile_is_not_cached(self, tmp_path, fake_tex):
+        """Test that LaTeX errors are reported and not cached."""
+        service = BeamerCompileService(cache_dir=tmp_path / "cache", use_preamble_formats=False)
+
+        result = await service.compile(_document("\\fail"), "talk", tmp_path)
+
+        assert not result.success
+        assert not list((tmp_path / "cache" / "outputs").glob("*.pdf"))
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self, tmp_path, fake_tex):
+        """Test that concurrent compiles of different decks all succeed."""
+        service = BeamerCompileService(cache_dir=tmp_path / "cache", max_concurrency=2,
+                                       use_preamble_formats=False)
+
+        results = await asyncio.gather(*(
+            service.compile(_document(f"Deck {i}"), f"deck{i}", tmp_path) for i in range(4)
+        ))
+
+        assert all(r.success for r in results)
+
+    def test_cap_holds_across_event_loops(self, tmp_path, fake_tex, monkeypatch):
+        """Test that blocking callers, each on its own loop, share the concurrency cap."""
+        service = BeamerCompileService(cache_dir=tmp_path / "cache", max_concurrency=1,
+                                       use_preamble_formats=False)
+        counter_lock = threading.Lock()
+        running = []
+        peak = []
+        run = service._run
+
+        async def counted_run(command, cwd):
+            with counter_lock:
+                running.append(command)
+                peak.append(len(running))
+            try:
+                await asyncio.sleep(0.02)
+                return await run(command, cwd)
+            finally:
+                with counter_lock:
+                    running.remove(command)
+
+        monkeypatch.setattr(service, "_run", counted_run)
+
+        def compile_blocking(i):
+            return asyncio.run(service.compile(_document(f"Deck {i}"), f"deck{i}", tmp_path))
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(compile_blocking, range(4)))
+
+        assert all(r.success for r in results)
+        assert max(peak) == 1
+
+    @pytest.mark.asyncio
+    async def test_unrelated_documents_get_separate_workspaces(self, tmp_path, fake_tex):
+        """Test that without a workspace key documents do not share leftover files."""
+        service = BeamerCompileService(cache_dir=tmp_path / "cache", use_preamble_formats=False)
+        figure = tmp_path / "figure.png"
+        figure.write_bytes(b"png")
+
+        await service.compile(_document("One"), "talk", tmp_path, assets={"figure.png": figure})
+        await service.compile(_document("Two"), "talk", tmp_path)
+
+        first, second = service._workspaces.values()
+        assert (first.path / "figure.png").exists()
+        assert not (second.path / "figure.png").exists()
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_workspaces_are_deleted(self, tmp_path, fake_tex):
+        """Test that workspaces beyond max_workspaces are dropped with their directories."""
+        service = BeamerCompileService(cache_dir=tmp_path / "cache", max_workspaces=2,
+                                       use_preamble_formats=False)
+        workspaces_dir = tmp_path / "cache" / "workspaces"
+
+        await service.compile(_document("One"), "one", tmp_path, workspace_key="one")
+        await service.compile(_document("Two"), "two", tmp_path, workspace_key="two")
+        await service.compile(_document("One again"), "one", tmp_path, workspace_key="one")
+        await service.compile(_document("Three"), "three", tmp_path, workspace_key="three")
+
+        assert list(service._workspaces) == ["one", "three"]
+        assert sorted(p.name for p in workspaces_dir.iterdir()) == ["one", "three"]
+        assert service.get_stats()["workspace_evictions"] == 1
+
+        # An evicted document starts over without its auxiliary state
+        result = await service.compile(_document("Two again"), "two", tmp_path, workspace_key="two")
+        assert result.success and result.latex_passes == 2
+        assert sorted(p.name for p in workspaces_dir.iterdir()) == ["three", "two"]
@@ -0,0 +1,176 @@
+"""
+Tests for equation rendering and the shared render cache.
+"""
+import io
+import time
+
+import pytest
+from PIL import Image
+
+from app.services.document_processing.utils.equation_renderer import (
+    MATH_PATTERN,
+    EquationImage,
+    EquationRenderCache,
+    EquationRenderer,
+    normalize_latex,
+)
+from app.services.slides.orchestrator.export_pipeline import (
+    ExportFormat,
+    ExportOptions,
+    ExportPipeline,
+)
+
+
+class TestNormalizeLatex:
+    """Test cache-key normalization."""
+
+    def test_delimiters_and_spacing(self):
+        """Test that delimiters and insignificant spaces are dropped."""
+        assert normalize_latex("$a + b$") == "a+b"
+        assert normalize_latex("\\[ a+b \\]") == "a+b"
+        assert normalize_latex("  a  +\n b ") == "a+b"
+
+    def test_significant_spaces_kept(self):
+        """Test spaces after control words and inside text groups."""
+        assert normalize_latex("\\alpha  b") == "\\alpha b"
+        assert normalize_latex("\\alpha +b") == "\\alpha+b"
+        assert normalize_latex("x \\text{if  x  is}  y") == "x\\text{if x is}y"
+        assert normalize_latex("a\\ b") == "a\\ b"
+
+    def test_unbalanced_delimiters_kept(self):
+        """Test that "$a$ + $b$" is not mistaken for one delimited expression."""
+        assert normalize_latex("$a$ + $b$") == "$a$+$b$"
+
+
+class TestMathPattern:
+    """Test which dollar-delimited spans are taken as math."""
+
+    def test_inline_and_display_math(self):
+        """Test that delimited math is found with its equation type."""
+        matches = [m.groups() for m in MATH_PATTERN.finditer("So $x^2$ and $$\\sum_i a_i$$, not \\$y$.")]
+
+        assert matches == [(None, "x^2"), ("\\sum_i a_i", None)]
+
+    def test_currency_is_not_math(self):
+        """Test that prices in prose are left as text."""
+        assert not MATH_PATTERN.search("Revenue was $5 million and costs rose to $10 million")
+        assert not MATH_PATTERN.search("Tickets cost $5 and $6 at the door")
+        assert not MATH_PATTERN.search("from $5 to$10")
+
+
+class TestEquationRenderer:
+    """Test mathtext rendering through the cache."""
+
+    def setup_method(self):
+        """Set up a renderer with a private cache."""
+        self.cache = EquationRenderCache()
+        self.renderer = EquationRenderer(dpi=150, font_size=20, cache=self.cache)
+
+    def test_png_at_requested_dpi(self):
+        """Test that PNG output is a real typeset image scaled by DPI."""
+        low = self.renderer.render_image("\\frac{a}{b} + \\sqrt{x^2}", dpi=100)
+        high = self.renderer.render_image("\\frac{a}{b} + \\sqrt{x^2}", dpi=300)
+
+        assert Image.open(io.BytesIO(high.data)).size == (high.width, high.height)
+        assert high.width == pytest.approx(low.width * 3, abs=3)
+        assert 0 < high.depth < high.height
+
+    def test_vector_output(self):
+        """Test SVG output, measured in points."""
+        image = self.renderer.render_image("E = mc^2", "svg")
+
+        assert image.dpi == 72
+        assert b"<svg" in image.data
+
+    def test_equivalent_sources_share_a_render(self):
+        """Test that spacing and delimiter variants hit one cache entry."""
+        first = self.renderer.render_image("$x^2 + y^2$")
+        second = self.renderer.render_image("\\[ x^2+y^2 \\]")
+
+        assert first is second
+        assert self.cache.get_stats()["entries"] == 1
+        assert self.cache.hits == 1
+
+    def test_multiline_display(self):
+        """Test that aligned multi-line displays are stacked."""
+        single = self.renderer.render_image("a = b")
+        stacked = self.renderer.render_image("\\begin{align} a &= b \\\\ c &= d \\label{x} \\end{align}")
+
+        assert stacked.height > single.height * 1.5
+
+    def test_failures_are_cached(self):
+        """Test that unparseable math returns None and is parsed once."""
+        assert self.renderer.render_image("\\notacommand{x}") is None
+        assert self.renderer.render_image("\\notacommand{x}") is None
+
+        stats = self.cache.get_stats()
+        assert stats["failures"] == 1
+        assert stats["misses"] == 1
+
+    def test_render_equation_formats(self):
+        """Test that render_equation fills raster, vector and text formats."""
+        rendered = self.renderer.render_equation("\\alpha_i", formats=["png", "svg", "plain_text"])
+
+        assert rendered.png_data.startswith(b"\x89PNG")
+        assert "<svg" in rendered.svg_data
+        assert rendered.baseline < rendered.height
+        assert rendered.plain_text == "alpha_i"
+
+
+def test_render_cache_is_byte_bounded():
+    """Test LRU eviction by size."""
+    cache = EquationRenderCache(max_bytes=250, max_entry_bytes=200)
+
+    def image(size):
+        return EquationImage(b"x" * size, "png", 1, 1, 0, 72)
+
+    cache.put(("a",), image(100))
+    cache.put(("b",), image(100))
+    cache.get(("a",))
+    cache.put(("c",), image(100))
+    cache.put(("huge",), image(300))
+
+    assert cache.get(("b",), "miss") == "miss"
+    assert cache.get(("a",)) is not None
+    assert cache.get(("huge",), "miss") == "miss"
+    assert cache.get_stats()["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_html_export_typesets_math():
+    """Test that the HTML exporter embeds equations as SVG."""
+    pipeline = ExportPipeline(equation_renderer=EquationRenderer(cache=EquationRenderCache()))
+    presentation = {
+        "title": "Physics",
+        "slides": [{"content": {"body": "Energy is $E = mc^2$", "bullets": ["$\\badcmd$"]}}],
+    }
+
+    result = await pipeline.prepare_export(presentation, ExportOptions(format=ExportFormat.HTML))
+    html = result.data.decode() if isinstance(result.data, bytes) else str(result.data)
+
+    assert 'class="math math-inline"' in html
+    assert "data:image/svg+xml;base64," in html
+    assert "$\\badcmd$" in html
+
+
+@pytest.mark.slow
+def test_equation_cache_benchmark():
+    """Benchmark rendering a deck's equations cold and from the cache."""
+    equations = [f"\\sum_{{i=0}}^{{{n}}} \\frac{{x_i^{n}}}{{\\sqrt{{{n}+i}}}}" for n in range(20)]
+    # Each equation appears on several slides, and in PPTX, PDF and HTML
+    deck = equations * 10
+
+    renderer = EquationRenderer(dpi=300, font_size=24, cache=EquationRenderCache())
+
+    start = time.perf_counter()
+    for latex_code in equations:
+        renderer.render_image(latex_code)
+    cold = (time.perf_counter() - start) / len(equations)
+
+    start = time.perf_counter()
+    for latex_code in deck:
+        renderer.render_image(f"$ {latex_code} $")
+    warm = (time.perf_counter() - start) / len(deck)
+
+    print(f"\nEquation render: {cold * 1000:.2f} ms cold, {warm * 1e6:.1f} us cached")
+    assert warm * 20 < cold
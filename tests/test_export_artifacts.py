@@ -0,0 +1,243 @@
+"""
+Tests for streaming export artifact sinks and ranged delivery.
+"""
+import asyncio
+import hashlib
+import io
+import os
+import subprocess
+import sys
+import textwrap
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from app.services.export.artifacts import (
+    MIN_PART_SIZE,
+    LocalFileSink,
+    S3MultipartSink,
+    iter_buffer,
+    parse_range_header,
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+class InMemoryStorage:
+    """Object storage double exposing the S3StorageManager upload calls."""
+
+    bucket_name = "exports"
+    chunk_size = MIN_PART_SIZE
+
+    def __init__(self, fail_on_part=None):
+        self.objects = {}
+        self.uploads = {}
+        self.aborted = []
+        self.fail_on_part = fail_on_part
+
+    async def upload_bytes(self, data, key, bucket=None, metadata=None, content_type=None):
+        self.objects[key] = bytes(data)
+        return {"etag": "single"}
+
+    async def start_multipart_upload(self, key, total_size, bucket=None, metadata=None,
+                                     content_type="application/octet-stream"):
+        upload_id = f"upload-{len(self.uploads)}"
+        self.uploads[upload_id] = (key, {})
+        return upload_id
+
+    async def upload_part(self, upload_id, part_number, data):
+        await asyncio.sleep(0)
+        if part_number == self.fail_on_part:
+            raise IOError("part upload failed")
+        self.uploads[upload_id][1][part_number] = data
+
+    async def complete_multipart_upload(self, upload_id):
+        key, parts = self.uploads.pop(upload_id)
+        self.objects[key] = b"".join(parts[n] for n in sorted(parts))
+        return {"etag": "multipart", "parts_count": len(parts)}
+
+    async def abort_multipart_upload(self, upload_id):
+        self.uploads.pop(upload_id, None)
+        self.aborted.append(upload_id)
+
+
+class TestLocalFileSink:
+    """Test atomic local artifact writes."""
+
+    def test_commit_renames_into_place(self, tmp_path):
+        """Test that the artifact only appears once committed."""
+        target = tmp_path / "deck.pdf"
+
+        with LocalFileSink(target, content_type="application/pdf") as sink:
+            sink.write(b"%PDF-")
+            sink.write(memoryview(b"body"))
+            assert not target.exists()
+
+        artifact = sink.commit()
+        assert target.read_bytes() == b"%PDF-body"
+        assert artifact.size == 9
+        assert artifact.sha256 == hashlib.sha256(b"%PDF-body").hexdigest()
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_failure_discards_partial_file(self, tmp_path):
+        """Test that an exception inside the block leaves nothing behind."""
+        with pytest.raises(RuntimeError):
+            with LocalFileSink(tmp_path / "deck.pptx") as sink:
+                sink.write(b"partial")
+                raise RuntimeError("generator failed")
+
+        assert list(tmp_path.iterdir()) == []
+        with pytest.raises(ValueError):
+            sink.commit()
+
+    def test_zip_packages_stream_without_seeking(self, tmp_path):
+        """Test that a PPTX-style zip package can be written to the sink."""
+        target = tmp_path / "deck.pptx"
+
+        with LocalFileSink(target) as sink:
+            with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as package:
+                package.writestr("ppt/presentation.xml", "<p/>" * 1000)
+                package.writestr("[Content_Types].xml", "<Types/>")
+
+        with zipfile.ZipFile(target) as package:
+            assert package.read("ppt/presentation.xml") == b"<p/>" * 1000
+
+
+class TestS3MultipartSink:
+    """Test streaming uploads to object storage."""
+
+    @pytest.mark.asyncio
+    async def test_large_artifact_uploads_parts(self):
+        """Test that full parts are uploaded while writing and the tail on commit."""
+        storage = InMemoryStorage()
+        sink = S3MultipartSink(storage, "exports/a.pptx", asyncio.get_running_loop())
+        payload = os.urandom(MIN_PART_SIZE * 2 + 1234)
+
+        def write():
+            with sink:
+                for offset in range(0, len(payload), 700_000):
+                    sink.write(payload[offset:offset + 700_000])
+                assert len(sink._buffer) < MIN_PART_SIZE
+            return sink.commit()
+
+        artifact = await asyncio.to_thread(write)
+
+        assert storage.objects["exports/a.pptx"] == payload
+        assert artifact.etag == "multipart"
+        assert artifact.size == len(payload)
+        assert artifact.storage_key == "exports/a.pptx"
+
+    @pytest.mark.asyncio
+    async def test_small_artifact_uses_single_put(self):
+        """Test that artifacts below one part skip multipart upload."""
+        storage = InMemoryStorage()
+        sink = S3MultipartSink(storage, "exports/b.pdf", asyncio.get_running_loop())
+
+        def write():
+            with sink:
+                sink.write(b"small")
+            return sink.commit()
+
+        artifact = await asyncio.to_thread(write)
+
+        assert storage.objects == {"exports/b.pdf": b"small"}
+        assert storage.uploads == {}
+        assert artifact.etag == "single"
+
+    @pytest.mark.asyncio
+    async def test_failed_part_aborts_upload(self):
+        """Test that a failed part aborts the multipart upload."""
+        storage = InMemoryStorage(fail_on_part=1)
+        sink = S3MultipartSink(storage, "exports/c.pptx", asyncio.get_running_loop())
+
+        def write():
+            with sink:
+                for _ in range(3):
+                    sink.write(b"x" * MIN_PART_SIZE)
+
+        with pytest.raises(IOError):
+            await asyncio.to_thread(write)
+
+        assert storage.aborted == ["upload-0"]
+        assert storage.objects == {}
+
+
+def test_parse_range_header():
+    """Test single-range parsing and unsatisfiable ranges."""
+    assert parse_range_header(None, 100) is None
+    assert parse_range_header("bytes=0-9", 100) == (0, 9)
+    assert parse_range_header("bytes=90-", 100) == (90, 99)
+    assert parse_range_header("bytes=-10", 100) == (90, 99)
+    assert parse_range_header("bytes=50-500", 100) == (50, 99)
+    assert parse_range_header("bytes=0-1,5-6", 100) is None
+    assert parse_range_header("items=0-1", 100) is None
+
+    with pytest.raises(ValueError):
+        parse_range_header("bytes=100-", 100)
+    with pytest.raises(ValueError):
+        parse_range_header("bytes=9-3", 100)
+
+
+def test_iter_buffer_ranges():
+    """Test chunked iteration over a buffer range."""
+    buffer = io.BytesIO(bytes(range(256)) * 10)
+
+    chunks = list(iter_buffer(buffer, 100, 1099, chunk_size=256))
+
+    assert b"".join(chunks) == buffer.getvalue()[100:1100]
+    assert max(len(chunk) for chunk in chunks) == 256
+    buffer.write(b"still writable")
+
+
+_RSS_SCRIPT = textwrap.dedent("""
+    import io, resource, sys, tempfile
+    from app.services.export.artifacts import LocalFileSink
+
+    mode, size = sys.argv[1], int(sys.argv[2])
+    chunk = b"\\0" * (1024 * 1024)
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    def generate(stream):
+        for _ in range(size // len(chunk)):
+            stream.write(chunk)
+
+    with tempfile.TemporaryDirectory() as directory:
+        if mode == "buffer":
+            # Previous path: export to a BytesIO, then read it back to deliver
+            buffer = io.BytesIO()
+            generate(buffer)
+            buffer.seek(0)
+            data = buffer.read()
+            with open(directory + "/deck.pptx", "wb") as f:
+                f.write(data)
+        else:
+            with LocalFileSink(directory + "/deck.pptx") as sink:
+                generate(sink)
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print((peak - baseline) // 1024)
+""")
+
+
+@pytest.mark.slow
+def test_artifact_streaming_rss_benchmark():
+    """Benchmark peak RSS growth for a 200 MB export, buffered vs streamed."""
+    size = 200 * 1024 * 1024
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT)}
+
+    def peak_mb(mode):
+        output = subprocess.run(
+            [sys.executable, "-c", _RSS_SCRIPT, mode, str(size)],
+            capture_output=True, text=True, check=True, cwd=REPO_ROOT, env=env
+        ).stdout
+        return int(output.split()[-1])
+
+    buffered = peak_mb("buffer")
+    streamed = peak_mb("stream")
+
+    print(f"\nPeak RSS growth for 200 MB export: {buffered} MB buffered, {streamed} MB streamed")
+    # Buffered growth depends on allocator and memory pressure; it is at
+    # least half the artifact, while streaming stays near one chunk
+    assert buffered > 100
+    assert streamed < 32
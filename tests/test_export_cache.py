@@ -0,0 +1,97 @@
+"""
+Tests for the export pipeline result cache.
+"""
+import pytest
+
+from app.services.slides.orchestrator.export_pipeline import (
+    DiskExportCacheStore,
+    ExportFormat,
+    ExportOptions,
+    ExportPipeline,
+    ExportResult,
+    ExportResultCache,
+)
+
+
+def _presentation(title="Deck"):
+    return {
+        "id": "pres-1",
+        "title": title,
+        "slides": [{"title": f"Slide {i}", "content": "Body"} for i in range(3)],
+    }
+
+
+class TestExportResultCache:
+    """Test keying, eviction and backing store behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_export_hits_cache(self):
+        """Test that an unchanged deck is served from the cache."""
+        pipeline = ExportPipeline()
+        options = ExportOptions(format=ExportFormat.JSON)
+
+        first = await pipeline.prepare_export(_presentation(), options)
+        second = await pipeline.prepare_export(_presentation(), options)
+
+        assert second.data == first.data
+        assert second.metadata["cache_hit"] is True
+        assert "cache_hit" not in first.metadata
+        assert pipeline.get_cache_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_edited_deck_and_options_miss(self):
+        """Test that content and option changes produce new keys."""
+        pipeline = ExportPipeline()
+        options = ExportOptions(format=ExportFormat.MARKDOWN)
+
+        await pipeline.prepare_export(_presentation(), options)
+        edited = await pipeline.prepare_export(_presentation("Edited"), options)
+        other = await pipeline.prepare_export(
+            _presentation(), ExportOptions(format=ExportFormat.MARKDOWN, include_notes=False)
+        )
+
+        assert b"Edited" in edited.data
+        assert "cache_hit" not in other.metadata
+        assert pipeline.get_cache_stats()["misses"] == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_exports_are_not_cached(self):
+        """Test that results with errors are not stored."""
+        pipeline = ExportPipeline()
+
+        result = await pipeline.prepare_export({"slides": []}, ExportOptions(format=ExportFormat.JSON))
+
+        assert result.errors
+        assert pipeline.get_cache_stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_lru_is_bounded_by_bytes(self):
+        """Test that least recently used entries are evicted by size."""
+        cache = ExportResultCache(max_bytes=100, max_entry_bytes=60)
+        for key in ("a", "b", "c"):
+            await cache.set(key, ExportResult(format=ExportFormat.JSON, data=b"x" * 40))
+        await cache.set("huge", ExportResult(format=ExportFormat.JSON, data=b"x" * 80))
+
+        assert "a" not in cache and "huge" not in cache
+        assert "b" in cache and "c" in cache
+        assert cache.get_stats()["bytes"] == 80
+        assert cache.get_stats()["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disk_store_shared_between_caches(self, tmp_path):
+        """Test that results written by one worker are read by another."""
+        store = DiskExportCacheStore(tmp_path)
+        writer = ExportResultCache(store=store)
+        reader = ExportResultCache(store=store)
+        result = ExportResult(
+            format=ExportFormat.HTML, data=b"<html></html>", metadata={"slide_count": 2}
+        )
+
+        await writer.set("key", result)
+        loaded = await reader.get("key")
+
+        assert loaded.data == result.data
+        assert loaded.metadata == {"slide_count": 2}
+        assert loaded.created_at == result.created_at
+        assert reader.get_stats()["store_hits"] == 1
+        assert await reader.get("missing") is None
@@ -0,0 +1,188 @@
+"""
+Tests for fair-share scheduling across tenants.
+"""
+
+import pytest
+
+from app.services.document_processing.queue.fair_scheduler import FairShareScheduler, TenantPolicy
+from app.services.document_processing.queue.task_queue import TaskPriority
+
+
+class RecordingQueue:
+    """Task queue double recording released tasks."""
+
+    def __init__(self):
+        self.released = []
+
+    async def enqueue_task(self, task_id, task_data, priority=TaskPriority.NORMAL,
+                           delay_seconds=None, queue_name=None):
+        self.released.append((task_id, priority))
+        return True
+
+    async def get_task_status(self, task_id):
+        return None
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+async def simulate(scheduler, clock, arrivals, duration, service_time):
+    """
+    Run a discrete-time simulation of workers draining the scheduler.
+
+    Every released task occupies a worker for service_time seconds.
+
+    Returns:
+        Wait in seconds from submission to release, per task id
+    """
+    submitted = {}
+    waits = {}
+    running = []
+    seen = 0
+
+    for second in range(duration):
+        clock.now = float(second)
+
+        for finish_at, task_id in [entry for entry in running if entry[0] <= second]:
+            running.remove((finish_at, task_id))
+            await scheduler.task_finished(task_id)
+
+        for task_id, tenant_id, priority in arrivals(second):
+            submitted[task_id] = second
+            await scheduler.enqueue_task(task_id, {}, tenant_id=tenant_id, priority=priority)
+
+        for task_id, _ in scheduler.queue.released[seen:]:
+            waits[task_id] = second - submitted[task_id]
+            running.append((second + service_time, task_id))
+        seen = len(scheduler.queue.released)
+
+    return submitted, waits
+
+
+def adversarial_arrivals(second):
+    """Tenant "burst" sends 3 HIGH tasks a second; "quiet" sends one LOW task every 10 s."""
+    arrivals = [(f"burst-{second}-{i}", "burst", TaskPriority.HIGH) for i in range(3)]
+    if second % 10 == 5:
+        arrivals.append((f"quiet-{second}", "quiet", TaskPriority.LOW))
+    return arrivals
+
+
+def saturating_arrivals(second):
+    """One tenant keeps a HIGH backlog fed at capacity and sends a LOW task every 10 s."""
+    arrivals = [(f"burst-{second}-{i}", "burst", TaskPriority.HIGH) for i in range(20 if second == 0 else 2)]
+    if second % 10 == 5:
+        arrivals.append((f"quiet-{second}", "burst", TaskPriority.LOW))
+    return arrivals
+
+
+class TestFairShareScheduler:
+    """Test fair-share release order."""
+
+    @pytest.mark.asyncio
+    async def test_low_priority_wait_is_bounded_under_adversarial_load(self):
+        """Test that a HIGH burst from one tenant cannot starve another tenant's LOW work."""
+        clock = Clock()
+        # 4 workers at 2 s per task serve 2 tasks/s; "burst" alone sends 3/s
+        scheduler = FairShareScheduler(RecordingQueue(), max_in_flight=4, clock=clock)
+
+        submitted, waits = await simulate(scheduler, clock, adversarial_arrivals, 600, service_time=2)
+
+        quiet = [task_id for task_id in submitted if task_id.startswith("quiet")]
+        assert all(task_id in waits for task_id in quiet)
+        assert max(waits[task_id] for task_id in quiet) <= 2
+        # The bursting tenant still gets all remaining capacity
+        burst_released = sum(task_id.startswith("burst") for task_id in waits)
+        assert burst_released >= 0.9 * 2 * 600 - len(quiet)
+
+    @pytest.mark.asyncio
+    async def test_strict_priority_starves_without_fair_share(self):
+        """Test the baseline: one shared tenant means strict priority order."""
+        clock = Clock()
+        scheduler = FairShareScheduler(RecordingQueue(), max_in_flight=4, aging_interval=0, clock=clock)
+
+        def shared_tenant(second):
+            return [(task_id, "shared", priority) for task_id, _, priority in adversarial_arrivals(second)]
+
+        submitted, waits = await simulate(scheduler, clock, shared_tenant, 600, service_time=2)
+
+        assert not any(task_id.startswith("quiet") for task_id in waits)
+
+    @pytest.mark.asyncio
+    async def test_aging_bounds_wait_within_a_tenant(self):
+        """Test that aging serves a tenant's own LOW work behind its HIGH backlog."""
+        waits_by_aging = {}
+        for aging_interval in (0, 30):
+            clock = Clock()
+            scheduler = FairShareScheduler(
+                RecordingQueue(), max_in_flight=4, aging_interval=aging_interval, clock=clock
+            )
+            submitted, waits = await simulate(scheduler, clock, saturating_arrivals, 600, service_time=2)
+            quiet = [task_id for task_id in submitted if task_id.startswith("quiet") and submitted[task_id] < 500]
+            waits_by_aging[aging_interval] = [waits.get(task_id) for task_id in quiet]
+
+        # Without aging the HIGH backlog never drains
+        assert set(waits_by_aging[0]) == {None}
+        # After three intervals LOW is CRITICAL and older than any aged HIGH task
+        assert all(wait is not None and wait <= 3 * 30 + 2 for wait in waits_by_aging[30])
+
+    @pytest.mark.asyncio
+    async def test_weights_split_capacity(self):
+        """Test that backlogged tenants are served in proportion to their weights."""
+        scheduler = FairShareScheduler(
+            RecordingQueue(),
+            max_in_flight=0,
+            tenant_policies={"gold": TenantPolicy(weight=3)}
+        )
+        for i in range(200):
+            await scheduler.enqueue_task(f"gold-{i}", {}, tenant_id="gold")
+            await scheduler.enqueue_task(f"free-{i}", {}, tenant_id="free")
+
+        scheduler.max_in_flight = 100
+        await scheduler.dispatch()
+
+        gold = sum(task_id.startswith("gold") for task_id, _ in scheduler.queue.released)
+        assert 74 <= gold <= 76
+
+    @pytest.mark.asyncio
+    async def test_per_tenant_concurrency_cap(self):
+        """Test that a capped tenant leaves capacity to others and resumes on completion."""
+        scheduler = FairShareScheduler(
+            RecordingQueue(),
+            max_in_flight=10,
+            tenant_policies={"capped": TenantPolicy(max_concurrency=2)}
+        )
+        for i in range(5):
+            await scheduler.enqueue_task(f"capped-{i}", {}, tenant_id="capped")
+        await scheduler.enqueue_task("other", {}, tenant_id="other")
+
+        released = [task_id for task_id, _ in scheduler.queue.released]
+        assert released == ["capped-0", "capped-1", "other"]
+
+        await scheduler.task_finished("capped-0")
+        assert scheduler.queue.released[-1][0] == "capped-2"
+        assert scheduler.get_stats()["tenants"]["capped"] == {"backlog": 2, "in_flight": 2, "weight": 1.0}
+
+    @pytest.mark.asyncio
+    async def test_rejected_release_is_retried(self):
+        """Test that a task the queue rejects stays first in its tenant's backlog."""
+        queue = RecordingQueue()
+        scheduler = FairShareScheduler(queue)
+        accept = False
+
+        async def enqueue_task(task_id, task_data, priority, queue_name=None):
+            if accept:
+                queue.released.append((task_id, priority))
+            return accept
+
+        queue.enqueue_task = enqueue_task
+        await scheduler.enqueue_task("task", {}, tenant_id="tenant")
+        assert queue.released == [] and scheduler.get_stats()["in_flight"] == 0
+
+        accept = True
+        await scheduler.dispatch()
+        assert queue.released == [("task", TaskPriority.NORMAL)]
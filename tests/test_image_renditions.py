@@ -0,0 +1,108 @@
+"""
+Tests for the shared image rendition cache.
+"""
+import io
+
+from PIL import Image
+
+from app.services.export.generators.image_renditions import (
+    ImageRenditionService,
+    RenditionCache,
+    RenditionSpec,
+    collect_image_sources,
+)
+
+
+def _image_bytes(size=(1600, 1200), format="JPEG", mode="RGB"):
+    buffer = io.BytesIO()
+    Image.new(mode, size, (200, 30, 30) if mode == "RGB" else (200, 30, 30, 0)).save(buffer, format=format)
+    return buffer.getvalue()
+
+
+class TestImageRenditionService:
+    """Test rendition reuse across slides and exporters."""
+
+    def test_reused_logo_decodes_once(self, tmp_path):
+        """Test that one source rendered for two exporters decodes once."""
+        logo = tmp_path / "logo.jpg"
+        logo.write_bytes(_image_bytes())
+        service = ImageRenditionService()
+        pptx_spec = RenditionSpec(size=(200, 150), quality=90, optimize=True)
+        pdf_spec = RenditionSpec(size=(300, 225), quality=85, dpi=150)
+
+        for _ in range(40):
+            service.render(str(logo), pptx_spec)
+            service.render(str(logo), pdf_spec)
+
+        stats = service.get_stats()
+        assert stats["decodes"] == 1
+        assert stats["renders"] == 2
+        assert stats["memory_hits"] == 78
+
+    def test_same_content_shares_renditions(self, tmp_path):
+        """Test that identical content under different sources is reused."""
+        data = _image_bytes()
+        (tmp_path / "a.jpg").write_bytes(data)
+        spec = RenditionSpec(size=(100, 100))
+        service = ImageRenditionService()
+
+        first = service.render(str(tmp_path / "a.jpg"), spec)
+        second = service.render(io.BytesIO(data), spec)
+
+        assert first == second
+        assert service.get_stats()["renders"] == 1
+
+    def test_draft_decoding_and_fit(self):
+        """Test reduced-scale JPEG decoding and aspect-preserving fit."""
+        service = ImageRenditionService()
+
+        rendition = Image.open(io.BytesIO(service.render(_image_bytes(), RenditionSpec(size=(160, 160)))))
+
+        assert rendition.size == (160, 120)
+        image, full_size = next(iter(service._decoded.values()))
+        assert not full_size
+        assert image.width < 1600
+
+    def test_transparency_flattened_onto_white(self):
+        """Test that transparent PNGs are composited onto white."""
+        service = ImageRenditionService()
+        data = _image_bytes(size=(20, 20), format="PNG", mode="RGBA")
+
+        rendition = Image.open(io.BytesIO(service.render(data, RenditionSpec(size=(20, 20), format="PNG"))))
+
+        assert rendition.getpixel((0, 0)) == (255, 255, 255)
+
+    def test_disk_tier_survives_new_service(self, tmp_path):
+        """Test that renditions persisted to disk are reused by a new cache."""
+        data = _image_bytes()
+        spec = RenditionSpec(size=(64, 64))
+        ImageRenditionService(cache=RenditionCache(disk_dir=tmp_path)).render(data, spec)
+
+        service = ImageRenditionService(cache=RenditionCache(disk_dir=tmp_path))
+        service.render(data, spec)
+
+        assert service.get_stats()["disk_hits"] == 1
+        assert service.get_stats()["decodes"] == 0
+
+    def test_disk_tier_shared_with_running_cache(self, tmp_path):
+        """Test that a cache finds renditions written to its directory after it started."""
+        data = _image_bytes()
+        spec = RenditionSpec(size=(64, 64))
+        pptx_process = ImageRenditionService(cache=RenditionCache(disk_dir=tmp_path))
+        pdf_process = ImageRenditionService(cache=RenditionCache(disk_dir=tmp_path))
+
+        pptx_process.render(data, spec)
+        pdf_process.render(data, spec)
+
+        assert pdf_process.get_stats()["disk_hits"] == 1
+        assert pdf_process.get_stats()["decodes"] == 0
+        assert pdf_process.cache.get_stats()["disk_entries"] == 1
+
+    def test_collect_image_sources(self):
+        """Test that image references are collected from slide bodies."""
+        slides = [
+            {"body": [{"type": "image", "path": "figures/a.png"}, {"type": "text", "path": "x"}]},
+            {"body": [{"type": "figure", "url": "https://example.com/b.jpg"}]},
+        ]
+
+        assert collect_image_sources(slides) == ["figures/a.png", "https://example.com/b.jpg"]
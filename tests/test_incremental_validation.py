@@ -0,0 +1,369 @@
+"""
+Tests for incremental revalidation of edited presentations.
+"""
+import copy
+import random
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.slides.quality import (
+    BaseQualityAssurance,
+    QualityChecker,
+    QualityCheckCache,
+    QualityDimension,
+    ReadabilityScorer,
+    TimingValidator,
+    TransitionValidator,
+    VisualBalanceAssessor,
+)
+from app.services.slides.rules import (
+    FeatureRule,
+    IncrementalValidator,
+    RuleCategory,
+    RuleContext,
+    RuleEngine,
+    register_academic_rules,
+    register_text_rules,
+    register_timing_rules,
+    register_visual_rules,
+)
+
+
+VOCABULARY = (
+    "we utilize the proposed method in order to evaluate data. results were obtained and analyzed! "
+    "this shows significant gains? furthermore the hypothesis is supported (Lee, 2020). it is "
+    "important to note that the Transformer-based approach uses GPU clusters. Overview Conclusion "
+    "Section references studies show a lot of gains"
+).split()
+
+
+def words(rng, count):
+    return " ".join(rng.choice(VOCABULARY) for _ in range(count))
+
+
+def make_deck(slides: int, seed: int = 5):
+    """Build a rules deck of text, bullet and chart slides."""
+    rng = random.Random(seed)
+    deck = []
+    for number in range(1, slides + 1):
+        body = [
+            {"type": "text", "content": words(rng, rng.randint(8, 30))},
+            {"type": "bullet_list", "items": [{"text": words(rng, rng.randint(4, 14))} for _ in range(rng.randint(2, 7))]},
+        ]
+        if number % 4 == 0:
+            body.append({"type": "chart", "caption": words(rng, 5), "data": {"series": [{"data": [1, 2, 3]}]}})
+        deck.append({"slide_number": number, "content": {"title": words(rng, rng.randint(2, 6)), "body": body}})
+    return {"title": "Robust Transformers", "slides": deck}
+
+
+def make_slides(count: int, seed: int = 5):
+    """Build quality-checker slides with the attributes checkers read."""
+    rng = random.Random(seed)
+    slides = []
+    for number in range(1, count + 1):
+        body = [
+            {"type": "text", "content": words(rng, rng.randint(5, 60))},
+            {"type": "bullet_list", "items": [words(rng, rng.randint(2, 20)) + rng.choice(["", "."]) for _ in range(rng.randint(1, 8))]},
+        ]
+        if rng.random() < 0.4:
+            body.append({"type": rng.choice(["image", "chart", "equation", "code", "table"])})
+        content = {"body": body}
+        if rng.random() < 0.3:
+            content["layout"] = rng.choice(["single", "two_column", "image_left", "grid"])
+        slides.append(SimpleNamespace(
+            id=number,
+            slide_number=number,
+            title=rng.choice([None, words(rng, 3).title(), words(rng, 4).upper(), words(rng, 2)]),
+            content=content,
+            layout_type=rng.choice(["content", "content", "content", "section"]),
+            speaker_notes=rng.choice([None, words(rng, 20)]),
+            section=None,
+            duration_seconds=rng.choice([None, None, 45]),
+            transitions=rng.choice([{}, {"type": "fade"}, {"type": "cube", "duration": 2.5}]),
+            animations={},
+            contains_equations=rng.random() < 0.2,
+            contains_code=rng.random() < 0.1,
+            contains_citations=rng.random() < 0.3,
+            figure_count=rng.choice([0, 0, 1, 2]),
+            is_hidden=False,
+            is_backup=False,
+        ))
+    return slides
+
+
+def academic_engine() -> RuleEngine:
+    engine = RuleEngine()
+    register_text_rules(engine)
+    register_academic_rules(engine)
+    register_timing_rules(engine)
+    register_visual_rules(engine)
+    return engine
+
+
+def conference_context(slide_count: int) -> RuleContext:
+    return RuleContext(
+        presentation_type="conference",
+        academic_level="graduate",
+        duration_minutes=20,
+        slide_count=slide_count
+    )
+
+
+def violation_keys(violations):
+    return [(v.rule_id, v.severity, v.message, v.location) for v in violations]
+
+
+def rule_results(results):
+    return (
+        results["presentation_valid"],
+        results["total_violations"],
+        violation_keys(results["presentation_violations"]),
+        {number: violation_keys(result["violations"]) for number, result in results["slide_results"].items()},
+    )
+
+
+def edit_slide(deck, index, text):
+    deck["slides"][index]["content"]["body"][0]["content"] = text
+
+
+class CountingRule(FeatureRule):
+    """Rule counting the slides it validated, by slide number."""
+
+    def __init__(self):
+        super().__init__("test.counting", "Counting", "Counts validated slides", RuleCategory.TEXT)
+        self.calls = []
+
+    def validate_features(self, features, context):
+        if features.is_slide:
+            self.calls.append(features.slide_number)
+        return []
+
+
+class CountingSummaries:
+    """Wraps an incremental checker's summarize_slide to count calls."""
+
+    def __init__(self, checker):
+        self.calls = 0
+        summarize = checker.summarize_slide
+
+        def counted(slide, text):
+            self.calls += 1
+            return summarize(slide, text)
+
+        checker.summarize_slide = counted
+
+
+class DeckChecker(QualityChecker):
+    """Whole-deck checker counting its runs."""
+
+    def __init__(self):
+        self.runs = 0
+
+    @property
+    def dimension(self):
+        return QualityDimension.COHERENCE
+
+    def check(self, presentation, slides, references=None):
+        self.runs += 1
+        return 0.5, [], {"slides": len(slides)}
+
+
+def incremental_checkers():
+    return [TimingValidator(), TransitionValidator(), VisualBalanceAssessor(), ReadabilityScorer()]
+
+
+def report_contents(report):
+    metrics = report.metrics
+    return (
+        metrics.overall_score,
+        metrics.dimension_scores,
+        [vars(issue) for issue in metrics.issues],
+        sorted(metrics.strengths),
+        report.detailed_analysis,
+        report.recommendations,
+        report.estimated_revision_time,
+    )
+
+
+PRESENTATION = SimpleNamespace(id=1, academic_level="graduate", duration_minutes=20)
+
+
+class TestIncrementalRules:
+    """Test incremental rule validation."""
+
+    def test_matches_full_validation_and_revalidates_edited_slide(self):
+        """Test that a one-slide edit revalidates that slide only, with full results."""
+        engine = academic_engine()
+        counting = CountingRule()
+        engine.register_rule(counting)
+        validator = IncrementalValidator(engine)
+        deck = make_deck(20)
+        context = conference_context(20)
+
+        assert rule_results(validator.validate_presentation(deck, context)) == \
+            rule_results(engine.validate_presentation(deck, context))
+
+        edit_slide(deck, 6, "We really found a lot of gains in order to show results.")
+        counting.calls.clear()
+        incremental = validator.validate_presentation(deck, context)
+
+        assert counting.calls == [7]
+        assert validator.stats.slides_validated == 21
+        assert validator.stats.slides_reused == 19
+        assert validator.stats.presentations_validated == 2
+
+        full = engine.validate_presentation(deck, context)
+        assert rule_results(incremental) == rule_results(full)
+        assert full["total_violations"] > 0
+
+    def test_unchanged_deck_reuses_presentation_results(self):
+        """Test reuse of everything for an unchanged deck, and a fresh plan for new context."""
+        engine = academic_engine()
+        validator = IncrementalValidator(engine)
+        deck = make_deck(8)
+
+        first = validator.validate_presentation(deck, conference_context(8))
+        again = validator.validate_presentation(copy.deepcopy(deck), conference_context(8))
+        assert rule_results(again) == rule_results(first)
+        assert validator.stats.presentations_reused == 1
+        assert validator.stats.slides_validated == 8
+
+        deck["title"] = "Robust Transformers, Revisited"
+        validator.validate_presentation(deck, conference_context(8))
+        assert validator.stats.presentations_validated == 2
+        assert validator.stats.slides_validated == 8
+
+        validator.validate_presentation(deck, RuleContext("lecture", "undergraduate", 50, 8))
+        assert validator.stats.slides_validated == 16
+
+    def test_edits_in_place_do_not_change_cached_slides(self):
+        """Test that mutating validated slide dicts leaves cached features intact."""
+        engine = academic_engine()
+        validator = IncrementalValidator(engine)
+        deck = make_deck(6)
+        context = conference_context(6)
+        original = copy.deepcopy(deck)
+
+        validator.validate_presentation(deck, context)
+        edit_slide(deck, 2, "Overview " * 120)
+        validator.validate_presentation(deck, context)
+
+        # Back to the original text: served from the cache, as computed then
+        assert rule_results(validator.validate_presentation(original, context)) == \
+            rule_results(engine.validate_presentation(original, context))
+        assert validator.stats.slides_validated == 7
+
+
+class TestQualityCheckCache:
+    """Test cached quality assessment."""
+
+    def test_matches_uncached_assessment_after_edit(self):
+        """Test that an edited deck is assessed as without the cache, summarizing one slide."""
+        checkers = incremental_checkers()
+        counters = [CountingSummaries(checker) for checker in checkers]
+        deck_checker = DeckChecker()
+        cached = BaseQualityAssurance(checkers + [deck_checker], cache=QualityCheckCache())
+        uncached = BaseQualityAssurance(incremental_checkers() + [DeckChecker()])
+        slides = make_slides(30)
+
+        assert report_contents(cached.assess_quality(PRESENTATION, slides)) == \
+            report_contents(uncached.assess_quality(PRESENTATION, slides))
+        assert [counter.calls for counter in counters] == [30] * 4
+
+        slides[11].content["body"][0]["content"] = "This shows. It is clear. " * 40
+        slides[11].title = "THE METHOD"
+        for counter in counters:
+            counter.calls = 0
+        report = cached.assess_quality(PRESENTATION, slides)
+
+        assert [counter.calls for counter in counters] == [1] * 4
+        assert deck_checker.runs == 2
+        assert report_contents(report) == report_contents(uncached.assess_quality(PRESENTATION, slides))
+        assert any(issue.slide_number == 12 for issue in report.metrics.issues)
+
+    def test_reordered_slides_reuse_summaries(self):
+        """Test that moved slides keep their summaries and get issues at their new position."""
+        checkers = incremental_checkers()
+        counters = [CountingSummaries(checker) for checker in checkers]
+        deck_checker = DeckChecker()
+        cached = BaseQualityAssurance(checkers + [deck_checker], cache=QualityCheckCache())
+        uncached = BaseQualityAssurance(incremental_checkers() + [DeckChecker()])
+        slides = make_slides(12, seed=9)
+        cached.assess_quality(PRESENTATION, slides)
+
+        moved = [slides[0]] + slides[6:] + slides[1:6]
+        for number, slide in enumerate(moved, 1):
+            slide.slide_number = number
+        for counter in counters:
+            counter.calls = 0
+
+        assert report_contents(cached.assess_quality(PRESENTATION, moved)) == \
+            report_contents(uncached.assess_quality(PRESENTATION, moved))
+        assert [counter.calls for counter in counters] == [0] * 4
+
+        # Whole-deck checkers rerun for the new order, and are reused after
+        assert deck_checker.runs == 2
+        cached.assess_quality(PRESENTATION, moved)
+        assert deck_checker.runs == 2
+
+    def test_registering_a_checker_clears_its_dimension(self):
+        """Test that a replaced checker does not see its predecessor's summaries."""
+        cache = QualityCheckCache()
+        qa_system = BaseQualityAssurance([TimingValidator()], cache=cache)
+        slides = make_slides(5)
+        qa_system.assess_quality(PRESENTATION, slides)
+        assert cache.get_stats()["summaries"] == 5
+
+        replacement = TimingValidator()
+        counter = CountingSummaries(replacement)
+        qa_system.register_checker(replacement)
+        qa_system.assess_quality(PRESENTATION, slides)
+        assert counter.calls == 5
+
+
+@pytest.mark.slow
+def test_one_slide_edit_benchmark():
+    """Benchmark: one-slide edit of a 100-slide deck, full vs incremental revalidation."""
+    engine = academic_engine()
+    validator = IncrementalValidator(engine)
+    deck = make_deck(100)
+    context = conference_context(100)
+    slides = make_slides(100)
+    qa_system = BaseQualityAssurance(incremental_checkers())
+    cached_qa = BaseQualityAssurance(incremental_checkers(), cache=QualityCheckCache())
+
+    validator.validate_presentation(deck, context)
+    cached_qa.assess_quality(PRESENTATION, slides)
+    edits = iter(range(10 ** 6))
+
+    def edit():
+        # A new text every run, so the edited slide is never cached
+        number = next(edits)
+        edit_slide(deck, 40, f"Revision {number} of the results.")
+        slides[40].content["body"][0]["content"] = f"Revision {number} of the results."
+
+    def full():
+        edit()
+        engine.validate_presentation(deck, context)
+        qa_system.assess_quality(PRESENTATION, slides)
+
+    def incremental():
+        edit()
+        validator.validate_presentation(deck, context)
+        cached_qa.assess_quality(PRESENTATION, slides)
+
+    def best_of(run, repeat=10):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - started)
+        return min(timings)
+
+    full_time = best_of(full)
+    incremental_time = best_of(incremental)
+    print(f"\nfull: {full_time * 1000:.1f} ms, incremental: {incremental_time * 1000:.1f} ms, "
+          f"speedup {full_time / incremental_time:.1f}x")
+    assert incremental_time < full_time
@@ -0,0 +1,210 @@
+"""
+Tests for coalesced generation job progress.
+"""
+
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy import JSON, Column, MetaData, String, Table, Uuid, create_engine, event, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.repositories.job_progress import progress_update_statement
+from app.services.jobs import JobProgressSink
+
+metadata = MetaData()
+
+jobs = Table(
+    "generationjob", metadata,
+    Column("id", Uuid, primary_key=True),
+    Column("status", String(50), nullable=False),
+    Column("processing_steps", JSON),
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class RecordingWriter:
+    """Writer double keeping every write."""
+
+    def __init__(self, failures=0):
+        self.writes = []
+        self.failures = failures
+
+    async def __call__(self, job_id, step_patches, values):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("database unavailable")
+        self.writes.append((job_id, [dict(patch) for patch in step_patches], dict(values)))
+
+
+class TestProgressUpdateStatement:
+    """Test the partial processing_steps update on SQLite."""
+
+    @pytest.fixture
+    def connection(self):
+        engine = create_engine("sqlite://")
+        metadata.create_all(engine)
+        with engine.connect() as connection:
+            yield connection
+
+    def test_patches_merge_into_existing_steps(self, connection):
+        """Test that patched steps keep untouched fields and new steps are appended in order."""
+        job_id = uuid.uuid4()
+        connection.execute(jobs.insert().values(
+            id=job_id, status="processing",
+            processing_steps=[
+                {"step": "parsing", "status": "completed", "duration_ms": 1200},
+                {"step": "outline", "status": "processing", "progress": 0.2, "started_at": "t0"},
+            ]
+        ))
+
+        connection.execute(progress_update_statement(jobs, job_id, [
+            {"step": "slides", "status": "processing", "progress": 0.1, "started_at": "t2"},
+            {"step": "outline", "status": "completed", "progress": 1.0, "started_at": "t1"},
+            {"step": "review", "status": "processing", "progress": 0.0, "started_at": "t3"},
+        ], "sqlite", status="completed"))
+
+        row = connection.execute(select(jobs)).one()
+        assert row.status == "completed"
+        assert row.processing_steps == [
+            {"step": "parsing", "status": "completed", "duration_ms": 1200},
+            {"step": "outline", "status": "completed", "progress": 1.0, "started_at": "t0"},
+            {"step": "slides", "status": "processing", "progress": 0.1, "started_at": "t2"},
+            {"step": "review", "status": "processing", "progress": 0.0, "started_at": "t3"},
+        ]
+
+    def test_null_steps_and_values_only(self, connection):
+        """Test that jobs without steps get them, and no patches sets only columns."""
+        job_id = uuid.uuid4()
+        connection.execute(jobs.insert().values(id=job_id, status="pending", processing_steps=None))
+
+        connection.execute(progress_update_statement(jobs, job_id, [{"step": "parsing", "progress": 0.5}], "sqlite"))
+        connection.execute(progress_update_statement(jobs, job_id, [], "sqlite", status="processing"))
+
+        row = connection.execute(select(jobs)).one()
+        assert (row.status, row.processing_steps) == ("processing", [{"step": "parsing", "progress": 0.5}])
+
+
+class TestJobProgressSink:
+    """Test buffering and flushing of progress ticks."""
+
+    @pytest.mark.asyncio
+    async def test_writes_are_bounded_by_time(self):
+        """Test that 1000 ticks over 10 seconds cause about one write per second."""
+        clock = FakeClock()
+        writer = RecordingWriter()
+        sink = JobProgressSink(writer, flush_interval=1.0, clock=clock)
+        job_id = uuid.uuid4()
+
+        for tick in range(1000):
+            clock.now = tick * 0.01
+            await sink.record(job_id, "slides", tick / 1000)
+        await sink.flush()
+
+        assert sink.stats.ticks == 1000
+        assert 10 <= len(writer.writes) <= 12
+        assert writer.writes[-1][1] == [{"step": "slides", "status": "processing", "progress": 0.999}]
+        assert "started_at" in writer.writes[0][1][0]
+
+    @pytest.mark.asyncio
+    async def test_status_changes_flush_immediately(self):
+        """Test that step completion and job transitions are written at once."""
+        clock = FakeClock()
+        writer = RecordingWriter()
+        sink = JobProgressSink(writer, flush_interval=60.0, clock=clock)
+        job_id = uuid.uuid4()
+
+        await sink.record(job_id, "outline", 0.0)
+        clock.now = 2.5
+        await sink.record(job_id, "outline", 0.5)
+        await sink.record(job_id, "outline", 1.0, step_status="completed")
+        await sink.record(job_id, "slides", 0.0)
+        clock.now = 3.0
+        await sink.record(job_id, "slides", 0.4)
+        await sink.transition(job_id, "completed", result_data={"slides": 12})
+
+        assert [len(steps) for _, steps, _ in writer.writes] == [1, 1, 1, 1]
+        assert writer.writes[1][1][0]["duration_ms"] == 2500
+        assert writer.writes[3] == (
+            job_id,
+            [{"step": "slides", "status": "processing", "progress": 0.4}],
+            {"status": "completed", "result_data": {"slides": 12}},
+        )
+        assert sink.pending_jobs == 0
+        assert sink._steps == {}
+
+    @pytest.mark.asyncio
+    async def test_terminal_state_survives_failed_write(self):
+        """Test that a failed terminal write is raised, kept and retried."""
+        writer = RecordingWriter(failures=1)
+        sink = JobProgressSink(writer, flush_interval=60.0, clock=FakeClock())
+        job_id = uuid.uuid4()
+
+        with pytest.raises(ConnectionError):
+            await sink.transition(job_id, "failed", error_message="provider timeout")
+        assert sink.pending_jobs == 1
+
+        assert await sink.flush() == 1
+        assert writer.writes == [(job_id, [], {"status": "failed", "error_message": "provider timeout"})]
+        assert sink.stats.failed_writes == 1
+
+    @pytest.mark.asyncio
+    async def test_background_flush_of_idle_jobs(self):
+        """Test that progress of a job that stops reporting is still written."""
+        writer = RecordingWriter()
+        sink = JobProgressSink(writer, flush_interval=0.05)
+        job_id = uuid.uuid4()
+        await sink.record(job_id, "slides", 0.1)
+        await sink.record(job_id, "slides", 0.2)
+        await sink.start()
+
+        await asyncio.sleep(0.2)
+        await sink.stop()
+
+        assert writer.writes[-1][1][0]["progress"] == 0.2
+        assert sink.pending_jobs == 0
+
+
+@pytest.mark.asyncio
+async def test_sink_against_database():
+    """Test that a burst of ticks lands as a few single-statement writes."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as connection:
+        await connection.run_sync(metadata.create_all)
+    job_id = uuid.uuid4()
+    async with engine.begin() as connection:
+        await connection.execute(jobs.insert().values(id=job_id, status="processing", processing_steps=[]))
+
+    statements = []
+    event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    async def writer(job_id, step_patches, values):
+        async with engine.begin() as connection:
+            await connection.execute(progress_update_statement(jobs, job_id, step_patches, "sqlite", **values))
+
+    clock = FakeClock()
+    sink = JobProgressSink(writer, flush_interval=1.0, clock=clock)
+    for tick in range(300):
+        clock.now = tick * 0.01
+        await sink.record(job_id, "outline" if tick < 100 else "slides", tick / 300,
+                          step_status="completed" if tick == 99 else "processing")
+    await sink.transition(job_id, "completed")
+
+    async with engine.connect() as connection:
+        row = (await connection.execute(select(jobs))).one()
+    await engine.dispose()
+
+    assert row.status == "completed"
+    assert [(s["step"], s["status"], s["progress"]) for s in row.processing_steps] == [
+        ("outline", "completed", 99 / 300),
+        ("slides", "processing", 299 / 300),
+    ]
+    assert row.processing_steps[0]["duration_ms"] == 990
+    assert len(statements) <= 8
@@ -0,0 +1,220 @@
+"""
+Tests for keyset pagination and estimated totals, run on SQLite.
+"""
+
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import DateTime, Float, ForeignKey, Index, String, Uuid, event, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, joinedload, mapped_column, relationship
+
+from app.repositories.pagination import (
+    InvalidCursorError,
+    SortKey,
+    count_total,
+    decode_cursor,
+    encode_cursor,
+    paginate,
+)
+
+START = datetime(2024, 1, 1)
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Owner(Base):
+    __tablename__ = "owner"
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    name: Mapped[str] = mapped_column(String(50))
+
+
+class Document(Base):
+    __tablename__ = "document"
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    owner_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("owner.id"))
+    score: Mapped[float] = mapped_column(Float)
+    updated_at: Mapped[datetime] = mapped_column(DateTime)
+    owner: Mapped[Owner] = relationship()
+
+    __table_args__ = (Index("idx_document_updated", "updated_at", "id"),)
+
+
+class StatementCounter:
+    """Counts statements sent to the database."""
+
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine.sync_engine, "before_cursor_execute", self)
+
+    def __call__(self, *args):
+        self.count += 1
+
+
+async def make_session(size):
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    session = async_sessionmaker(engine, expire_on_commit=False)()
+    owner = Owner(name="owner")
+    session.add(owner)
+    session.add_all(
+        # Scores and timestamps repeat so ordering relies on every key
+        Document(owner=owner, score=float(i % 7), updated_at=START + timedelta(minutes=i % 50))
+        for i in range(size)
+    )
+    await session.commit()
+    return engine, session
+
+
+@pytest.fixture
+async def session():
+    engine, session = await make_session(230)
+    yield session
+    await session.close()
+    await engine.dispose()
+
+
+def documents():
+    return select(Document).options(joinedload(Document.owner))
+
+
+async def all_pages(session, sort_keys, limit):
+    pages = []
+    cursor = None
+    while True:
+        page = await paginate(session, documents(), sort_keys, limit=limit, cursor=cursor)
+        pages.append(page.items)
+        if not page.has_next:
+            return pages
+        cursor = page.next_cursor
+
+
+class TestKeysetPagination:
+    """Test cursor paging and totals."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("score_descending", [True, False])
+    async def test_pages_cover_results_in_order(self, session, score_descending):
+        """Test that following cursors visits every row once, in query order."""
+        sort_keys = [
+            SortKey(Document.score, descending=score_descending),
+            SortKey(Document.updated_at),
+            SortKey(Document.id),
+        ]
+        expected = (await session.execute(
+            select(Document.id).order_by(
+                Document.score.desc() if score_descending else Document.score.asc(),
+                Document.updated_at.desc(),
+                Document.id.desc()
+            )
+        )).scalars().all()
+
+        pages = await all_pages(session, sort_keys, limit=20)
+
+        assert [document.id for page in pages for document in page] == expected
+        assert [len(page) for page in pages] == [20] * 11 + [10]
+        assert pages[0][0].owner.name == "owner"
+
+    @pytest.mark.asyncio
+    async def test_small_result_total_needs_no_count(self, session):
+        """Test that a result set fitting on one page is counted from the page."""
+        counter = StatementCounter(session.bind)
+
+        page = await paginate(
+            session, documents().where(Document.score == 3.0),
+            [SortKey(Document.updated_at), SortKey(Document.id)],
+            limit=50, include_total=True
+        )
+
+        assert page.total == 33
+        assert page.total_is_estimate is False
+        assert counter.count == 1
+
+    @pytest.mark.asyncio
+    async def test_large_totals_are_capped(self, session):
+        """Test that counting stops at the exact limit and is flagged as an estimate."""
+        sort_keys = [SortKey(Document.updated_at), SortKey(Document.id)]
+
+        exact = await paginate(session, documents(), sort_keys, limit=10, include_total=True)
+        capped = await paginate(
+            session, documents(), sort_keys, limit=10, include_total=True, exact_total_limit=100
+        )
+        lazy = await paginate(session, documents(), sort_keys, limit=10)
+
+        assert (exact.total, exact.total_is_estimate) == (230, False)
+        assert capped.total_is_estimate is True
+        assert capped.total >= 101
+        assert lazy.total is None
+        assert await count_total(session, documents(), exact_total_limit=500) == (230, False)
+
+    @pytest.mark.asyncio
+    async def test_offset_without_cursor(self, session):
+        """Test that offset paging still works for the first request."""
+        sort_keys = [SortKey(Document.updated_at), SortKey(Document.id)]
+        first = await paginate(session, documents(), sort_keys, limit=30)
+        second = await paginate(session, documents(), sort_keys, limit=10, offset=20)
+
+        assert [d.id for d in second.items] == [d.id for d in first.items[20:]]
+
+
+def test_cursor_round_trip():
+    """Test that cursors are opaque and keep value types."""
+    values = (0.0607927, START, uuid.UUID(int=5), "draft", None)
+
+    cursor = encode_cursor(values)
+
+    assert "draft" not in cursor
+    assert decode_cursor(cursor, 5) == values
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, 3)
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("not a cursor!", 5)
+    with pytest.raises(InvalidCursorError):
+        # [{"uuid": "x"}]
+        decode_cursor("W3sidXVpZCI6ICJ4In1d", 1)
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_deep_page_latency_benchmark():
+    """Benchmark page latency by depth, OFFSET vs keyset."""
+    size = 50_000
+    limit = 20
+    engine, session = await make_session(size)
+    sort_keys = [SortKey(Document.updated_at), SortKey(Document.id)]
+    ordered = select(Document).order_by(Document.updated_at.desc(), Document.id.desc())
+
+    cursors = {}
+    cursor = None
+    for page_number in range(size // limit):
+        if page_number in (1, 100, 1000, 2400):
+            cursors[page_number] = cursor
+        page = await paginate(session, select(Document), sort_keys, limit=limit, cursor=cursor)
+        cursor = page.next_cursor
+        session.expunge_all()
+
+    print()
+    for page_number, cursor in cursors.items():
+        started = time.perf_counter()
+        for _ in range(5):
+            await session.execute(ordered.limit(limit).offset(page_number * limit))
+        offset_ms = (time.perf_counter() - started) / 5 * 1000
+
+        started = time.perf_counter()
+        for _ in range(5):
+            await paginate(session, select(Document), sort_keys, limit=limit, cursor=cursor)
+        keyset_ms = (time.perf_counter() - started) / 5 * 1000
+        session.expunge_all()
+
+        print(f"page {page_number}: OFFSET {offset_ms:.2f} ms, keyset {keyset_ms:.2f} ms")
+        if page_number == 2400:
+            assert keyset_ms < offset_ms
+
+    await session.close()
+    await engine.dispose()
@@ -0,0 +1,120 @@
+"""
+Tests for multi-file LaTeX include resolution.
+"""
+import os
+
+import pytest
+
+from app.services.document_processing.utils.latex_includes import (
+    LaTeXIncludeResolver,
+    LaTeXSourceCache,
+)
+from app.services.document_processing.utils.latex_parser import LaTeXTokenizer, TokenType
+
+
+def _write(path, content):
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a small multi-file LaTeX project."""
+    main = _write(
+        tmp_path / "main.tex",
+        "\\documentclass{article}\n"
+        "\\begin{document}\n"
+        "\\input{intro}\n"
+        "% \\input{commented}\n"
+        "\\include{chapters/methods}\n"
+        "\\end{document}\n",
+    )
+    _write(tmp_path / "intro.tex", "Intro text.\n")
+    (tmp_path / "chapters").mkdir()
+    _write(tmp_path / "chapters" / "methods.tex", "Methods \\input{chapters/detail}.\n")
+    _write(tmp_path / "chapters" / "detail.tex", "Detail text")
+    return main
+
+
+class TestLaTeXIncludeResolver:
+    """Test include graph construction and assembly."""
+
+    async def test_assembles_nested_includes(self, project):
+        """Test that includes are spliced in and comments are left alone."""
+        resolver = LaTeXIncludeResolver(cache=LaTeXSourceCache())
+        document = await resolver.load(project)
+
+        assert "Intro text." in document.source
+        assert "Methods Detail text." in document.source
+        assert "% \\input{commented}" in document.source
+        assert len(document.files) == 4
+        assert not document.missing and not document.cycles
+
+    async def test_tokens_match_assembled_source(self, project):
+        """Test that the assembled token stream covers the assembled source."""
+        resolver = LaTeXIncludeResolver(cache=LaTeXSourceCache())
+        document = await resolver.load(project)
+        tokens = resolver.build_tokens(document)
+
+        assert "".join(t.content for t in tokens) == document.source
+        detail = next(t for t in tokens if t.content == "Detail")
+        assert detail.position == document.source.index("Detail text")
+        assert detail.line == document.source[:detail.position].count("\n") + 1
+
+    async def test_cycles_and_missing_files_keep_command(self, tmp_path):
+        """Test that cyclic and missing includes are reported, not expanded."""
+        main = _write(tmp_path / "main.tex", "A \\input{b} \\input{missing}")
+        _write(tmp_path / "b.tex", "B \\input{main}")
+
+        document = await LaTeXIncludeResolver(cache=LaTeXSourceCache()).load(main)
+
+        assert document.source == "A B \\input{main} \\input{missing}"
+        assert document.cycles == [[main.resolve(), (tmp_path / "b.tex").resolve(), main.resolve()]]
+        assert document.missing == [(tmp_path / "missing.tex").resolve()]
+
+    async def test_only_changed_files_are_rescanned(self, project):
+        """Test that a second load re-tokenizes only the edited file."""
+        cache = LaTeXSourceCache()
+        resolver = LaTeXIncludeResolver(cache=cache)
+        first = await resolver.load(project)
+        assert len(first.scanned_files) == 4
+
+        intro = project.parent / "intro.tex"
+        intro.write_text("Edited intro.\n", encoding="utf-8")
+        stat = intro.stat()
+        os.utime(intro, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = await resolver.load(project)
+
+        assert second.scanned_files == [intro.resolve()]
+        assert len(second.cached_files) == 3
+        assert "Edited intro." in second.source
+
+    async def test_matches_whole_document_tokenization(self, project):
+        """Test that per-file scanning agrees with tokenizing the whole source."""
+        resolver = LaTeXIncludeResolver(cache=LaTeXSourceCache())
+        document = await resolver.load(project)
+
+        whole = LaTeXTokenizer().tokenize(document.source)
+        assembled = resolver.build_tokens(document)
+
+        assert [(t.type, t.content, t.position) for t in assembled] == [
+            (t.type, t.content, t.position) for t in whole
+        ]
+        assert next(t for t in assembled if t.content == "text.").type == TokenType.TEXT
+
+    async def test_runs_split_by_includes_are_rejoined(self, tmp_path):
+        """Test that text, whitespace and math runs meeting at a splice point merge."""
+        main = _write(tmp_path / "main.tex", "pre\\input{a}fix \\input{b} $\\input{c}x$")
+        _write(tmp_path / "a.tex", "sub")
+        _write(tmp_path / "b.tex", "  mid")
+        _write(tmp_path / "c.tex", "$")
+
+        resolver = LaTeXIncludeResolver(cache=LaTeXSourceCache())
+        document = await resolver.load(main)
+        assembled = resolver.build_tokens(document)
+        whole = LaTeXTokenizer().tokenize(document.source)
+
+        assert document.source == "presubfix   mid $$x$"
+        assert [(t.type, t.content) for t in assembled] == [(t.type, t.content) for t in whole]
+        assert assembled[0].content == "presubfix"
@@ -0,0 +1,129 @@
+"""
+Tests for the LaTeX tokenizer.
+"""
+import time
+
+import pytest
+
+from app.services.document_processing.utils.latex_parser import (
+    LaTeXParser,
+    LaTeXToken,
+    LaTeXTokenizer,
+    TokenType,
+)
+
+
+SAMPLE_SOURCE = r"""\documentclass[12pt]{article}
+% preamble comment
+\begin{document}
+\section{Introduction}
+As shown in Table~\ref{tab:results}, $x_i^2$ grows \& so does $$E = mc^2$$.
+\newcommand{\vect}[1]{\mathbf{#1}}
+\end{document}
+"""
+
+
+def _tokenize(source):
+    return [(t.type, t.content) for t in LaTeXTokenizer().tokenize(source)]
+
+
+class TestLaTeXTokenizer:
+    """Test token stream produced by the scanner."""
+
+    def test_basic_token_types(self):
+        """Test that each construct maps to the expected token type."""
+        assert _tokenize(r"\section{Intro} text") == [
+            (TokenType.COMMAND, r"\section"),
+            (TokenType.BRACE_OPEN, "{"),
+            (TokenType.TEXT, "Intro"),
+            (TokenType.BRACE_CLOSE, "}"),
+            (TokenType.WHITESPACE, " "),
+            (TokenType.TEXT, "text"),
+        ]
+
+    def test_comments_math_and_escapes(self):
+        """Test comments, math delimiters and escaped characters."""
+        assert _tokenize("a % note\n$$\\%$") == [
+            (TokenType.TEXT, "a"),
+            (TokenType.WHITESPACE, " "),
+            (TokenType.COMMENT, "% note"),
+            (TokenType.NEWLINE, "\n"),
+            (TokenType.MATH_DISPLAY, "$$"),
+            (TokenType.SPECIAL_CHAR, "\\%"),
+            (TokenType.MATH_INLINE, "$"),
+        ]
+
+    def test_special_characters_do_not_stall(self):
+        """Test that bare special characters become tokens of their own."""
+        assert _tokenize("a~b_c^d&e#1") == [
+            (TokenType.TEXT, "a"),
+            (TokenType.SPECIAL_CHAR, "~"),
+            (TokenType.TEXT, "b"),
+            (TokenType.SPECIAL_CHAR, "_"),
+            (TokenType.TEXT, "c"),
+            (TokenType.SPECIAL_CHAR, "^"),
+            (TokenType.TEXT, "d"),
+            (TokenType.SPECIAL_CHAR, "&"),
+            (TokenType.TEXT, "e"),
+            (TokenType.PARAMETER, "#1"),
+        ]
+
+    def test_control_symbols_and_trailing_backslash(self):
+        """Test single-character commands and a backslash at end of input."""
+        assert _tokenize("\\,\\1\\") == [
+            (TokenType.COMMAND, "\\,"),
+            (TokenType.COMMAND, "\\1"),
+            (TokenType.SPECIAL_CHAR, "\\"),
+        ]
+
+    def test_tokens_cover_source(self):
+        """Test that tokens are contiguous and reassemble the source."""
+        tokens = LaTeXTokenizer().tokenize(SAMPLE_SOURCE)
+
+        assert "".join(t.content for t in tokens) == SAMPLE_SOURCE
+        for previous, current in zip(tokens, tokens[1:]):
+            assert previous.end_position == current.position
+
+    def test_line_and_column_resolution(self):
+        """Test lazily resolved line and column numbers."""
+        tokens = LaTeXTokenizer().tokenize("ab\n  \\cmd\n")
+        command = next(t for t in tokens if t.type == TokenType.COMMAND)
+
+        assert (tokens[0].line, tokens[0].column) == (1, 1)
+        assert (command.line, command.column) == (2, 3)
+        assert command.raw_content == r"\cmd"
+
+    def test_explicit_token_construction(self):
+        """Test tokens built by hand keep their given location."""
+        token = LaTeXToken(TokenType.TEXT, "word", line=4, column=7, position=30)
+
+        assert (token.line, token.column, token.position) == (4, 7, 30)
+        assert token == LaTeXToken(TokenType.TEXT, "word", position=30)
+
+    def test_parser_compatibility(self):
+        """Test that the parser consumes the token stream."""
+        source = "\\section{Intro}\nSee Table~\\ref{tab:results}.\n\\begin{abstract}x\\end{abstract}"
+        tokens = LaTeXTokenizer().tokenize(source)
+        commands, environments = LaTeXParser(tokens).parse()
+
+        by_name = {c.name: c for c in commands}
+        assert len(by_name["section"].arguments) == 1
+        assert (by_name["ref"].line, by_name["ref"].column) == (2, 11)
+        assert len(environments) == 1
+        assert environments[0].begin_line == 3
+
+
+@pytest.mark.slow
+def test_tokenizer_throughput():
+    """Benchmark tokenizer throughput in MB/s on a thesis-sized input."""
+    source = SAMPLE_SOURCE * 5000
+    size_mb = len(source.encode("utf-8")) / (1024 * 1024)
+
+    tokenizer = LaTeXTokenizer()
+    start = time.perf_counter()
+    tokens = tokenizer.tokenize(source)
+    elapsed = time.perf_counter() - start
+
+    throughput = size_mb / elapsed
+    print(f"\nTokenized {size_mb:.2f} MB into {len(tokens)} tokens: {throughput:.2f} MB/s")
+    assert throughput > 1.0
@@ -0,0 +1,104 @@
+"""
+Tests for parallel format export.
+"""
+import asyncio
+import time
+
+import pytest
+
+from app.services.export.queue.parallel_export import FormatExportPool
+
+
+def _burn(label, seconds):
+    """Stand-in for a CPU-bound generator."""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+    return label
+
+
+def _fail(label):
+    raise RuntimeError(f"{label} generator crashed")
+
+
+def _rendition_dir():
+    from app.services.export.generators.image_renditions import default_rendition_service
+
+    return str(default_rendition_service.cache.disk_dir)
+
+
+async def _probe_loop_lag(stop: asyncio.Event, interval: float = 0.01):
+    """Return the worst delay seen by a periodic timer on the event loop."""
+    worst = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - start - interval)
+    return worst
+
+
+class TestFormatExportPool:
+    """Test pool dispatch and failure isolation."""
+
+    @pytest.mark.asyncio
+    async def test_failure_is_isolated_per_format(self):
+        """Test that one failing format does not cancel the others."""
+        pool = FormatExportPool(max_workers=2, use_processes=False)
+        try:
+            outcomes = await asyncio.gather(
+                pool.run(_burn, "pptx", 0.01),
+                pool.run(_fail, "pdf"),
+                return_exceptions=True,
+            )
+        finally:
+            pool.shutdown()
+
+        assert outcomes[0] == "pptx"
+        assert isinstance(outcomes[1], RuntimeError)
+        assert pool.get_stats()["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_process_pool_runs_functions(self):
+        """Test that work runs in spawned processes."""
+        pool = FormatExportPool(max_workers=1)
+        try:
+            assert await pool.run(_burn, "pdf", 0.01) == "pdf"
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_pool_processes_share_a_rendition_directory(self, tmp_path):
+        """Test that pool processes cache renditions in the pool's directory."""
+        pool = FormatExportPool(max_workers=1, rendition_dir=tmp_path)
+        try:
+            assert await pool.run(_rendition_dir) == str(tmp_path)
+        finally:
+            pool.shutdown()
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_parallel_export_benchmark():
+    """Benchmark a three-format job: wall time vs slowest format, and loop lag."""
+    durations = {"pptx": 0.4, "pdf": 0.6, "beamer": 0.8}
+    pool = FormatExportPool(max_workers=3)
+    try:
+        # Warm up worker processes so spawn cost is not measured
+        await asyncio.gather(*(pool.run(_burn, "warmup", 0.05) for _ in range(3)))
+
+        stop = asyncio.Event()
+        probe = asyncio.create_task(_probe_loop_lag(stop))
+        start = time.perf_counter()
+        await asyncio.gather(*(pool.run(_burn, fmt, seconds) for fmt, seconds in durations.items()))
+        elapsed = time.perf_counter() - start
+        stop.set()
+        worst_lag = await probe
+    finally:
+        pool.shutdown()
+
+    print(
+        f"\n3-format job: {elapsed:.2f}s (sum {sum(durations.values()):.1f}s, "
+        f"slowest {max(durations.values()):.1f}s), worst loop lag {worst_lag * 1000:.1f} ms"
+    )
+    assert elapsed < sum(durations.values())
+    assert worst_lag < 0.1
@@ -0,0 +1,50 @@
+"""
+Tests for LaTeX math typeset into PDF paragraphs.
+"""
+import io
+
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import SimpleDocTemplate
+
+from app.services.export.generators.pdf_generator import PDFGenerator
+
+
+def build_pdf(flowables) -> bytes:
+    buffer = io.BytesIO()
+    SimpleDocTemplate(buffer).build(flowables)
+    return buffer.getvalue()
+
+
+def test_inline_math_builds():
+    """Test that a paragraph with inline math is typeset and builds."""
+    generator = PDFGenerator()
+    style = getSampleStyleSheet()['Normal']
+    paragraph = generator._typeset_paragraph(r'Energy $E=mc^2$ holds, as does $E=mc^2$ again', style)
+
+    assert '<img src="' in paragraph.text
+    assert len(generator._math_files) == 1
+    assert build_pdf([paragraph]).startswith(b'%PDF')
+
+
+def test_inline_math_kept_as_source_when_unstored(monkeypatch):
+    """Test that math whose render cannot be stored stays as source text."""
+    generator = PDFGenerator()
+
+    def fail(data):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(generator, '_math_image_path', fail)
+    paragraph = generator._typeset_paragraph(r'Energy $E=mc^2$ holds', getSampleStyleSheet()['Normal'])
+
+    assert '$E=mc^2$' in paragraph.text
+    assert build_pdf([paragraph]).startswith(b'%PDF')
+
+
+def test_currency_is_left_as_text():
+    """Test that prices in a paragraph are not typeset as math."""
+    generator = PDFGenerator()
+    text = 'Revenue was $5 million and costs rose to $10 million'
+    paragraph = generator._typeset_paragraph(text, getSampleStyleSheet()['Normal'])
+
+    assert paragraph.text == text
+    assert not generator._math_files
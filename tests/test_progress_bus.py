@@ -0,0 +1,235 @@
+"""
+Tests for the Redis job progress bus and its WebSocket delivery.
+"""
+
+import asyncio
+import json
+import uuid
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from redis.exceptions import ConnectionError
+
+from app.api.v1.endpoints.websocket import WebSocketManager
+from app.infrastructure.cache import progress_bus
+from app.infrastructure.cache.progress_bus import (
+    JobProgressBus,
+    decode_frame,
+    encode_frame,
+    job_channel,
+)
+
+
+class FakeWebSocket:
+    """WebSocket that records the messages sent to it."""
+
+    def __init__(self):
+        self.messages = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        self.messages.append(json.loads(text))
+
+    def progress(self):
+        return [(m["job_id"], m["data"]) for m in self.messages if m["type"] == "job_progress"]
+
+
+async def eventually(condition, timeout=2.0):
+    """Wait for a condition set by the listener task."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+async def redis_client(monkeypatch):
+    client = FakeAsyncRedis()
+
+    async def get_redis():
+        return client
+
+    monkeypatch.setattr(progress_bus, "get_redis", get_redis)
+    yield client
+    await client.aclose()
+
+
+@pytest.fixture
+async def manager():
+    manager = WebSocketManager()
+    yield manager
+    await manager.shutdown()
+
+
+async def connect(manager, *job_ids):
+    socket = FakeWebSocket()
+    connection = await manager.connect(socket, uuid.uuid4())
+    await manager.subscribe_to_jobs(connection.connection_id, list(job_ids))
+    return socket
+
+
+def test_frame_round_trip():
+    """Test that frames carry the job id, payload and publish time."""
+    job_id = uuid.uuid4()
+    decoded_job, data, published_at = decode_frame(encode_frame(job_id, {"progress": 0.5}))
+
+    assert decoded_job == str(job_id)
+    assert data == {"progress": 0.5}
+    assert published_at > 0
+    assert job_channel(job_id) == f"slidegenie:progress:{job_id}"
+
+
+@pytest.mark.asyncio
+async def test_frames_reach_only_the_jobs_sockets(redis_client, manager):
+    """Test that published frames are demultiplexed to each job's sockets."""
+    job_a, job_b = uuid.uuid4(), uuid.uuid4()
+    socket_a = await connect(manager, job_a)
+    socket_b = await connect(manager, job_b)
+    socket_both = await connect(manager, job_a, job_b)
+
+    await manager.start_progress_bus()
+    assert manager.progress_bus.is_running
+
+    await manager.broadcast_job_progress(job_a, {"progress": 0.25})
+    await manager.broadcast_job_progress(job_b, {"progress": 0.75})
+    await eventually(lambda: len(socket_both.progress()) == 2)
+
+    assert socket_a.progress() == [(str(job_a), {"progress": 0.25})]
+    assert socket_b.progress() == [(str(job_b), {"progress": 0.75})]
+    assert socket_both.progress() == [(str(job_a), {"progress": 0.25}), (str(job_b), {"progress": 0.75})]
+    assert manager.progress_bus.frames_published == 2
+
+
+@pytest.mark.asyncio
+async def test_frames_from_other_processes_are_delivered(redis_client, manager):
+    """Test that frames published by a worker without a bus reach local sockets."""
+    job_id = uuid.uuid4()
+    socket = await connect(manager, job_id)
+    await manager.start_progress_bus()
+
+    assert await progress_bus.publish_job_progress(job_id, {"stage": "parsing"})
+    await eventually(lambda: socket.progress())
+
+    assert socket.progress() == [(str(job_id), {"stage": "parsing"})]
+
+
+@pytest.mark.asyncio
+async def test_jobs_without_local_subscribers_are_skipped(redis_client):
+    """Test that frames for jobs nobody here follows are not decoded or dispatched."""
+    followed, other = str(uuid.uuid4()), str(uuid.uuid4())
+    dispatched = []
+
+    async def dispatcher(job_id, data, published_at):
+        dispatched.append((job_id, data))
+
+    bus = JobProgressBus(dispatcher, interested=lambda job_id: job_id == followed, client=redis_client)
+    await bus.start()
+    try:
+        await bus.publish(other, {"progress": 0.1})
+        await bus.publish(followed, {"progress": 0.2})
+        await eventually(lambda: bus.frames_received == 2)
+    finally:
+        await bus.stop()
+
+    assert dispatched == [(followed, {"progress": 0.2})]
+    assert bus.get_stats()["frames_skipped"] == 1
+    assert bus.get_stats()["frames_dropped"] == 0
+
+
+@pytest.mark.asyncio
+async def test_ended_subscription_is_closed_before_resubscribing(redis_client, monkeypatch):
+    """Test that a subscription whose listen() ends is closed and replaced."""
+    pubsubs = []
+    make_pubsub = redis_client.pubsub
+
+    async def ended():
+        return
+        yield
+
+    def pubsub(**kwargs):
+        subscription = make_pubsub(**kwargs)
+        if not pubsubs:
+            subscription.listen = ended
+        pubsubs.append(subscription)
+        return subscription
+
+    monkeypatch.setattr(redis_client, "pubsub", pubsub)
+    dispatched = []
+
+    async def dispatcher(job_id, data, published_at):
+        dispatched.append(data)
+
+    bus = JobProgressBus(dispatcher, client=redis_client)
+    await bus.start()
+    try:
+        await eventually(lambda: len(pubsubs) == 2 and pubsubs[1].subscribed)
+        assert pubsubs[0].connection is None
+
+        await bus.publish(uuid.uuid4(), {"progress": 0.5})
+        await eventually(lambda: dispatched)
+    finally:
+        await bus.stop()
+
+    assert dispatched == [{"progress": 0.5}]
+    assert pubsubs[1].connection is None
+
+
+@pytest.mark.asyncio
+async def test_local_delivery_when_redis_is_unavailable(monkeypatch, manager):
+    """Test that progress still reaches local sockets without Redis."""
+    async def get_redis():
+        raise ConnectionError("Redis is down")
+
+    monkeypatch.setattr(progress_bus, "get_redis", get_redis)
+    job_id = uuid.uuid4()
+    socket = await connect(manager, job_id)
+
+    await manager.start_progress_bus()
+    assert manager.progress_bus is None
+
+    await manager.broadcast_job_progress(job_id, {"progress": 1.0})
+
+    assert socket.progress() == [(str(job_id), {"progress": 1.0})]
+
+
+@pytest.mark.asyncio
+async def test_failed_publish_falls_back_to_local_delivery(redis_client, manager):
+    """Test that sockets are served directly when a publish through the bus fails."""
+    job_id = uuid.uuid4()
+    socket = await connect(manager, job_id)
+    await manager.start_progress_bus()
+
+    manager.progress_bus.client = FakeAsyncRedis(connected=False)
+    await manager.broadcast_job_progress(job_id, {"progress": 0.5})
+
+    assert socket.progress() == [(str(job_id), {"progress": 0.5})]
+    assert manager.progress_bus.frames_published == 0
+
+
+@pytest.mark.asyncio
+async def test_shutdown_stops_the_listener(redis_client, manager):
+    """Test that shutdown cancels the listener and closes its subscription."""
+    job_id = uuid.uuid4()
+    socket = await connect(manager, job_id)
+    await manager.start_progress_bus()
+    bus = manager.progress_bus
+    task = bus._listener_task
+    assert await redis_client.pubsub_numpat() == 1
+
+    await manager.shutdown()
+
+    assert task.done()
+    assert manager.progress_bus is None
+    assert bus._pubsub is None
+    assert not bus.get_stats()["running"]
+
+    await progress_bus.publish_job_progress(job_id, {"progress": 0.5})
+    await asyncio.sleep(0.05)
+    assert socket.progress() == []
+    assert bus.frames_received == 0
+
+    # Starting again subscribes afresh
+    await manager.start_progress_bus()
+    assert manager.progress_bus.is_running
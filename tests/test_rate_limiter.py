@@ -0,0 +1,169 @@
+"""
+Tests for the script-based Redis rate limiter.
+
+Runs the Lua scripts on fakeredis (with its Lua runtime) to check that
+every strategy is exact under concurrent requests and costs one round trip.
+"""
+
+import asyncio
+import time
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from app.services.security.rate_limiter import RateLimiter, RateLimitStrategy
+
+ALL_STRATEGIES = [
+    RateLimitStrategy.FIXED_WINDOW,
+    RateLimitStrategy.SLIDING_WINDOW,
+    RateLimitStrategy.TOKEN_BUCKET,
+    RateLimitStrategy.GCRA,
+]
+
+
+class CountingRedis(FakeAsyncRedis):
+    """Fake Redis client counting the commands sent to the server."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.commands = []
+
+    async def execute_command(self, *args, **options):
+        self.commands.append(args[0])
+        return await super().execute_command(*args, **options)
+
+
+class BrokenRedis(FakeAsyncRedis):
+    """Fake Redis client whose server is unreachable."""
+
+    async def execute_command(self, *args, **options):
+        raise ConnectionError("Connection refused")
+
+
+@pytest.fixture
+def client():
+    return CountingRedis()
+
+
+def make_limiter(client, strategy, limit=50, window=60):
+    return RateLimiter(
+        cache=object(),
+        default_limit=limit,
+        default_window=window,
+        strategy=strategy,
+        client=client,
+    )
+
+
+class TestScriptedRateLimiter:
+    """Test atomic rate limiting strategies."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("strategy", ALL_STRATEGIES)
+    async def test_exact_under_contention(self, client, strategy):
+        """Test that concurrent requests never exceed the limit."""
+        limiter = make_limiter(client, strategy, limit=50)
+
+        results = await asyncio.gather(
+            *(limiter.check_rate_limit("user-1") for _ in range(200))
+        )
+
+        allowed = [result for result in results if result.allowed]
+        assert len(allowed) == 50
+        assert all(result.retry_after >= 1 for result in results if not result.allowed)
+        assert sorted(result.remaining for result in allowed) == list(range(50))
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("strategy", ALL_STRATEGIES)
+    async def test_one_round_trip_per_check(self, client, strategy):
+        """Test that a check after preloading is a single EVALSHA."""
+        limiter = make_limiter(client, strategy)
+        await limiter.preload_scripts()
+        client.commands.clear()
+
+        for _ in range(5):
+            await limiter.check_rate_limit("user-2")
+
+        assert client.commands == ["EVALSHA"] * 5
+
+    @pytest.mark.asyncio
+    async def test_scripts_reload_after_flush(self, client):
+        """Test that checks recover when the server loses its script cache."""
+        limiter = make_limiter(client, RateLimitStrategy.GCRA, limit=2)
+        await limiter.check_rate_limit("user-3")
+        await client.script_flush()
+
+        result = await limiter.check_rate_limit("user-3")
+
+        assert result.allowed is True
+        assert result.remaining == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("strategy", [RateLimitStrategy.TOKEN_BUCKET, RateLimitStrategy.GCRA])
+    async def test_capacity_refills_over_time(self, client, strategy):
+        """Test that smoothing strategies admit requests again as time passes."""
+        limiter = make_limiter(client, strategy, limit=10, window=1)
+
+        for _ in range(10):
+            assert (await limiter.check_rate_limit("user-4")).allowed
+        assert not (await limiter.check_rate_limit("user-4")).allowed
+
+        # One request is re-admitted every 100ms
+        await asyncio.sleep(0.25)
+        admitted = [(await limiter.check_rate_limit("user-4")).allowed for _ in range(5)]
+        assert admitted.count(True) in (2, 3)
+
+    @pytest.mark.asyncio
+    async def test_rejected_requests_do_not_count(self, client):
+        """Test that rejected requests don't extend a sliding window."""
+        limiter = make_limiter(client, RateLimitStrategy.SLIDING_WINDOW, limit=3)
+
+        for _ in range(10):
+            await limiter.check_rate_limit("user-5")
+
+        assert await client.zcard("sliding:user-5") == 3
+        status = await limiter.get_rate_limit_status("user-5")
+        assert status["current"] == 3
+        assert status["remaining"] == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("strategy", ALL_STRATEGIES)
+    async def test_reset_rate_limit(self, client, strategy):
+        """Test that reset clears the key of every strategy."""
+        limiter = make_limiter(client, strategy, limit=1)
+        await limiter.check_rate_limit("user-6")
+        assert not (await limiter.check_rate_limit("user-6")).allowed
+
+        assert await limiter.reset_rate_limit("user-6") is True
+        assert (await limiter.check_rate_limit("user-6")).allowed
+
+    @pytest.mark.asyncio
+    async def test_fails_open_when_redis_unavailable(self):
+        """Test that requests are allowed if Redis errors."""
+        limiter = make_limiter(BrokenRedis(), RateLimitStrategy.GCRA, limit=1)
+
+        result = await limiter.check_rate_limit("user-7")
+
+        assert result.allowed is True
+        assert result.remaining == 1
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+@pytest.mark.parametrize("strategy", ALL_STRATEGIES)
+async def test_rate_limit_throughput_benchmark(strategy):
+    """Benchmark checks per second against the in-process fake server."""
+    client = CountingRedis()
+    limiter = make_limiter(client, strategy, limit=1_000_000)
+    await limiter.preload_scripts()
+    checks = 2000
+
+    started = time.perf_counter()
+    for batch in range(0, checks, 100):
+        await asyncio.gather(
+            *(limiter.check_rate_limit(f"user-{i % 10}") for i in range(batch, batch + 100))
+        )
+    elapsed = time.perf_counter() - started
+
+    print(f"\n{strategy.value}: {checks / elapsed:,.0f} checks/s, 1 round trip each")
+    assert client.commands.count("EVALSHA") == checks
@@ -0,0 +1,210 @@
+"""
+Tests for read-replica session routing.
+"""
+
+import asyncio
+import contextvars
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructure.database.routing import (
+    PRIMARY,
+    REPLICA,
+    ROLE_KEY,
+    ReplicaRouter,
+    replica_read,
+)
+
+metadata = MetaData()
+
+decks = Table(
+    "deck", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("title", String(100)),
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class LagProbe:
+    """Lag probe double returning a settable lag."""
+
+    def __init__(self, lag=0.0):
+        self.lag = lag
+        self.calls = 0
+
+    async def __call__(self, session):
+        self.calls += 1
+        if isinstance(self.lag, Exception):
+            raise self.lag
+        return self.lag
+
+
+class DeckRepository:
+    """Minimal repository reading and writing decks."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @replica_read
+    async def titles(self):
+        result = await self.db.execute(select(decks.c.title).order_by(decks.c.id))
+        return list(result.scalars())
+
+    async def add(self, title):
+        await self.db.execute(insert(decks).values(title=title))
+
+
+@pytest.fixture
+async def databases(tmp_path):
+    """Primary and replica as separate files, the replica one deck behind."""
+    engines = []
+    for name, titles in [("primary", ["Intro", "Results"]), ("replica", ["Intro"])]:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / name}.db")
+        async with engine.begin() as connection:
+            await connection.run_sync(metadata.create_all)
+            await connection.execute(insert(decks), [{"title": title} for title in titles])
+        engines.append(engine)
+    yield [sessionmaker(engine, class_=AsyncSession, expire_on_commit=False) for engine in engines]
+    for engine in engines:
+        await engine.dispose()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def probe():
+    return LagProbe()
+
+
+@pytest.fixture
+def router(databases, clock, probe):
+    primary, replica = databases
+    return ReplicaRouter(
+        primary, [replica],
+        max_lag_seconds=5.0,
+        lag_check_interval=2.0,
+        read_your_writes_seconds=30.0,
+        lag_probe=probe,
+        clock=clock
+    )
+
+
+async def read_titles(router):
+    async with await router.read_session() as session:
+        return session.info[ROLE_KEY], list((await session.execute(select(decks.c.title))).scalars())
+
+
+def in_new_context(coroutine_function, *args):
+    """Run a coroutine function as a separate request would, in a fresh context."""
+    return asyncio.create_task(coroutine_function(*args), context=contextvars.Context())
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_replica(router):
+    """Test that read sessions use the replica and primary sessions do not."""
+    assert await read_titles(router) == (REPLICA, ["Intro"])
+
+    async with router.primary_session() as session:
+        assert session.info[ROLE_KEY] == PRIMARY
+        assert len((await session.execute(select(decks))).all()) == 2
+
+    assert router.stats.replica_reads == 1
+
+
+@pytest.mark.asyncio
+async def test_reads_after_commit_stay_on_primary(router, clock):
+    """Test read-your-writes within a request, and only within it."""
+    async def request():
+        async with router.primary_session() as session:
+            await session.execute(insert(decks).values(title="Discussion"))
+            await session.commit()
+        return await read_titles(router)
+
+    role, titles = await in_new_context(request)
+    assert (role, titles[-1]) == (PRIMARY, "Discussion")
+    assert router.stats.sticky_reads == 1
+
+    # Another request did not write
+    assert (await in_new_context(read_titles, router))[0] == REPLICA
+
+    async def request_without_writes():
+        async with router.primary_session() as session:
+            await session.execute(select(decks))
+            await session.commit()
+        return await read_titles(router)
+
+    assert (await in_new_context(request_without_writes))[0] == REPLICA
+
+    async def long_request():
+        async with router.primary_session() as session:
+            await session.execute(insert(decks).values(title="Appendix"))
+            await session.commit()
+        clock.now += 31.0
+        return await read_titles(router)
+
+    assert (await in_new_context(long_request))[0] == REPLICA
+
+
+@pytest.mark.asyncio
+async def test_lagging_replica_falls_back_until_next_check(router, clock, probe):
+    """Test that lag is measured once per interval and decides the route."""
+    probe.lag = 12.0
+    assert (await read_titles(router))[0] == PRIMARY
+    probe.lag = 0.5
+    clock.now = 1.0
+    assert (await read_titles(router))[0] == PRIMARY
+    assert probe.calls == 1
+
+    clock.now = 2.0
+    assert (await read_titles(router))[0] == REPLICA
+    assert probe.calls == 2
+    assert router.stats.lag_fallbacks == 2
+
+
+@pytest.mark.asyncio
+async def test_failing_probe_takes_replica_out_of_rotation(router, clock, probe):
+    """Test that an unreachable replica is skipped until it answers again."""
+    probe.lag = ConnectionError("replica unreachable")
+    assert (await read_titles(router))[0] == PRIMARY
+    assert router.stats.probe_failures == 1
+
+    probe.lag = 0.0
+    clock.now = 2.0
+    assert (await read_titles(router))[0] == REPLICA
+
+
+@pytest.mark.asyncio
+async def test_replica_read_methods(router, databases):
+    """Test that marked methods use the replica unless the session has writes."""
+    async def request():
+        async with router.primary_session() as session:
+            repository = DeckRepository(session)
+            assert await repository.titles() == ["Intro"]
+            assert repository.db is session
+
+            await repository.add("Discussion")
+            assert await repository.titles() == ["Intro", "Results", "Discussion"]
+            await session.commit()
+
+            assert await repository.titles() == ["Intro", "Results", "Discussion"]
+
+    await in_new_context(request)
+
+    _, replica = databases
+    async with replica() as session:
+        # Unrouted sessions run the method as is
+        assert await DeckRepository(session).titles() == ["Intro"]
+    assert router.stats.replica_reads == 1
@@ -0,0 +1,66 @@
+"""
+Tests for repositories opened on their own sessions.
+"""
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.repositories.base import BaseRepository
+
+metadata = MetaData()
+
+counters = Table(
+    "counter", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("value", Integer, nullable=False),
+)
+
+
+class CounterRepository(BaseRepository):
+    def __init__(self, db):
+        super().__init__(None, db)
+
+    async def add(self, counter_id, value):
+        await self.db.execute(insert(counters).values(id=counter_id, value=value))
+
+
+@pytest.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as connection:
+        await connection.run_sync(metadata.create_all)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def stored(session_factory):
+    async with session_factory() as session:
+        result = await session.execute(select(counters.c.id, counters.c.value).order_by(counters.c.id))
+        return result.all()
+
+
+@pytest.mark.asyncio
+async def test_session_scope_commits_on_success(session_factory):
+    """Test that a scope commits its writes and discards them on error."""
+    async with CounterRepository.session_scope(session_factory) as repository:
+        assert isinstance(repository, CounterRepository)
+        await repository.add(1, 10)
+
+    with pytest.raises(RuntimeError):
+        async with CounterRepository.session_scope(session_factory) as repository:
+            await repository.add(2, 20)
+            raise RuntimeError("write failed")
+
+    assert await stored(session_factory) == [(1, 10)]
+
+
+@pytest.mark.asyncio
+async def test_session_writer_commits_each_write(session_factory):
+    """Test that a session writer passes its arguments after the repository."""
+    write = CounterRepository.session_writer(session_factory, CounterRepository.add)
+
+    await write(1, 10)
+    await write(2, 20)
+
+    assert await stored(session_factory) == [(1, 10), (2, 20)]
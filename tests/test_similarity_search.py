@@ -0,0 +1,245 @@
+"""
+Tests for the in-process ANN index, the batched embedding pipeline and
+nearest-neighbour queries.
+"""
+
+import asyncio
+import time
+import uuid
+from contextlib import asynccontextmanager
+
+import numpy as np
+import pytest
+
+from app.repositories.embedding import EmbeddingRepository
+from app.services.search import EmbeddingPipeline, IVFIndex, content_hash, exact_search, recall_at_k
+
+
+def clustered_vectors(count, dimensions=32, clusters=20, seed=1):
+    """Vectors grouped around random centres, like topic embeddings."""
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(size=(clusters, dimensions))
+    vectors = centres[rng.integers(clusters, size=count)] + 0.3 * rng.normal(size=(count, dimensions))
+    return vectors.astype(np.float32)
+
+
+class TestIVFIndex:
+    """Test approximate nearest neighbour search."""
+
+    def test_probing_all_partitions_is_exact(self):
+        """Test that nprobe = nlist returns the exact neighbours."""
+        vectors = clustered_vectors(2000)
+        ids = list(range(len(vectors)))
+        index = IVFIndex(dimensions=32, nlist=16)
+        index.add(ids, vectors)
+        queries = clustered_vectors(50, seed=2)
+
+        approximate = [[i for i, _ in hits] for hits in index.search_batch(queries, k=10, nprobe=16)]
+
+        assert recall_at_k(approximate, exact_search(ids, vectors, queries, k=10)) == 1.0
+
+    def test_recall_grows_with_nprobe(self):
+        """Test that nprobe trades latency for recall."""
+        vectors = clustered_vectors(5000)
+        ids = list(range(len(vectors)))
+        index = IVFIndex(dimensions=32, nlist=64)
+        index.add(ids, vectors)
+        queries = clustered_vectors(100, seed=3)
+        exact = exact_search(ids, vectors, queries, k=10)
+
+        recalls = [
+            recall_at_k([[i for i, _ in hits] for hits in index.search_batch(queries, 10, nprobe)], exact)
+            for nprobe in (1, 4, 16)
+        ]
+
+        assert recalls == sorted(recalls)
+        assert recalls[-1] >= 0.95
+
+    def test_update_remove_and_exclude(self):
+        """Test that replaced, removed and excluded vectors are handled."""
+        index = IVFIndex(dimensions=2, nlist=2)
+        index.add(["a", "b", "c"], [[0, 0], [10, 10], [0, 1]])
+
+        assert [i for i, _ in index.search([0, 0], k=2, nprobe=2)] == ["a", "c"]
+        assert [i for i, _ in index.search([0, 0], k=2, nprobe=2, exclude=["a"])] == ["c", "b"]
+
+        index.add(["c"], [[10, 11]])
+        assert index.remove("a") is True
+        assert index.remove("a") is False
+
+        hits = index.search([0, 0], k=3, nprobe=2)
+        assert [i for i, _ in hits] == ["b", "c"]
+        assert hits[0][1] == pytest.approx(np.sqrt(200))
+        assert len(index) == 2
+
+
+class InMemoryStore:
+    """Embedding store double backed by dicts."""
+
+    def __init__(self, texts):
+        self.texts = texts
+        self.embeddings = {}
+        self.upserts = 0
+
+    async def get_embedding_sources(self, presentation_ids):
+        return {pid: self.texts[pid] for pid in presentation_ids if pid in self.texts}
+
+    async def get_content_hashes(self, presentation_ids):
+        return {pid: self.embeddings[pid][1] for pid in presentation_ids if pid in self.embeddings}
+
+    async def upsert_combined_embeddings(self, rows, model):
+        self.upserts += 1
+        for presentation_id, embedding, text_hash in rows:
+            self.embeddings[presentation_id] = (embedding, text_hash)
+
+
+def make_pipeline(texts, fail=False, **kwargs):
+    store = InMemoryStore(texts)
+    calls = []
+
+    async def embed_batch(batch):
+        calls.append(list(batch))
+        if fail:
+            raise ConnectionError("provider unavailable")
+        return [[float(len(text))] for text in batch]
+
+    @asynccontextmanager
+    async def store_factory():
+        yield store
+
+    pipeline = EmbeddingPipeline(embed_batch, store_factory, model="test-model", **kwargs)
+    return pipeline, store, calls
+
+
+class TestEmbeddingPipeline:
+    """Test batching and deduplication of embedding updates."""
+
+    @pytest.mark.asyncio
+    async def test_batches_and_deduplicates(self):
+        """Test that repeats and identical texts cost no extra embeddings."""
+        ids = [uuid.uuid4() for _ in range(5)]
+        texts = {ids[0]: "deep learning", ids[1]: "deep learning", ids[2]: "graphs",
+                 ids[3]: "proteins", ids[4]: "robotics"}
+        pipeline, store, calls = make_pipeline(texts, batch_size=3)
+
+        for presentation_id in ids + ids[:2]:
+            pipeline.submit(presentation_id)
+        embedded = await pipeline.flush()
+
+        assert embedded == 5
+        assert [len(batch) for batch in calls] == [2, 2]
+        assert pipeline.stats.duplicate_submissions == 2
+        assert store.embeddings[ids[0]] == store.embeddings[ids[1]]
+        assert store.embeddings[ids[2]][1] == content_hash("test-model", "graphs")
+
+    @pytest.mark.asyncio
+    async def test_unchanged_text_is_not_re_embedded(self):
+        """Test that only presentations whose text changed are embedded again."""
+        ids = [uuid.uuid4() for _ in range(3)]
+        texts = {pid: f"abstract {i}" for i, pid in enumerate(ids)}
+        pipeline, store, calls = make_pipeline(texts)
+        for pid in ids:
+            pipeline.submit(pid)
+        await pipeline.flush()
+
+        texts[ids[1]] = "revised abstract"
+        for pid in ids:
+            pipeline.submit(pid)
+        await pipeline.flush()
+
+        assert calls[1] == ["revised abstract"]
+        assert pipeline.stats.unchanged == 2
+
+    @pytest.mark.asyncio
+    async def test_background_worker_flushes_partial_batches(self):
+        """Test that the worker embeds a partial batch after max_wait and drains on stop."""
+        ids = [uuid.uuid4() for _ in range(4)]
+        pipeline, store, calls = make_pipeline({pid: str(pid) for pid in ids}, batch_size=10, max_wait=0.05)
+        await pipeline.start()
+
+        pipeline.submit(ids[0])
+        await asyncio.sleep(0.2)
+        assert ids[0] in store.embeddings
+
+        for pid in ids[1:]:
+            pipeline.submit(pid)
+        await pipeline.stop()
+
+        assert set(store.embeddings) == set(ids)
+        assert pipeline.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_provider_failure_is_contained(self):
+        """Test that a failing provider call is counted and stores nothing."""
+        pid = uuid.uuid4()
+        pipeline, store, calls = make_pipeline({pid: "text"}, fail=True)
+        pipeline.submit(pid)
+
+        assert await pipeline.flush() == 0
+        assert pipeline.stats.failed == 1
+        assert store.embeddings == {}
+
+
+class RecordingSession:
+    """Session double that records executed statements."""
+
+    def __init__(self):
+        self.executed = []
+
+    async def execute(self, statement, params=None):
+        self.executed.append((str(statement), params))
+        return []
+
+
+class TestNearestCombined:
+    """Test the nearest-neighbour query parameters."""
+
+    @pytest.mark.asyncio
+    async def test_no_exclusion_keeps_every_candidate(self):
+        """Test that without exclude_id there is no predicate a NULL would void."""
+        session = RecordingSession()
+
+        await EmbeddingRepository(session).nearest_combined("[0,1]", limit=5)
+
+        [(sql, params)] = session.executed
+        assert "exclude_id" not in sql
+        assert params == {"embedding": "[0,1]", "candidates": 10, "limit": 5}
+
+    @pytest.mark.asyncio
+    async def test_exclusion_leaves_out_one_presentation(self):
+        """Test that exclude_id adds the predicate and its parameter."""
+        session = RecordingSession()
+        presentation_id = uuid.uuid4()
+
+        await EmbeddingRepository(session).nearest_combined("[0,1]", exclude_id=presentation_id)
+
+        [(sql, params)] = session.executed
+        assert "pe.presentation_id <> :exclude_id" in sql
+        assert params["exclude_id"] == presentation_id
+
+
+@pytest.mark.slow
+def test_ann_recall_and_qps_benchmark():
+    """Benchmark recall@10 and queries per second against exact search."""
+    vectors = clustered_vectors(50_000, dimensions=128, clusters=200)
+    ids = list(range(len(vectors)))
+    queries = clustered_vectors(200, dimensions=128, clusters=200, seed=7)
+    index = IVFIndex(dimensions=128, nlist=256)
+
+    started = time.perf_counter()
+    index.add(ids, vectors)
+    build_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    exact = exact_search(ids, vectors, queries, k=10)
+    exact_qps = len(queries) / (time.perf_counter() - started)
+
+    print(f"\nBuilt IVF index over {len(vectors)} vectors in {build_time:.1f} s; exact search {exact_qps:.0f} QPS")
+    for nprobe in (1, 4, 16, 64):
+        started = time.perf_counter()
+        hits = index.search_batch(queries, k=10, nprobe=nprobe)
+        qps = len(queries) / (time.perf_counter() - started)
+        recall = recall_at_k([[i for i, _ in row] for row in hits], exact)
+        print(f"nprobe={nprobe}: recall@10 {recall:.3f}, {qps:.0f} QPS")
+        if nprobe == 16:
+            assert recall >= 0.9
@@ -0,0 +1,206 @@
+"""
+Tests for set-based slide ordering statements, run on SQLite.
+"""
+
+import time
+import uuid
+
+import pytest
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    Table,
+    Uuid,
+    create_engine,
+    event,
+    select,
+    update,
+)
+
+from app.repositories.ordering import (
+    POSITION_GAP,
+    gap_position,
+    position_between,
+    renumber_statements,
+    reorder_statement,
+)
+
+metadata = MetaData()
+
+presentations = Table(
+    "presentation", metadata,
+    Column("id", Uuid, primary_key=True),
+    Column("slide_count", Integer, default=0),
+)
+
+slides = Table(
+    "slide", metadata,
+    Column("id", Uuid, primary_key=True),
+    Column("presentation_id", Uuid, nullable=False),
+    Column("slide_number", Integer, nullable=False),
+    Column("position", BigInteger, nullable=False),
+    Column("is_hidden", Boolean, default=False),
+    Column("deleted_at", DateTime),
+)
+
+
+class StatementCounter:
+    """Counts statements sent to the database."""
+
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self)
+
+    def __call__(self, *args):
+        self.count += 1
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    return engine
+
+
+def create_deck(connection, size):
+    presentation_id = uuid.uuid4()
+    slide_ids = [uuid.uuid4() for _ in range(size)]
+    connection.execute(presentations.insert(), {"id": presentation_id, "slide_count": size})
+    connection.execute(slides.insert(), [
+        {
+            "id": slide_id,
+            "presentation_id": presentation_id,
+            "slide_number": i + 1,
+            "position": gap_position(i),
+        }
+        for i, slide_id in enumerate(slide_ids)
+    ])
+    return presentation_id, slide_ids
+
+
+def deck_order(connection, presentation_id):
+    return connection.execute(
+        select(slides.c.id, slides.c.slide_number)
+        .where(slides.c.presentation_id == presentation_id, slides.c.deleted_at.is_(None))
+        .order_by(slides.c.position)
+    ).all()
+
+
+def test_position_between():
+    """Test midpoints, open ends and exhausted gaps."""
+    assert position_between(None, None) == POSITION_GAP
+    assert position_between(1024, 2048) == 1536
+    assert position_between(None, 1024) == 0
+    assert position_between(2048, None) == 2048 + POSITION_GAP
+    assert position_between(1024, 1025) is None
+
+
+def test_reorder_is_one_statement(engine):
+    """Test that a permutation is applied with one UPDATE."""
+    with engine.begin() as connection:
+        presentation_id, slide_ids = create_deck(connection, 12)
+        other_id, other_slides = create_deck(connection, 3)
+        new_order = slide_ids[::-1]
+        counter = StatementCounter(engine)
+
+        connection.execute(reorder_statement(slides, presentation_id, new_order))
+
+        assert counter.count == 1
+        assert deck_order(connection, presentation_id) == [
+            (slide_id, i + 1) for i, slide_id in enumerate(new_order)
+        ]
+        # Slide IDs of other presentations are never touched
+        connection.execute(reorder_statement(slides, presentation_id, other_slides[::-1]))
+        assert [row.id for row in deck_order(connection, other_id)] == other_slides
+
+
+def test_insert_writes_one_row_and_renumbers_in_place(engine):
+    """Test that an insert only rewrites numbers after it and updates the count."""
+    with engine.begin() as connection:
+        presentation_id, slide_ids = create_deck(connection, 10)
+        new_id = uuid.uuid4()
+        connection.execute(slides.insert(), {
+            "id": new_id,
+            "presentation_id": presentation_id,
+            "slide_number": 4,
+            "position": position_between(gap_position(2), gap_position(3)),
+        })
+
+        statements = renumber_statements(presentations, slides, presentation_id, "sqlite")
+        connection.execute(statements[0])
+        renumbered = connection.exec_driver_sql("SELECT changes()").scalar()
+        connection.execute(statements[1])
+
+        assert renumbered == 7
+        assert [row.id for row in deck_order(connection, presentation_id)] == (
+            slide_ids[:3] + [new_id] + slide_ids[3:]
+        )
+        assert [row.slide_number for row in deck_order(connection, presentation_id)] == list(range(1, 12))
+        assert connection.execute(select(presentations.c.slide_count)).scalar() == 11
+
+
+def test_delete_and_hidden_slides_update_count(engine):
+    """Test that deleted slides are skipped and hidden ones not counted."""
+    with engine.begin() as connection:
+        presentation_id, slide_ids = create_deck(connection, 5)
+        connection.execute(slides.delete().where(slides.c.id == slide_ids[1]))
+        connection.execute(update(slides).where(slides.c.id == slide_ids[3]).values(is_hidden=True))
+
+        for statement in renumber_statements(presentations, slides, presentation_id, "sqlite"):
+            connection.execute(statement)
+
+        assert [row.slide_number for row in deck_order(connection, presentation_id)] == [1, 2, 3, 4]
+        assert connection.execute(select(presentations.c.slide_count)).scalar() == 3
+
+
+def test_rebalance_respaces_positions(engine):
+    """Test that rebalancing restores even gaps once neighbours are adjacent."""
+    with engine.begin() as connection:
+        presentation_id, slide_ids = create_deck(connection, 3)
+        connection.execute(update(slides).where(slides.c.id == slide_ids[2]).values(position=gap_position(1) + 1))
+        assert position_between(gap_position(1), gap_position(1) + 1) is None
+
+        for statement in renumber_statements(presentations, slides, presentation_id, "sqlite", rebalance=True):
+            connection.execute(statement)
+
+        positions = connection.execute(
+            select(slides.c.position).where(slides.c.presentation_id == presentation_id).order_by(slides.c.position)
+        ).scalars().all()
+        assert positions == [gap_position(i) for i in range(3)]
+
+
+@pytest.mark.slow
+def test_reorder_benchmark(engine):
+    """Benchmark statements and latency per reorder as decks grow."""
+    print()
+    for size in (30, 120, 480):
+        with engine.begin() as connection:
+            presentation_id, slide_ids = create_deck(connection, size)
+            new_order = slide_ids[1:] + slide_ids[:1]
+            counter = StatementCounter(engine)
+
+            # Previous implementation: one UPDATE per slide
+            started = time.perf_counter()
+            for i, slide_id in enumerate(new_order):
+                connection.execute(
+                    update(slides)
+                    .where(slides.c.id == slide_id, slides.c.presentation_id == presentation_id)
+                    .values(slide_number=i + 1)
+                )
+            per_slide_time = time.perf_counter() - started
+            per_slide_statements = counter.count
+
+            counter.count = 0
+            started = time.perf_counter()
+            connection.execute(reorder_statement(slides, presentation_id, new_order[::-1]))
+            set_based_time = time.perf_counter() - started
+            event.remove(engine, "before_cursor_execute", counter)
+
+        print(f"{size} slides: per-slide {per_slide_statements} statements {per_slide_time * 1000:.1f} ms, "
+              f"set-based {counter.count} statement {set_based_time * 1000:.1f} ms")
+        assert per_slide_statements == size
+        assert counter.count == 1
@@ -0,0 +1,97 @@
+"""
+Tests for indexed in-deck slide search.
+"""
+
+import uuid
+
+import pytest
+from sqlalchemy import Column, MetaData, Table, Text, Uuid, create_engine, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from app.infrastructure.database.search_text import slide_search_text
+from app.repositories.slide_search import like_pattern, search_condition
+
+metadata = MetaData()
+
+slides = Table(
+    "slide", metadata,
+    Column("id", Uuid, primary_key=True),
+    Column("title", Text),
+    Column("speaker_notes", Text),
+    Column("search_text", Text),
+    Column("search_vector", TSVECTOR().with_variant(Text, "sqlite")),
+)
+
+
+CONTENT = {
+    "title": "Protein Folding",
+    "subtitle": "With attention",
+    "body": [
+        {"type": "text", "content": "AlphaFold predicts structures", "style": {"color": "crimson"}},
+        {"type": "bullet_list", "items": ["Accuracy", {"text": "Speed", "items": ["GPU hours"]}], "level": 1},
+        {"type": "image", "url": "https://example.org/fold.png", "caption": "Predicted fold"},
+        {"type": "table", "headers": ["Model", "RMSD"], "rows": [["AF2", "0.96"]]},
+        {"type": "chart", "data": {"values": [1, 2]}, "config": {"label": "hidden"}},
+    ],
+    "layout": "two_column",
+    "notes": "Mention CASP14",
+}
+
+
+def test_search_text_keeps_readable_text_only():
+    """Test that extraction keeps visible text and drops layout, styles and URLs."""
+    text = slide_search_text(CONTENT)
+
+    for expected in ["Protein Folding", "AlphaFold predicts structures", "GPU hours",
+                     "Predicted fold", "RMSD", "AF2", "Mention CASP14"]:
+        assert expected in text
+    for unexpected in ["bullet_list", "crimson", "example.org", "two_column", "hidden"]:
+        assert unexpected not in text
+    assert slide_search_text(None) == ""
+    assert slide_search_text({}) == ""
+
+
+def test_like_pattern_escapes_wildcards():
+    """Test that wildcard characters in a query match literally."""
+    assert like_pattern("50%_off\\") == "%50\\%\\_off\\\\%"
+
+
+class TestSearchCondition:
+    """Test the search condition builder."""
+
+    @pytest.fixture
+    def connection(self):
+        engine = create_engine("sqlite://")
+        metadata.create_all(engine, tables=[slides])
+        with engine.connect() as connection:
+            connection.execute(slides.insert(), [
+                {"id": uuid.UUID(int=1), "title": "Results: 50% faster", "speaker_notes": "Pause here"},
+                {"id": uuid.UUID(int=2), "title": "Results: 500 faster", "speaker_notes": None},
+                {"id": uuid.UUID(int=3), "title": "Methods", "speaker_notes": "Explain the 50% SPEEDUP"},
+            ])
+            yield connection
+
+    def matches(self, connection, query, search_in):
+        stmt = select(slides.c.id).where(search_condition(slides, query, search_in)).order_by(slides.c.id)
+        return [row.id.int for row in connection.execute(stmt)]
+
+    def test_substring_match_is_case_insensitive_and_literal(self, connection):
+        """Test that title and notes match substrings, treating % literally."""
+        assert self.matches(connection, "50%", ["title"]) == [1]
+        assert self.matches(connection, "50% speedup", ["speaker_notes"]) == [3]
+        assert self.matches(connection, "50%", ["title", "speaker_notes"]) == [1, 3]
+        assert self.matches(connection, "RESULTS", ["title"]) == [1, 2]
+
+    def test_content_uses_stored_vector(self):
+        """Test that content search reads the stored vector, not the JSONB content."""
+        sql = str(search_condition(slides, "folding", ["title", "content"]).compile(dialect=postgresql.dialect()))
+
+        assert "slide.search_vector @@ plainto_tsquery" in sql
+        assert "slide.title ILIKE" in sql
+        assert "jsonb_to_tsvector" not in sql
+        assert "lower(" not in sql
+
+    def test_unknown_fields_add_no_condition(self):
+        """Test that searching no known field leaves the query unfiltered."""
+        assert search_condition(slides, "folding", ["layout"]) is None
@@ -0,0 +1,220 @@
+"""
+Tests for the shared slide text index and concurrent quality checkers.
+"""
+import random
+import time
+from types import SimpleNamespace
+
+import nltk
+import pytest
+
+from app.services.slides.quality import (
+    BaseQualityAssurance,
+    CitationChecker,
+    CoherenceChecker,
+    QualityCheckCache,
+    ReadabilityScorer,
+    SlideText,
+    SlideTextIndex,
+    TimingValidator,
+    TransitionValidator,
+    VisualBalanceAssessor,
+)
+from app.services.slides.quality.text_index import CITATION_TEXT, VISIBLE_TEXT
+
+
+def punkt_available() -> bool:
+    try:
+        nltk.data.find("tokenizers/punkt_tab")
+        return True
+    except LookupError:
+        return False
+
+
+requires_punkt = pytest.mark.skipif(not punkt_available(), reason="NLTK punkt data not installed")
+
+VOCABULARY = (
+    "studies show the proposed Transformer-based model (Smith, 2020) improves accuracy. "
+    "furthermore results indicate [3] significant gains! in 2021 data shows 45% of users "
+    "prefer it. however the GPU cost grows. Introduction Methods Results Conclusion"
+).split()
+
+PRESENTATION = SimpleNamespace(id=1, academic_level="graduate", duration_minutes=20)
+
+
+def make_slides(count: int, seed: int = 11):
+    """Build slides with text, bullets, captions, notes and citations."""
+    rng = random.Random(seed)
+
+    def words(length):
+        return " ".join(rng.choice(VOCABULARY) for _ in range(length))
+
+    slides = []
+    for number in range(1, count + 1):
+        body = [
+            {"type": "text", "content": words(rng.randint(5, 50))},
+            {"type": "bullet_list", "items": [words(rng.randint(3, 15)) for _ in range(rng.randint(1, 6))]},
+        ]
+        if number % 3 == 0:
+            body.append({"type": "image"})
+            body.append({"type": "caption", "content": words(8)})
+        slides.append(SimpleNamespace(
+            id=number,
+            slide_number=number,
+            title=rng.choice([None, "Introduction", "Methods", words(3).title(), "Conclusion"]),
+            content={"body": body},
+            layout_type="content",
+            speaker_notes=rng.choice([None, words(25)]),
+            section=None,
+            duration_seconds=None,
+            transitions=rng.choice([{}, {"type": "fade"}]),
+            animations={},
+            contains_equations=False,
+            contains_code=False,
+            contains_citations=rng.random() < 0.4,
+            figure_count=1 if number % 3 == 0 else 0,
+            is_hidden=False,
+            is_backup=False,
+        ))
+    return slides
+
+
+def default_checkers():
+    checkers = [
+        TransitionValidator(), CitationChecker(), TimingValidator(),
+        VisualBalanceAssessor(), ReadabilityScorer()
+    ]
+    if punkt_available():
+        checkers.insert(0, CoherenceChecker())
+    return checkers
+
+
+def references():
+    return [
+        SimpleNamespace(key="Smith", year=2020, venue="NeurIPS", authors=["Smith"], title="Attention",
+                        citation_type="article", bibtex_type="article"),
+        SimpleNamespace(key="lee2019", year=2012, venue=None, authors=["Lee"], title="Gains",
+                        citation_type="misc", bibtex_type="misc"),
+    ]
+
+
+def report_contents(report):
+    metrics = report.metrics
+    return (
+        metrics.overall_score,
+        metrics.dimension_scores,
+        [vars(issue) for issue in metrics.issues],
+        sorted(metrics.strengths),
+        report.detailed_analysis,
+        report.recommendations,
+    )
+
+
+def test_slide_text_kinds_and_citations():
+    """Test the text read per kind, and citations found once per pattern set."""
+    slide = SimpleNamespace(
+        title="Results",
+        content={
+            "subtitle": "On held-out data",
+            "body": [
+                {"type": "text", "content": "Accuracy improves (Smith, 2020)."},
+                {"type": "bullet_list", "items": ["Latency drops [3]", "Cost holds"]},
+                {"type": "caption", "content": "Figure from Lee et al. (2019)"},
+            ]
+        },
+        speaker_notes="Mention the ablation.",
+    )
+    text = SlideText(slide)
+
+    assert text.text(VISIBLE_TEXT) == \
+        "Results On held-out data Accuracy improves (Smith, 2020). Latency drops [3] Cost holds"
+    assert text.text() == text.text(VISIBLE_TEXT) + " Mention the ablation."
+    assert text.text(CITATION_TEXT).endswith("Cost holds Figure from Lee et al. (2019) Mention the ablation.")
+    assert text.word_count() == 16
+    assert text.text() is text.text()
+
+    patterns = CitationChecker().citation_patterns
+    found = text.citations(patterns)
+    assert found["inline"] == ["Smith, 2020"]
+    assert found["numbered"] == ["3"]
+    assert found["author_year"] == ["Lee et al. (2019)"]
+    assert text.citations(dict(patterns)) is found
+
+
+@requires_punkt
+def test_term_frequencies():
+    """Test term frequencies per slide and for the whole presentation."""
+    index = SlideTextIndex([
+        SimpleNamespace(title="Model results", content={}, speaker_notes=None),
+        SimpleNamespace(title=None, content={"body": [{"type": "text", "content": "Model gains, model costs."}]},
+                        speaker_notes=None),
+    ])
+
+    assert index[1].term_frequencies == {"model": 2, "gains": 1, "costs": 1}
+    assert list(index.term_frequencies) == ["model", "results", "gains", "costs"]
+    assert index.term_frequencies["model"] == 3
+
+
+def test_assessment_extracts_each_slide_once(monkeypatch):
+    """Test that all checkers of an assessment read text extracted once per slide."""
+    extracted = []
+    extract = SlideText._extract_parts
+
+    def counted(self, slide):
+        extracted.append(slide.slide_number)
+        return extract(self, slide)
+
+    monkeypatch.setattr(SlideText, "_extract_parts", counted)
+    slides = make_slides(12)
+    BaseQualityAssurance(default_checkers()).assess_quality(PRESENTATION, slides, references())
+
+    assert sorted(extracted) == list(range(1, 13))
+
+
+def test_concurrent_checkers_match_sequential():
+    """Test that checkers run in a thread pool report as when run in turn."""
+    slides = make_slides(30)
+    sequential = BaseQualityAssurance(default_checkers())
+    concurrent = BaseQualityAssurance(default_checkers(), max_workers=4)
+    cached = BaseQualityAssurance(default_checkers(), cache=QualityCheckCache(), max_workers=4)
+
+    try:
+        expected = report_contents(sequential.assess_quality(PRESENTATION, slides, references()))
+        assert report_contents(concurrent.assess_quality(PRESENTATION, slides, references())) == expected
+        for _ in range(2):
+            assert report_contents(cached.assess_quality(PRESENTATION, slides, references())) == expected
+        assert cached.cache.get_stats()["summary_hits"] == 30 * 4
+    finally:
+        concurrent.shutdown()
+        cached.shutdown()
+
+
+# Target for one end-to-end assessment of 50 slides by the default checkers
+TARGET_SECONDS_PER_50_SLIDES = 0.25
+
+
+@pytest.mark.slow
+def test_assessment_benchmark():
+    """Benchmark: end-to-end assessment of 50 slides, in turn and concurrently."""
+    slides = make_slides(50)
+    refs = references()
+
+    def best_of(qa_system, repeat=10):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            qa_system.assess_quality(PRESENTATION, slides, refs)
+            timings.append(time.perf_counter() - started)
+        return min(timings)
+
+    sequential = best_of(BaseQualityAssurance(default_checkers()))
+    concurrent_system = BaseQualityAssurance(default_checkers(), max_workers=4)
+    try:
+        concurrent = best_of(concurrent_system)
+    finally:
+        concurrent_system.shutdown()
+
+    checkers = ", ".join(type(checker).__name__ for checker in default_checkers())
+    print(f"\n50 slides ({checkers}): in turn {sequential * 1000:.1f} ms, "
+          f"4 workers {concurrent * 1000:.1f} ms, target {TARGET_SECONDS_PER_50_SLIDES * 1000:.0f} ms")
+    assert min(sequential, concurrent) < TARGET_SECONDS_PER_50_SLIDES
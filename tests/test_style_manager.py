@@ -0,0 +1,158 @@
+"""
+Tests for the slide style manager.
+"""
+import time
+import tracemalloc
+from copy import deepcopy
+
+import pytest
+
+from app.services.slides.orchestrator.style_manager import (
+    FrozenStyleMap,
+    StyleManager,
+    StyleRule,
+    freeze_style,
+)
+
+
+def _deck(count):
+    slide_types = ["title", "content", "content", "section"]
+    return [
+        {
+            "type": slide_types[i % len(slide_types)],
+            "content": {
+                "title": f"Slide {i}",
+                "bullets": [{"text": f"Point {j}"} for j in range(4)],
+                "body": "Body text",
+            },
+            "style": {"fontSize": "18px"} if i % 5 == 0 else {},
+        }
+        for i in range(count)
+    ]
+
+
+class TestStyleManager:
+    """Test style cascade and structural sharing."""
+
+    @pytest.mark.asyncio
+    async def test_apply_theme_cascade(self):
+        """Test precedence of theme, global, slide and override styles."""
+        manager = StyleManager()
+        manager.set_global_styles({"fontFamily": "Inter", "color": "#111"})
+        slide = {"type": "content", "content": {"body": "B"}, "style": {"color": "#222"}}
+
+        styled = await manager.apply_theme(slide, "professional", {"opacity": 1})
+
+        assert styled["style"]["fontFamily"] == "Inter"
+        assert styled["style"]["color"] == "#222"
+        assert styled["style"]["opacity"] == 1
+        assert styled["content"]["body_style"]["color"] == manager.themes["professional"].colors["text"]
+        assert "body_style" not in slide["content"]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_styles_are_shared(self):
+        """Test that slides with identical inputs share style maps."""
+        manager = StyleManager()
+        first, second = [await manager.apply_theme(s, "modern") for s in _deck(2)[1:] * 2]
+
+        assert first["style"] is second["style"]
+        assert first["content"]["bullets"][0]["style"] is second["content"]["bullets"][1]["style"]
+
+    def test_frozen_maps_are_read_only(self):
+        """Test that shared maps reject mutation but thaw to mutable copies."""
+        style = freeze_style({"title": {"color": "#000"}})
+
+        with pytest.raises(TypeError):
+            style["title"]["color"] = "#fff"
+
+        thawed = style.thaw()
+        thawed["title"]["color"] = "#fff"
+        assert style["title"]["color"] == "#000"
+        assert deepcopy(style) is style
+
+    def test_deep_merge_copies_only_changed_path(self):
+        """Test that merges reuse untouched branches."""
+        manager = StyleManager()
+        base = freeze_style({"a": {"x": 1}, "b": {"y": 2}})
+
+        merged = manager._deep_merge(base, {"b": {"y": 3}})
+
+        assert merged["a"] is base["a"]
+        assert merged["b"] == {"y": 3}
+        assert manager._deep_merge(base, {"a": {"x": 1}}) is base
+
+    @pytest.mark.asyncio
+    async def test_finalize_applies_rules_and_responsive(self):
+        """Test finalized styles with rules, responsive blocks and cleanup."""
+        manager = StyleManager()
+        manager.add_style_rule(StyleRule(
+            property="title.fontSize",
+            value="3em",
+            scope="slide_type",
+            conditions={"types": ["title"]},
+        ))
+        theme = {"title": {"color": "#000"}, "responsive": {"md": {"fontSize": "20px"}}}
+        slide = {"type": "title", "style": {"empty": ""}}
+
+        result = await manager.finalize_slide_style(slide, {"color": "#333"}, theme)
+
+        assert isinstance(result["style"], FrozenStyleMap)
+        assert result["style"]["title"] == {"color": "#000", "fontSize": "3em"}
+        assert result["style"]["@media"] == {"(min-width: 768px)": {"fontSize": "20px"}}
+        assert "empty" not in result["style"]
+        assert "responsive" not in theme.get("title", {})
+
+    @pytest.mark.asyncio
+    async def test_finalize_sees_inputs_edited_in_place(self):
+        """Test that style inputs mutated between calls are not served from cache."""
+        manager = StyleManager()
+        theme = {"text": {"color": "#111"}}
+        global_style = {"font": "A"}
+        slide_style = {"text": {"size": "1em"}}
+
+        first = await manager.finalize_slide_style(
+            {"type": "content", "style": slide_style}, global_style, theme
+        )
+        global_style["font"] = "B"
+        slide_style["text"]["size"] = "2em"
+        theme["text"]["color"] = "#222"
+        second = await manager.finalize_slide_style(
+            {"type": "content", "style": slide_style}, global_style, theme
+        )
+
+        assert first["style"]["font"] == "A"
+        assert first["style"]["text"] == {"color": "#111", "size": "1em"}
+        assert second["style"]["font"] == "B"
+        assert second["style"]["text"] == {"color": "#222", "size": "2em"}
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_style_cascade_benchmark():
+    """Benchmark allocations and time to style and finalize a 60-slide deck."""
+    manager = StyleManager()
+    manager.set_global_styles({"fontFamily": "Inter", "lineHeight": 1.5})
+    theme = {"background": {"color": "#fff"}, "text": {"color": "#111", "size": "1em"}}
+    global_style = {"padding": "2em"}
+    deck = _deck(60)
+
+    async def run_deck():
+        for slide in deck:
+            styled = await manager.apply_theme(slide, "modern")
+            await manager.finalize_slide_style(styled, global_style, theme)
+
+    await run_deck()
+
+    tracemalloc.start()
+    await run_deck()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    rounds = 20
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await run_deck()
+    per_deck = (time.perf_counter() - start) / rounds
+
+    print(f"\nStyled 60-slide deck: {per_deck * 1000:.2f} ms/deck, peak {peak / 1024:.1f} KiB")
+    assert per_deck < 0.5
@@ -0,0 +1,298 @@
+"""
+Tests for ARQTaskQueue priority dequeue, delayed task promotion and the
+Redis-backed task registry.
+"""
+
+import asyncio
+import time
+
+import pytest
+from fakeredis import FakeAsyncRedis, FakeServer
+
+from app.services.document_processing.queue.task_queue import (
+    PROMOTE_DELAYED_SCRIPT,
+    ARQTaskQueue,
+    TaskPriority,
+    TaskStatus,
+)
+
+
+class CountingRedis(FakeAsyncRedis):
+    """Fake Redis client counting the commands sent to the server."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.commands = []
+
+    async def execute_command(self, *args, **options):
+        self.commands.append(args[0])
+        return await super().execute_command(*args, **options)
+
+    def pipeline(self, transaction=True, shard_hint=None):
+        pipe = super().pipeline(transaction, shard_hint)
+        execute = pipe.execute
+
+        async def counted_execute(raise_on_error=True):
+            self.commands.append("PIPELINE")
+            return await execute(raise_on_error)
+
+        pipe.execute = counted_execute
+        return pipe
+
+
+@pytest.fixture
+async def queue():
+    task_queue = ARQTaskQueue(
+        redis_pool=CountingRedis(decode_responses=True),
+        promote_interval=0.05
+    )
+    await task_queue.initialize()
+    yield task_queue
+    await task_queue.shutdown()
+
+
+class TestPriorityDequeue:
+    """Test dequeue order and latency."""
+
+    @pytest.mark.asyncio
+    async def test_dequeues_highest_priority_first(self, queue):
+        """Test that tasks come out by priority, FIFO within a priority."""
+        for task_id, priority in [
+            ("low", TaskPriority.LOW),
+            ("normal-1", TaskPriority.NORMAL),
+            ("critical", TaskPriority.CRITICAL),
+            ("normal-2", TaskPriority.NORMAL),
+            ("high", TaskPriority.HIGH),
+        ]:
+            await queue.enqueue_task(task_id, {}, priority=priority)
+
+        order = [(await queue.dequeue_task(timeout=0.1))["task_id"] for _ in range(5)]
+
+        assert order == ["critical", "high", "normal-1", "normal-2", "low"]
+        assert await queue.dequeue_task(timeout=0.1) is None
+        assert (await queue.get_task_status("low")).status == TaskStatus.RUNNING
+
+    @pytest.mark.asyncio
+    async def test_idle_higher_priorities_add_no_latency(self, queue):
+        """Test that a waiting worker sees a low priority task immediately."""
+        waiter = asyncio.create_task(queue.dequeue_task(timeout=2))
+        await asyncio.sleep(0.05)
+        started = time.perf_counter()
+        await queue.enqueue_task("task", {}, priority=TaskPriority.LOW)
+
+        task = await waiter
+
+        assert task["task_id"] == "task"
+        assert time.perf_counter() - started < 0.5
+
+    @pytest.mark.asyncio
+    async def test_round_trips_per_dequeue(self, queue):
+        """Test that a dequeue is one BRPOP across all priorities and one state update."""
+        await queue.enqueue_task("task", {}, priority=TaskPriority.NORMAL)
+        queue._promoter_task.cancel()
+        queue.redis_pool.commands.clear()
+
+        await queue.dequeue_task()
+
+        assert queue.redis_pool.commands == ["BRPOP", "EVALSHA"]
+
+    @pytest.mark.asyncio
+    async def test_batch_dequeue(self, queue):
+        """Test that a batch takes available tasks by priority in two round trips."""
+        for i in range(3):
+            await queue.enqueue_task(f"normal-{i}", {}, priority=TaskPriority.NORMAL)
+        await queue.enqueue_task("high", {}, priority=TaskPriority.HIGH)
+        queue._promoter_task.cancel()
+        queue.redis_pool.commands.clear()
+
+        tasks = await queue.dequeue_tasks(3)
+
+        assert [task["task_id"] for task in tasks] == ["high", "normal-0", "normal-1"]
+        assert queue.redis_pool.commands == ["EVALSHA", "EVALSHA"]
+        assert (await queue.get_metrics()).active_tasks == 3
+
+        remaining = await queue.dequeue_tasks(10, timeout=0.1)
+        assert [task["task_id"] for task in remaining] == ["normal-2"]
+        assert await queue.dequeue_tasks(10, timeout=0.1) == []
+
+
+class TestDelayedPromotion:
+    """Test background promotion of delayed tasks."""
+
+    @pytest.mark.asyncio
+    async def test_delayed_task_is_promoted_when_due(self, queue):
+        """Test that a delayed task only becomes available after its delay."""
+        await queue.enqueue_task("later", {}, priority=TaskPriority.HIGH, delay_seconds=1)
+
+        assert await queue.dequeue_task(timeout=0.3) is None
+        task = await queue.dequeue_task(timeout=2)
+
+        assert task["task_id"] == "later"
+        assert await queue.redis_pool.zcard("queue:default:high:delayed") == 0
+
+    @pytest.mark.asyncio
+    async def test_single_promoter_across_processes(self):
+        """Test that only one of several queues sharing Redis promotes."""
+        server = FakeServer()
+        queues = [
+            ARQTaskQueue(redis_pool=FakeAsyncRedis(server=server, decode_responses=True))
+            for _ in range(3)
+        ]
+        for task_queue in queues:
+            task_queue._promote_script = task_queue.redis_pool.register_script(PROMOTE_DELAYED_SCRIPT)
+        await queues[0].redis_pool.zadd("queue:default:normal:delayed", {'{"task_id": "t"}': 0})
+
+        results = [await task_queue._process_delayed_tasks("default") for task_queue in queues]
+
+        assert results == [1, -1, -1]
+        assert await queues[0].redis_pool.lrange("queue:default:normal", 0, -1) == ['{"task_id": "t"}']
+
+
+class TestSharedTaskRegistry:
+    """Test task state and metrics shared between processes."""
+
+    @pytest.fixture
+    async def queues(self):
+        server = FakeServer()
+        queues = [
+            ARQTaskQueue(
+                redis_pool=FakeAsyncRedis(server=server, decode_responses=True),
+                promote_interval=0.05,
+                status_cache_ttl=0
+            )
+            for _ in range(2)
+        ]
+        for task_queue in queues:
+            await task_queue.initialize()
+        yield queues
+        for task_queue in queues:
+            await task_queue.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_status_visible_across_processes(self, queues):
+        """Test that a task enqueued by one process is tracked by another."""
+        api, worker = queues
+        await api.enqueue_task("task", {"document": 1}, priority=TaskPriority.HIGH)
+
+        pending = await worker.get_task_status("task")
+        assert pending.status == TaskStatus.PENDING
+        assert pending.metadata == {"task_data": {"document": 1}}
+
+        await worker.dequeue_task(timeout=0.1)
+        assert (await api.get_task_status("task")).status == TaskStatus.RUNNING
+
+        await worker.mark_task_complete("task", success=True, result={"pages": 3})
+        done = await api.get_task_status("task")
+        assert done.status == TaskStatus.SUCCESS
+        assert done.result == {"pages": 3}
+        assert done.started_at <= done.completed_at
+        assert await api.get_task_status("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_metrics_aggregate_across_processes(self, queues):
+        """Test that counters and the duration histogram are shared."""
+        api, worker = queues
+        for i in range(4):
+            await api.enqueue_task(f"task-{i}", {})
+        tasks = await worker.dequeue_tasks(3)
+        for task in tasks:
+            await worker.mark_task_complete(task["task_id"], success=True)
+
+        metrics = await api.get_metrics()
+
+        assert metrics.total_tasks_enqueued == 4
+        assert metrics.total_tasks_completed == 3
+        assert metrics.pending_tasks == 1
+        assert metrics.active_tasks == 0
+        assert metrics.queue_lengths == {"default:normal": 1}
+        assert metrics.duration_histogram["1"] == 3
+        assert metrics.duration_histogram["+Inf"] == 3
+        assert 0 <= metrics.average_task_duration < 1
+
+    @pytest.mark.asyncio
+    async def test_retries_then_fails(self, queues):
+        """Test that retry counts persist and exhausted tasks count as failed."""
+        api, worker = queues
+        await api.enqueue_task("flaky", {})
+        await worker.dequeue_task(timeout=0.1)
+
+        await worker.mark_task_complete("flaky", success=False, error_message="boom")
+        retrying = await api.get_task_status("flaky")
+        assert retrying.status == TaskStatus.RETRY
+        assert retrying.retry_count == 1
+        assert await api.redis_pool.zcard("queue:default:normal:delayed") == 1
+
+        # Exhaust the remaining retries without waiting for the backoff
+        await api.redis_pool.hset("queue:task:flaky", mapping={"status": "running", "retry_count": "3"})
+        await worker.mark_task_complete("flaky", success=False, error_message="boom")
+
+        metrics = await api.get_metrics()
+        assert (await api.get_task_status("flaky")).status == TaskStatus.FAILURE
+        assert metrics.total_tasks_failed == 1
+        assert metrics.failed_tasks_last_hour == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_task_is_not_run(self, queues):
+        """Test that a task cancelled by one process is dropped by workers."""
+        api, worker = queues
+        await api.enqueue_task("task", {})
+
+        # Simulate the worker popping the payload just before the cancel
+        payload = await worker.redis_pool.rpop("queue:default:normal")
+        assert await api.cancel_task("task") is True
+        assert await worker._mark_dequeued([payload]) == []
+
+        assert await api.cancel_task("task") is False
+        metrics = await api.get_metrics()
+        assert metrics.pending_tasks == 0
+        assert metrics.active_tasks == 0
+
+    @pytest.mark.asyncio
+    async def test_local_status_cache(self):
+        """Test that repeated status polls within the cache TTL skip Redis."""
+        client = CountingRedis(decode_responses=True)
+        task_queue = ARQTaskQueue(redis_pool=client, status_cache_ttl=60)
+        await task_queue.initialize()
+        task_queue._promoter_task.cancel()
+        await task_queue.enqueue_task("task", {})
+        task_queue._status_cache.clear()
+        client.commands.clear()
+
+        for _ in range(10):
+            assert (await task_queue.get_task_status("task")).status == TaskStatus.PENDING
+
+        assert client.commands == ["HGETALL"]
+        await task_queue.shutdown()
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_dequeue_latency_benchmark():
+    """Benchmark wake-up latency and Redis round trips per task."""
+    task_queue = ARQTaskQueue(redis_pool=CountingRedis(decode_responses=True), promote_interval=60)
+    await task_queue.initialize()
+    task_queue._promoter_task.cancel()
+
+    latencies = []
+    for i in range(20):
+        waiter = asyncio.create_task(task_queue.dequeue_task(timeout=5))
+        await asyncio.sleep(0.01)
+        started = time.perf_counter()
+        await task_queue.enqueue_task(f"task-{i}", {}, priority=TaskPriority.LOW)
+        await waiter
+        latencies.append(time.perf_counter() - started)
+
+    for i in range(1000):
+        await task_queue.enqueue_task(f"batch-{i}", {}, priority=TaskPriority.NORMAL)
+    task_queue.redis_pool.commands.clear()
+    while await task_queue.dequeue_tasks(50, timeout=0.1):
+        pass
+    batch_ops = len(task_queue.redis_pool.commands)
+    await task_queue.shutdown()
+
+    latencies.sort()
+    print(f"\nIdle-queue wake-up latency: median {latencies[10] * 1000:.1f} ms, "
+          f"max {latencies[-1] * 1000:.1f} ms (previously up to 3 s behind idle higher priorities)")
+    print(f"Batch dequeue of 1000 tasks: {batch_ops} Redis round trips ({batch_ops / 1000:.3f} per task)")
+    assert latencies[-1] < 0.5
+    assert batch_ops <= 50
@@ -0,0 +1,230 @@
+"""
+Tests for buffered presentation view counters.
+"""
+
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table, Uuid, func, select, update
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.repositories.view_counts import ViewDelta, view_count_statement
+from app.services.counters import RedisViewCounter, ShardedViewCounter, ViewCountBuffer
+
+metadata = MetaData()
+
+presentations = Table(
+    "presentation", metadata,
+    Column("id", Uuid, primary_key=True),
+    Column("view_count", Integer, default=0),
+    Column("last_accessed", DateTime),
+)
+
+START = datetime(2024, 3, 1, 12, 0)
+
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as connection:
+        await connection.run_sync(metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+def table_writer(engine):
+    async def write(deltas):
+        async with engine.begin() as connection:
+            await connection.execute(view_count_statement(presentations, deltas))
+    return write
+
+
+async def view_counts(engine):
+    async with engine.connect() as connection:
+        result = await connection.execute(select(presentations).order_by(presentations.c.id))
+        return {row.id: (row.view_count, row.last_accessed) for row in result}
+
+
+@pytest.mark.asyncio
+async def test_statement_applies_deltas_in_one_update(engine):
+    """Test that views are added and last_accessed only moves forward."""
+    ids = [uuid.UUID(int=i) for i in range(1, 4)]
+    async with engine.begin() as connection:
+        await connection.execute(presentations.insert(), [
+            {"id": ids[0], "view_count": 10, "last_accessed": START},
+            {"id": ids[1], "view_count": None, "last_accessed": None},
+            {"id": ids[2], "view_count": 5, "last_accessed": START},
+        ])
+        await connection.execute(view_count_statement(presentations, {
+            ids[0]: ViewDelta(3, START + timedelta(minutes=5)),
+            ids[1]: ViewDelta(2, START - timedelta(days=1)),
+        }))
+        assert (await connection.execute(select(func.changes()))).scalar() == 2
+
+    assert await view_counts(engine) == {
+        ids[0]: (13, START + timedelta(minutes=5)),
+        ids[1]: (2, START - timedelta(days=1)),
+        ids[2]: (5, START),
+    }
+
+    async with engine.begin() as connection:
+        await connection.execute(view_count_statement(presentations, {ids[0]: ViewDelta(1, START)}))
+    assert (await view_counts(engine))[ids[0]] == (14, START + timedelta(minutes=5))
+
+
+@pytest.fixture(params=["memory", "redis"])
+def backend(request):
+    if request.param == "memory":
+        return ShardedViewCounter(shards=4)
+    return RedisViewCounter(FakeAsyncRedis(decode_responses=True))
+
+
+class TestCounterBackends:
+    """Test both counter backends against the same contract."""
+
+    @pytest.mark.asyncio
+    async def test_increment_pending_and_drain(self, backend):
+        """Test that views accumulate per deck and a drain takes and clears them."""
+        hot, cold, unseen = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        for second in range(5):
+            await backend.increment(hot, 1000.0 + second)
+        await backend.increment(cold, 2000.0)
+
+        assert await backend.pending([hot, cold, unseen]) == {hot: 5, cold: 1}
+
+        deltas = await backend.drain()
+        assert deltas == {
+            hot: ViewDelta(5, datetime.fromtimestamp(1004.0, tz=timezone.utc)),
+            cold: ViewDelta(1, datetime.fromtimestamp(2000.0, tz=timezone.utc)),
+        }
+        assert await backend.pending([hot, cold]) == {}
+        assert await backend.drain() == {}
+
+    @pytest.mark.asyncio
+    async def test_restore_merges_with_new_views(self, backend):
+        """Test that restored views add to views counted since the drain."""
+        deck = uuid.uuid4()
+        await backend.increment(deck, 1000.0)
+        deltas = await backend.drain()
+        await backend.increment(deck, 3000.0)
+
+        await backend.restore(deltas)
+
+        drained = await backend.drain()
+        assert drained[deck].views == 2
+        assert drained[deck].last_accessed == datetime.fromtimestamp(3000.0, tz=timezone.utc)
+
+
+class TestViewCountBuffer:
+    """Test flushing and reads."""
+
+    @pytest.mark.asyncio
+    async def test_reads_include_pending_views(self, engine):
+        """Test that a read is the persisted count plus pending views."""
+        deck = uuid.uuid4()
+        async with engine.begin() as connection:
+            await connection.execute(presentations.insert().values(id=deck, view_count=40))
+        buffer = ViewCountBuffer(ShardedViewCounter(), table_writer(engine))
+
+        for _ in range(3):
+            await buffer.record_view(deck)
+        assert await buffer.view_count(deck, 40) == 43
+
+        assert await buffer.flush() == 3
+        assert (await view_counts(engine))[deck][0] == 43
+        assert await buffer.view_count(deck, 43) == 43
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_views(self, engine):
+        """Test that views survive a failed write and land with the next flush."""
+        deck = uuid.uuid4()
+        async with engine.begin() as connection:
+            await connection.execute(presentations.insert().values(id=deck, view_count=0))
+        write = table_writer(engine)
+        failures = [ConnectionError("database unavailable")]
+
+        async def flaky_write(deltas):
+            if failures:
+                raise failures.pop()
+            await write(deltas)
+
+        buffer = ViewCountBuffer(ShardedViewCounter(), flaky_write)
+        await buffer.record_view(deck)
+        assert await buffer.flush() == 0
+        await buffer.record_view(deck)
+
+        assert await buffer.flush() == 2
+        assert (await view_counts(engine))[deck][0] == 2
+
+    @pytest.mark.asyncio
+    async def test_periodic_flush(self, engine):
+        """Test that the background flusher writes views and stop drains the rest."""
+        deck = uuid.uuid4()
+        async with engine.begin() as connection:
+            await connection.execute(presentations.insert().values(id=deck, view_count=0))
+        buffer = ViewCountBuffer(ShardedViewCounter(), table_writer(engine), flush_interval=0.05)
+        await buffer.start()
+
+        await buffer.record_view(deck)
+        await asyncio.sleep(0.2)
+        assert (await view_counts(engine))[deck][0] == 1
+
+        await buffer.record_view(deck)
+        await buffer.stop()
+        assert (await view_counts(engine))[deck][0] == 2
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_hot_deck_load(tmp_path):
+    """Load test: concurrent views of one deck, per-view UPDATE vs buffered."""
+    views = 5000
+    concurrency = 50
+    # A file database gives each client its own connection and real
+    # write locking, unlike the shared in-memory connection
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'views.db'}", connect_args={"timeout": 60}
+    )
+    async with engine.begin() as connection:
+        await connection.run_sync(metadata.create_all)
+    deck = uuid.uuid4()
+    async with engine.begin() as connection:
+        await connection.execute(presentations.insert().values(id=deck, view_count=0))
+
+    async def per_view_update():
+        async with engine.begin() as connection:
+            await connection.execute(
+                update(presentations)
+                .where(presentations.c.id == deck)
+                .values(view_count=presentations.c.view_count + 1, last_accessed=func.now())
+            )
+
+    async def run(record):
+        async def client(count):
+            for _ in range(count):
+                await record()
+        started = time.perf_counter()
+        await asyncio.gather(*(client(views // concurrency) for _ in range(concurrency)))
+        return views / (time.perf_counter() - started)
+
+    print()
+    direct = await run(per_view_update)
+    print(f"per-view UPDATE: {direct:,.0f} views/s")
+
+    for name, backend in [
+        ("sharded in-process", ShardedViewCounter()),
+        ("redis", RedisViewCounter(FakeAsyncRedis(decode_responses=True))),
+    ]:
+        buffer = ViewCountBuffer(backend, table_writer(engine), flush_interval=0.1)
+        await buffer.start()
+        throughput = await run(lambda: buffer.record_view(deck))
+        await buffer.stop()
+        print(f"buffered, {name}: {throughput:,.0f} views/s")
+        assert throughput > direct
+
+    assert (await view_counts(engine))[deck][0] == 3 * views
+    await engine.dispose()